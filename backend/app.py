@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import os
 from data.db import Database
+from clients.async_http import aclose_async_http_client
 from routers.portfolio import router as portfolio_router
 from routers.health import router as health_router
 from routers.user import router as user_router
@@ -88,6 +89,7 @@ async def lifespan(app: FastAPI):
         logger.info("앱 종료 처리 중...")
         db = Database()
         await db.close()
+        await aclose_async_http_client()
         logger.info("앱 종료 완료")
 
 
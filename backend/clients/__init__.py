@@ -32,10 +32,24 @@ def get_finnhub_client():
     return FinnhubClient()
 
 
+def get_async_stock_client():
+    from .stock_client import AsyncStockClient
+
+    return AsyncStockClient()
+
+
+def get_async_finnhub_client():
+    from .finnhub_client import AsyncFinnhubClient
+
+    return AsyncFinnhubClient()
+
+
 __all__ = [
     "get_stock_client",
     "get_supabase_client",
     "get_email_client",
     "get_cache_client",
     "get_finnhub_client",
+    "get_async_stock_client",
+    "get_async_finnhub_client",
 ]
@@ -0,0 +1,53 @@
+# clients/async_http.py
+"""비동기 클라이언트가 공유하는 httpx.AsyncClient 풀 + 공급자별 동시 요청 제한.
+
+- 이벤트 루프마다 AsyncClient/세마포어를 하나씩 둔다. FastAPI는 루프 하나를 계속 쓰고,
+  LangGraph 노드 안의 asyncio.run은 호출마다 새 루프라 루프 간 공유가 불가능하기 때문.
+- 공급자별 동시 요청 상한은 환경변수 {PROVIDER}_MAX_CONCURRENCY (기본 DEFAULT_MAX_CONCURRENCY).
+- 앱 종료 시 aclose_async_http_client()로 현재 루프의 연결 풀을 닫는다.
+"""
+import asyncio
+import os
+import weakref
+from typing import Dict
+
+import httpx
+
+DEFAULT_MAX_CONCURRENCY = 8
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+HTTP_LIMITS = httpx.Limits(
+    max_connections=int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", "50")),
+    max_keepalive_connections=int(os.getenv("ASYNC_HTTP_MAX_KEEPALIVE", "20")),
+)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """현재 이벤트 루프의 공유 AsyncClient (keep-alive 연결 풀)"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+        _clients[loop] = client
+    return client
+
+
+def provider_semaphore(provider: str) -> asyncio.Semaphore:
+    """현재 이벤트 루프에서 provider(yahoo, finnhub 등)의 동시 요청 수를 제한하는 세마포어"""
+    loop = asyncio.get_running_loop()
+    semaphores = _semaphores.setdefault(loop, {})
+    if provider not in semaphores:
+        limit = int(os.getenv(f"{provider.upper()}_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY)))
+        semaphores[provider] = asyncio.Semaphore(max(1, limit))
+    return semaphores[provider]
+
+
+async def aclose_async_http_client() -> None:
+    """현재 이벤트 루프의 AsyncClient 연결 풀 정리"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
@@ -1,11 +1,140 @@
 import os
+import math
+import asyncio
+import time
+import uuid
 import redis
 import pickle
+import numpy as np
+import pandas as pd
+import random
 import logging
-from typing import Any, Optional
+import threading
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from clients import cache_codec
+from clients.local_cache import LocalCache, get_local_cache
+from clients.redis_scan import scan_unlink
 
 logger = logging.getLogger(__name__)
 
+# get_or_set 동시 미스 제어 (single-flight)
+LOCK_LEASE_SECONDS = 30  # 값을 계산하는 쪽이 죽어도 이 시간 뒤에는 다른 요청이 계산할 수 있음
+LOCK_POLL_SECONDS = 0.1  # 대기 중인 요청이 값을 다시 확인하는 간격
+EARLY_REFRESH_BETA = 1.0  # 조기 갱신 강도 (클수록 만료 훨씬 전부터 갱신, 0이면 끔)
+
+# 프로세스 내 L1 캐시 (clients/local_cache.py)
+L1_TTL = int(os.getenv("CACHE_L1_TTL", "60"))  # L1 보관 최대 시간 = 다른 프로세스의 갱신이 늦게 보일 수 있는 상한
+L1_INVALIDATION = os.getenv("CACHE_L1_INVALIDATION", "true").lower() in ("1", "true", "yes")  # pub/sub 무효화
+INVALIDATION_CHANNEL = "cache:invalidate"
+INVALIDATION_RETRY_SECONDS = 5  # 구독이 끊겼을 때 재연결 간격
+COPYABLE_TYPES = (pd.DataFrame, pd.Series, np.ndarray)  # L1에 디코딩한 값으로 두고 적중 시 .copy()로 내주는 타입
+
+# 실패 결과 캐시 (negative caching)
+NEGATIVE_CACHE_TTL = int(os.getenv("CACHE_NEGATIVE_TTL", "60"))  # 첫 실패 후 재조회까지
+NEGATIVE_CACHE_MAX_TTL = int(os.getenv("CACHE_NEGATIVE_MAX_TTL", str(6 * 60 * 60)))  # 연속 실패 백오프 상한
+NEGATIVE_MEMORY_SECONDS = 24 * 60 * 60  # 실패 항목이 만료된 뒤에도 연속 실패 횟수를 기억하는 시간
+
+# KEYS[1]=락 키, ARGV[1]=토큰 — 내가 잡은 락일 때만 해제
+RELEASE_LOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+_listener_pid: Optional[int] = None
+_listener_origin = ""
+_listener_lock = threading.Lock()
+
+
+def _start_invalidation_listener(client: Any) -> None:
+    """프로세스당 한 번 무효화 채널 구독 스레드를 띄운다 (fork된 자식 프로세스에서는 다시)"""
+    global _listener_pid, _listener_origin
+    pid = os.getpid()
+    if _listener_pid == pid:
+        return
+    with _listener_lock:
+        if _listener_pid == pid:
+            return
+        _listener_pid = pid
+        _listener_origin = uuid.uuid4().hex
+        threading.Thread(
+            target=_listen_for_invalidations, args=(client,), daemon=True, name="cache-invalidation"
+        ).start()
+
+
+def _listen_for_invalidations(client: Any) -> None:
+    while True:
+        try:
+            pubsub = client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(INVALIDATION_CHANNEL)
+            # 구독 전이나 연결이 끊긴 동안의 무효화는 받지 못했으므로 L1을 비우고 시작
+            get_local_cache().clear()
+            for message in pubsub.listen():
+                _apply_invalidation(get_local_cache(), message["data"])
+        except Exception as e:
+            logger.warning(f"Cache invalidation subscription lost (retrying): {e}")
+            time.sleep(INVALIDATION_RETRY_SECONDS)
+
+
+def _apply_invalidation(local: LocalCache, data: Any) -> None:
+    """메시지 "{발신 프로세스}|{k: 키, p: 패턴}|{키}" → 다른 프로세스가 바꾼 키를 L1에서 삭제"""
+    if isinstance(data, bytes):
+        data = data.decode()
+    origin, kind, key = data.split("|", 2)
+    if origin == _listener_origin:
+        return  # 이 프로세스가 보낸 무효화 (L1은 이미 반영됨)
+    if kind == "p":
+        local.delete_pattern(key)
+    else:
+        local.delete(key)
+
+
+@dataclass
+class CachedFailure:
+    """조회 실패 결과 (negative cache 항목). 성공 값과는 타입으로 구분된다.
+
+    fetch 함수가 실패 시 이 값을 돌려주면 get_or_set/get_or_set_many가 짧은 TTL로 저장하고,
+    같은 키가 연속으로 실패할수록 TTL을 두 배씩 늘린다 (NEGATIVE_CACHE_TTL → NEGATIVE_CACHE_MAX_TTL).
+    """
+
+    error: str = ""
+    failures: int = 1  # 연속 실패 횟수
+
+    @property
+    def ttl_seconds(self) -> int:
+        return min(NEGATIVE_CACHE_MAX_TTL, NEGATIVE_CACHE_TTL * 2 ** min(self.failures - 1, 20))
+
+
+@dataclass
+class CacheEntry:
+    """캐시 저장 단위: 값 + 논리 만료 시각 + 계산에 걸린 시간.
+
+    Redis 키 자체는 만료 후 stale_ttl만큼 더 남아 있어 stale-while-revalidate에 쓴다.
+    """
+
+    value: Any
+    expires_at: float
+    compute_seconds: float = 0.0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.expires_at
+
+    @property
+    def is_failure(self) -> bool:
+        return isinstance(self.value, CachedFailure)
+
+    def should_refresh_early(self, beta: float = EARLY_REFRESH_BETA, now: Optional[float] = None) -> bool:
+        """확률적 조기 갱신 (XFetch): 계산이 오래 걸리는 값일수록, 만료가 가까울수록 갱신 확률이 높다"""
+        if beta <= 0 or self.compute_seconds <= 0:
+            return False
+        now = now or time.time()
+        return now - self.compute_seconds * beta * math.log(1.0 - random.random()) >= self.expires_at
+
 
 class CacheClient:
     def __init__(self):
@@ -20,29 +149,84 @@ class CacheClient:
             raise ValueError(f"Redis connection failed: {e}")
 
     def get(self, key: str) -> Optional[Any]:
-        """캐시에서 데이터 조회"""
+        """캐시에서 데이터 조회 (논리 TTL이 지난 값은 None)"""
+        entry = self.get_entry(key)
+        if entry is None or not entry.is_fresh():
+            return None
+        return entry.value
+
+    def get_entry(self, key: str) -> Optional[CacheEntry]:
+        """만료 정보까지 포함한 캐시 항목 조회 (stale 구간의 항목도 반환). L1 → Redis 순."""
+        local = self._local()
+        entry = self._recall(local, key)
+        if entry is not None:
+            return entry
         try:
             data = self.client.get(key)
-            if data:
-                return pickle.loads(data)
-            return None
+            if not data:
+                return None
+            entry = self._decode_entry(data)
         except Exception as e:
             logger.warning(f"Cache get error for key {key}: {e}")
             return None
+        self._remember(local, key, entry, data)
+        return entry
+
+    @staticmethod
+    def _decode_entry(data: bytes) -> CacheEntry:
+        if cache_codec.is_encoded(data):
+            value, expires_at, compute_seconds = cache_codec.decode(data)
+            return CacheEntry(value=value, expires_at=expires_at, compute_seconds=compute_seconds)
+        # 코덱 도입 전에 pickle로 저장된 값
+        value = pickle.loads(data)
+        if isinstance(value, CacheEntry):
+            return value
+        return CacheEntry(value=value, expires_at=math.inf)
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl_seconds: int = 300,
+        stale_ttl: int = 0,
+        compute_seconds: float = 0.0,
+        expire_at: Optional[datetime] = None,
+    ) -> bool:
+        """캐시에 데이터 저장 (기본 5분 TTL). stale_ttl: 만료 후에도 갱신 중 임시로 돌려줄 수 있는 시간.
 
-    def set(self, key: str, value: Any, ttl_seconds: int = 300) -> bool:
-        """캐시에 데이터 저장 (기본 5분 TTL)"""
+        expire_at을 주면 ttl_seconds 대신 그 시각에 만료 (예: market_calendar.bars_expire_at()).
+        CachedFailure는 ttl_seconds 대신 실패 횟수에 따른 백오프 TTL로 저장한다.
+        """
+        local = self._local()
+        local.delete(key)
+        ttl_seconds = self._ttl_until(expire_at, ttl_seconds)
+        ttl_seconds, stale_ttl = self._effective_ttls(value, ttl_seconds, stale_ttl)
         try:
-            serialized = pickle.dumps(value)
-            return self.client.setex(key, ttl_seconds, serialized)
+            expires_at = time.time() + ttl_seconds
+            serialized = cache_codec.encode(value, expires_at, compute_seconds)
+            if L1_INVALIDATION:
+                # 저장과 무효화 알림을 한 번의 왕복으로
+                pipe = self.client.pipeline(transaction=False)
+                pipe.setex(key, max(1, int(ttl_seconds + stale_ttl)), serialized)
+                self._publish_invalidation("k", key, pipe)
+                stored = pipe.execute()[0]
+            else:
+                stored = self.client.setex(key, max(1, int(ttl_seconds + stale_ttl)), serialized)
         except Exception as e:
             logger.warning(f"Cache set error for key {key}: {e}")
             return False
+        if stored:
+            entry = CacheEntry(value=value, expires_at=expires_at, compute_seconds=compute_seconds)
+            self._remember(local, key, entry, serialized)
+        return stored
 
     def delete(self, key: str) -> bool:
         """캐시에서 데이터 삭제"""
+        self._local().delete(key)
         try:
-            return bool(self.client.delete(key))
+            deleted = bool(self.client.delete(key))
+            self._publish_invalidation("k", key)
+            return deleted
         except Exception as e:
             logger.warning(f"Cache delete error for key {key}: {e}")
             return False
@@ -55,31 +239,449 @@ class CacheClient:
             logger.warning(f"Cache exists error for key {key}: {e}")
             return False
 
-    def get_or_set(self, key: str, fetch_func, ttl_seconds: int = 300) -> Any:
-        """캐시 조회 또는 새로 생성"""
-        cached = self.get(key)
-        if cached is not None:
+    # ---- 여러 키 (MGET / 파이프라인으로 왕복 1회) ----
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회. 캐시에 있는(논리 TTL 전) 키만 담아 반환."""
+        now = time.time()
+        return {key: entry.value for key, entry in self.get_entries(keys).items() if entry.is_fresh(now)}
+
+    def get_entries(self, keys: Iterable[str]) -> Dict[str, CacheEntry]:
+        """여러 키의 캐시 항목 조회 (stale 구간 포함). L1에 없는 키만 MGET 한 번으로 읽는다."""
+        local = self._local()
+        entries: Dict[str, CacheEntry] = {}
+        remote = []
+        for key in dict.fromkeys(keys):
+            entry = self._recall(local, key)
+            if entry is not None:
+                entries[key] = entry
+            else:
+                remote.append(key)
+        if not remote:
+            return entries
+        try:
+            values = self.client.mget(remote)
+        except Exception as e:
+            logger.warning(f"Cache mget error for {len(remote)} keys: {e}")
+            return entries
+        for key, data in zip(remote, values):
+            if not data:
+                continue
+            try:
+                entry = self._decode_entry(data)
+            except Exception as e:
+                logger.warning(f"Cache decode error for key {key}: {e}")
+                continue
+            entries[key] = entry
+            self._remember(local, key, entry, data)
+        return entries
+
+    def set_many(
+        self,
+        values: Dict[str, Any],
+        ttl_seconds: Union[int, Dict[str, int]] = 300,
+        expire_at: Optional[datetime] = None,
+    ) -> bool:
+        """여러 키를 파이프라인 한 번으로 저장. ttl_seconds는 공통 TTL 또는 키별 TTL dict (expire_at을 주면 그 시각에 만료)."""
+        if not values:
+            return True
+        if expire_at is not None:
+            ttl_seconds = self._ttl_until(expire_at, 0)
+        local = self._local()
+        expires: Dict[str, float] = {}
+        encoded: Dict[str, bytes] = {}
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, value in values.items():
+                ttl, stale_ttl = self._effective_ttls(
+                    value, ttl_seconds[key] if isinstance(ttl_seconds, dict) else ttl_seconds, 0
+                )
+                local.delete(key)
+                expires[key] = time.time() + ttl
+                encoded[key] = cache_codec.encode(value, expires[key])
+                pipe.setex(key, max(1, int(ttl + stale_ttl)), encoded[key])
+            for key in values:
+                self._publish_invalidation("k", key, pipe)
+            stored = pipe.execute()[: len(values)]  # 뒤쪽은 publish 결과
+        except Exception as e:
+            logger.warning(f"Cache set_many error for {len(values)} keys: {e}")
+            return False
+        for (key, value), ok in zip(values.items(), stored):
+            if ok:
+                self._remember(local, key, CacheEntry(value=value, expires_at=expires[key]), encoded[key])
+        return all(stored)
+
+    def set_failures(
+        self, failures: Dict[str, CachedFailure], previous: Optional[Dict[str, CacheEntry]] = None
+    ) -> bool:
+        """실패 기록(negative cache)만 저장 — 성공 값은 다른 곳(가격 저장소 등)에 두는 조회용.
+
+        previous(직전 항목, 없으면 새로 읽음)도 실패였으면 연속 실패 횟수를 이어 세어 백오프 TTL을 늘린다.
+        """
+        if not failures:
+            return True
+        if previous is None:
+            previous = self.get_entries(failures)
+        return self.set_many(
+            {key: self._count_failure(value, previous.get(key)) for key, value in failures.items()}, NEGATIVE_CACHE_TTL
+        )
+
+    def get_or_set_many(
+        self,
+        keys: Iterable[str],
+        fetch_many: Callable[[List[str]], Dict[str, Any]],
+        ttl_seconds: Union[int, Callable[[Any], int]] = 300,
+        wait_timeout: float = LOCK_LEASE_SECONDS,
+        expire_at: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """여러 키를 한 번에 조회하고 미스만 fetch_many(미스 키 목록) → {키: 값}으로 채운다.
+
+        get_or_set과 같은 single-flight: 다른 요청이 이미 계산 중인 키는 기다렸다가 그 결과를 쓴다.
+        fetch_many가 돌려주지 않은 키는 저장하지 않고 결과에서도 빠진다.
+        실패한 키에 CachedFailure를 돌려주면 백오프 TTL로 저장되고, 만료 전까지는 결과에 CachedFailure로 담긴다.
+        ttl_seconds는 공통 TTL 또는 값 → TTL 함수 (성공 값에만 적용). expire_at을 주면 그 시각에 만료.
+        """
+        if expire_at is not None:
+            ttl_seconds = self._ttl_until(expire_at, 0)
+        keys = list(dict.fromkeys(keys))
+        entries = self.get_entries(keys)  # 만료된 실패 항목도 읽어 연속 실패 횟수를 잇는다
+        now = time.time()
+        results = {key: entry.value for key, entry in entries.items() if entry.is_fresh(now)}
+        missing = [key for key in keys if key not in results]
+        if not missing:
+            return results
+
+        def ttl_for(value: Any) -> int:
+            if isinstance(value, CachedFailure):
+                return value.ttl_seconds
+            return ttl_seconds(value) if callable(ttl_seconds) else ttl_seconds
+
+        def fill(targets: List[str]) -> None:
+            fetched = fetch_many(targets) if targets else {}
+            fetched = {key: self._count_failure(value, entries.get(key)) for key, value in fetched.items()}
+            self.set_many(fetched, {key: ttl_for(value) for key, value in fetched.items()})
+            results.update(fetched)
+
+        tokens = self.acquire_locks(missing)
+        owned = [key for key in missing if tokens[key] is not None]
+        try:
+            fill(owned)
+        finally:
+            self.release_locks({key: tokens[key] for key in owned})
+
+        deadline = time.monotonic() + wait_timeout
+        unfilled = []
+        for key in missing:
+            if tokens[key] is not None:
+                continue  # 직접 조회한 키 (fetch_many가 돌려주지 않았으면 그대로 미스)
+            value = self.wait_for(key, deadline - time.monotonic())
+            if value is not None:
+                results[key] = value
+            else:
+                unfilled.append(key)
+        if unfilled:
+            # 계산 중이던 쪽이 실패했거나 너무 오래 걸림 → 직접 조회
+            fill(unfilled)
+        return results
+
+    def get_or_set(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        ttl_seconds: int = 300,
+        stale_ttl: int = 0,
+        wait_timeout: float = LOCK_LEASE_SECONDS,
+        expire_at: Optional[datetime] = None,
+    ) -> Any:
+        """캐시 조회 또는 새로 생성 (expire_at을 주면 ttl_seconds 대신 그 시각에 만료).
+
+        - 미스: 키별 분산 락을 잡은 요청 하나만 계산하고, 나머지는 값이 저장될 때까지 기다린다 (single-flight).
+        - 히트: 만료가 가까우면 확률적으로 한 요청이 미리 다시 계산한다.
+        - stale_ttl > 0: 만료 후 stale_ttl 동안은 이전 값을 바로 돌려주고 백그라운드에서 갱신한다.
+        - fetch_func가 CachedFailure를 돌려주면 백오프 TTL로 저장하고, 만료 전까지는 다시 조회하지 않는다.
+          만료된 실패 항목은 stale로 돌려주지 않는다.
+        """
+        ttl_seconds = self._ttl_until(expire_at, ttl_seconds)
+        entry = self.get_entry(key)
+        if entry is not None:
+            if entry.is_fresh():
+                logger.debug(f"Cache hit: {key}")
+                if not entry.is_failure and entry.should_refresh_early():
+                    token = self.acquire_lock(key)
+                    if token is not None:
+                        logger.debug(f"Early refresh: {key}")
+                        return self._compute_and_set(key, fetch_func, ttl_seconds, stale_ttl, token)
+                return entry.value
+            if stale_ttl > 0 and not entry.is_failure:
+                logger.debug(f"Cache stale hit (revalidating): {key}")
+                token = self.acquire_lock(key)
+                if token is not None:
+                    threading.Thread(
+                        target=self._revalidate,
+                        args=(key, fetch_func, ttl_seconds, stale_ttl, token),
+                        daemon=True,
+                    ).start()
+                return entry.value
+
+        logger.debug(f"Cache miss: {key}")
+        deadline = time.monotonic() + wait_timeout
+        while True:
+            token = self.acquire_lock(key)
+            if token is not None:
+                return self._compute_and_set(key, fetch_func, ttl_seconds, stale_ttl, token, previous=entry)
+            cached = self.wait_for(key, deadline - time.monotonic())
+            if cached is not None:
+                return cached
+            if time.monotonic() >= deadline:
+                # 계산 중인 쪽이 너무 오래 걸리면 직접 계산 (락 없이)
+                logger.warning(f"Timed out waiting for cache fill, computing directly: {key}")
+                return self._compute_and_set(key, fetch_func, ttl_seconds, stale_ttl, None, previous=entry)
+            # 락은 풀렸는데 값이 없음 (계산 실패) → 락 재시도
+
+    async def get_or_set_async(
+        self,
+        key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        ttl_seconds: int = 300,
+        wait_timeout: float = LOCK_LEASE_SECONDS,
+        expire_at: Optional[datetime] = None,
+    ) -> Any:
+        """get_or_set의 비동기 버전 (fetch_func는 코루틴 함수).
+
+        Redis 호출은 asyncio.to_thread로 돌려 이벤트 루프를 막지 않는다. single-flight, 조기 갱신,
+        CachedFailure 음성 캐시는 get_or_set과 같다 (stale 재검증은 없음).
+        """
+        ttl_seconds = self._ttl_until(expire_at, ttl_seconds)
+        entry = await asyncio.to_thread(self.get_entry, key)
+        if entry is not None and entry.is_fresh():
             logger.debug(f"Cache hit: {key}")
-            return cached
+            if not entry.is_failure and entry.should_refresh_early():
+                token = await asyncio.to_thread(self.acquire_lock, key)
+                if token is not None:
+                    logger.debug(f"Early refresh: {key}")
+                    return await self._compute_and_set_async(key, fetch_func, ttl_seconds, token)
+            return entry.value
 
         logger.debug(f"Cache miss: {key}")
-        fresh_data = fetch_func()
-        self.set(key, fresh_data, ttl_seconds)
-        return fresh_data
+        deadline = time.monotonic() + wait_timeout
+        while True:
+            token = await asyncio.to_thread(self.acquire_lock, key)
+            if token is not None:
+                return await self._compute_and_set_async(key, fetch_func, ttl_seconds, token, previous=entry)
+            cached = await self.wait_for_async(key, deadline - time.monotonic())
+            if cached is not None:
+                return cached
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for cache fill, computing directly: {key}")
+                return await self._compute_and_set_async(key, fetch_func, ttl_seconds, None, previous=entry)
+
+    # ---- 분산 락 (single-flight) ----
+
+    def acquire_lock(self, key: str, lease_seconds: int = LOCK_LEASE_SECONDS) -> Optional[str]:
+        """키별 계산 락. 잡으면 해제용 토큰, 이미 다른 요청이 잡고 있으면 None.
+
+        Redis 장애 시에는 락 없이 진행하도록 빈 토큰("")을 돌려준다.
+        """
+        token = uuid.uuid4().hex
+        try:
+            if self.client.set(self._lock_key(key), token, nx=True, ex=lease_seconds):
+                return token
+            return None
+        except Exception as e:
+            logger.warning(f"Cache lock error for key {key} (continuing without lock): {e}")
+            return ""
+
+    def release_lock(self, key: str, token: Optional[str]) -> None:
+        if not token:
+            return
+        try:
+            self.client.eval(RELEASE_LOCK_SCRIPT, 1, self._lock_key(key), token)
+        except Exception as e:
+            logger.warning(f"Cache unlock error for key {key}: {e}")
+
+    def wait_for(self, key: str, timeout: float) -> Optional[Any]:
+        """다른 요청이 계산 중인 값을 기다린다. 값이 생기면 반환, 락이 풀렸는데 값이 없거나 시간 초과면 None."""
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            try:
+                locked = self.client.exists(self._lock_key(key))
+            except Exception:
+                locked = False
+            if not locked or time.monotonic() >= deadline:
+                return None
+            time.sleep(LOCK_POLL_SECONDS)
+
+    async def wait_for_async(self, key: str, timeout: float) -> Optional[Any]:
+        """wait_for의 비동기 버전 (폴링 사이에 이벤트 루프를 막지 않음)"""
+        deadline = time.monotonic() + max(0.0, timeout)
+        while True:
+            cached = await asyncio.to_thread(self.get, key)
+            if cached is not None:
+                return cached
+            try:
+                locked = await asyncio.to_thread(self.client.exists, self._lock_key(key))
+            except Exception:
+                locked = False
+            if not locked or time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+
+    def acquire_locks(self, keys: List[str], lease_seconds: int = LOCK_LEASE_SECONDS) -> Dict[str, Optional[str]]:
+        """acquire_lock의 여러 키 버전 (파이프라인 한 번)"""
+        tokens = {key: uuid.uuid4().hex for key in keys}
+        if not keys:
+            return {}
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, token in tokens.items():
+                pipe.set(self._lock_key(key), token, nx=True, ex=lease_seconds)
+            acquired = pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache lock error for {len(keys)} keys (continuing without lock): {e}")
+            return {key: "" for key in keys}
+        return {key: token if ok else None for (key, token), ok in zip(tokens.items(), acquired)}
+
+    def release_locks(self, tokens: Dict[str, Optional[str]]) -> None:
+        held = {key: token for key, token in tokens.items() if token}
+        if not held:
+            return
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, token in held.items():
+                pipe.eval(RELEASE_LOCK_SCRIPT, 1, self._lock_key(key), token)
+            pipe.execute()
+        except Exception as e:
+            logger.warning(f"Cache unlock error for {len(held)} keys: {e}")
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"lock:{key}"
+
+    def _compute_and_set(
+        self,
+        key: str,
+        fetch_func: Callable[[], Any],
+        ttl_seconds: int,
+        stale_ttl: int,
+        token: Optional[str],
+        previous: Optional[CacheEntry] = None,
+    ) -> Any:
+        try:
+            started = time.monotonic()
+            fresh_data = self._count_failure(fetch_func(), previous)
+            self.set(key, fresh_data, ttl_seconds, stale_ttl=stale_ttl, compute_seconds=time.monotonic() - started)
+            return fresh_data
+        finally:
+            self.release_lock(key, token)
+
+    async def _compute_and_set_async(
+        self,
+        key: str,
+        fetch_func: Callable[[], Awaitable[Any]],
+        ttl_seconds: int,
+        token: Optional[str],
+        previous: Optional[CacheEntry] = None,
+    ) -> Any:
+        try:
+            started = time.monotonic()
+            fresh_data = self._count_failure(await fetch_func(), previous)
+            compute_seconds = time.monotonic() - started
+            await asyncio.to_thread(self.set, key, fresh_data, ttl_seconds, compute_seconds=compute_seconds)
+            return fresh_data
+        finally:
+            await asyncio.to_thread(self.release_lock, key, token)
+
+    def _revalidate(self, key: str, fetch_func: Callable[[], Any], ttl_seconds: int, stale_ttl: int, token: str) -> None:
+        try:
+            self._compute_and_set(key, fetch_func, ttl_seconds, stale_ttl, token)
+        except Exception as e:
+            logger.warning(f"Background cache refresh failed for key {key}: {e}")
+
+    @staticmethod
+    def _count_failure(value: Any, previous: Optional[CacheEntry]) -> Any:
+        """직전 항목도 실패였으면 연속 실패 횟수를 이어서 센다 (성공하면 저장과 함께 초기화)"""
+        if isinstance(value, CachedFailure) and previous is not None and previous.is_failure:
+            return replace(value, failures=previous.value.failures + 1)
+        return value
+
+    @staticmethod
+    def _ttl_until(expire_at: Optional[datetime], default: int) -> int:
+        """expire_at(tz-aware)까지 남은 초 (최소 1초). expire_at이 없으면 default."""
+        if expire_at is None:
+            return default
+        return max(1, math.ceil(expire_at.timestamp() - time.time()))
+
+    @staticmethod
+    def _effective_ttls(value: Any, ttl_seconds: int, stale_ttl: int) -> Tuple[int, int]:
+        """(논리 TTL, stale 구간). 실패 항목은 백오프 TTL + 연속 실패 횟수를 기억할 만큼의 stale 구간."""
+        if isinstance(value, CachedFailure):
+            return value.ttl_seconds, NEGATIVE_MEMORY_SECONDS
+        return ttl_seconds, stale_ttl
 
     def clear_pattern(self, pattern: str) -> int:
-        """패턴에 맞는 모든 키 삭제"""
+        """패턴에 맞는 모든 키 삭제 (SCAN + 배치 UNLINK — KEYS처럼 Redis를 멈추지 않음)"""
+        self._local().delete_pattern(pattern)
         try:
-            keys = self.client.keys(pattern)
-            if keys:
-                return self.client.delete(*keys)
-            return 0
+            result = scan_unlink(self.client, pattern)
+            self._publish_invalidation("p", pattern)
+            logger.info(f"Cache cleared {pattern}: {result.as_dict()}")
+            return result.deleted
         except Exception as e:
             logger.warning(f"Cache clear pattern error for {pattern}: {e}")
             return 0
 
+    @staticmethod
+    def _remember(local: LocalCache, key: str, entry: CacheEntry, data: bytes) -> None:
+        """만료 전 항목만 L1에 (L1_TTL 이내로).
+
+        DataFrame/Series/ndarray는 디코딩한 값의 복사본(크기는 메모리 사용량)을, 그 외 값은 인코딩 바이트를 보관한다.
+        프레임은 복사(memcpy)가 디코딩(압축 해제 + 버퍼 복사 + 프레임 조립)보다 수십 배 싸고,
+        dict/list는 msgpack 디코딩이 copy.deepcopy보다 싸기 때문이다 (_recall에서 각각 복사/디코딩).
+        """
+        if not entry.is_fresh():
+            return
+        expires_at = min(entry.expires_at, time.time() + L1_TTL)
+        value = entry.value
+        if isinstance(value, np.ndarray):
+            local.set(key, replace(entry, value=value.copy()), expires_at, value.nbytes)
+        elif isinstance(value, COPYABLE_TYPES):
+            nbytes = int(np.sum(value.memory_usage(index=True)))
+            local.set(key, replace(entry, value=value.copy()), expires_at, nbytes)
+        else:
+            local.set(key, data, expires_at, len(data))
+
+    @classmethod
+    def _recall(cls, local: LocalCache, key: str) -> Optional[CacheEntry]:
+        """L1 적중 시 매번 새 값 객체를 만든다 (호출부가 값을 수정해도 L1과 다른 호출부에 영향 없음)"""
+        item = local.get(key)
+        if item is None:
+            return None
+        if isinstance(item, CacheEntry):
+            return replace(item, value=item.value.copy())
+        try:
+            return cls._decode_entry(item)
+        except Exception as e:
+            logger.warning(f"Cache L1 decode error for key {key}: {e}")
+            local.delete(key)
+            return None
+
+    def _local(self) -> LocalCache:
+        """현재 프로세스의 L1 (무효화 구독이 켜져 있으면 구독 스레드도 이 프로세스에서 실행 중인지 보장)"""
+        if L1_INVALIDATION:
+            _start_invalidation_listener(self.client)
+        return get_local_cache()
+
+    def _publish_invalidation(self, kind: str, key: str, pipe: Any = None) -> None:
+        """다른 프로세스의 L1에서 key(kind="k") 또는 패턴(kind="p")을 지우도록 알림"""
+        if not L1_INVALIDATION:
+            return
+        (pipe or self.client).publish(INVALIDATION_CHANNEL, f"{_listener_origin}|{kind}|{key}")
+
     def get_ttl(self, key: str) -> int:
-        """키의 남은 TTL 조회 (초 단위)"""
+        """키의 남은 TTL 조회 (초 단위, stale 구간 포함)"""
         try:
             return self.client.ttl(key)
         except Exception as e:
@@ -0,0 +1,235 @@
+# clients/cache_codec.py
+"""CacheClient 저장 포맷 (pickle 대신 값 종류별 코덱 + 선택적 압축).
+
+- 헤더: 매직(b"PC") + 버전 + 코덱 태그 + 압축 태그 + 논리 만료 시각 + 계산 시간. 읽을 때 태그로 바로 디코딩.
+- 코덱: DataFrame → NumPy 버퍼(읽기는 버퍼 영역 한 번 복사 후 np.frombuffer 뷰),
+  dict/list/스칼라 → msgpack(ormsgpack), 그 외(또는 위 코덱으로 표현할 수 없는 값) → pickle.
+  msgpack은 튜플을 리스트로 복원한다. 날짜/numpy/비문자열 키 등 타입이 바뀌는 값은 pickle로 저장.
+- 압축: 페이로드가 CACHE_COMPRESS_THRESHOLD 바이트 이상이면 zstandard로 압축한다.
+- 헤더가 없는 값(코덱 도입 전 pickle)은 is_encoded()가 False — 호출부가 pickle로 읽는다.
+"""
+import os
+import pickle
+import struct
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import ormsgpack
+import pandas as pd
+import zstandard
+
+MAGIC = b"PC"
+VERSION = 1
+HEADER = struct.Struct("<2sBBBdd")  # 매직, 버전, 코덱, 압축, expires_at, compute_seconds
+
+CODEC_PICKLE = 0
+CODEC_MSGPACK = 1
+CODEC_FRAME = 2
+
+COMPRESS_NONE = 0
+COMPRESS_ZSTD = 1
+
+COMPRESS_THRESHOLD = int(os.getenv("CACHE_COMPRESS_THRESHOLD", str(16 * 1024)))  # 이보다 작은 값은 압축하지 않음
+ZSTD_LEVEL = 3
+
+MSGPACK_OPTIONS = ormsgpack.OPT_PASSTHROUGH_DATETIME | ormsgpack.OPT_PASSTHROUGH_SUBCLASS
+_FRAME_META_LENGTH = struct.Struct("<I")
+_ALIGN = 8  # 버퍼 시작 위치 정렬 (np.frombuffer 성능)
+_BUFFER_KINDS = "biufcmM"  # 원시 버퍼로 저장하는 dtype 종류 (bool/정수/실수/복소수/시간)
+
+
+class UnsupportedValue(TypeError):
+    """코덱이 값의 타입을 그대로 보존할 수 없음 (다음 코덱으로)"""
+
+
+def _reject(value: Any) -> Any:
+    raise UnsupportedValue(type(value).__name__)
+
+
+# ---- 코덱 ----
+
+
+def _encode_msgpack(value: Any) -> bytes:
+    try:
+        return ormsgpack.packb(value, default=_reject, option=MSGPACK_OPTIONS)
+    except (ormsgpack.MsgpackEncodeError, UnsupportedValue) as e:
+        raise UnsupportedValue(str(e)) from e
+
+
+def _decode_msgpack(payload: memoryview) -> Any:
+    return ormsgpack.unpackb(payload)
+
+
+def _encode_frame(frame: pd.DataFrame) -> bytes:
+    """DataFrame → [메타 길이][메타(msgpack)][정렬된 버퍼...]
+
+    같은 dtype 컬럼들은 2차원 블록 하나로 저장하고 (디코딩 시 블록의 행을 컬럼 뷰로 사용),
+    문자열 등 object 컬럼은 msgpack으로 저장한다.
+    """
+    if not frame.columns.is_unique or not all(isinstance(c, str) for c in frame.columns):
+        raise UnsupportedValue("frame columns must be unique strings")
+
+    buffers: List[bytes] = []
+    offset = 0
+
+    def add_buffer(array: np.ndarray) -> Dict[str, Any]:
+        nonlocal offset
+        data = np.ascontiguousarray(array).tobytes()
+        pad = -offset % _ALIGN
+        if pad:
+            buffers.append(b"\0" * pad)
+            offset += pad
+        entry = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset, "length": len(data)}
+        buffers.append(data)
+        offset += len(data)
+        return entry
+
+    def add_values(values: Any) -> Dict[str, Any]:
+        if isinstance(values, np.ndarray) and values.dtype.kind in _BUFFER_KINDS:
+            return add_buffer(values)
+        if isinstance(values, np.ndarray) and values.dtype.kind == "O":
+            return {"objects": _encode_msgpack(values.tolist())}
+        raise UnsupportedValue(f"unsupported dtype {getattr(values, 'dtype', type(values))}")
+
+    index = frame.index
+    if isinstance(index, pd.RangeIndex):
+        index_meta: Dict[str, Any] = {"range": [index.start, index.stop, index.step]}
+    elif isinstance(index, pd.DatetimeIndex):
+        tz = str(index.tz) if index.tz is not None else None
+        values = index.tz_convert("UTC").tz_localize(None) if tz else index
+        index_meta = {"datetime": add_buffer(values.values), "tz": tz, "freq": index.freqstr}
+    elif isinstance(index, pd.MultiIndex):
+        raise UnsupportedValue("MultiIndex")
+    else:
+        index_meta = {"values": add_values(index.to_numpy())}
+    index_meta["name"] = index.name
+
+    groups: Dict[np.dtype, List[str]] = {}
+    objects = []
+    for name, dtype in frame.dtypes.items():
+        if not isinstance(dtype, np.dtype):
+            raise UnsupportedValue(f"extension dtype {dtype}")
+        if dtype.kind in _BUFFER_KINDS:
+            groups.setdefault(dtype, []).append(name)
+        else:
+            objects.append([name, add_values(frame[name].to_numpy())])
+    blocks = [[names, add_buffer(frame[names].to_numpy().T)] for names in groups.values()]
+
+    meta = _encode_msgpack(
+        {
+            "index": index_meta,
+            "columns": list(frame.columns),
+            "columns_name": frame.columns.name,
+            "blocks": blocks,
+            "objects": objects,
+        }
+    )
+    return b"".join([_FRAME_META_LENGTH.pack(len(meta)), meta, *buffers])
+
+
+def _decode_frame(payload: memoryview) -> pd.DataFrame:
+    (meta_length,) = _FRAME_META_LENGTH.unpack_from(payload)
+    start = _FRAME_META_LENGTH.size
+    meta = ormsgpack.unpackb(payload[start : start + meta_length])
+    # 버퍼 영역만 한 번 복사해 쓰기 가능한 배열로 만든다 (이후 배열들은 이 복사본의 뷰)
+    body = memoryview(bytearray(payload[start + meta_length :]))
+
+    def values_of(entry: Dict[str, Any]) -> np.ndarray:
+        if "objects" in entry:
+            return np.array(ormsgpack.unpackb(entry["objects"]), dtype=object)
+        array = np.frombuffer(body[entry["offset"] : entry["offset"] + entry["length"]], dtype=np.dtype(entry["dtype"]))
+        return array.reshape(entry["shape"])
+
+    index_meta = meta["index"]
+    if "range" in index_meta:
+        index = pd.RangeIndex(*index_meta["range"], name=index_meta["name"])
+    elif "datetime" in index_meta:
+        index = pd.DatetimeIndex(values_of(index_meta["datetime"]), name=index_meta["name"])
+        if index_meta["tz"]:
+            index = index.tz_localize("UTC").tz_convert(index_meta["tz"])
+        if index_meta["freq"]:
+            index.freq = index_meta["freq"]
+    else:
+        index = pd.Index(values_of(index_meta["values"]), name=index_meta["name"])
+
+    columns: Dict[str, np.ndarray] = {}
+    for names, entry in meta["blocks"]:
+        columns.update(zip(names, values_of(entry)))  # 블록의 행 = 컬럼 (복사 없는 뷰)
+    for name, entry in meta["objects"]:
+        columns[name] = values_of(entry)
+    if meta["columns"]:
+        frame = pd.DataFrame({name: columns[name] for name in meta["columns"]}, index=index, copy=False)
+    else:
+        frame = pd.DataFrame(index=index)
+    frame.columns.name = meta["columns_name"]
+    return frame
+
+
+def _encode_pickle(value: Any) -> bytes:
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_pickle(payload: memoryview) -> Any:
+    return pickle.loads(payload)
+
+
+# 코덱 태그 → 디코더
+DECODERS = {
+    CODEC_PICKLE: _decode_pickle,
+    CODEC_MSGPACK: _decode_msgpack,
+    CODEC_FRAME: _decode_frame,
+}
+
+
+def _encode_value(value: Any) -> Tuple[int, bytes]:
+    """값 종류에 맞는 코덱으로 인코딩. 표현할 수 없으면 pickle."""
+    try:
+        if isinstance(value, pd.DataFrame):
+            return CODEC_FRAME, _encode_frame(value)
+        if value is None or isinstance(value, (dict, list, tuple, str, int, float, bool)):
+            return CODEC_MSGPACK, _encode_msgpack(value)
+    except UnsupportedValue:
+        pass
+    return CODEC_PICKLE, _encode_pickle(value)
+
+
+# ---- 압축 ----
+
+
+def _compress(payload: bytes) -> Tuple[int, bytes]:
+    if len(payload) < COMPRESS_THRESHOLD:
+        return COMPRESS_NONE, payload
+    return COMPRESS_ZSTD, zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload)
+
+
+def _decompress(compression: int, payload: memoryview) -> memoryview:
+    if compression == COMPRESS_NONE:
+        return payload
+    if compression == COMPRESS_ZSTD:
+        return memoryview(zstandard.ZstdDecompressor().decompress(payload))
+    raise ValueError(f"Unknown cache compression tag: {compression}")
+
+
+# ---- 공개 함수 ----
+
+
+def encode(value: Any, expires_at: float, compute_seconds: float = 0.0) -> bytes:
+    codec, payload = _encode_value(value)
+    compression, payload = _compress(payload)
+    return HEADER.pack(MAGIC, VERSION, codec, compression, expires_at, compute_seconds) + payload
+
+
+def is_encoded(data: bytes) -> bool:
+    return data[:2] == MAGIC
+
+
+def decode(data: bytes) -> Tuple[Any, float, float]:
+    """encode()의 역: (값, expires_at, compute_seconds)"""
+    magic, version, codec, compression, expires_at, compute_seconds = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Unsupported cache value format (version {version})")
+    decoder = DECODERS.get(codec)
+    if decoder is None:
+        raise ValueError(f"Unknown cache codec tag: {codec}")
+    payload = _decompress(compression, memoryview(data)[HEADER.size :])
+    return decoder(payload), expires_at, compute_seconds
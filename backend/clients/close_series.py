@@ -0,0 +1,111 @@
+# clients/close_series.py
+"""날짜순 종가 시계열: 정렬된 날짜 서수(int64)와 종가(float64) 배열 한 쌍.
+
+date→종가 dict는 "target 당일 또는 이후 첫 거래일 종가"를 물을 때마다 정렬이 필요하다.
+한 번 정렬해 배열로 들고 있으면 조회는 이진 탐색(np.searchsorted)이고, 여러 날짜도 한 번에 찾는다.
+
+- on_or_after(target) / on_or_after_many(targets): target 당일 또는 이후 첫 종가 (없으면 None / NaN)
+- until(session): session 이하 봉만 (장중 미완성 봉 제거)
+- 빈 시계열은 거짓(falsy) — 기존 빈 dict 검사와 같게 쓸 수 있다.
+"""
+from datetime import date
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+
+class CloseSeries:
+    """정렬된 날짜 서수 + 종가 배열. 생성 후 바뀌지 않는다."""
+
+    __slots__ = ("ordinals", "values")
+
+    def __init__(self, ordinals: np.ndarray, values: np.ndarray):
+        self.ordinals = ordinals
+        self.values = values
+
+    @classmethod
+    def empty(cls) -> "CloseSeries":
+        return cls(np.empty(0, dtype="i8"), np.empty(0, dtype="f8"))
+
+    @classmethod
+    def from_mapping(cls, closes_by_date: Mapping[date, float]) -> "CloseSeries":
+        """date→종가 dict → 시계열 (날짜순 정렬)"""
+        if not closes_by_date:
+            return cls.empty()
+        ordinals = np.fromiter((d.toordinal() for d in closes_by_date), dtype="i8", count=len(closes_by_date))
+        values = np.fromiter(closes_by_date.values(), dtype="f8", count=len(closes_by_date))
+        order = np.argsort(ordinals, kind="stable")
+        return cls(ordinals[order], values[order])
+
+    @classmethod
+    def from_history(cls, history: Optional[pd.DataFrame], field: str = "Close") -> "CloseSeries":
+        """yfinance history(DatetimeIndex) → 시계열. 같은 날짜가 여러 번이면 마지막 값."""
+        if history is None or history.empty or field not in history:
+            return cls.empty()
+        closes = history[field]
+        if not closes.index.is_monotonic_increasing:
+            closes = closes.sort_index()
+        ordinals = np.fromiter((ts.toordinal() for ts in closes.index), dtype="i8", count=len(closes))
+        values = closes.to_numpy(dtype="f8", na_value=np.nan)
+        if len(ordinals) > 1 and not (np.diff(ordinals) > 0).all():
+            # 마지막 값 유지 (dict 변환과 같은 결과)
+            keep = np.append(ordinals[1:] != ordinals[:-1], True)
+            ordinals, values = ordinals[keep], values[keep]
+        return cls(ordinals, values)
+
+    @classmethod
+    def coerce(cls, closes: Union["CloseSeries", Mapping[date, float], None]) -> "CloseSeries":
+        """CloseSeries는 그대로, dict는 변환, None은 빈 시계열"""
+        if isinstance(closes, CloseSeries):
+            return closes
+        return cls.from_mapping(closes or {})
+
+    # ---- 조회 ----
+
+    def on_or_after(self, target: date) -> Optional[float]:
+        """target 당일 또는 그 이후 첫 거래일의 종가 (휴장일 보정). 데이터 밖이면 None."""
+        i = int(np.searchsorted(self.ordinals, target.toordinal(), side="left"))
+        return float(self.values[i]) if i < len(self.ordinals) else None
+
+    def on_or_after_many(self, targets: Iterable[date]) -> np.ndarray:
+        """여러 target의 on_or_after를 한 번에 (데이터 밖은 NaN)"""
+        wanted = np.fromiter((d.toordinal() for d in targets), dtype="i8")
+        idx = np.searchsorted(self.ordinals, wanted, side="left")
+        found = idx < len(self.ordinals)
+        result = np.full(len(wanted), np.nan)
+        result[found] = self.values[idx[found]]
+        return result
+
+    def until(self, session: date) -> "CloseSeries":
+        """session 이하 봉만 남긴 시계열 (배열은 복사하지 않는다)"""
+        end = int(np.searchsorted(self.ordinals, session.toordinal(), side="right"))
+        if end == len(self.ordinals):
+            return self
+        return CloseSeries(self.ordinals[:end], self.values[:end])
+
+    def dates(self) -> List[date]:
+        return [date.fromordinal(int(o)) for o in self.ordinals]
+
+    def items(self) -> Iterator[Tuple[date, float]]:
+        return zip(self.dates(), self.values.tolist())
+
+    def to_dict(self) -> Dict[date, float]:
+        return dict(self.items())
+
+    @property
+    def first_date(self) -> Optional[date]:
+        return date.fromordinal(int(self.ordinals[0])) if len(self.ordinals) else None
+
+    @property
+    def last_date(self) -> Optional[date]:
+        return date.fromordinal(int(self.ordinals[-1])) if len(self.ordinals) else None
+
+    def __len__(self) -> int:
+        return len(self.ordinals)
+
+    def __bool__(self) -> bool:
+        return len(self.ordinals) > 0
+
+    def __repr__(self) -> str:
+        return f"CloseSeries({len(self)} bars, {self.first_date}..{self.last_date})"
@@ -4,15 +4,56 @@ import logging
 import markdown
 import weasyprint
 import base64
+import requests
 from datetime import datetime
+from resend.http_client import HTTPClient
+from clients.http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
+_session_client_installed = False
+
+
+class SessionHTTPClient(HTTPClient):
+    """resend 요청을 공유 연결 풀(get_http_session)로 보내는 HTTP 클라이언트.
+
+    resend의 공개 인터페이스(resend.http_client.HTTPClient)를 구현한다 — uv.lock 고정 버전(2.13.1)부터 제공.
+    """
+
+    def __init__(self, timeout: int = 30):
+        self._timeout = timeout
+
+    def request(self, method, url, headers, json=None, files=None, data=None):
+        try:
+            resp = get_http_session().request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json if files is None and data is None else None,
+                files=files,
+                data=data,
+                timeout=self._timeout,
+            )
+            return resp.content, resp.status_code, resp.headers
+        except requests.RequestException as e:
+            # resend가 HttpClientError로 감싸서 올린다 (기본 RequestsClient와 동일)
+            raise RuntimeError(f"Request failed: {e}") from e
+
+
+def _install_session_http_client() -> None:
+    """resend 기본 HTTP 클라이언트(요청마다 새 연결)를 공유 연결 풀을 쓰는 SessionHTTPClient로 교체"""
+    global _session_client_installed
+    if _session_client_installed:
+        return
+    resend.default_http_client = SessionHTTPClient()
+    _session_client_installed = True
+
 
 class EmailClient:
     def __init__(self):
         self.client = resend
         self.client.api_key = os.getenv("RESEND_API_KEY")
+        _install_session_http_client()
 
     def _markdown_to_html(self, markdown_content: str) -> str:
         """마크다운 텍스트를 HTML로 변환합니다."""
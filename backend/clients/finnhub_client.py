@@ -3,15 +3,23 @@
 
 - FINNHUB_API_KEY 미설정 시 is_available()가 False — 호출부는 기존 경로로 자동 강등.
 - 무료 티어: 60콜/분. 캐싱(Redis)으로 호출 수를 더 줄인다.
+- 모든 워커가 Redis 토큰 버킷(60콜/분)을 공유한다. 토큰이 없으면 기다리고, 우선순위는 시세 > 어닝스 > 뉴스.
+  그래도 429가 오면 버킷을 비우고 Retry-After만큼 쉰 뒤 재시도.
 - 라이선스 주의: 무료 티어는 개인용(personal use). 서비스 과금 시작 전에
   상용 라이선스 협의 필요 (https://finnhub.io/pricing-startups-and-enterprise).
 """
+import asyncio
 import logging
 import os
+import time
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
-import requests
+from clients.async_http import get_async_http_client, provider_semaphore
+from clients.cache_client import CachedFailure
+from clients.http_session import get_http_session
+from clients.market_calendar import bars_expire_at, seconds_until
+from clients.rate_limiter import TokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +27,55 @@ BASE_URL = "https://finnhub.io/api/v1"
 REQUEST_TIMEOUT_SECONDS = 10
 
 NEWS_CACHE_TTL = 3 * 60 * 60  # 뉴스 3시간 (일 1회 파이프라인 기준 충분)
-EARNINGS_CACHE_TTL = 24 * 60 * 60  # 어닝스 캘린더 24시간
+EARNINGS_CACHE_TTL = 24 * 60 * 60  # 어닝스 캘린더 최대 24시간 (실적 발표가 반영되는 다음 마감 + 30분에 먼저 만료)
+
+# 호출량 제한 (모든 워커 공유)
+CALLS_PER_MINUTE = int(os.getenv("FINNHUB_CALLS_PER_MINUTE", "60"))
+PRIORITY_QUOTE = "quote"
+PRIORITY_EARNINGS = "earnings"
+PRIORITY_NEWS = "news"
+# 우선순위별로 남겨둘 토큰 수: 뉴스는 버킷에 15개 이상, 어닝스는 5개 이상 남아 있을 때만 호출
+PRIORITY_RESERVES = {PRIORITY_QUOTE: 0, PRIORITY_EARNINGS: 5, PRIORITY_NEWS: 15}
+MAX_RATE_LIMIT_RETRIES = 3  # 429 응답 재시도 횟수
+MAX_RETRY_AFTER_SECONDS = 60
+
+_rate_limiter: Optional[TokenBucket] = None
+
+
+def get_rate_limiter(cache=None) -> TokenBucket:
+    """프로세스 공용 Finnhub 토큰 버킷. Redis가 있으면 워커 간 공유."""
+    global _rate_limiter
+    if _rate_limiter is None or (_rate_limiter.redis is None and cache is not None):
+        _rate_limiter = TokenBucket(
+            "finnhub",
+            capacity=CALLS_PER_MINUTE,
+            period_seconds=60,
+            reserves=PRIORITY_RESERVES,
+            redis_client=cache.client if cache is not None else None,
+        )
+    return _rate_limiter
+
+
+def _earnings_ttl() -> int:
+    return max(60, min(EARNINGS_CACHE_TTL, seconds_until(bars_expire_at())))
+
+
+def _company_news_key(symbol: str, to_date: date) -> str:
+    return f"finnhub:company_news:{symbol}:{to_date.isoformat()}"
+
+
+def _retry_after_seconds(response, attempt: int) -> float:
+    try:
+        return min(MAX_RETRY_AFTER_SECONDS, float(response.headers.get("Retry-After", "")))
+    except ValueError:
+        return float(2**attempt)
 
 
 class FinnhubClient:
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("FINNHUB_API_KEY", "")
         self.cache = self._init_cache()
+        self.rate_limiter = get_rate_limiter(self.cache)
 
     @staticmethod
     def _init_cache():
@@ -41,6 +91,10 @@ class FinnhubClient:
     def is_available(self) -> bool:
         return bool(self.api_key)
 
+    def get_quota_usage(self) -> Dict[str, Any]:
+        """직전 1분 호출 수 / 대기 횟수 / 쿼터 대비 사용률"""
+        return self.rate_limiter.usage()
+
     # ---- 공개 API ----
 
     def get_market_news(self, category: str = "general", limit: int = 30) -> List[Dict[str, Any]]:
@@ -63,7 +117,39 @@ class FinnhubClient:
             )
             return [self._normalize_article(a) for a in raw[:limit]]
 
-        return self._cached(f"finnhub:company_news:{symbol}:{to_date.isoformat()}", fetch, NEWS_CACHE_TTL)
+        return self._cached(_company_news_key(symbol, to_date), fetch, NEWS_CACHE_TTL)
+
+    def get_company_news_many(
+        self, symbols: List[str], days: int = 7, limit: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 종목 뉴스. 캐시 상태는 한 번에 조회하고 미스 종목만 호출. 실패한 종목은 빈 리스트(짧게 negative 캐시)."""
+        to_date = datetime.now(timezone.utc).date()
+        from_date = to_date - timedelta(days=days)
+        symbol_by_key = {_company_news_key(symbol, to_date): symbol for symbol in symbols}
+
+        def fetch_many(keys: List[str]) -> Dict[str, Any]:
+            fetched = {}
+            for key in keys:
+                symbol = symbol_by_key[key]
+                try:
+                    raw = self._get(
+                        "/company-news",
+                        {"symbol": symbol, "from": from_date.isoformat(), "to": to_date.isoformat()},
+                    )
+                    fetched[key] = [self._normalize_article(a) for a in raw[:limit]]
+                except Exception as e:
+                    logger.warning(f"Failed to fetch company news for {symbol}: {e}")
+                    fetched[key] = CachedFailure(str(e))
+            return fetched
+
+        if self.cache is None:
+            cached = fetch_many(list(symbol_by_key))
+        else:
+            cached = self.cache.get_or_set_many(symbol_by_key, fetch_many, ttl_seconds=NEWS_CACHE_TTL)
+        return {
+            symbol: [] if isinstance(cached.get(key), CachedFailure) else cached.get(key, [])
+            for key, symbol in symbol_by_key.items()
+        }
 
     def get_upcoming_earnings(self, tickers: List[str], days: int = 7) -> Dict[str, str]:
         """티커별 가장 가까운 실적 발표일(YYYY-MM-DD). 향후 days일 내에 없는 티커는 제외."""
@@ -71,45 +157,58 @@ class FinnhubClient:
         to_date = from_date + timedelta(days=days)
 
         def fetch():
-            raw = self._get("/calendar/earnings", {"from": from_date.isoformat(), "to": to_date.isoformat()})
+            raw = self._get(
+                "/calendar/earnings",
+                {"from": from_date.isoformat(), "to": to_date.isoformat()},
+                priority=PRIORITY_EARNINGS,
+            )
             return raw.get("earningsCalendar", [])
 
-        calendar = self._cached(f"finnhub:earnings:{from_date.isoformat()}:{to_date.isoformat()}", fetch, EARNINGS_CACHE_TTL)
-
-        wanted = {t.upper() for t in tickers}
-        upcoming: Dict[str, str] = {}
-        for entry in calendar:
-            symbol = str(entry.get("symbol", "")).upper()
-            event_date = entry.get("date")
-            if symbol in wanted and event_date:
-                if symbol not in upcoming or event_date < upcoming[symbol]:
-                    upcoming[symbol] = event_date
-        return upcoming
+        calendar = self._cached(f"finnhub:earnings:{from_date.isoformat()}:{to_date.isoformat()}", fetch, _earnings_ttl())
+        return self._earliest_by_symbol(calendar, tickers)
 
     def get_quote(self, symbol: str) -> Optional[float]:
         """현재가 (yfinance 실패 시 폴백용). 유효하지 않으면 None."""
-        raw = self._get("/quote", {"symbol": symbol})
+        raw = self._get("/quote", {"symbol": symbol}, priority=PRIORITY_QUOTE)
         price = raw.get("c")
         return float(price) if price and price > 0 else None
 
     # ---- 내부 헬퍼 ----
 
-    def _get(self, path: str, params: Dict[str, Any]) -> Any:
+    def _get(self, path: str, params: Dict[str, Any], priority: str = PRIORITY_NEWS) -> Any:
         if not self.is_available():
             raise RuntimeError("FINNHUB_API_KEY is not configured")
-        response = requests.get(
-            f"{BASE_URL}{path}",
-            params={**params, "token": self.api_key},
-            timeout=REQUEST_TIMEOUT_SECONDS,
-        )
-        response.raise_for_status()
-        return response.json()
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            self.rate_limiter.acquire(priority)
+            response = get_http_session().get(
+                f"{BASE_URL}{path}",
+                params={**params, "token": self.api_key},
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                self.rate_limiter.drain()
+                time.sleep(_retry_after_seconds(response, attempt))
+                continue
+            response.raise_for_status()
+            return response.json()
 
     def _cached(self, key: str, fetch: Callable[[], Any], ttl_seconds: int) -> Any:
         if self.cache is None:
             return fetch()
         return self.cache.get_or_set(key, fetch, ttl_seconds=ttl_seconds)
 
+    @staticmethod
+    def _earliest_by_symbol(calendar: List[Dict[str, Any]], tickers: List[str]) -> Dict[str, str]:
+        wanted = {t.upper() for t in tickers}
+        upcoming: Dict[str, str] = {}
+        for entry in calendar:
+            symbol = str(entry.get("symbol", "")).upper()
+            event_date = entry.get("date")
+            if symbol in wanted and event_date:
+                if symbol not in upcoming or event_date < upcoming[symbol]:
+                    upcoming[symbol] = event_date
+        return upcoming
+
     @staticmethod
     def _normalize_article(article: Dict[str, Any]) -> Dict[str, Any]:
         published = article.get("datetime")
@@ -123,3 +222,137 @@ class FinnhubClient:
             "published_at": published,
             "related": article.get("related", ""),  # 관련 티커 (쉼표 구분)
         }
+
+
+class AsyncFinnhubClient:
+    """FinnhubClient의 비동기 버전. 공유 httpx.AsyncClient + 동시 요청 FINNHUB_MAX_CONCURRENCY개 제한.
+
+    캐시 키/TTL은 FinnhubClient와 같아서 동기/비동기 호출이 같은 캐시를 공유한다.
+    캐시/토큰 버킷의 Redis 호출은 스레드에서 돌린다. 생성자는 Redis 연결 확인(ping)을 하므로
+    이벤트 루프 안에서는 asyncio.to_thread(AsyncFinnhubClient)로 만든다.
+    """
+
+    PROVIDER = "finnhub"
+
+    def __init__(self, api_key: Optional[str] = None):
+        self.api_key = api_key or os.getenv("FINNHUB_API_KEY", "")
+        self.cache = FinnhubClient._init_cache()
+        self.rate_limiter = get_rate_limiter(self.cache)
+
+    def is_available(self) -> bool:
+        return bool(self.api_key)
+
+    # ---- 공개 API ----
+
+    async def get_market_news(self, category: str = "general", limit: int = 30) -> List[Dict[str, Any]]:
+        async def fetch():
+            raw = await self._get("/news", {"category": category})
+            return [FinnhubClient._normalize_article(a) for a in raw[:limit]]
+
+        return await self._cached(f"finnhub:market_news:{category}", fetch, NEWS_CACHE_TTL)
+
+    async def get_company_news(self, symbol: str, days: int = 7, limit: int = 10) -> List[Dict[str, Any]]:
+        to_date = datetime.now(timezone.utc).date()
+        from_date = to_date - timedelta(days=days)
+
+        async def fetch():
+            raw = await self._get(
+                "/company-news",
+                {"symbol": symbol, "from": from_date.isoformat(), "to": to_date.isoformat()},
+            )
+            return [FinnhubClient._normalize_article(a) for a in raw[:limit]]
+
+        return await self._cached(_company_news_key(symbol, to_date), fetch, NEWS_CACHE_TTL)
+
+    async def get_company_news_many(
+        self, symbols: List[str], days: int = 7, limit: int = 10
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """여러 종목 뉴스를 동시에 조회. 캐시는 한 번에 확인하고 미스 종목만 호출. 실패한 종목은 빈 리스트(짧게 negative 캐시)."""
+        to_date = datetime.now(timezone.utc).date()
+        from_date = to_date - timedelta(days=days)
+        keys = {symbol: _company_news_key(symbol, to_date) for symbol in symbols}
+        cached: Dict[str, Any] = {}
+        if self.cache is not None:
+            cached = await asyncio.to_thread(self.cache.get_many, keys.values())
+
+        def fetcher(symbol: str) -> Callable[[], Awaitable[Any]]:
+            async def fetch():
+                try:
+                    raw = await self._get(
+                        "/company-news",
+                        {"symbol": symbol, "from": from_date.isoformat(), "to": to_date.isoformat()},
+                    )
+                    return [FinnhubClient._normalize_article(a) for a in raw[:limit]]
+                except Exception as e:
+                    logger.warning(f"Failed to fetch company news for {symbol}: {e}")
+                    return CachedFailure(str(e))
+
+            return fetch
+
+        missing = [symbol for symbol in symbols if keys[symbol] not in cached]
+        results = await asyncio.gather(
+            *(self._cached(keys[symbol], fetcher(symbol), NEWS_CACHE_TTL) for symbol in missing)
+        )
+        cached.update({keys[symbol]: result for symbol, result in zip(missing, results)})
+        return {
+            symbol: [] if isinstance(cached[keys[symbol]], CachedFailure) else cached[keys[symbol]]
+            for symbol in symbols
+        }
+
+    async def get_upcoming_earnings(self, tickers: List[str], days: int = 7) -> Dict[str, str]:
+        from_date = datetime.now(timezone.utc).date()
+        to_date = from_date + timedelta(days=days)
+
+        async def fetch():
+            raw = await self._get(
+                "/calendar/earnings",
+                {"from": from_date.isoformat(), "to": to_date.isoformat()},
+                priority=PRIORITY_EARNINGS,
+            )
+            return raw.get("earningsCalendar", [])
+
+        calendar = await self._cached(
+            f"finnhub:earnings:{from_date.isoformat()}:{to_date.isoformat()}", fetch, _earnings_ttl()
+        )
+        return FinnhubClient._earliest_by_symbol(calendar, tickers)
+
+    async def get_quote(self, symbol: str) -> Optional[float]:
+        raw = await self._get("/quote", {"symbol": symbol}, priority=PRIORITY_QUOTE)
+        price = raw.get("c")
+        return float(price) if price and price > 0 else None
+
+    async def get_quotes(self, symbols: List[str]) -> Dict[str, float]:
+        """여러 종목 시세를 동시에 조회. 실패/무효 시세는 제외."""
+        results = await asyncio.gather(*(self.get_quote(symbol) for symbol in symbols), return_exceptions=True)
+        quotes = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Finnhub quote failed for {symbol}: {result}")
+            elif result:
+                quotes[symbol] = result
+        return quotes
+
+    # ---- 내부 헬퍼 ----
+
+    async def _get(self, path: str, params: Dict[str, Any], priority: str = PRIORITY_NEWS) -> Any:
+        if not self.is_available():
+            raise RuntimeError("FINNHUB_API_KEY is not configured")
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            await self.rate_limiter.acquire_async(priority)
+            async with provider_semaphore(self.PROVIDER):
+                response = await get_async_http_client().get(
+                    f"{BASE_URL}{path}",
+                    params={**params, "token": self.api_key},
+                    timeout=REQUEST_TIMEOUT_SECONDS,
+                )
+            if response.status_code == 429 and attempt < MAX_RATE_LIMIT_RETRIES:
+                await self.rate_limiter.drain_async()
+                await asyncio.sleep(_retry_after_seconds(response, attempt))
+                continue
+            response.raise_for_status()
+            return response.json()
+
+    async def _cached(self, key: str, fetch: Callable[[], Awaitable[Any]], ttl_seconds: int) -> Any:
+        if self.cache is None:
+            return await fetch()
+        return await self.cache.get_or_set_async(key, fetch, ttl_seconds=ttl_seconds)
@@ -0,0 +1,96 @@
+# clients/http_session.py
+"""동기 REST 클라이언트(Finnhub, Yahoo 검색, 이메일)가 공유하는 requests.Session 연결 풀.
+
+- 프로세스당 세션 1개 (Celery prefork로 fork되면 자식 프로세스에서 새로 만든다).
+- keep-alive로 호스트별 연결을 재사용해 매 호출의 TCP/TLS 핸드셰이크를 없앤다.
+- 연결 오류/5xx는 지수 백오프로 재시도 (GET 계열만, POST는 중복 전송 방지를 위해 연결 단계 오류만).
+  429는 호출부(Finnhub 토큰 버킷)가 직접 처리하므로 재시도 대상에서 제외.
+- 풀 크기: HTTP_POOL_CONNECTIONS(호스트 수), HTTP_POOL_MAXSIZE(호스트당 연결 수).
+- connection_stats()로 호스트별 요청 수 대비 새 연결 수(재사용률)를 확인할 수 있다.
+"""
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+RETRY_TOTAL = int(os.getenv("HTTP_RETRY_TOTAL", "3"))
+RETRY_BACKOFF_FACTOR = 0.5  # 0.5s, 1s, 2s ...
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=RETRY_TOTAL,
+        connect=RETRY_TOTAL,
+        read=RETRY_TOTAL,
+        status=RETRY_TOTAL,
+        backoff_factor=RETRY_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET", "HEAD", "OPTIONS"}),
+        respect_retry_after_header=False,  # True면 Retry-After가 있는 429도 여기서 재시도돼 토큰 버킷을 우회함
+        raise_on_status=False,  # 마지막 응답을 그대로 돌려줘 호출부가 raise_for_status로 처리
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_http_session() -> requests.Session:
+    """현재 프로세스의 공유 세션"""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _lock:
+            if _session is None or _session_pid != pid:
+                _session = _build_session()
+                _session_pid = pid
+    return _session
+
+
+def connection_stats() -> Dict[str, Dict[str, Any]]:
+    """호스트별 연결 재사용 통계: 요청 수, 새로 연 연결 수, 재사용률"""
+    if _session is None or _session_pid != os.getpid():
+        return {}
+    stats: Dict[str, Dict[str, Any]] = {}
+    seen = set()
+    for adapter in _session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_made = pool.num_requests
+            connections = pool.num_connections
+            stats[f"{pool.scheme}://{pool.host}"] = {
+                "requests": requests_made,
+                "connections_opened": connections,
+                "reuse_ratio": 1 - connections / requests_made if requests_made else 0.0,
+            }
+    return stats
+
+
+def close_http_session() -> None:
+    """현재 세션의 연결 풀 정리 (다음 호출 시 새로 생성)"""
+    global _session, _session_pid
+    with _lock:
+        if _session is not None:
+            _session.close()
+        _session = None
+        _session_pid = None
@@ -0,0 +1,111 @@
+# clients/local_cache.py
+"""CacheClient 앞단의 프로세스 내 L1 캐시 (바이트 상한 LRU + TTL).
+
+- 한 파이프라인 실행 안에서 같은 키(SPY history, 티커별 history/info)를 여러 노드가 반복해서 읽을 때
+  Redis 왕복 없이 dict 조회 + 복사/디코딩으로 끝낸다.
+- CacheClient는 DataFrame/Series/ndarray는 디코딩한 값(복사본)을 넣고 적중할 때마다 .copy()로 내주며,
+  그 외 값은 Redis에 저장한 인코딩 바이트(불변)를 넣고 적중할 때마다 디코딩한다 (프레임은 복사가, dict/list는
+  msgpack 디코딩이 더 싸다). 호출부마다 새 객체를 받으므로 한 호출부가 값을 수정해도 다른 호출부에 퍼지지 않는다.
+- 크기는 보관한 형태로 센다 (프레임/배열은 메모리 사용량, 바이트는 길이). 합계가 max_bytes를 넘으면 가장 오래 안 쓴 항목부터 버린다.
+  max_bytes의 1/4을 넘는 값 하나는 L1에 넣지 않는다 (큰 값 하나가 전체를 밀어내지 않도록).
+- 항목 만료: 값의 논리 TTL과 L1 TTL 중 이른 쪽. L1에는 만료 전(fresh) 값만 있다.
+- 프로세스 간 일관성은 CacheClient의 pub/sub 무효화가 맡는다 (꺼져 있으면 L1 TTL만큼 늦게 반영).
+"""
+import fnmatch
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+L1_MAX_BYTES = int(os.getenv("CACHE_L1_MAX_BYTES", str(64 * 1024 * 1024)))  # 0이면 L1 끔
+L1_MAX_ITEM_FRACTION = 4  # 값 하나는 max_bytes / 4까지만
+
+
+class LocalCache:
+    def __init__(self, max_bytes: int = L1_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._items: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()  # 키 → (값, 만료 시각, 바이트)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """만료 전 값이면 반환하고 최근 사용으로 표시, 아니면 None"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            item = self._items.get(key)
+            if item is None or item[1] <= time.time():
+                if item is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def set(self, key: str, value: Any, expires_at: float, nbytes: int) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes // L1_MAX_ITEM_FRACTION or expires_at <= time.time():
+                return
+            self._items[key] = (value, expires_at, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._remove(oldest)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def delete_pattern(self, pattern: str) -> None:
+        """Redis glob 패턴(*, ?, [..])에 맞는 키 삭제"""
+        with self._lock:
+            for key in [k for k in self._items if fnmatch.fnmatchcase(k, pattern)]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "items": len(self._items),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def _remove(self, key: str) -> None:
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._bytes -= item[2]
+
+
+_local_cache: Optional[LocalCache] = None
+_local_cache_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_local_cache() -> LocalCache:
+    """현재 프로세스의 L1 캐시 (fork된 자식 프로세스는 부모의 내용을 물려받지 않고 새로 시작)"""
+    global _local_cache, _local_cache_pid
+    pid = os.getpid()
+    if _local_cache is None or _local_cache_pid != pid:
+        with _lock:
+            if _local_cache is None or _local_cache_pid != pid:
+                _local_cache = LocalCache()
+                _local_cache_pid = pid
+    return _local_cache
@@ -0,0 +1,180 @@
+# clients/market_calendar.py
+"""미국 주식시장(NYSE) 거래 시간 헬퍼 — 시세/가격 캐시 만료 시점 계산용.
+
+- 정규장 09:30~16:00 (America/New_York), 주말과 NYSE 휴장일 휴장, 조기 폐장일은 13:00 마감.
+- 휴장일은 NYSE 규칙으로 계산한다 (토요일 휴일 → 금요일, 일요일 휴일 → 월요일 대체 휴장.
+  단 1월 1일이 토요일이면 전년 12월 31일은 정상 개장).
+- 임시 휴장(국장 등)은 SPECIAL_CLOSURES에 추가한다.
+- 모든 함수는 tz-aware datetime을 받고 돌려준다 (now 미지정 시 현재 UTC).
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import FrozenSet, Optional
+from zoneinfo import ZoneInfo
+
+MARKET_TZ = ZoneInfo("America/New_York")
+MARKET_OPEN = time(9, 30)
+MARKET_CLOSE = time(16, 0)
+EARLY_CLOSE = time(13, 0)  # 독립기념일 전날, 추수감사절 다음 날, 크리스마스이브
+SETTLE_SECONDS = 30 * 60  # 마감 후 일봉(종가)이 확정되기까지 기다리는 시간
+
+SPECIAL_CLOSURES = frozenset({date(2025, 1, 9)})  # 정규 규칙 밖의 임시 휴장 (2025-01-09 카터 전 대통령 국장)
+
+
+def is_trading_day(day: date) -> bool:
+    """정규장이 열리는 날인지 (주말, NYSE 휴장일 제외)"""
+    return day.weekday() < 5 and day not in nyse_holidays(day.year)
+
+
+def session_close(day: date) -> time:
+    """그날의 마감 시각 (조기 폐장일이면 13:00)"""
+    return EARLY_CLOSE if day in nyse_early_closes(day.year) else MARKET_CLOSE
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """지금 정규장 시간인지"""
+    local = _local_now(now)
+    day = local.date()
+    return is_trading_day(day) and MARKET_OPEN <= local.time() < session_close(day)
+
+
+def next_open(now: Optional[datetime] = None) -> datetime:
+    """now 이후(포함하지 않음) 가장 가까운 개장 시각"""
+    return _next_session_time(_local_now(now), lambda day: MARKET_OPEN)
+
+
+def next_close(now: Optional[datetime] = None) -> datetime:
+    """now 이후(포함하지 않음) 가장 가까운 마감 시각 (조기 폐장 반영)"""
+    return _next_session_time(_local_now(now), session_close)
+
+
+def previous_trading_day(day: date) -> date:
+    """day 이전(포함하지 않음) 가장 가까운 거래일"""
+    day -= timedelta(days=1)
+    while not is_trading_day(day):
+        day -= timedelta(days=1)
+    return day
+
+
+def last_settled_session(now: Optional[datetime] = None, settle_seconds: int = SETTLE_SECONDS) -> date:
+    """종가가 확정된 가장 최근 거래일 (오늘 마감 + 확정 대기 전이면 직전 거래일)"""
+    local = _local_now(now)
+    day = local.date()
+    if is_trading_day(day):
+        settled_at = datetime.combine(day, session_close(day), tzinfo=MARKET_TZ) + timedelta(seconds=settle_seconds)
+        if local >= settled_at:
+            return day
+    return previous_trading_day(day)
+
+
+# ---- 캐시 만료 정책 ----
+
+
+def bars_expire_at(now: Optional[datetime] = None, settle_seconds: int = SETTLE_SECONDS) -> datetime:
+    """일봉/종가 기반 값의 만료 시각: 다음 마감 + 확정 대기.
+
+    장중·장 마감 직후에는 오늘 마감 + 대기, 확정 이후/주말/휴장일에는 다음 거래일 마감 + 대기까지
+    그대로 유효하다 (그 사이에는 새 일봉이 생기지 않음).
+    """
+    now = now or datetime.now(timezone.utc)
+    settle = timedelta(seconds=settle_seconds)
+    return next_close(now - settle) + settle
+
+
+def quote_expire_at(now: Optional[datetime] = None, intraday_seconds: int = 60) -> datetime:
+    """현재가의 만료 시각: 장중에는 intraday_seconds 뒤(마감 이후로는 넘기지 않음), 장 밖에서는 다음 개장"""
+    now = now or datetime.now(timezone.utc)
+    if is_market_open(now):
+        return min(now + timedelta(seconds=intraday_seconds), next_close(now))
+    return next_open(now)
+
+
+def seconds_until(moment: datetime, now: Optional[datetime] = None) -> int:
+    """moment까지 남은 초 (지났으면 0)"""
+    now = now or datetime.now(timezone.utc)
+    return max(0, int((moment - now).total_seconds()))
+
+
+# ---- NYSE 휴장일 ----
+
+
+@lru_cache(maxsize=None)
+def nyse_holidays(year: int) -> FrozenSet[date]:
+    """year의 NYSE 정규 휴장일 (대체 휴장 반영) + 임시 휴장"""
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),  # 마틴 루서 킹 데이 (1월 셋째 월)
+        _nth_weekday(year, 2, 0, 3),  # 대통령의 날 (2월 셋째 월)
+        _easter(year) - timedelta(days=2),  # 성금요일
+        _last_weekday(year, 5, 0),  # 메모리얼 데이 (5월 마지막 월)
+        _observed(date(year, 7, 4)),  # 독립기념일
+        _nth_weekday(year, 9, 0, 1),  # 노동절 (9월 첫째 월)
+        _nth_weekday(year, 11, 3, 4),  # 추수감사절 (11월 넷째 목)
+        _observed(date(year, 12, 25)),  # 크리스마스
+    }
+    new_year = date(year, 1, 1)
+    if new_year.weekday() != 5:  # 토요일이면 대체 휴장 없음 (전년 12/31 정상 개장)
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date(year, 6, 19)))  # 준틴스
+    holidays |= {day for day in SPECIAL_CLOSURES if day.year == year}
+    return frozenset(holidays)
+
+
+@lru_cache(maxsize=None)
+def nyse_early_closes(year: int) -> FrozenSet[date]:
+    """year의 13:00 조기 폐장일"""
+    closes = {_nth_weekday(year, 11, 3, 4) + timedelta(days=1)}  # 추수감사절 다음 날
+    july_3 = date(year, 7, 3)
+    if july_3.weekday() < 4:  # 7/4가 화~금이면 전날 조기 폐장 (7/3 금요일은 대체 휴장)
+        closes.add(july_3)
+    christmas_eve = date(year, 12, 24)
+    if christmas_eve.weekday() < 4:  # 12/24 금요일은 대체 휴장
+        closes.add(christmas_eve)
+    return frozenset(closes - nyse_holidays(year))
+
+
+def _observed(day: date) -> date:
+    if day.weekday() == 5:
+        return day - timedelta(days=1)
+    if day.weekday() == 6:
+        return day + timedelta(days=1)
+    return day
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+
+def _last_weekday(year: int, month: int, weekday: int) -> date:
+    last = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+
+def _easter(year: int) -> date:
+    """부활절 (그레고리력, Anonymous Gregorian algorithm)"""
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    f = (b + 8) // 25
+    g = (b - f + 1) // 3
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    l = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 22 * l) // 451
+    month, day = divmod(h + l - 7 * m + 114, 31)
+    return date(year, month, day + 1)
+
+
+def _local_now(now: Optional[datetime]) -> datetime:
+    return (now or datetime.now(timezone.utc)).astimezone(MARKET_TZ)
+
+
+def _next_session_time(local: datetime, at) -> datetime:
+    """local 이후 가장 가까운 거래일의 at(day) 시각"""
+    day = local.date()
+    while True:
+        if is_trading_day(day):
+            candidate = datetime.combine(day, at(day), tzinfo=MARKET_TZ)
+            if candidate > local:
+                return candidate
+        day += timedelta(days=1)
@@ -0,0 +1,58 @@
+# clients/price_matrix.py
+"""여러 티커의 history를 하나의 배열로 쌓아 지표를 한 번에 계산하는 헬퍼.
+
+- stack_field: 티커별 history의 한 컬럼을 (티커 × 봉) 배열로. 최근 봉 기준 오른쪽 정렬, 짧은 티커는 왼쪽이 NaN.
+- atr_pct: 티커 전체의 True Range → 최근 window개 평균 / 마지막 종가를 벡터 연산으로 계산.
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def stack_field(histories: Dict[str, pd.DataFrame], field: str) -> Tuple[List[str], np.ndarray]:
+    """티커별 history의 field 컬럼 → (티커 목록, (티커 수 × 최대 봉 수) float 배열)"""
+    tickers = list(histories)
+    columns = [
+        histories[t][field].to_numpy(dtype="f8", na_value=np.nan)
+        if histories[t] is not None and field in histories[t]
+        else np.empty(0)
+        for t in tickers
+    ]
+    width = max((len(c) for c in columns), default=0)
+    stacked = np.full((len(tickers), width), np.nan)
+    for row, column in enumerate(columns):
+        if len(column):
+            stacked[row, width - len(column) :] = column
+    return tickers, stacked
+
+
+def atr_pct(histories: Dict[str, pd.DataFrame], window: int = 14) -> Dict[str, float]:
+    """티커별 ATR% (최근 window개 True Range 평균 / 마지막 종가).
+
+    - history가 비어 있으면 0.0
+    - 봉 수가 window보다 적으면 NaN (rolling 평균과 동일)
+    """
+    if not histories:
+        return {}
+    tickers, high = stack_field(histories, "High")
+    _, low = stack_field(histories, "Low")
+    _, close = stack_field(histories, "Close")
+
+    prev_close = np.full_like(close, np.nan)
+    prev_close[:, 1:] = close[:, :-1]
+    # 전일 종가가 없는 첫 봉은 High - Low만 사용 (fmax는 NaN을 무시)
+    true_range = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+    if true_range.shape[1] >= window:
+        atr = true_range[:, -window:].mean(axis=1)
+    else:
+        atr = np.full(len(tickers), np.nan)
+    last_close = close[:, -1] if close.shape[1] else np.full(len(tickers), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratios = atr / last_close
+    return {
+        ticker: 0.0 if histories[ticker] is None or histories[ticker].empty else float(ratio)
+        for ticker, ratio in zip(tickers, ratios)
+    }
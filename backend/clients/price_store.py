@@ -0,0 +1,206 @@
+# clients/price_store.py
+"""로컬 OHLCV 가격 저장소 (티커별 memory-mapped .npy 파일).
+
+- PRICE_STORE_DIR 미설정 시 is_available()가 False — StockClient는 기존 Redis 캐시 경로로 강등.
+- 티커당 파일 1개: 날짜 + OHLCV 구조화 배열. read()는 np.load(mmap_mode="r") 슬라이스라 복사가 없다
+  (read_frame()은 DataFrame으로 복사한다).
+- 갱신은 마지막 저장일부터의 봉만 받아 병합한다 (당일 미완성 봉은 다음 갱신 때 덮어씀).
+  쓰기는 임시 파일 → os.replace로 원자적으로 교체하므로, 읽는 쪽은 항상 완성된 파일만 본다.
+  병합(읽기 → 병합 → 봉/메타 쓰기)은 티커별 잠금 파일(.lock)에 flock을 잡고 하므로, 여러 워커 프로세스가
+  같은 티커를 동시에 갱신해도 한쪽 봉이 사라지지 않는다.
+- 사이드카 메타(.meta.json): covered_from(이 날짜 이후는 전부 받아둠), synced_at(마지막 갱신 시각).
+"""
+import fcntl
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BAR_DTYPE = np.dtype(
+    [
+        ("date", "<M8[D]"),
+        ("open", "<f8"),
+        ("high", "<f8"),
+        ("low", "<f8"),
+        ("close", "<f8"),
+        ("volume", "<f8"),
+    ]
+)
+# 저장 필드 → yfinance history 컬럼명
+FRAME_COLUMNS = {"open": "Open", "high": "High", "low": "Low", "close": "Close", "volume": "Volume"}
+
+# yfinance period → 시작일 오프셋 (ytd/max는 period_start_date에서 별도 처리)
+PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+def period_start_date(period: str, today: Optional[date] = None) -> Optional[date]:
+    """yfinance period 문자열을 시작일로 변환. "max"는 None(전체)."""
+    today = today or datetime.now(timezone.utc).date()
+    if period == "max":
+        return None
+    if period == "ytd":
+        return date(today.year, 1, 1)
+    if period not in PERIOD_OFFSETS:
+        raise ValueError(f"Unsupported period: {period}")
+    return (pd.Timestamp(today) - PERIOD_OFFSETS[period]).date()
+
+
+def frame_to_bars(frame: pd.DataFrame) -> np.ndarray:
+    """yfinance history DataFrame → 날짜 오름차순 구조화 배열 (종가가 없는 행 제외)"""
+    if frame is None or frame.empty:
+        return np.empty(0, dtype=BAR_DTYPE)
+    frame = frame.dropna(subset=["Close"])
+    index = pd.DatetimeIndex(frame.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)  # 거래소 현지 날짜 기준
+    bars = np.empty(len(frame), dtype=BAR_DTYPE)
+    bars["date"] = index.normalize().values.astype("datetime64[D]")
+    for field, column in FRAME_COLUMNS.items():
+        bars[field] = frame[column].to_numpy(dtype="f8", na_value=np.nan) if column in frame else np.nan
+    return np.sort(bars, order="date")
+
+
+def bars_to_frame(bars: np.ndarray, tz: Optional[str] = None) -> pd.DataFrame:
+    """구조화 배열 → yfinance history 형태의 DataFrame (Open/High/Low/Close/Volume, DatetimeIndex).
+
+    tz를 주면 인덱스(거래소 현지 날짜)에 그 타임존을 붙인다 (yf.Ticker.history와 같은 tz-aware 인덱스).
+    """
+    index = pd.DatetimeIndex(bars["date"].astype("datetime64[ns]"), name="Date")
+    if tz is not None:
+        index = index.tz_localize(tz)
+    return pd.DataFrame({column: bars[field] for field, column in FRAME_COLUMNS.items()}, index=index)
+
+
+class PriceStore:
+    def __init__(self, root: Optional[str] = None):
+        self.root = root if root is not None else os.getenv("PRICE_STORE_DIR", "")
+        if self.root:
+            os.makedirs(self.root, exist_ok=True)
+
+    def is_available(self) -> bool:
+        return bool(self.root)
+
+    # ---- 읽기 ----
+
+    def read(self, ticker: str, start: Optional[date] = None) -> np.ndarray:
+        """start 이후의 봉 (mmap 슬라이스, 읽기 전용). 저장된 데이터가 없으면 빈 배열."""
+        path = self._path(ticker)
+        if not os.path.exists(path):
+            return np.empty(0, dtype=BAR_DTYPE)
+        try:
+            bars = np.load(path, mmap_mode="r")
+        except Exception as e:
+            logger.warning(f"Corrupted price store file for {ticker} (ignored): {e}")
+            return np.empty(0, dtype=BAR_DTYPE)
+        if start is None or len(bars) == 0:
+            return bars
+        return bars[np.searchsorted(bars["date"], np.datetime64(start, "D"), side="left"):]
+
+    def read_frame(self, ticker: str, start: Optional[date] = None, tz: Optional[str] = None) -> pd.DataFrame:
+        """start 이후의 봉을 yfinance history 형태 DataFrame으로 (tz: 인덱스에 붙일 거래소 타임존).
+
+        mmap 뷰가 아니라 읽을 때마다 새 DataFrame(복사본)을 만든다. 구조화 배열의 필드는 띄엄띄엄 놓인 뷰라
+        pandas가 열을 모으며 어차피 복사하고, 호출부가 프레임을 수정해도 저장 파일·다른 호출부와 무관하다.
+        복사 없이 읽어야 하면 read()의 배열을 쓴다.
+        """
+        return bars_to_frame(self.read(ticker, start), tz)
+
+    def last_date(self, ticker: str) -> Optional[date]:
+        bars = self.read(ticker)
+        return bars["date"][-1].astype(object) if len(bars) else None
+
+    def get_meta(self, ticker: str) -> Dict[str, Any]:
+        try:
+            with open(self._meta_path(ticker), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    # ---- 쓰기 ----
+
+    def merge(self, ticker: str, frame: pd.DataFrame, covered_from: Optional[date] = None) -> int:
+        """새 봉을 병합해 저장한다. 같은 날짜는 새 값으로 덮어쓴다. 저장된 총 봉 수를 반환.
+
+        covered_from: 이번에 받은 데이터가 이 날짜 이후 전 구간을 포함할 때 지정 (전체 조회 시).
+        받은 봉이 없으면(조회 실패/빈 응답) 아무것도 쓰지 않는다 — covered_from/synced_at도 그대로 두어
+        다음 조회 때 다시 받는다.
+        """
+        new_bars = frame_to_bars(frame)
+        if not len(new_bars):
+            return len(self.read(ticker))
+        with self._locked(ticker):
+            return self._merge_bars(ticker, new_bars, covered_from)
+
+    # ---- 내부 헬퍼 ----
+
+    def _merge_bars(self, ticker: str, new_bars: np.ndarray, covered_from: Optional[date]) -> int:
+        """merge의 읽기 → 병합 → 쓰기 (티커 잠금 안에서 호출)"""
+        existing = np.array(self.read(ticker))  # mmap 해제를 위해 복사
+        if len(existing):
+            keep = ~np.isin(existing["date"], new_bars["date"])
+            bars = np.sort(np.concatenate([existing[keep], new_bars]), order="date")
+        else:
+            bars = new_bars
+
+        self._atomic_write(self._path(ticker), lambda f: np.save(f, bars, allow_pickle=False))
+
+        meta = self.get_meta(ticker)
+        if covered_from is not None:
+            previous = meta.get("covered_from")
+            if previous is None or covered_from.isoformat() < previous:
+                meta["covered_from"] = covered_from.isoformat()
+        meta["synced_at"] = datetime.now(timezone.utc).isoformat()
+        self._atomic_write(self._meta_path(ticker), lambda f: f.write(json.dumps(meta).encode("utf-8")))
+        return len(bars)
+
+    @contextmanager
+    def _locked(self, ticker: str) -> Iterator[None]:
+        """티커별 잠금 파일에 배타 flock (다른 프로세스의 병합이 끝날 때까지 대기)"""
+        with open(self._lock_path(ticker), "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _path(self, ticker: str) -> str:
+        return os.path.join(self.root, f"{self._safe_name(ticker)}.npy")
+
+    def _meta_path(self, ticker: str) -> str:
+        return os.path.join(self.root, f"{self._safe_name(ticker)}.meta.json")
+
+    def _lock_path(self, ticker: str) -> str:
+        return os.path.join(self.root, f"{self._safe_name(ticker)}.lock")
+
+    @staticmethod
+    def _safe_name(ticker: str) -> str:
+        return "".join(c if c.isalnum() or c in "-_^." else "_" for c in ticker.upper())
+
+    def _atomic_write(self, path: str, write) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,208 @@
+# clients/rate_limiter.py
+"""외부 API 호출량 제한용 토큰 버킷 (Redis 공유, 우선순위 지원).
+
+- 모든 워커 프로세스가 같은 Redis 키의 버킷을 쓴다 (Lua 스크립트로 원자적 차감, 시각은 Redis TIME 기준).
+- 우선순위: 낮은 우선순위 호출은 상위 우선순위 몫(reserve)을 남겨둔 채로만 토큰을 쓴다.
+  버킷이 바닥나도 높은 우선순위 호출(예: 시세 폴백)이 먼저 토큰을 받는다.
+- 토큰이 없으면 실패하지 않고 다음 토큰이 찰 때까지 기다린다 (max_wait 초과 시 RateLimitTimeout).
+- Redis가 없으면 프로세스 내부 버킷으로 강등 (프로세스 간 공유는 안 됨).
+- 지표: 분 단위 사용/대기 횟수를 Redis에 남기고 usage()로 조회.
+"""
+import asyncio
+import logging
+import math
+import random
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+METRICS_TTL = 60 * 60  # 분 단위 지표 보관 1시간
+HIGH_UTILIZATION = 0.8  # 직전 1분 사용률이 이 값을 넘으면 경고 로그
+
+# KEYS[1]=버킷 키, ARGV=capacity, 초당 충전량, reserve, cost → {허용 여부, 대기 초, 남은 토큰}
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local reserve = tonumber(ARGV[3])
+local cost = tonumber(ARGV[4])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local allowed = 0
+local wait = 0
+if tokens - cost >= reserve then
+    tokens = tokens - cost
+    allowed = 1
+else
+    wait = (reserve + cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) * 2)
+return {allowed, tostring(wait), tostring(tokens)}
+"""
+
+
+# KEYS[1]=버킷 키, ARGV=만료 초 → 토큰을 0으로, ts는 충전 스크립트와 같은 Redis TIME 기준
+DRAIN_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('HSET', KEYS[1], 'tokens', '0', 'ts', tostring(now))
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[1]))
+return 1
+"""
+
+
+class RateLimitTimeout(Exception):
+    """max_wait 안에 토큰을 받지 못함"""
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        name: str,
+        capacity: int,
+        period_seconds: float,
+        reserves: Optional[Dict[str, int]] = None,
+        redis_client: Any = None,
+        max_wait: float = 120.0,
+    ):
+        """
+        Args:
+            name: 버킷 이름 (Redis 키 접두어)
+            capacity: period_seconds 동안 허용하는 호출 수 (= 버킷 크기)
+            reserves: 우선순위별로 남겨둘 토큰 수. 작을수록 우선순위가 높다 (없는 우선순위는 0)
+            redis_client: redis.Redis. None이면 프로세스 내부 버킷
+            max_wait: 토큰 대기 최대 시간 (초)
+        """
+        self.name = name
+        self.capacity = capacity
+        self.rate = capacity / period_seconds
+        self.reserves = reserves or {}
+        self.max_wait = max_wait
+        self.redis = redis_client
+        self._script = redis_client.register_script(TOKEN_BUCKET_SCRIPT) if redis_client is not None else None
+        self._drain_script = redis_client.register_script(DRAIN_SCRIPT) if redis_client is not None else None
+        self._lock = threading.Lock()
+        self._local_tokens = float(capacity)
+        self._local_ts = time.monotonic()
+
+    @property
+    def key(self) -> str:
+        return f"ratelimit:{self.name}"
+
+    # ---- 토큰 획득 ----
+
+    def acquire(self, priority: str) -> None:
+        """토큰 하나를 받을 때까지 대기 (동기)"""
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = self._try_acquire(priority)
+            if wait is None:
+                return
+            time.sleep(self._next_sleep(wait, deadline, priority))
+
+    async def acquire_async(self, priority: str) -> None:
+        """토큰 하나를 받을 때까지 대기 (이벤트 루프를 막지 않음 — Redis 호출은 스레드에서)"""
+        deadline = time.monotonic() + self.max_wait
+        while True:
+            wait = await asyncio.to_thread(self._try_acquire, priority)
+            if wait is None:
+                return
+            await asyncio.sleep(self._next_sleep(wait, deadline, priority))
+
+    def drain(self) -> None:
+        """공급자가 429를 돌려주면 버킷을 비워 모든 프로세스가 잠시 멈추게 한다"""
+        if self._drain_script is not None:
+            try:
+                # 로컬 시계가 아니라 Redis TIME으로 ts를 남긴다 (충전 계산과 같은 시계)
+                self._drain_script(keys=[self.key], args=[math.ceil(self.capacity / self.rate) * 2])
+                return
+            except Exception as e:
+                logger.warning(f"Failed to drain rate limit bucket {self.name}: {e}")
+        with self._lock:
+            self._local_tokens = 0.0
+            self._local_ts = time.monotonic()
+
+    async def drain_async(self) -> None:
+        """drain의 비동기 버전 (이벤트 루프를 막지 않음)"""
+        await asyncio.to_thread(self.drain)
+
+    # ---- 지표 ----
+
+    def usage(self) -> Dict[str, Any]:
+        """직전 1분 사용량/대기 횟수와 쿼터 대비 사용률"""
+        minute = int(time.time() // 60) - 1
+        used, throttled = 0, 0
+        if self.redis is not None:
+            try:
+                used, throttled = (
+                    int(v or 0) for v in self.redis.mget(self._metric_key("used", minute), self._metric_key("throttled", minute))
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read rate limit metrics for {self.name}: {e}")
+        per_minute = self.rate * 60
+        return {
+            "name": self.name,
+            "limit_per_minute": per_minute,
+            "used_last_minute": used,
+            "throttled_last_minute": throttled,
+            "utilization": used / per_minute if per_minute else 0.0,
+        }
+
+    # ---- 내부 헬퍼 ----
+
+    def _try_acquire(self, priority: str) -> Optional[float]:
+        """토큰을 받으면 None, 못 받으면 다시 시도할 때까지의 대기 시간(초)"""
+        reserve = self.reserves.get(priority, 0)
+        allowed, wait = self._take(reserve)
+        self._record("used" if allowed else "throttled")
+        return None if allowed else wait
+
+    def _take(self, reserve: int) -> Tuple[bool, float]:
+        if self._script is not None:
+            try:
+                allowed, wait, _ = self._script(keys=[self.key], args=[self.capacity, self.rate, reserve, 1])
+                return bool(int(allowed)), float(wait)
+            except Exception as e:
+                logger.warning(f"Redis rate limiter unavailable for {self.name} (using local bucket): {e}")
+        return self._take_local(reserve)
+
+    def _take_local(self, reserve: int) -> Tuple[bool, float]:
+        with self._lock:
+            now = time.monotonic()
+            self._local_tokens = min(self.capacity, self._local_tokens + (now - self._local_ts) * self.rate)
+            self._local_ts = now
+            if self._local_tokens - 1 >= reserve:
+                self._local_tokens -= 1
+                return True, 0.0
+            return False, (reserve + 1 - self._local_tokens) / self.rate
+
+    def _next_sleep(self, wait: float, deadline: float, priority: str) -> float:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RateLimitTimeout(f"Rate limit wait exceeded {self.max_wait}s for {self.name} ({priority})")
+        # 여러 프로세스가 동시에 깨어나 경쟁하지 않도록 약간의 지터
+        return min(remaining, wait + random.uniform(0, 0.1))
+
+    def _record(self, metric: str) -> None:
+        if self.redis is None:
+            return
+        minute = int(time.time() // 60)
+        key = self._metric_key(metric, minute)
+        try:
+            pipe = self.redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, METRICS_TTL)
+            count = pipe.execute()[0]
+        except Exception:
+            return
+        if metric == "used" and count == int(self.rate * 60 * HIGH_UTILIZATION):
+            logger.warning(f"Rate limit {self.name}: {HIGH_UTILIZATION:.0%} of per-minute quota used")
+
+    def _metric_key(self, metric: str, minute: int) -> str:
+        return f"ratelimit:{self.name}:{metric}:{minute}"
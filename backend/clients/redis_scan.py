@@ -0,0 +1,79 @@
+# clients/redis_scan.py
+"""KEYS 대신 SCAN으로 키를 조금씩 훑고 UNLINK로 묶어서 지우는 헬퍼.
+
+- KEYS는 키 전체를 한 번에 훑는 O(N) 명령이라 그동안 Redis 전체가 멈춘다.
+  브로커/결과/캐시/beat가 같은 Redis를 쓰므로 Celery 작업 전달까지 멈춘다.
+- SCAN은 한 번에 COUNT개 정도만 보고 커서를 돌려준다. 배치 사이에 잠깐 쉬어 다른 명령이 끼어들 틈을 준다.
+- UNLINK는 키를 키 공간에서 즉시 떼고 메모리 해제는 백그라운드 스레드에서 한다 (큰 값도 블록하지 않음).
+- SCAN은 같은 키를 두 번 돌려줄 수 있다. 삭제 수는 UNLINK 응답(실제로 지운 수)으로 센다.
+"""
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+SCAN_COUNT = int(os.getenv("REDIS_SCAN_COUNT", "500"))  # SCAN 한 번에 훑을 키 수 (힌트)
+SCAN_PAUSE_SECONDS = float(os.getenv("REDIS_SCAN_PAUSE_SECONDS", "0.001"))  # 배치 사이 휴식
+SCAN_PROGRESS_EVERY = 100  # 배치 N개마다 진행 로그
+
+
+@dataclass
+class ScanResult:
+    scanned: int = 0  # SCAN이 돌려준 키 수 (중복 포함)
+    matched: int = 0  # 삭제 대상으로 고른 키 수
+    deleted: int = 0  # UNLINK가 실제로 지운 키 수
+    batches: int = 0
+
+    def as_dict(self) -> dict:
+        return {"scanned": self.scanned, "matched": self.matched, "deleted": self.deleted, "batches": self.batches}
+
+
+def iter_key_batches(client: Any, pattern: str, count: int = SCAN_COUNT) -> Iterator[List[str]]:
+    """pattern에 맞는 키를 SCAN 배치 단위(문자열 리스트)로 돌려준다. 빈 배치는 건너뛴다."""
+    cursor = 0
+    while True:
+        cursor, keys = client.scan(cursor=cursor, match=pattern, count=count)
+        if keys:
+            yield [key.decode() if isinstance(key, bytes) else key for key in keys]
+        if int(cursor) == 0:
+            return
+
+
+def scan_unlink(
+    client: Any,
+    pattern: str,
+    select: Optional[Callable[[str], bool]] = None,
+    before_unlink: Optional[Callable[[Any, List[str]], None]] = None,
+    count: int = SCAN_COUNT,
+    pause_seconds: float = SCAN_PAUSE_SECONDS,
+    progress: Optional[Callable[[ScanResult], None]] = None,
+) -> ScanResult:
+    """pattern에 맞는 키를 SCAN으로 훑으며 배치마다 UNLINK.
+
+    - select: 지울 키만 고르는 필터 (없으면 전부)
+    - before_unlink(pipe, keys): 같은 파이프라인에 함께 보낼 명령 추가 (예: 스케줄 zset에서 제거)
+    - progress: 배치마다 누적 ScanResult로 호출
+    """
+    result = ScanResult()
+    for keys in iter_key_batches(client, pattern, count):
+        result.batches += 1
+        result.scanned += len(keys)
+        targets = [key for key in keys if select is None or select(key)]
+        if targets:
+            result.matched += len(targets)
+            pipe = client.pipeline(transaction=False)
+            if before_unlink is not None:
+                before_unlink(pipe, targets)
+            pipe.unlink(*targets)
+            result.deleted += int(pipe.execute()[-1] or 0)
+        if progress is not None:
+            progress(result)
+        if result.batches % SCAN_PROGRESS_EVERY == 0:
+            logger.info(f"SCAN {pattern}: {result.as_dict()}")
+        if pause_seconds > 0:
+            time.sleep(pause_seconds)
+    logger.debug(f"SCAN {pattern} 완료: {result.as_dict()}")
+    return result
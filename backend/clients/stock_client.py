@@ -1,16 +1,67 @@
 import yfinance as yf
 import pandas as pd
 import requests
+import asyncio
 import logging
-from typing import Dict, List, Any
+import os
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
 from data.schemas import StockSearchOut
-from clients.cache_client import CacheClient
+from clients import price_matrix
+from clients.async_http import get_async_http_client, provider_semaphore
+from clients.cache_client import CacheClient, CacheEntry, CachedFailure
+from clients.http_session import get_http_session
+from clients.market_calendar import bars_expire_at, quote_expire_at, seconds_until
+from clients.price_store import PERIOD_OFFSETS, PriceStore, period_start_date
+from clients.symbol_index import (
+    NASDAQ_LISTED_URL,
+    OTHER_LISTED_URL,
+    SymbolIndex,
+    load_aliases,
+    normalize as normalize_query,
+    parse_symbol_directory,
+)
 
 logger = logging.getLogger(__name__)
 
+STOCK_COMPONENTS = ("history", "info", "calendar")  # get_stock_data가 조회할 수 있는 구성요소
+MAX_FETCH_WORKERS = 8  # 배치 조회 시 info/calendar 동시 요청 상한 (Yahoo 차단 방지)
+PRICE_STORE_SYNC_INTERVAL = 60 * 60  # 가격 저장소 증분 갱신 주기 (티커별 1시간에 1번)
+DEFAULT_EXCHANGE_TZ = "America/New_York"  # yfinance 타임존 캐시에 없는 티커의 거래소 타임존
+CACHEABLE_PERIODS = (*PERIOD_OFFSETS, "ytd", "max")  # 상위 기간 캐시 탐색 대상
+
+# 구성요소별 캐시 TTL
+HISTORY_SETTLE_SECONDS = 30 * 60  # history: 장 마감 + 30분(종가 확정) 시점에 만료
+HISTORY_MIN_TTL = 60
+INFO_CACHE_TTL = 3 * 24 * 60 * 60  # info: 펀더멘털/회사 정보는 분기 단위로 바뀌므로 3일
+CALENDAR_CACHE_TTL = 7 * 24 * 60 * 60  # calendar: 최대 7일, 다음 실적 발표 다음 날 만료
+CALENDAR_MIN_TTL = 6 * 60 * 60  # 발표일이 지났는데 새 일정이 없으면 6시간 후 재조회
+QUOTE_CACHE_TTL = int(os.getenv("QUOTE_CACHE_TTL", "45"))  # 현재가: 장중 45초, 장 마감 후에는 다음 개장까지
+
+# 종목 검색
+SYMBOL_LIST_CACHE_KEY = "stock:symbols"
+SYMBOL_LIST_CACHE_TTL = 24 * 60 * 60  # 상장 종목 목록: 거래일 마감 후 갱신, 만료 후에도 이 시간 동안 이전 목록 사용
+SYMBOL_INDEX_REFRESH_SECONDS = 6 * 60 * 60  # 프로세스 내 인덱스 재구성 주기
+SYMBOL_INDEX_RETRY_SECONDS = 10 * 60  # 목록 조회 실패 시 재시도 간격
+SEARCH_CACHE_TTL = 24 * 60 * 60  # 인덱스에 없는 검색어의 Yahoo 결과
+
+# Yahoo Finance 비공식 API (검색, 시세 차트)
+YAHOO_SEARCH_URL = "https://query1.finance.yahoo.com/v1/finance/search"
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}"
+YAHOO_HEADERS = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+
 
 class StockClient:
     _cache_client = None
+    _price_store = None
+    _quote_lock = threading.Lock()
+    _symbol_index: Optional[SymbolIndex] = None
+    _symbol_index_expires_at = 0.0
+    _symbol_index_lock = threading.Lock()
+    _quote_inflight: Dict[str, Future] = {}  # 조회 중인 티커 → 결과 (동시 요청 합류용)
 
     def __init__(self): ...
 
@@ -20,6 +71,12 @@ class StockClient:
             cls._cache_client = CacheClient()
         return cls._cache_client
 
+    @classmethod
+    def get_price_store(cls) -> PriceStore:
+        if cls._price_store is None:
+            cls._price_store = PriceStore()
+        return cls._price_store
+
     @classmethod
     def search_stock(cls, query: str) -> List[StockSearchOut]:
         """
@@ -37,116 +94,423 @@ class StockClient:
             - search_stock("AAPL") -> [StockSearchOut(ticker="AAPL", company_name="Apple Inc.")]
         """
 
+        # 로컬 심볼 인덱스 → (미스) 검색어별 캐시 → Yahoo 자동완성 API
+        index = cls.get_symbol_index()
+        if index is not None:
+            results = index.search(query)
+            if results:
+                return results
+        cached = cls._get_cached_search(query)
+        if cached is not None:
+            return cached
+
         try:
             # Yahoo Finance 자동완성 API 사용 (비공식)
-            url = "https://query1.finance.yahoo.com/v1/finance/search"
-            params = {
-                "q": query,
-                "lang": "en-US",
-                "region": "US",
-                "quotesCount": 10,
-                "newsCount": 0,
-                "enableFuzzyQuery": False,
-                "quotesQueryId": "tss_match_phrase_query",
-            }
+            response = get_http_session().get(
+                YAHOO_SEARCH_URL, params=cls._search_params(query), headers=YAHOO_HEADERS, timeout=10
+            )
+            response.raise_for_status()
+            results = cls._parse_search_results(response.json())
+            cls._set_cached_search(query, results)
+            return results
 
-            headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        except requests.exceptions.RequestException as e:
+            logger.error(f"종목 검색 중 네트워크 오류: {e}")
+            raise e
+        except Exception as e:
+            logger.error(f"종목 검색 중 오류: {e}")
+            raise e
+
+    @classmethod
+    def get_symbol_index(cls) -> Optional[SymbolIndex]:
+        """프로세스 내 심볼 인덱스. 주기적으로 Redis의 심볼 목록(하루 1회 갱신)으로 다시 만든다. 없으면 None."""
+        if cls._symbol_index_is_fresh():
+            return cls._symbol_index
+        with cls._symbol_index_lock:
+            if cls._symbol_index_is_fresh():
+                return cls._symbol_index
+            try:
+                symbols = cls.get_cache_client().get_or_set(
+                    SYMBOL_LIST_CACHE_KEY,
+                    cls._fetch_symbol_list,
+                    expire_at=bars_expire_at(),  # 목록은 거래일 마감 후에만 바뀜 (주말/휴장일에는 재조회 안 함)
+                    stale_ttl=SYMBOL_LIST_CACHE_TTL,  # 만료돼도 갱신되는 동안은 이전 목록 사용
+                )
+                cls._symbol_index = SymbolIndex(symbols, load_aliases())
+                cls._symbol_index_expires_at = cls._now_ts() + SYMBOL_INDEX_REFRESH_SECONDS
+            except Exception as e:
+                # 기존 인덱스가 있으면 계속 쓰고, 잠시 후 다시 시도
+                logger.warning(f"Failed to load symbol index (using previous index / upstream search): {e}")
+                cls._symbol_index_expires_at = cls._now_ts() + SYMBOL_INDEX_RETRY_SECONDS
+            return cls._symbol_index
 
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+    @classmethod
+    def _symbol_index_is_fresh(cls) -> bool:
+        """재구성(또는 실패 후 재시도) 시점 전인지"""
+        return cls._symbol_index_expires_at > cls._now_ts()
+
+    @staticmethod
+    def _now_ts() -> float:
+        return datetime.now(timezone.utc).timestamp()
+
+    @staticmethod
+    def _fetch_symbol_list() -> List[Tuple[str, str]]:
+        """Nasdaq Trader 심볼 디렉터리에서 미국 상장 보통주 목록 [(ticker, 회사명)]"""
+        session = get_http_session()
+        symbols = []
+        for url, symbol_column in ((NASDAQ_LISTED_URL, "Symbol"), (OTHER_LISTED_URL, "ACT Symbol")):
+            response = session.get(url, timeout=30)
             response.raise_for_status()
+            symbols.extend(parse_symbol_directory(response.text, symbol_column))
+        if not symbols:
+            raise ValueError("Symbol directory is empty")
+        return symbols
 
-            data = response.json()
-            quotes = data.get("quotes", [])
+    @staticmethod
+    def _search_cache_key(query: str) -> str:
+        return f"stock:search:{normalize_query(query)}"
 
-            # 티커와 회사명 추출 (주식만 필터링)
-            stocks = []
-            seen_tickers = set()  # 중복 방지
+    @classmethod
+    def _get_cached_search(cls, query: str) -> Optional[List[StockSearchOut]]:
+        try:
+            return cls.get_cache_client().get(cls._search_cache_key(query))
+        except Exception as e:
+            logger.warning(f"Search cache read failed: {e}")
+            return None
 
-            for quote in quotes:
-                if quote.get("quoteType") == "EQUITY" and quote.get("symbol"):
-                    symbol = quote["symbol"]
-                    # 불필요한 접미사 제거 (.L, .DE 등 해외 거래소 접미사)
-                    if "." not in symbol or symbol.endswith(".US"):
-                        clean_symbol = symbol.replace(".US", "")
+    @classmethod
+    def _set_cached_search(cls, query: str, results: List[StockSearchOut]) -> None:
+        try:
+            cls.get_cache_client().set(cls._search_cache_key(query), results, ttl_seconds=SEARCH_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f"Search cache write failed: {e}")
+
+    @staticmethod
+    def _search_params(query: str) -> Dict[str, Any]:
+        return {
+            "q": query,
+            "lang": "en-US",
+            "region": "US",
+            "quotesCount": 10,
+            "newsCount": 0,
+            "enableFuzzyQuery": False,
+            "quotesQueryId": "tss_match_phrase_query",
+        }
+
+    @staticmethod
+    def _parse_search_results(data: Dict[str, Any]) -> List[StockSearchOut]:
+        quotes = data.get("quotes", [])
+
+        # 티커와 회사명 추출 (주식만 필터링)
+        stocks = []
+        seen_tickers = set()  # 중복 방지
+
+        for quote in quotes:
+            if quote.get("quoteType") == "EQUITY" and quote.get("symbol"):
+                symbol = quote["symbol"]
+                # 불필요한 접미사 제거 (.L, .DE 등 해외 거래소 접미사)
+                if "." not in symbol or symbol.endswith(".US"):
+                    clean_symbol = symbol.replace(".US", "")
+
+                    # 중복 체크
+                    if clean_symbol not in seen_tickers:
+                        seen_tickers.add(clean_symbol)
+
+                        # 회사명 추출 (shortname 우선, 없으면 longname)
+                        company_name = quote.get("shortname") or quote.get("longname") or clean_symbol
+
+                        stocks.append(StockSearchOut(ticker=clean_symbol, company_name=company_name))
+
+        # 최대 10개만 반환
+        return stocks[:10]
+
+    # ---- 캐시 키 / TTL ----
+
+    @staticmethod
+    def _history_cache_key(ticker: str, period: str) -> str:
+        return f"stock:history:{ticker}:{period}"
+
+    @staticmethod
+    def _store_failure_key(ticker: str) -> str:
+        return f"stock:store_failure:{ticker}"
+
+    @staticmethod
+    def _component_cache_key(component: str, ticker: str) -> str:
+        return f"stock:{component}:{ticker}"
+
+    @staticmethod
+    def _history_ttl(now: Optional[datetime] = None) -> int:
+        """다음 거래일 마감 + 종가 확정 대기 시점까지 (장중에 받은 이력은 마감 직후 갱신, 주말/휴장일에는 유지)"""
+        now = now or datetime.now(timezone.utc)
+        return max(HISTORY_MIN_TTL, seconds_until(bars_expire_at(now, HISTORY_SETTLE_SECONDS), now))
 
-                        # 중복 체크
-                        if clean_symbol not in seen_tickers:
-                            seen_tickers.add(clean_symbol)
+    @classmethod
+    def _calendar_ttl(cls, calendar: Any, now: Optional[datetime] = None) -> int:
+        """다음 실적 발표 다음 날까지 (최대 7일). 발표일을 모르면 7일."""
+        now = now or datetime.now(timezone.utc)
+        earnings = cls._next_earnings_date(calendar)
+        if earnings is None:
+            return CALENDAR_CACHE_TTL
+        refresh_at = datetime.combine(earnings + timedelta(days=1), time(0), tzinfo=timezone.utc)
+        return max(CALENDAR_MIN_TTL, min(CALENDAR_CACHE_TTL, seconds_until(refresh_at, now)))
+
+    @staticmethod
+    def _next_earnings_date(calendar: Any) -> Optional[date]:
+        """yfinance calendar(dict 또는 DataFrame)에서 가장 이른 실적 발표일"""
+        try:
+            if isinstance(calendar, dict):
+                raw = calendar.get("Earnings Date") or []
+            elif isinstance(calendar, pd.DataFrame) and "Earnings Date" in calendar:
+                raw = list(calendar["Earnings Date"])
+            else:
+                return None
+            dates = [pd.Timestamp(d).date() for d in (raw if isinstance(raw, list) else [raw]) if d is not None]
+            return min(dates) if dates else None
+        except Exception:
+            return None
 
-                            # 회사명 추출 (shortname 우선, 없으면 longname)
-                            company_name = quote.get("shortname") or quote.get("longname") or clean_symbol
+    @classmethod
+    def _component_ttl(cls, component: str, value: Any) -> int:
+        if component == "calendar":
+            return cls._calendar_ttl(value)
+        return INFO_CACHE_TTL
 
-                            stocks.append(StockSearchOut(ticker=clean_symbol, company_name=company_name))
+    # ---- history ----
 
-            # 최대 10개만 반환
-            return stocks[:10]
+    @classmethod
+    def _resolve_histories(cls, tickers: List[str], period: str, batch: bool = True) -> Dict[str, pd.DataFrame]:
+        """티커별 history: 가격 저장소가 있으면 저장소, 없으면 Redis 캐시(상위 기간 재사용) → 미스만 조회"""
+        unique = list(dict.fromkeys(tickers))  # 순서 유지 중복 제거
+        store = cls.get_price_store()
+        if store.is_available():
+            start = period_start_date(period)
+            try:
+                cls._sync_price_store(unique, period, start)
+            except Exception as e:
+                logger.error(f"Price store sync failed (serving stored bars only): {e}")
+            return {ticker: store.read_frame(ticker, start, tz=cls._exchange_tz(ticker)) for ticker in unique}
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f"종목 검색 중 네트워크 오류: {e}")
-            raise e
-        except Exception as e:
-            logger.error(f"종목 검색 중 오류: {e}")
-            raise e
+        cache_client = cls.get_cache_client()
+        keys = {ticker: cls._history_cache_key(ticker, period) for ticker in unique}
+        cached = cache_client.get_many(keys.values())
+        histories: Dict[str, Any] = {ticker: cached[key] for ticker, key in keys.items() if key in cached}
+        missing = [ticker for ticker in unique if ticker not in histories]
+        if missing:
+            # 더 긴 기간의 캐시가 있으면 잘라서 재사용 (3mo ⊂ 6mo ⊂ 1y)
+            histories.update(cls._get_superset_histories(missing, period))
+            missing = [ticker for ticker in missing if ticker not in histories]
+
+        if missing:
+            # 미스만 한 번에 조회. 같은 티커를 다른 요청이 조회 중이면 그 결과를 기다린다 (single-flight)
+            tickers_by_key = {keys[ticker]: ticker for ticker in missing}
+
+            def fetch_many(missing_keys: List[str]) -> Dict[str, pd.DataFrame]:
+                fetched = cls._fetch_histories([tickers_by_key[key] for key in missing_keys], period, batch)
+                return {keys[ticker]: history for ticker, history in fetched.items()}
+
+            fetched = cache_client.get_or_set_many(tickers_by_key, fetch_many, ttl_seconds=cls._history_ttl())
+            for key, history in fetched.items():
+                histories[tickers_by_key[key]] = history
+        # 실패 기록(negative cache)은 빈 DataFrame으로
+        return {
+            ticker: pd.DataFrame() if isinstance(history, CachedFailure) else history
+            for ticker, history in histories.items()
+        }
 
     @classmethod
-    def _get_stock_data_with_cache(cls, ticker: str, period: str = "3mo") -> Dict[str, Any]:
-        """개별 티커 캐싱"""
-        cache_client = cls.get_cache_client()
+    def _fetch_histories(cls, tickers: List[str], period: str, batch: bool) -> Dict[str, Any]:
+        """캐시 미스 티커들의 history 조회. batch면 yf.download 한 번, 아니면 티커별 순차 조회.
 
-        # 시간 버킷팅 적용
-        cache_key = f"_get_stock_data_with_cache:{ticker}:{period}"
+        조회 실패나 빈 결과는 CachedFailure로 돌려줘 짧은 TTL로만 캐시되게 한다
+        (일시적 오류가 하루 동안 빈 history로 남지 않고, 상장 폐지 종목은 백오프하며 재조회).
+        """
+        if batch and len(tickers) > 1:
+            try:
+                histories = cls._download_histories(tickers, period=period)
+            except Exception as e:
+                logger.error(f"Batch history download failed for {tickers}: {e}")
+                return {ticker: CachedFailure(str(e)) for ticker in tickers}
+            return {
+                ticker: CachedFailure("no historical data") if history.empty else history
+                for ticker, history in histories.items()
+            }
 
-        def fetch_single_ticker():
+        histories = {}
+        for ticker in tickers:
             try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period=period)
-                info = stock.info
-                calendar = stock.calendar
-
-                # 데이터 품질 검증
-                if hist.empty:
-                    logger.warning(f"No historical data for {ticker}")
-                    return {
-                        "status": "error",
-                        "error": f"No historical data for {ticker}",
-                        "stock_history": pd.DataFrame(),
-                        "stock_info": {},
-                        "stock_calendar": pd.DataFrame(),
-                    }
-
-                logger.debug(f"Successfully fetched {len(hist)} days of data for {ticker}")
-                return {
-                    "status": "success",
-                    "stock_history": hist,
-                    "stock_info": info,
-                    "stock_calendar": calendar,
-                }
+                history = yf.Ticker(ticker).history(period=period)
+            except Exception as e:
+                logger.error(f"Failed to fetch history for {ticker}: {e}")
+                histories[ticker] = CachedFailure(str(e))
+                continue
+            if history.empty:
+                logger.warning(f"No historical data for {ticker}")
+                histories[ticker] = CachedFailure("no historical data")
+            else:
+                histories[ticker] = history
+        return histories
+
+    @staticmethod
+    def _download_histories(
+        tickers: List[str], period: Optional[str] = None, start: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """여러 티커의 history를 yf.download 한 번으로 조회 (period 또는 start 지정). 데이터가 없는 티커는 빈 DataFrame."""
+        range_kwargs = {"start": start.isoformat()} if start is not None else {"period": period}
+        frame = yf.download(
+            tickers,
+            **range_kwargs,
+            group_by="ticker",
+            actions=True,
+            auto_adjust=True,
+            ignore_tz=True,  # 현지 날짜 유지 → _localize_history에서 티커별 거래소 타임존 부여
+            threads=True,
+            progress=False,
+        )
+        histories = {}
+        available = set(frame.columns.get_level_values(0)) if frame is not None and not frame.empty else set()
+        for ticker in tickers:
+            if ticker in available:
+                histories[ticker] = StockClient._localize_history(frame[ticker].dropna(how="all"), ticker)
+            else:
+                logger.warning(f"No historical data for {ticker}")
+                histories[ticker] = pd.DataFrame()
+        return histories
+
+    @staticmethod
+    def _localize_history(history: pd.DataFrame, ticker: str) -> pd.DataFrame:
+        """yf.download(일봉)의 tz-naive 인덱스(거래소 현지 날짜)를 yf.Ticker.history와 같은 거래소 타임존으로.
+
+        여러 거래소 티커를 섞어 받아도 날짜가 밀리지 않도록 download는 타임존을 버린 현지 날짜로 받고,
+        티커별 거래소 타임존(yfinance가 조회 중 채워 두는 타임존 캐시)을 다시 붙인다.
+        """
+        if history.empty or history.index.tz is not None:
+            return history
+        history = history.copy()
+        history.index = history.index.tz_localize(StockClient._exchange_tz(ticker))
+        return history
+
+    @staticmethod
+    def _exchange_tz(ticker: str) -> str:
+        """티커의 거래소 타임존 (yfinance 타임존 캐시, 없으면 DEFAULT_EXCHANGE_TZ)"""
+        try:
+            return yf.cache.get_tz_cache().lookup(ticker) or DEFAULT_EXCHANGE_TZ
+        except Exception:
+            return DEFAULT_EXCHANGE_TZ
+
+    @staticmethod
+    def _superset_periods(period: str) -> List[str]:
+        """period를 포함하는 더 긴 기간들 (긴 것부터). 알 수 없는 period면 빈 리스트."""
+        if period not in CACHEABLE_PERIODS:
+            return []
+        today = datetime.now(timezone.utc).date()
+        start = period_start_date(period, today)
+        if start is None:
+            return []  # max보다 긴 기간은 없음
+
+        def start_of(p):
+            return period_start_date(p, today) or date.min
+
+        candidates = [p for p in CACHEABLE_PERIODS if p != period and start_of(p) <= start]
+        return sorted(candidates, key=start_of)
+
+    @classmethod
+    def _get_superset_history(cls, ticker: str, period: str) -> Optional[pd.DataFrame]:
+        """같은 티커의 더 긴 기간 history 캐시를 period 구간으로 잘라 반환. 없으면 None (조회 필요)."""
+        return cls._get_superset_histories([ticker], period).get(ticker)
+
+    @classmethod
+    def _get_superset_histories(cls, tickers: List[str], period: str) -> Dict[str, pd.DataFrame]:
+        """_get_superset_history의 여러 티커 버전: 모든 상위 기간 키를 한 번에 조회해 티커별로 가장 긴 것을 사용"""
+        supersets = cls._superset_periods(period)
+        if not supersets or not tickers:
+            return {}
+        cached = cls.get_cache_client().get_many(
+            cls._history_cache_key(ticker, superset) for ticker in tickers for superset in supersets
+        )
+        histories = {}
+        for ticker in tickers:
+            for superset in supersets:
+                history = cached.get(cls._history_cache_key(ticker, superset))
+                if history is None or isinstance(history, CachedFailure) or history.empty:
+                    continue
+                logger.debug(f"Serving {ticker}:{period} from cached {superset} history")
+                histories[ticker] = cls._slice_history(history, period)
+                break
+        return histories
+
+    @staticmethod
+    def _slice_history(history: pd.DataFrame, period: str) -> pd.DataFrame:
+        """history를 period 시작일 이후로 자른다 (인덱스 타임존 유지)"""
+        start = period_start_date(period)
+        if start is None or history.empty:
+            return history
+        start_ts = pd.Timestamp(start)
+        if getattr(history.index, "tz", None) is not None:
+            start_ts = start_ts.tz_localize(history.index.tz)
+        return history[history.index >= start_ts]
+
+    # ---- info / calendar ----
 
+    @classmethod
+    def _resolve_component(cls, tickers: List[str], component: str, batch: bool = True) -> Dict[str, Any]:
+        """티커별 info 또는 calendar: Redis 캐시(MGET 한 번) → 미스만 조회해 구성요소별 TTL로 저장"""
+        tickers_by_key = {cls._component_cache_key(component, ticker): ticker for ticker in dict.fromkeys(tickers)}
+
+        def fetch_many(missing_keys: List[str]) -> Dict[str, Any]:
+            fetched = cls._fetch_components([tickers_by_key[key] for key in missing_keys], component, batch)
+            return {cls._component_cache_key(component, ticker): value for ticker, value in fetched.items()}
+
+        values = cls.get_cache_client().get_or_set_many(
+            tickers_by_key, fetch_many, ttl_seconds=lambda value: cls._component_ttl(component, value)
+        )
+        empty: Callable[[], Any] = dict if component == "info" else pd.DataFrame
+        return {
+            tickers_by_key[key]: empty() if isinstance(value, CachedFailure) else value for key, value in values.items()
+        }
+
+    @classmethod
+    def _fetch_components(cls, tickers: List[str], component: str, batch: bool) -> Dict[str, Any]:
+        """info/calendar 조회. batch면 제한된 스레드 풀로 병렬 조회. 실패한 티커는 CachedFailure (짧게 캐시)."""
+
+        def fetch_one(ticker: str) -> Any:
+            try:
+                return getattr(yf.Ticker(ticker), component)
             except Exception as e:
-                logger.error(f"Failed to fetch data for {ticker}: {e}")
-                return {
-                    "status": "error",
-                    "error": str(e),
-                    "stock_history": pd.DataFrame(),
-                    "stock_info": {},
-                    "stock_calendar": pd.DataFrame(),
-                }
+                logger.error(f"Failed to fetch {component} for {ticker}: {e}")
+                return CachedFailure(str(e))
 
-        # 24시간 캐시 (장기 데이터이므로 하루 차이는 미미함)
-        return cache_client.get_or_set(cache_key, fetch_single_ticker, ttl_seconds=24 * 60 * 60)
+        if not tickers:
+            return {}
+        if batch and len(tickers) > 1:
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(tickers))) as executor:
+                return dict(zip(tickers, executor.map(fetch_one, tickers)))
+        return {ticker: fetch_one(ticker) for ticker in tickers}
 
     @classmethod
-    def get_stock_data(cls, tickers: List[str], period: str = "3mo") -> Dict[str, Any]:
+    def get_stock_data(
+        cls,
+        tickers: List[str],
+        period: str = "3mo",
+        batch: bool = True,
+        components: Iterable[str] = STOCK_COMPONENTS,
+    ) -> Dict[str, Any]:
         """
         주식 데이터를 가져오는 도구
 
+        history/info/calendar는 각각 따로 캐싱·조회되므로 필요한 구성요소만 요청하면
+        나머지는 캐시 조회도, 네트워크 요청도 하지 않는다.
+
         Args:
             tickers: 주식 티커 리스트 (예: ["AAPL", "MSFT"])
             period: 데이터 기간 ("1mo", "3mo", "6mo", "1y", "2y", "5y", "10y",
-                    "ytd", "max")
+                    "ytd", "max") — history에만 적용
+            batch: True면 캐시 미스 티커를 한 번에 조회 (history 벡터화 다운로드 +
+                   info/calendar 병렬 조회), False면 티커별로 순차 조회
+            components: 조회할 구성요소 ("history", "info", "calendar")
 
         Returns:
             Dict containing stock data for all tickers with cache info
+            (요청한 구성요소의 키만 포함)
 
         Example:
         ```json
@@ -168,22 +532,19 @@ class StockClient:
         ```
         """
         try:
-            stock_history = {}
-            stock_info = {}
-            stock_calendar = {}
-            for ticker in tickers:
-                # 개별 티커 일일 캐싱 사용
-                ticker_data = cls._get_stock_data_with_cache(ticker, period)
-                stock_history[ticker] = ticker_data["stock_history"]
-                stock_info[ticker] = ticker_data["stock_info"]
-                stock_calendar[ticker] = ticker_data["stock_calendar"]
-
-            return {
-                "status": "success",
-                "stock_history": stock_history,
-                "stock_info": stock_info,
-                "stock_calendar": stock_calendar,
-            }
+            unknown = set(components) - set(STOCK_COMPONENTS)
+            if unknown:
+                raise ValueError(f"Unknown stock data components: {sorted(unknown)}")
+
+            result: Dict[str, Any] = {"status": "success"}
+            if "history" in components:
+                histories = cls._resolve_histories(tickers, period, batch)
+                result["stock_history"] = {ticker: histories[ticker] for ticker in tickers}
+            for component in ("info", "calendar"):
+                if component in components:
+                    values = cls._resolve_component(tickers, component, batch)
+                    result[f"stock_{component}"] = {ticker: values[ticker] for ticker in tickers}
+            return result
 
         except Exception as e:
             logger.error(f"Critical error in get_stock_data: {e}")
@@ -192,17 +553,205 @@ class StockClient:
                 "error": str(e),
             }
 
+    @classmethod
+    def get_history(cls, tickers: List[str], period: str = "6mo") -> Dict[str, pd.DataFrame]:
+        """
+        가격 이력(OHLCV)만 조회
+
+        로컬 가격 저장소(PRICE_STORE_DIR)가 있으면 저장소를 먼저 읽고 부족한 봉만 증분 조회해 이어붙인다.
+        없으면 Redis history 캐시를 사용한다.
+
+        Returns:
+            Dict[str, pd.DataFrame]: 티커별 history (데이터가 없으면 빈 DataFrame)
+        """
+        stock_history = cls.get_stock_data(tickers, period, components=("history",)).get("stock_history", {})
+        return {ticker: stock_history.get(ticker, pd.DataFrame()) for ticker in tickers}
+
+    @classmethod
+    def _sync_price_store(cls, tickers: List[str], period: str, start: Optional[date]) -> None:
+        """저장소가 요청 구간을 덮지 못하는 티커는 전체 조회, 나머지는 마지막 저장일 이후만 조회해 병합.
+
+        빈/실패 조회는 Redis 경로와 같은 negative cache(CachedFailure, 연속 실패 백오프)에 기록해 그동안 건너뛴다.
+        """
+        store = cls.get_price_store()
+        required_from = start or date.min
+        now = datetime.now(timezone.utc)
+
+        previous = cls._get_store_failures(tickers)
+        full, incremental = [], []
+        for ticker in dict.fromkeys(tickers):
+            if ticker in previous and previous[ticker].is_fresh():
+                continue  # 최근 조회가 실패/빈 응답(상장 폐지·잘못된 심볼) → 백오프 동안 재조회하지 않음
+            meta = store.get_meta(ticker)
+            covered_from = meta.get("covered_from")
+            if covered_from is None or covered_from > required_from.isoformat():
+                full.append(ticker)
+                continue
+            synced_at = meta.get("synced_at")
+            if synced_at and cls._store_sync_fresh(datetime.fromisoformat(synced_at), now):
+                continue
+            incremental.append(ticker)
+
+        failures: Dict[str, CachedFailure] = {}
+        if full:
+            for ticker, history in cls._download_store_histories(full, failures, period=period).items():
+                store.merge(ticker, history, covered_from=required_from)
+            logger.debug(f"Price store full fetch ({period}): {full}")
+
+        if incremental:
+            # 당일 미완성 봉을 갱신하기 위해 마지막 저장일부터 다시 받는다 (겹치는 날짜는 덮어씀)
+            since = min(store.last_date(ticker) or required_from for ticker in incremental)
+            for ticker, history in cls._download_store_histories(incremental, failures, start=since).items():
+                store.merge(ticker, history)
+            logger.debug(f"Price store incremental fetch since {since}: {incremental}")
+
+        recovered = [ticker for ticker in full + incremental if ticker in previous and ticker not in failures]
+        cls._set_store_failures(failures, previous, recovered)
+
+    @classmethod
+    def _download_store_histories(
+        cls, tickers: List[str], failures: Dict[str, CachedFailure], **range_kwargs: Any
+    ) -> Dict[str, pd.DataFrame]:
+        """저장소용 일괄 조회. 실패하거나 빈 티커는 failures에 CachedFailure로 모은다 (_fetch_histories와 같은 기준)."""
+        try:
+            histories = cls._download_histories(tickers, **range_kwargs)
+        except Exception as e:
+            logger.error(f"Price store download failed for {tickers}: {e}")
+            failures.update({ticker: CachedFailure(str(e)) for ticker in tickers})
+            return {}
+        failures.update(
+            {ticker: CachedFailure("no historical data") for ticker, history in histories.items() if history.empty}
+        )
+        return histories
+
+    @classmethod
+    def _get_store_failures(cls, tickers: List[str]) -> Dict[str, CacheEntry]:
+        """저장소 조회의 실패 기록 (만료 후 연속 실패 횟수를 기억하는 구간 포함). 캐시 장애는 기록 없음으로 취급."""
+        keys = {ticker: cls._store_failure_key(ticker) for ticker in tickers}
+        try:
+            entries = cls.get_cache_client().get_entries(keys.values())
+        except Exception as e:
+            logger.warning(f"Price store failure cache read failed: {e}")
+            return {}
+        return {ticker: entries[key] for ticker, key in keys.items() if key in entries and entries[key].is_failure}
+
+    @classmethod
+    def _set_store_failures(
+        cls, failures: Dict[str, CachedFailure], previous: Dict[str, CacheEntry], recovered: List[str]
+    ) -> None:
+        """실패 티커는 백오프 TTL로 기록하고, 다시 받아진 티커는 기록을 지워 연속 실패 횟수를 초기화한다"""
+        if not failures and not recovered:
+            return
+        try:
+            cache_client = cls.get_cache_client()
+            cache_client.set_failures(
+                {cls._store_failure_key(ticker): failure for ticker, failure in failures.items()},
+                {cls._store_failure_key(ticker): entry for ticker, entry in previous.items()},
+            )
+            for ticker in recovered:
+                cache_client.delete(cls._store_failure_key(ticker))
+        except Exception as e:
+            logger.warning(f"Price store failure cache write failed: {e}")
+
+    @staticmethod
+    def _store_sync_fresh(synced_at: datetime, now: Optional[datetime] = None) -> bool:
+        """저장소 동기화가 아직 유효한지: 갱신 주기 안이고, 동기화 이후 일봉이 확정(마감 + 대기)되지 않았어야 한다.
+
+        장중 동기화는 미완성 봉을 담고 있으므로 마감 직전에 받은 봉도 확정 시각이 지나면 다시 받는다.
+        """
+        now = now or datetime.now(timezone.utc)
+        return (now - synced_at).total_seconds() < PRICE_STORE_SYNC_INTERVAL and now < bars_expire_at(synced_at)
+
+    @staticmethod
+    def _quote_cache_key(ticker: str) -> str:
+        return f"stock:quote:{ticker}"
+
+    @staticmethod
+    def _quote_ttl(now: Optional[datetime] = None) -> int:
+        """장중에는 QUOTE_CACHE_TTL(마감을 넘기지 않음), 장 밖에서는 다음 개장까지 (주말/휴장일 포함, 가격이 바뀌지 않음)"""
+        now = now or datetime.now(timezone.utc)
+        return max(1, seconds_until(quote_expire_at(now, QUOTE_CACHE_TTL), now))
+
     @classmethod
     def get_stock_current_price(cls, tickers: List[str]) -> Dict[str, float]:
-        """현재가 조회. yfinance 실패 시 Finnhub 시세로 폴백, 둘 다 실패한 티커는 제외."""
-        current_prices = {}
-        finnhub = None
-        for ticker in tickers:
+        """현재가 조회. 짧은 TTL 캐시 → 미스 티커만 일괄 조회 (yfinance 실패 시 Finnhub 폴백).
+
+        동시에 같은 티커를 조회하는 요청은 먼저 시작한 요청의 결과를 기다려 공유한다.
+        둘 다 실패한 티커는 결과에서 제외.
+        """
+        tickers = list(dict.fromkeys(tickers))
+        current_prices = cls._get_cached_quotes(tickers)
+        misses = [ticker for ticker in tickers if ticker not in current_prices]
+        if not misses:
+            return current_prices
+
+        # 진행 중인 조회가 있는 티커는 합류, 나머지는 이번 요청이 담당
+        with cls._quote_lock:
+            joined = {ticker: cls._quote_inflight[ticker] for ticker in misses if ticker in cls._quote_inflight}
+            owned = {ticker: Future() for ticker in misses if ticker not in joined}
+            cls._quote_inflight.update(owned)
+
+        if owned:
+            fetched = {}
             try:
-                current_prices[ticker] = float(yf.Ticker(ticker).history(period="1d")["Close"].iloc[-1])
-                continue
+                fetched = cls._fetch_quotes(list(owned))
+                cls._set_cached_quotes(fetched)
             except Exception as e:
-                logger.warning(f"yfinance price failed for {ticker}, trying Finnhub fallback: {e}")
+                logger.error(f"Quote fetch failed for {list(owned)}: {e}")
+            finally:
+                # 캐시 저장 후에 해제해야 그 사이 들어온 요청이 재조회하지 않음
+                for ticker, future in owned.items():
+                    future.set_result(fetched.get(ticker))
+                with cls._quote_lock:
+                    for ticker in owned:
+                        cls._quote_inflight.pop(ticker, None)
+
+        for ticker, future in {**owned, **joined}.items():
+            price = future.result()
+            if price is not None:
+                current_prices[ticker] = price
+        return {ticker: current_prices[ticker] for ticker in tickers if ticker in current_prices}
+
+    @classmethod
+    def _get_cached_quotes(cls, tickers: List[str]) -> Dict[str, float]:
+        """캐시된 시세. 캐시 장애는 전부 미스로 취급 (시세 조회 자체는 계속 진행)."""
+        keys = {ticker: cls._quote_cache_key(ticker) for ticker in tickers}
+        try:
+            cached = cls.get_cache_client().get_many(keys.values())
+        except Exception as e:
+            logger.warning(f"Quote cache read failed (fetching all): {e}")
+            return {}
+        return {ticker: cached[key] for ticker, key in keys.items() if key in cached}
+
+    @classmethod
+    def _set_cached_quotes(cls, prices: Dict[str, float]) -> None:
+        if not prices:
+            return
+        ttl = cls._quote_ttl()
+        try:
+            cls.get_cache_client().set_many(
+                {cls._quote_cache_key(ticker): price for ticker, price in prices.items()}, ttl_seconds=ttl
+            )
+        except Exception as e:
+            logger.warning(f"Quote cache write failed: {e}")
+
+    @classmethod
+    def _fetch_quotes(cls, tickers: List[str]) -> Dict[str, float]:
+        """미스 티커 시세를 한 번에 조회 (1d history의 마지막 종가). 실패 티커만 Finnhub로 개별 폴백."""
+        quotes = {}
+        for ticker, history in cls._fetch_histories(tickers, period="1d", batch=True).items():
+            if isinstance(history, CachedFailure):
+                continue
+            closes = history["Close"].dropna() if "Close" in history else pd.Series(dtype=float)
+            if len(closes):
+                quotes[ticker] = float(closes.iloc[-1])
+
+        failed = [ticker for ticker in tickers if ticker not in quotes]
+        if not failed:
+            return quotes
+        logger.warning(f"yfinance price failed for {failed}, trying Finnhub fallback")
+        finnhub = None
+        for ticker in failed:
             try:
                 if finnhub is None:
                     from clients.finnhub_client import FinnhubClient
@@ -211,23 +760,115 @@ class StockClient:
                 if finnhub.is_available():
                     price = finnhub.get_quote(ticker)
                     if price:
-                        current_prices[ticker] = price
+                        quotes[ticker] = price
             except Exception as e:
                 logger.warning(f"Finnhub price fallback failed for {ticker}: {e}")
-        return current_prices
+        return quotes
+
+    @classmethod
+    def get_atr_pcts(cls, tickers: List[str], period: str = "6mo", window: int = 14) -> Dict[str, float]:
+        """티커별 ATR% (변동성 비율). 캐시/저장소의 history로 한 번에 계산."""
+        return price_matrix.atr_pct(cls.get_history(tickers, period), window)
 
     @classmethod
     def get_atr_pct(cls, ticker: str, period: str = "6mo", window: int = 14) -> float:
         """ATR% (변동성 비율) 계산"""
-        hist = yf.Ticker(ticker).history(period=period)
-        if hist.empty:
-            return 0.0
-
-        high_low = hist["High"] - hist["Low"]
-        high_close = (hist["High"] - hist["Close"].shift()).abs()
-        low_close = (hist["Low"] - hist["Close"].shift()).abs()
-        tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-
-        atr = tr.rolling(window=window).mean().iloc[-1]
-        last_close = hist["Close"].iloc[-1]
-        return float(atr / last_close)
+        return cls.get_atr_pcts([ticker], period, window)[ticker]
+
+
+class AsyncStockClient:
+    """StockClient의 비동기 버전 (현재가, 종목 검색).
+
+    - 공유 httpx.AsyncClient + 동시 요청 YAHOO_MAX_CONCURRENCY개 제한, 이벤트 루프를 막지 않는다.
+    - 시세 캐시(stock:quote:*)와 TTL은 StockClient와 공유한다. 캐시(동기 Redis) 호출은 스레드에서 돌린다.
+    - 같은 루프에서 같은 티커를 동시에 조회하면 진행 중인 요청 하나를 함께 기다린다.
+    """
+
+    PROVIDER = "yahoo"
+    _inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+        weakref.WeakKeyDictionary()
+    )
+
+    def __init__(self):
+        self._finnhub = None
+
+    async def search_stock(self, query: str) -> List[StockSearchOut]:
+        """종목 검색 (StockClient.search_stock과 같은 결과: 로컬 인덱스 → 검색어 캐시 → Yahoo)"""
+        if StockClient._symbol_index_is_fresh():
+            index = StockClient._symbol_index
+        else:
+            # 인덱스 (재)구성은 파일 다운로드가 있어 스레드에서
+            index = await asyncio.to_thread(StockClient.get_symbol_index)
+        if index is not None:
+            results = index.search(query)
+            if results:
+                return results
+        cached = await asyncio.to_thread(StockClient._get_cached_search, query)
+        if cached is not None:
+            return cached
+
+        async with provider_semaphore(self.PROVIDER):
+            response = await get_async_http_client().get(
+                YAHOO_SEARCH_URL, params=StockClient._search_params(query), headers=YAHOO_HEADERS
+            )
+        response.raise_for_status()
+        results = StockClient._parse_search_results(response.json())
+        await asyncio.to_thread(StockClient._set_cached_search, query, results)
+        return results
+
+    async def get_stock_current_price(self, tickers: List[str]) -> Dict[str, float]:
+        """현재가 조회. 캐시 미스 티커를 동시에 조회 (Yahoo 실패 시 Finnhub 폴백), 둘 다 실패한 티커는 제외."""
+        tickers = list(dict.fromkeys(tickers))
+        current_prices = await asyncio.to_thread(StockClient._get_cached_quotes, tickers)
+        misses = [ticker for ticker in tickers if ticker not in current_prices]
+        if misses:
+            inflight = self._inflight.setdefault(asyncio.get_running_loop(), {})
+            tasks = []
+            for ticker in misses:
+                task = inflight.get(ticker)
+                if task is None:
+                    task = asyncio.ensure_future(self._fetch_quote(ticker))
+                    inflight[ticker] = task
+                    task.add_done_callback(lambda _, ticker=ticker: inflight.pop(ticker, None))
+                tasks.append(task)
+            # 다른 요청과 공유하는 작업이므로 이 요청이 취소돼도 작업 자체는 취소하지 않음
+            prices = await asyncio.gather(*(asyncio.shield(task) for task in tasks))
+            current_prices.update({ticker: price for ticker, price in zip(misses, prices) if price is not None})
+        return {ticker: current_prices[ticker] for ticker in tickers if ticker in current_prices}
+
+    async def _fetch_quote(self, ticker: str) -> Optional[float]:
+        try:
+            price = await self._fetch_chart_price(ticker)
+        except Exception as e:
+            logger.warning(f"Yahoo price failed for {ticker}, trying Finnhub fallback: {e}")
+            price = await self._fetch_finnhub_price(ticker)
+        if price is not None:
+            await asyncio.to_thread(StockClient._set_cached_quotes, {ticker: price})
+        return price
+
+    async def _fetch_chart_price(self, ticker: str) -> float:
+        async with provider_semaphore(self.PROVIDER):
+            response = await get_async_http_client().get(
+                YAHOO_CHART_URL.format(symbol=ticker),
+                params={"range": "1d", "interval": "1d"},
+                headers=YAHOO_HEADERS,
+            )
+        response.raise_for_status()
+        result = (response.json().get("chart") or {}).get("result") or []
+        price = result[0].get("meta", {}).get("regularMarketPrice") if result else None
+        if not price:
+            raise ValueError(f"No market price in chart response for {ticker}")
+        return float(price)
+
+    async def _fetch_finnhub_price(self, ticker: str) -> Optional[float]:
+        try:
+            if self._finnhub is None:
+                from clients.finnhub_client import AsyncFinnhubClient
+
+                # 생성자가 Redis에 연결(ping)하므로 스레드에서
+                self._finnhub = await asyncio.to_thread(AsyncFinnhubClient)
+            if self._finnhub.is_available():
+                return await self._finnhub.get_quote(ticker)
+        except Exception as e:
+            logger.warning(f"Finnhub price fallback failed for {ticker}: {e}")
+        return None
@@ -0,0 +1,192 @@
+# clients/symbol_index.py
+"""종목 검색용 인메모리 심볼 인덱스 (티커/회사명 접두어 + 오타 1글자 허용 검색, 한국어 별칭).
+
+- 심볼 목록: Nasdaq Trader 심볼 디렉터리(나스닥 + NYSE/기타 거래소 상장 보통주). ETF/테스트 종목 제외.
+- 별칭: symbol_aliases.json (티커 → 한국어 등 별칭 목록). 목록에 없는 티커의 별칭은 무시.
+- 접두어 검색: 정렬된 키 배열 + bisect. 회사명은 단어 시작 위치마다 키를 만들어 중간 단어로도 찾는다.
+- 순위: 티커 완전 일치 > 회사명 완전 일치 > 티커 접두어 > 회사명 접두어 > 중간 단어 > 오타 허용.
+  같은 순위에서는 별칭이 등록된(널리 알려진) 종목, 짧은 티커 순.
+- 오타 허용: 토큰별 1글자 삭제 변형(SymSpell 방식) 사전 → 삭제/삽입/치환 1회까지 일치.
+  메모리를 줄이려고 티커, 회사명 첫 단어, 별칭만 대상으로 한다.
+"""
+import bisect
+import json
+import logging
+import os
+import re
+import unicodedata
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from data.schemas import StockSearchOut
+
+logger = logging.getLogger(__name__)
+
+NASDAQ_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
+OTHER_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
+ALIASES_PATH = os.path.join(os.path.dirname(__file__), "symbol_aliases.json")
+
+MAX_RESULTS = 10
+MAX_PREFIX_CANDIDATES = 200  # 접두어가 짧을 때 순위 계산 대상 상한
+MIN_FUZZY_LENGTH = 3  # 이보다 짧은 검색어는 오타 허용 검색을 하지 않음
+
+# 순위 (작을수록 우선)
+RANK_EXACT_TICKER = 0
+RANK_EXACT_NAME = 1
+RANK_TICKER_PREFIX = 2
+RANK_NAME_PREFIX = 3  # 회사명/별칭 첫 단어부터 일치
+RANK_WORD_PREFIX = 4  # 회사명 중간 단어부터 일치
+RANK_FUZZY = 5
+
+_NON_WORD = re.compile(r"[^\w&]+")
+
+
+def normalize(text: str) -> str:
+    """검색 키 정규화: 유니코드 호환 정규화(NFKC) → 소문자 → 구두점을 공백으로"""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def clean_security_name(name: str) -> str:
+    """'Apple Inc. - Common Stock' → 'Apple Inc.'"""
+    return name.split(" - ")[0].strip()
+
+
+def parse_symbol_directory(text: str, symbol_column: str) -> List[Tuple[str, str]]:
+    """Nasdaq Trader 심볼 디렉터리(| 구분) → [(ticker, 회사명)]. ETF/테스트 종목 제외, 클래스주는 yfinance 표기(BRK-B)."""
+    lines = [line for line in text.splitlines() if line and not line.startswith("File Creation Time")]
+    if not lines:
+        return []
+    header = lines[0].split("|")
+    index = {column: i for i, column in enumerate(header)}
+    symbols = []
+    for line in lines[1:]:
+        fields = line.split("|")
+        if len(fields) != len(header):
+            continue
+        if fields[index["Test Issue"]] == "Y" or ("ETF" in index and fields[index["ETF"]] == "Y"):
+            continue
+        symbol = fields[index[symbol_column]].strip()
+        if not symbol or "$" in symbol:  # 우선주/권리 등
+            continue
+        symbols.append((symbol.replace(".", "-"), clean_security_name(fields[index["Security Name"]])))
+    return symbols
+
+
+def load_aliases(path: str = ALIASES_PATH) -> Dict[str, List[str]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Failed to load symbol aliases (continuing without): {e}")
+        return {}
+
+
+def _deletes(token: str) -> Set[str]:
+    return {token[:i] + token[i + 1 :] for i in range(len(token))}
+
+
+class SymbolIndex:
+    def __init__(self, symbols: Iterable[Tuple[str, str]], aliases: Optional[Dict[str, List[str]]] = None):
+        self.tickers: List[str] = []
+        self.names: List[str] = []
+        seen: Dict[str, int] = {}
+        for ticker, name in symbols:
+            ticker = ticker.upper()
+            if ticker in seen:
+                continue
+            seen[ticker] = len(self.tickers)
+            self.tickers.append(ticker)
+            self.names.append(name or ticker)
+
+        self._exact_names: Dict[str, List[int]] = {}
+        ticker_keys: List[Tuple[str, int]] = []
+        name_keys: List[Tuple[str, int, int]] = []  # (키, 종목 번호, 순위)
+        self._fuzzy: Dict[str, List[int]] = {}
+        self._popular: Set[int] = set()
+
+        for i, (ticker, name) in enumerate(zip(self.tickers, self.names)):
+            ticker_keys.append((ticker.casefold(), i))
+            self._add_fuzzy(i, ticker.casefold())
+            words = self._add_name(i, name, name_keys)
+            if words:
+                self._add_fuzzy(i, words[0])
+        for ticker, alias_list in (aliases or {}).items():
+            i = seen.get(ticker.upper())
+            if i is None:
+                continue
+            self._popular.add(i)
+            for alias in alias_list:
+                words = self._add_name(i, alias, name_keys)
+                for word in words:
+                    self._add_fuzzy(i, word)
+                if len(words) > 1:
+                    self._add_fuzzy(i, "".join(words))  # "마이크로 소프트" 같은 띄어쓰기 차이
+
+        ticker_keys.sort()
+        name_keys.sort()
+        self._ticker_keys = [k for k, _ in ticker_keys]
+        self._ticker_ids = [i for _, i in ticker_keys]
+        self._name_keys = [k for k, _, _ in name_keys]
+        self._name_ids = [i for _, i, _ in name_keys]
+        self._name_ranks = [r for _, _, r in name_keys]
+
+    def __len__(self) -> int:
+        return len(self.tickers)
+
+    def search(self, query: str, limit: int = MAX_RESULTS) -> List[StockSearchOut]:
+        """접두어 일치(티커 → 회사명/별칭) 우선, 부족하면 오타 1글자 허용 일치로 채운다"""
+        q = normalize(query)
+        if not q:
+            return []
+        ranks: Dict[int, int] = {}
+
+        def rank(i: int, value: int) -> None:
+            if value < ranks.get(i, RANK_FUZZY + 1):
+                ranks[i] = value
+
+        q_ticker = q.replace(" ", "")
+        for pos in self._prefix(self._ticker_keys, q_ticker):
+            i = self._ticker_ids[pos]
+            rank(i, RANK_EXACT_TICKER if self.tickers[i].casefold() == q_ticker else RANK_TICKER_PREFIX)
+        for i in self._exact_names.get(q, ()):
+            rank(i, RANK_EXACT_NAME)
+        for pos in self._prefix(self._name_keys, q):
+            rank(self._name_ids[pos], self._name_ranks[pos])
+
+        if len(ranks) < limit and len(q_ticker) >= MIN_FUZZY_LENGTH and " " not in q:
+            for key in {q} | _deletes(q):
+                for i in self._fuzzy.get(key, ()):
+                    rank(i, RANK_FUZZY)
+
+        ordered = sorted(
+            ranks, key=lambda i: (ranks[i], i not in self._popular, len(self.tickers[i]), self.tickers[i])
+        )
+        return [StockSearchOut(ticker=self.tickers[i], company_name=self.names[i]) for i in ordered[:limit]]
+
+    # ---- 내부 헬퍼 ----
+
+    def _add_name(self, i: int, name: str, name_keys: List[Tuple[str, int, int]]) -> List[str]:
+        """회사명/별칭의 완전 일치 키와 단어 시작 위치별 접두어 키 추가. 정규화된 단어 목록을 반환."""
+        normalized = normalize(name)
+        if not normalized:
+            return []
+        self._exact_names.setdefault(normalized, []).append(i)
+        words = normalized.split(" ")
+        for start in range(len(words)):
+            name_keys.append((" ".join(words[start:]), i, RANK_NAME_PREFIX if start == 0 else RANK_WORD_PREFIX))
+        return words
+
+    def _add_fuzzy(self, i: int, token: str) -> None:
+        if len(token) < MIN_FUZZY_LENGTH:
+            return
+        for key in {token} | _deletes(token):
+            self._fuzzy.setdefault(key, []).append(i)
+
+    @staticmethod
+    def _prefix(keys: List[str], prefix: str) -> range:
+        """prefix로 시작하는 키의 위치 범위 (최대 MAX_PREFIX_CANDIDATES개)"""
+        start = bisect.bisect_left(keys, prefix)
+        end = start
+        while end < len(keys) and end - start < MAX_PREFIX_CANDIDATES and keys[end].startswith(prefix):
+            end += 1
+        return range(start, end)
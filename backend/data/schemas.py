@@ -449,6 +449,69 @@ class RecommendationReturnsPatch(BaseModel):
     benchmark_return_60d: Optional[float] = None
 
 
+class ScorecardBucket(BaseModel):
+    """스코어카드 일 버킷 (사용자 × 창 × 주도 신호 × 추천일). 채점될 때마다 증분으로 더한다."""
+
+    user_id: int
+    window_days: int = Field(..., description="채점 창 (7 | 30 | 60)")
+    leader: str = Field(..., description="momentum | fundamental | none")
+    day: date = Field(..., description="추천일 (UTC)")
+    calls: int = 0
+    hits: int = 0
+    excess_sum: float = 0.0  # Σ(수익률 − SPY 수익률)
+    conf_calls: int = 0  # 확신도가 있는 콜 수
+    conf_sum: float = 0.0  # Σ confidence/100
+    conf_hits: int = 0
+    brier_sum: float = 0.0  # Σ(confidence/100 − hit)²
+    best_excess: Optional[float] = None
+    best_ticker: Optional[str] = None
+    best_action: Optional[str] = None
+    best_hit: Optional[bool] = None
+    worst_excess: Optional[float] = None
+    worst_ticker: Optional[str] = None
+    worst_action: Optional[str] = None
+    worst_hit: Optional[bool] = None
+
+    @field_validator("leader")
+    @classmethod
+    def _validate_leader(cls, v):
+        allowed = {"momentum", "fundamental", "none"}
+        if v not in allowed:
+            raise ValueError(f"Leader must be one of {allowed}")
+        return v
+
+
+class MarketRegimeCreate(BaseModel):
+    """거래일별 시장 국면 스냅샷 저장 스키마 (판정 입력값 포함)"""
+
+    session_date: date = Field(..., description="종가가 확정된 거래일")
+    regime: str = Field(..., description="risk_on | neutral | risk_off")
+    spy_vs_ma200_pct: Optional[float] = None
+    drawdown_pct: Optional[float] = None
+    realized_vol_pct: Optional[float] = None
+    spy_close: Optional[float] = None
+    spy_ma200: Optional[float] = None
+    spy_peak: Optional[float] = None
+    bars: int = Field(0, ge=0, description="판정에 쓴 SPY 봉 수")
+    note: Optional[str] = None
+    computed_at: datetime
+
+    @field_validator("regime")
+    @classmethod
+    def _validate_regime(cls, v):
+        allowed = {"risk_on", "neutral", "risk_off"}
+        if v not in allowed:
+            raise ValueError(f"Regime must be one of {allowed}")
+        return v
+
+
+class MarketRegimeOut(MarketRegimeCreate):
+    """시장 국면 이력 출력 스키마"""
+
+    class Config:
+        from_attributes = True
+
+
 class TaskProgressOut(BaseModel):
     """
     Celery 태스크 진행 상황 응답 스키마
@@ -0,0 +1,86 @@
+-- 채점 결과 기록과 스코어카드 증분을 한 RPC(한 트랜잭션)로 합친다.
+-- 기존 방식(추천 행 전체 upsert 후 apply_scorecard_deltas 별도 호출)은 동시 수정을 덮어쓰고,
+-- 두 번째 호출이 실패하거나 실행이 재시도/중복되면 집계가 어긋났다.
+
+-- 채점 결과 기록 + 스코어카드 증분을 한 트랜잭션으로 (채점 청크당 1회 호출). scores: [{id, return_7d, ..., benchmark_return_60d}]
+-- 수익률 컬럼만, 아직 비어 있는 창에만 쓴다 (다른 컬럼의 동시 수정을 덮지 않는다).
+-- 버킷에는 이번 호출에서 NULL → 값으로 바뀐 창만 더하므로 재시도/겹친 실행이 같은 창을 두 번 세지 않는다.
+CREATE OR REPLACE FUNCTION public.apply_recommendation_scores(scores JSONB)
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    updated INTEGER;
+    deltas  JSONB;
+BEGIN
+    -- 대상 행을 먼저 잠가 겹친 실행을 직렬화한다 (이후 문장은 먼저 끝난 실행의 기록을 본다)
+    PERFORM 1 FROM public.recommendations
+    WHERE id IN (SELECT (s->>'id')::INTEGER FROM jsonb_array_elements(scores) AS s)
+    ORDER BY id
+    FOR UPDATE;
+
+    WITH input AS (
+        SELECT * FROM jsonb_to_recordset(scores) AS i(
+            id INTEGER, return_7d NUMERIC, return_30d NUMERIC, return_60d NUMERIC,
+            benchmark_return_7d NUMERIC, benchmark_return_30d NUMERIC, benchmark_return_60d NUMERIC
+        )
+    ),
+    scored AS (
+        SELECT r.user_id, w.window_days, (r.created_at AT TIME ZONE 'UTC')::DATE AS day, r.ticker, r.action,
+               r.confidence, w.ret - w.bench AS excess,
+               CASE WHEN r.action = 'BUY' THEN w.ret - w.bench > 0 ELSE w.ret - w.bench < 0 END AS hit,
+               CASE WHEN r.momo_score IS NULL OR r.fund_score IS NULL THEN 'none'
+                    WHEN r.momo_score >= r.fund_score + 10 THEN 'momentum'
+                    WHEN r.fund_score >= r.momo_score + 10 THEN 'fundamental'
+                    ELSE 'none' END AS leader
+        FROM public.recommendations r
+        JOIN input i ON i.id = r.id
+        CROSS JOIN LATERAL (VALUES
+            (7, r.return_7d, i.return_7d, i.benchmark_return_7d),
+            (30, r.return_30d, i.return_30d, i.benchmark_return_30d),
+            (60, r.return_60d, i.return_60d, i.benchmark_return_60d)
+        ) AS w(window_days, prev, ret, bench)
+        WHERE r.action IN ('BUY', 'SELL', 'TRIM') AND w.prev IS NULL AND w.ret IS NOT NULL AND w.bench IS NOT NULL
+    )
+    SELECT COALESCE(jsonb_agg(to_jsonb(b)), '[]'::JSONB) INTO deltas
+    FROM (
+        SELECT
+            user_id, window_days, leader, day,
+            COUNT(*)                                                                  AS calls,
+            COUNT(*) FILTER (WHERE hit)                                               AS hits,
+            SUM(excess)                                                               AS excess_sum,
+            COUNT(confidence)                                                         AS conf_calls,
+            COALESCE(SUM(confidence / 100.0), 0)                                      AS conf_sum,
+            COUNT(*) FILTER (WHERE hit AND confidence IS NOT NULL)                    AS conf_hits,
+            COALESCE(SUM(POWER(confidence / 100.0 - CASE WHEN hit THEN 1 ELSE 0 END, 2)), 0) AS brier_sum,
+            MAX(excess)                                                               AS best_excess,
+            (ARRAY_AGG(ticker ORDER BY excess DESC))[1]                               AS best_ticker,
+            (ARRAY_AGG(action ORDER BY excess DESC))[1]                               AS best_action,
+            (ARRAY_AGG(hit ORDER BY excess DESC))[1]                                  AS best_hit,
+            MIN(excess)                                                               AS worst_excess,
+            (ARRAY_AGG(ticker ORDER BY excess ASC))[1]                                AS worst_ticker,
+            (ARRAY_AGG(action ORDER BY excess ASC))[1]                                AS worst_action,
+            (ARRAY_AGG(hit ORDER BY excess ASC))[1]                                   AS worst_hit
+        FROM scored
+        GROUP BY user_id, window_days, leader, day
+    ) AS b;
+
+    UPDATE public.recommendations AS r SET
+        return_7d            = COALESCE(r.return_7d, i.return_7d),
+        benchmark_return_7d  = CASE WHEN r.return_7d IS NULL THEN i.benchmark_return_7d ELSE r.benchmark_return_7d END,
+        return_30d           = COALESCE(r.return_30d, i.return_30d),
+        benchmark_return_30d = CASE WHEN r.return_30d IS NULL THEN i.benchmark_return_30d ELSE r.benchmark_return_30d END,
+        return_60d           = COALESCE(r.return_60d, i.return_60d),
+        benchmark_return_60d = CASE WHEN r.return_60d IS NULL THEN i.benchmark_return_60d ELSE r.benchmark_return_60d END
+    FROM jsonb_to_recordset(scores) AS i(
+        id INTEGER, return_7d NUMERIC, return_30d NUMERIC, return_60d NUMERIC,
+        benchmark_return_7d NUMERIC, benchmark_return_30d NUMERIC, benchmark_return_60d NUMERIC
+    )
+    WHERE r.id = i.id
+      AND ((r.return_7d IS NULL AND i.return_7d IS NOT NULL)
+        OR (r.return_30d IS NULL AND i.return_30d IS NOT NULL)
+        OR (r.return_60d IS NULL AND i.return_60d IS NOT NULL));
+    GET DIAGNOSTICS updated = ROW_COUNT;
+
+    PERFORM public.apply_scorecard_deltas(deltas);
+    RETURN updated;
+END;
+$$;
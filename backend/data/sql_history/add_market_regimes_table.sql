@@ -0,0 +1,15 @@
+-- 시장 국면 이력: 거래일마다 한 번 판정한 국면과 판정 입력값(SPY 종가/MA200/고점)을 남긴다.
+-- 같은 거래일을 다시 판정하면 덮어쓴다 (session_date 기준 upsert). 백테스트/보고서가 재계산 없이 조회한다.
+CREATE TABLE IF NOT EXISTS public.market_regimes (
+    session_date      DATE PRIMARY KEY,
+    regime            VARCHAR(10) NOT NULL CHECK (regime IN ('risk_on', 'neutral', 'risk_off')),
+    spy_vs_ma200_pct  NUMERIC,
+    drawdown_pct      NUMERIC,
+    realized_vol_pct  NUMERIC,
+    spy_close         NUMERIC,
+    spy_ma200         NUMERIC,
+    spy_peak          NUMERIC,
+    bars              INTEGER NOT NULL DEFAULT 0,
+    note              TEXT,
+    computed_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
@@ -0,0 +1,146 @@
+-- recommendation_scorecard_daily ----------------------------------------------
+-- 스코어카드 집계: 추천이 채점될 때마다 (사용자, 창, 주도 신호, 추천일) 버킷에 증분으로 더한다.
+-- 90일 스코어카드 = 최근 90일 버킷의 합 (REVIEWER가 쿼리 한 번으로 읽는다). HOLD는 적중 판정이 없어 제외.
+CREATE TABLE IF NOT EXISTS public.recommendation_scorecard_daily (
+    user_id       INTEGER NOT NULL,
+    window_days   INTEGER NOT NULL,
+    leader        VARCHAR(12) NOT NULL CHECK (leader IN ('momentum', 'fundamental', 'none')),
+    day           DATE NOT NULL,
+    calls         INTEGER NOT NULL DEFAULT 0,
+    hits          INTEGER NOT NULL DEFAULT 0,
+    excess_sum    DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ(수익률 − SPY 수익률)
+    conf_calls    INTEGER NOT NULL DEFAULT 0,           -- 확신도가 있는 콜 수
+    conf_sum      DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ confidence/100
+    conf_hits     INTEGER NOT NULL DEFAULT 0,
+    brier_sum     DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ(confidence/100 − hit)²
+    best_excess   DOUBLE PRECISION,
+    best_ticker   VARCHAR(10),
+    best_action   VARCHAR(10),
+    best_hit      BOOLEAN,
+    worst_excess  DOUBLE PRECISION,
+    worst_ticker  VARCHAR(10),
+    worst_action  VARCHAR(10),
+    worst_hit     BOOLEAN,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, window_days, leader, day),
+    CONSTRAINT fk_scorecard_daily_user_id FOREIGN KEY (user_id) REFERENCES public.users(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_scorecard_daily_day ON public.recommendation_scorecard_daily(day);
+
+-- 관리자용: 사용자별 최근 90일 스코어카드 (창별)
+CREATE OR REPLACE VIEW public.recommendation_scorecard_overview AS
+SELECT
+    user_id,
+    window_days,
+    SUM(calls)                                                       AS calls,
+    ROUND(SUM(hits)::NUMERIC / NULLIF(SUM(calls), 0), 3)             AS hit_rate,
+    ROUND((SUM(excess_sum) / NULLIF(SUM(calls), 0) * 100)::NUMERIC, 2) AS avg_excess_return_pct,
+    SUM(conf_calls)                                                  AS conf_calls,
+    ROUND((SUM(brier_sum) / NULLIF(SUM(conf_calls), 0))::NUMERIC, 3) AS brier,
+    MAX(day)                                                         AS last_day
+FROM public.recommendation_scorecard_daily
+WHERE day >= CURRENT_DATE - 90
+GROUP BY user_id, window_days;
+
+-- 스코어카드 버킷 증분 반영 (채점 배치당 1회 호출). deltas: ScorecardBucket JSON 배열.
+CREATE OR REPLACE FUNCTION public.apply_scorecard_deltas(deltas JSONB)
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    applied INTEGER;
+BEGIN
+    INSERT INTO public.recommendation_scorecard_daily AS s (
+        user_id, window_days, leader, day, calls, hits, excess_sum, conf_calls, conf_sum, conf_hits, brier_sum,
+        best_excess, best_ticker, best_action, best_hit, worst_excess, worst_ticker, worst_action, worst_hit
+    )
+    SELECT
+        d.user_id, d.window_days, d.leader, d.day, d.calls, d.hits, d.excess_sum, d.conf_calls, d.conf_sum,
+        d.conf_hits, d.brier_sum, d.best_excess, d.best_ticker, d.best_action, d.best_hit,
+        d.worst_excess, d.worst_ticker, d.worst_action, d.worst_hit
+    FROM jsonb_to_recordset(deltas) AS d(
+        user_id INTEGER, window_days INTEGER, leader VARCHAR(12), day DATE, calls INTEGER, hits INTEGER,
+        excess_sum DOUBLE PRECISION, conf_calls INTEGER, conf_sum DOUBLE PRECISION, conf_hits INTEGER,
+        brier_sum DOUBLE PRECISION, best_excess DOUBLE PRECISION, best_ticker VARCHAR(10), best_action VARCHAR(10),
+        best_hit BOOLEAN, worst_excess DOUBLE PRECISION, worst_ticker VARCHAR(10), worst_action VARCHAR(10),
+        worst_hit BOOLEAN
+    )
+    ON CONFLICT (user_id, window_days, leader, day) DO UPDATE SET
+        calls      = s.calls + EXCLUDED.calls,
+        hits       = s.hits + EXCLUDED.hits,
+        excess_sum = s.excess_sum + EXCLUDED.excess_sum,
+        conf_calls = s.conf_calls + EXCLUDED.conf_calls,
+        conf_sum   = s.conf_sum + EXCLUDED.conf_sum,
+        conf_hits  = s.conf_hits + EXCLUDED.conf_hits,
+        brier_sum  = s.brier_sum + EXCLUDED.brier_sum,
+        best_ticker  = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_ticker ELSE s.best_ticker END,
+        best_action  = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_action ELSE s.best_action END,
+        best_hit     = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_hit ELSE s.best_hit END,
+        best_excess  = GREATEST(s.best_excess, EXCLUDED.best_excess),
+        worst_ticker = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_ticker ELSE s.worst_ticker END,
+        worst_action = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_action ELSE s.worst_action END,
+        worst_hit    = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_hit ELSE s.worst_hit END,
+        worst_excess = LEAST(s.worst_excess, EXCLUDED.worst_excess),
+        updated_at   = now();
+    GET DIAGNOSTICS applied = ROW_COUNT;
+    RETURN applied;
+END;
+$$;
+
+-- 스코어카드 버킷 전체 재계산 (최초 이관 / 증분 누락 복구용). 주도 신호 기준 10점은 graph/feedback.SIGNAL_MARGIN과 같다.
+CREATE OR REPLACE FUNCTION public.rebuild_scorecard_aggregates()
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    DELETE FROM public.recommendation_scorecard_daily WHERE true;
+    WITH scored AS (
+        SELECT r.user_id, w.window_days, (r.created_at AT TIME ZONE 'UTC')::DATE AS day, r.ticker, r.action,
+               r.confidence, w.ret - w.bench AS excess,
+               CASE WHEN r.action = 'BUY' THEN w.ret - w.bench > 0 ELSE w.ret - w.bench < 0 END AS hit,
+               CASE WHEN r.momo_score IS NULL OR r.fund_score IS NULL THEN 'none'
+                    WHEN r.momo_score >= r.fund_score + 10 THEN 'momentum'
+                    WHEN r.fund_score >= r.momo_score + 10 THEN 'fundamental'
+                    ELSE 'none' END AS leader
+        FROM public.recommendations r
+        CROSS JOIN LATERAL (VALUES
+            (7, r.return_7d, r.benchmark_return_7d),
+            (30, r.return_30d, r.benchmark_return_30d),
+            (60, r.return_60d, r.benchmark_return_60d)
+        ) AS w(window_days, ret, bench)
+        WHERE r.action IN ('BUY', 'SELL', 'TRIM') AND w.ret IS NOT NULL AND w.bench IS NOT NULL
+    )
+    INSERT INTO public.recommendation_scorecard_daily (
+        user_id, window_days, leader, day, calls, hits, excess_sum, conf_calls, conf_sum, conf_hits, brier_sum,
+        best_excess, best_ticker, best_action, best_hit, worst_excess, worst_ticker, worst_action, worst_hit
+    )
+    SELECT
+        user_id, window_days, leader, day,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE hit),
+        SUM(excess),
+        COUNT(confidence),
+        COALESCE(SUM(confidence / 100.0), 0),
+        COUNT(*) FILTER (WHERE hit AND confidence IS NOT NULL),
+        COALESCE(SUM(POWER(confidence / 100.0 - CASE WHEN hit THEN 1 ELSE 0 END, 2)), 0),
+        MAX(excess),
+        (ARRAY_AGG(ticker ORDER BY excess DESC))[1],
+        (ARRAY_AGG(action ORDER BY excess DESC))[1],
+        (ARRAY_AGG(hit ORDER BY excess DESC))[1],
+        MIN(excess),
+        (ARRAY_AGG(ticker ORDER BY excess ASC))[1],
+        (ARRAY_AGG(action ORDER BY excess ASC))[1],
+        (ARRAY_AGG(hit ORDER BY excess ASC))[1]
+    FROM scored
+    GROUP BY user_id, window_days, leader, day;
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+    RETURN rebuilt;
+END;
+$$;
+
+-- 기존 채점 결과로 버킷을 채운다 (재실행 안전)
+SELECT public.rebuild_scorecard_aggregates();
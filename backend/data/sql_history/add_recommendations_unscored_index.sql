@@ -0,0 +1,4 @@
+-- 전 사용자 일괄 채점(score_all_pending_recommendations)용 부분 인덱스.
+-- 채점 안 된 창이 남은 추천만 담으므로, 채점이 끝난 행이 쌓여도 미채점 조회 비용은 늘지 않는다.
+CREATE INDEX IF NOT EXISTS idx_recommendations_unscored ON public.recommendations(created_at)
+    WHERE return_7d IS NULL OR return_30d IS NULL OR return_60d IS NULL;
@@ -116,6 +116,70 @@ CREATE TABLE IF NOT EXISTS public.recommendations (
 );
 CREATE INDEX IF NOT EXISTS idx_recommendations_user_id    ON public.recommendations(user_id);
 CREATE INDEX IF NOT EXISTS idx_recommendations_created_at ON public.recommendations(created_at);
+-- 일괄 채점용: 채점 안 된 창이 남은 추천만 (채점이 끝난 행은 인덱스에서 빠진다)
+CREATE INDEX IF NOT EXISTS idx_recommendations_unscored   ON public.recommendations(created_at)
+    WHERE return_7d IS NULL OR return_30d IS NULL OR return_60d IS NULL;
+
+-- recommendation_scorecard_daily ----------------------------------------------
+-- 스코어카드 집계: 추천이 채점될 때마다 (사용자, 창, 주도 신호, 추천일) 버킷에 증분으로 더한다.
+-- 90일 스코어카드 = 최근 90일 버킷의 합 (REVIEWER가 쿼리 한 번으로 읽는다). HOLD는 적중 판정이 없어 제외.
+CREATE TABLE IF NOT EXISTS public.recommendation_scorecard_daily (
+    user_id       INTEGER NOT NULL,
+    window_days   INTEGER NOT NULL,
+    leader        VARCHAR(12) NOT NULL CHECK (leader IN ('momentum', 'fundamental', 'none')),
+    day           DATE NOT NULL,
+    calls         INTEGER NOT NULL DEFAULT 0,
+    hits          INTEGER NOT NULL DEFAULT 0,
+    excess_sum    DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ(수익률 − SPY 수익률)
+    conf_calls    INTEGER NOT NULL DEFAULT 0,           -- 확신도가 있는 콜 수
+    conf_sum      DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ confidence/100
+    conf_hits     INTEGER NOT NULL DEFAULT 0,
+    brier_sum     DOUBLE PRECISION NOT NULL DEFAULT 0,  -- Σ(confidence/100 − hit)²
+    best_excess   DOUBLE PRECISION,
+    best_ticker   VARCHAR(10),
+    best_action   VARCHAR(10),
+    best_hit      BOOLEAN,
+    worst_excess  DOUBLE PRECISION,
+    worst_ticker  VARCHAR(10),
+    worst_action  VARCHAR(10),
+    worst_hit     BOOLEAN,
+    updated_at    TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (user_id, window_days, leader, day),
+    CONSTRAINT fk_scorecard_daily_user_id FOREIGN KEY (user_id) REFERENCES public.users(id) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_scorecard_daily_day ON public.recommendation_scorecard_daily(day);
+
+-- 관리자용: 사용자별 최근 90일 스코어카드 (창별)
+CREATE OR REPLACE VIEW public.recommendation_scorecard_overview AS
+SELECT
+    user_id,
+    window_days,
+    SUM(calls)                                                       AS calls,
+    ROUND(SUM(hits)::NUMERIC / NULLIF(SUM(calls), 0), 3)             AS hit_rate,
+    ROUND((SUM(excess_sum) / NULLIF(SUM(calls), 0) * 100)::NUMERIC, 2) AS avg_excess_return_pct,
+    SUM(conf_calls)                                                  AS conf_calls,
+    ROUND((SUM(brier_sum) / NULLIF(SUM(conf_calls), 0))::NUMERIC, 3) AS brier,
+    MAX(day)                                                         AS last_day
+FROM public.recommendation_scorecard_daily
+WHERE day >= CURRENT_DATE - 90
+GROUP BY user_id, window_days;
+
+-- market_regimes --------------------------------------------------------------
+-- 시장 국면 이력: 거래일마다 한 번 판정한 국면과 판정 입력값(SPY 종가/MA200/고점)을 남긴다.
+-- 같은 거래일을 다시 판정하면 덮어쓴다 (session_date 기준 upsert). 백테스트/보고서가 재계산 없이 조회한다.
+CREATE TABLE IF NOT EXISTS public.market_regimes (
+    session_date      DATE PRIMARY KEY,
+    regime            VARCHAR(10) NOT NULL CHECK (regime IN ('risk_on', 'neutral', 'risk_off')),
+    spy_vs_ma200_pct  NUMERIC,
+    drawdown_pct      NUMERIC,
+    realized_vol_pct  NUMERIC,
+    spy_close         NUMERIC,
+    spy_ma200         NUMERIC,
+    spy_peak          NUMERIC,
+    bars              INTEGER NOT NULL DEFAULT 0,
+    note              TEXT,
+    computed_at       TIMESTAMPTZ NOT NULL DEFAULT now()
+);
 
 -- Functions -------------------------------------------------------------------
 -- updated_at 자동 갱신용 (portfolios, positions 공용)
@@ -127,6 +191,189 @@ BEGIN
 END;
 $$;
 
+-- 스코어카드 버킷 증분 반영 (apply_recommendation_scores가 호출). deltas: ScorecardBucket JSON 배열.
+CREATE OR REPLACE FUNCTION public.apply_scorecard_deltas(deltas JSONB)
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    applied INTEGER;
+BEGIN
+    INSERT INTO public.recommendation_scorecard_daily AS s (
+        user_id, window_days, leader, day, calls, hits, excess_sum, conf_calls, conf_sum, conf_hits, brier_sum,
+        best_excess, best_ticker, best_action, best_hit, worst_excess, worst_ticker, worst_action, worst_hit
+    )
+    SELECT
+        d.user_id, d.window_days, d.leader, d.day, d.calls, d.hits, d.excess_sum, d.conf_calls, d.conf_sum,
+        d.conf_hits, d.brier_sum, d.best_excess, d.best_ticker, d.best_action, d.best_hit,
+        d.worst_excess, d.worst_ticker, d.worst_action, d.worst_hit
+    FROM jsonb_to_recordset(deltas) AS d(
+        user_id INTEGER, window_days INTEGER, leader VARCHAR(12), day DATE, calls INTEGER, hits INTEGER,
+        excess_sum DOUBLE PRECISION, conf_calls INTEGER, conf_sum DOUBLE PRECISION, conf_hits INTEGER,
+        brier_sum DOUBLE PRECISION, best_excess DOUBLE PRECISION, best_ticker VARCHAR(10), best_action VARCHAR(10),
+        best_hit BOOLEAN, worst_excess DOUBLE PRECISION, worst_ticker VARCHAR(10), worst_action VARCHAR(10),
+        worst_hit BOOLEAN
+    )
+    ON CONFLICT (user_id, window_days, leader, day) DO UPDATE SET
+        calls      = s.calls + EXCLUDED.calls,
+        hits       = s.hits + EXCLUDED.hits,
+        excess_sum = s.excess_sum + EXCLUDED.excess_sum,
+        conf_calls = s.conf_calls + EXCLUDED.conf_calls,
+        conf_sum   = s.conf_sum + EXCLUDED.conf_sum,
+        conf_hits  = s.conf_hits + EXCLUDED.conf_hits,
+        brier_sum  = s.brier_sum + EXCLUDED.brier_sum,
+        best_ticker  = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_ticker ELSE s.best_ticker END,
+        best_action  = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_action ELSE s.best_action END,
+        best_hit     = CASE WHEN s.best_excess IS NULL OR EXCLUDED.best_excess > s.best_excess
+                            THEN EXCLUDED.best_hit ELSE s.best_hit END,
+        best_excess  = GREATEST(s.best_excess, EXCLUDED.best_excess),
+        worst_ticker = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_ticker ELSE s.worst_ticker END,
+        worst_action = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_action ELSE s.worst_action END,
+        worst_hit    = CASE WHEN s.worst_excess IS NULL OR EXCLUDED.worst_excess < s.worst_excess
+                            THEN EXCLUDED.worst_hit ELSE s.worst_hit END,
+        worst_excess = LEAST(s.worst_excess, EXCLUDED.worst_excess),
+        updated_at   = now();
+    GET DIAGNOSTICS applied = ROW_COUNT;
+    RETURN applied;
+END;
+$$;
+
+-- 채점 결과 기록 + 스코어카드 증분을 한 트랜잭션으로 (채점 청크당 1회 호출). scores: [{id, return_7d, ..., benchmark_return_60d}]
+-- 수익률 컬럼만, 아직 비어 있는 창에만 쓴다 (다른 컬럼의 동시 수정을 덮지 않는다).
+-- 버킷에는 이번 호출에서 NULL → 값으로 바뀐 창만 더하므로 재시도/겹친 실행이 같은 창을 두 번 세지 않는다.
+CREATE OR REPLACE FUNCTION public.apply_recommendation_scores(scores JSONB)
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    updated INTEGER;
+    deltas  JSONB;
+BEGIN
+    -- 대상 행을 먼저 잠가 겹친 실행을 직렬화한다 (이후 문장은 먼저 끝난 실행의 기록을 본다)
+    PERFORM 1 FROM public.recommendations
+    WHERE id IN (SELECT (s->>'id')::INTEGER FROM jsonb_array_elements(scores) AS s)
+    ORDER BY id
+    FOR UPDATE;
+
+    WITH input AS (
+        SELECT * FROM jsonb_to_recordset(scores) AS i(
+            id INTEGER, return_7d NUMERIC, return_30d NUMERIC, return_60d NUMERIC,
+            benchmark_return_7d NUMERIC, benchmark_return_30d NUMERIC, benchmark_return_60d NUMERIC
+        )
+    ),
+    scored AS (
+        SELECT r.user_id, w.window_days, (r.created_at AT TIME ZONE 'UTC')::DATE AS day, r.ticker, r.action,
+               r.confidence, w.ret - w.bench AS excess,
+               CASE WHEN r.action = 'BUY' THEN w.ret - w.bench > 0 ELSE w.ret - w.bench < 0 END AS hit,
+               CASE WHEN r.momo_score IS NULL OR r.fund_score IS NULL THEN 'none'
+                    WHEN r.momo_score >= r.fund_score + 10 THEN 'momentum'
+                    WHEN r.fund_score >= r.momo_score + 10 THEN 'fundamental'
+                    ELSE 'none' END AS leader
+        FROM public.recommendations r
+        JOIN input i ON i.id = r.id
+        CROSS JOIN LATERAL (VALUES
+            (7, r.return_7d, i.return_7d, i.benchmark_return_7d),
+            (30, r.return_30d, i.return_30d, i.benchmark_return_30d),
+            (60, r.return_60d, i.return_60d, i.benchmark_return_60d)
+        ) AS w(window_days, prev, ret, bench)
+        WHERE r.action IN ('BUY', 'SELL', 'TRIM') AND w.prev IS NULL AND w.ret IS NOT NULL AND w.bench IS NOT NULL
+    )
+    SELECT COALESCE(jsonb_agg(to_jsonb(b)), '[]'::JSONB) INTO deltas
+    FROM (
+        SELECT
+            user_id, window_days, leader, day,
+            COUNT(*)                                                                  AS calls,
+            COUNT(*) FILTER (WHERE hit)                                               AS hits,
+            SUM(excess)                                                               AS excess_sum,
+            COUNT(confidence)                                                         AS conf_calls,
+            COALESCE(SUM(confidence / 100.0), 0)                                      AS conf_sum,
+            COUNT(*) FILTER (WHERE hit AND confidence IS NOT NULL)                    AS conf_hits,
+            COALESCE(SUM(POWER(confidence / 100.0 - CASE WHEN hit THEN 1 ELSE 0 END, 2)), 0) AS brier_sum,
+            MAX(excess)                                                               AS best_excess,
+            (ARRAY_AGG(ticker ORDER BY excess DESC))[1]                               AS best_ticker,
+            (ARRAY_AGG(action ORDER BY excess DESC))[1]                               AS best_action,
+            (ARRAY_AGG(hit ORDER BY excess DESC))[1]                                  AS best_hit,
+            MIN(excess)                                                               AS worst_excess,
+            (ARRAY_AGG(ticker ORDER BY excess ASC))[1]                                AS worst_ticker,
+            (ARRAY_AGG(action ORDER BY excess ASC))[1]                                AS worst_action,
+            (ARRAY_AGG(hit ORDER BY excess ASC))[1]                                   AS worst_hit
+        FROM scored
+        GROUP BY user_id, window_days, leader, day
+    ) AS b;
+
+    UPDATE public.recommendations AS r SET
+        return_7d            = COALESCE(r.return_7d, i.return_7d),
+        benchmark_return_7d  = CASE WHEN r.return_7d IS NULL THEN i.benchmark_return_7d ELSE r.benchmark_return_7d END,
+        return_30d           = COALESCE(r.return_30d, i.return_30d),
+        benchmark_return_30d = CASE WHEN r.return_30d IS NULL THEN i.benchmark_return_30d ELSE r.benchmark_return_30d END,
+        return_60d           = COALESCE(r.return_60d, i.return_60d),
+        benchmark_return_60d = CASE WHEN r.return_60d IS NULL THEN i.benchmark_return_60d ELSE r.benchmark_return_60d END
+    FROM jsonb_to_recordset(scores) AS i(
+        id INTEGER, return_7d NUMERIC, return_30d NUMERIC, return_60d NUMERIC,
+        benchmark_return_7d NUMERIC, benchmark_return_30d NUMERIC, benchmark_return_60d NUMERIC
+    )
+    WHERE r.id = i.id
+      AND ((r.return_7d IS NULL AND i.return_7d IS NOT NULL)
+        OR (r.return_30d IS NULL AND i.return_30d IS NOT NULL)
+        OR (r.return_60d IS NULL AND i.return_60d IS NOT NULL));
+    GET DIAGNOSTICS updated = ROW_COUNT;
+
+    PERFORM public.apply_scorecard_deltas(deltas);
+    RETURN updated;
+END;
+$$;
+
+-- 스코어카드 버킷 전체 재계산 (최초 이관 / 증분 누락 복구용). 주도 신호 기준 10점은 graph/feedback.SIGNAL_MARGIN과 같다.
+CREATE OR REPLACE FUNCTION public.rebuild_scorecard_aggregates()
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    DELETE FROM public.recommendation_scorecard_daily WHERE true;
+    WITH scored AS (
+        SELECT r.user_id, w.window_days, (r.created_at AT TIME ZONE 'UTC')::DATE AS day, r.ticker, r.action,
+               r.confidence, w.ret - w.bench AS excess,
+               CASE WHEN r.action = 'BUY' THEN w.ret - w.bench > 0 ELSE w.ret - w.bench < 0 END AS hit,
+               CASE WHEN r.momo_score IS NULL OR r.fund_score IS NULL THEN 'none'
+                    WHEN r.momo_score >= r.fund_score + 10 THEN 'momentum'
+                    WHEN r.fund_score >= r.momo_score + 10 THEN 'fundamental'
+                    ELSE 'none' END AS leader
+        FROM public.recommendations r
+        CROSS JOIN LATERAL (VALUES
+            (7, r.return_7d, r.benchmark_return_7d),
+            (30, r.return_30d, r.benchmark_return_30d),
+            (60, r.return_60d, r.benchmark_return_60d)
+        ) AS w(window_days, ret, bench)
+        WHERE r.action IN ('BUY', 'SELL', 'TRIM') AND w.ret IS NOT NULL AND w.bench IS NOT NULL
+    )
+    INSERT INTO public.recommendation_scorecard_daily (
+        user_id, window_days, leader, day, calls, hits, excess_sum, conf_calls, conf_sum, conf_hits, brier_sum,
+        best_excess, best_ticker, best_action, best_hit, worst_excess, worst_ticker, worst_action, worst_hit
+    )
+    SELECT
+        user_id, window_days, leader, day,
+        COUNT(*),
+        COUNT(*) FILTER (WHERE hit),
+        SUM(excess),
+        COUNT(confidence),
+        COALESCE(SUM(confidence / 100.0), 0),
+        COUNT(*) FILTER (WHERE hit AND confidence IS NOT NULL),
+        COALESCE(SUM(POWER(confidence / 100.0 - CASE WHEN hit THEN 1 ELSE 0 END, 2)), 0),
+        MAX(excess),
+        (ARRAY_AGG(ticker ORDER BY excess DESC))[1],
+        (ARRAY_AGG(action ORDER BY excess DESC))[1],
+        (ARRAY_AGG(hit ORDER BY excess DESC))[1],
+        MIN(excess),
+        (ARRAY_AGG(ticker ORDER BY excess ASC))[1],
+        (ARRAY_AGG(action ORDER BY excess ASC))[1],
+        (ARRAY_AGG(hit ORDER BY excess ASC))[1]
+    FROM scored
+    GROUP BY user_id, window_days, leader, day;
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+    RETURN rebuilt;
+END;
+$$;
+
 -- Triggers (재실행 안전) ------------------------------------------------------
 DROP TRIGGER IF EXISTS portfolio_updated_at ON public.portfolios;
 CREATE TRIGGER portfolio_updated_at
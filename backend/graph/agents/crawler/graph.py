@@ -49,9 +49,9 @@ def build_crawler_graph(llm_client):
             asof=asof,
         )
 
-        if cache_client.exists("crawler_new_candidates"):
-            # cache 조회
-            new_candidates = cache_client.get("crawler_new_candidates")
+        # cache 조회 (exists + get 대신 한 번의 왕복)
+        new_candidates = cache_client.get("crawler_new_candidates")
+        if new_candidates is not None:
             return {
                 "new_candidates": new_candidates,
             }
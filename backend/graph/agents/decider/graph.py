@@ -5,6 +5,7 @@ from langgraph.graph import StateGraph, START, END
 from langgraph.prebuilt import create_react_agent
 from .schema import DeciderState, DeciderLLMOutput
 from .validation import EARNINGS_BLACKOUT_DAYS, build_validated_decisions
+from ... import feature_store
 from ...regime import regime_rules
 from clients import get_finnhub_client, get_stock_client
 from repo import get_portfolio_repo
@@ -31,30 +32,31 @@ def _fetch_earnings_blackout(tickers: list[str]) -> dict[str, str]:
 
 
 def _fetch_company_names(tickers: list[str], new_candidates: list[dict]) -> dict[str, str]:
-    """보고서 표기용 회사명. 후보는 크롤러가 찾은 이름, 보유 종목은 캐시된 종목 정보에서."""
+    """보고서 표기용 회사명. 후보는 크롤러가 찾은 이름, 보유 종목은 피처 저장소의 메타데이터에서."""
     names = {str(c.get("ticker", "")).upper(): str(c.get("name", "")) for c in new_candidates if c.get("ticker")}
-    client = get_stock_client()
-    for ticker in tickers:
-        if names.get(ticker):
-            continue
-        try:
-            info = client.get_stock_data([ticker], period="6mo").get("stock_info", {}).get(ticker, {})
-            names[ticker] = info.get("shortName") or info.get("longName") or ""
-        except Exception:
-            names[ticker] = ""
+    missing = [ticker for ticker in tickers if not names.get(ticker)]
+    if not missing:
+        return names
+    try:
+        meta = feature_store.get_meta_rows(missing)
+    except Exception:
+        meta = {}
+    for ticker in missing:
+        names[ticker] = (meta.get(ticker) or {}).get("name", "")
     return names
 
 
 def _fetch_prices(tickers: list[str]) -> dict[str, float]:
     """티커별 현재가 조회. 실패한 티커는 제외(validation에서 포지션 가격으로 폴백)."""
-    prices: dict[str, float] = {}
-    client = get_stock_client()
-    for ticker in tickers:
-        try:
-            prices[ticker] = float(client.get_stock_current_price([ticker])[ticker])
-        except Exception as e:
-            logger.warning(f"Failed to fetch current price for {ticker}: {e}")
-    return prices
+    try:
+        prices = get_stock_client().get_stock_current_price(tickers)
+    except Exception as e:
+        logger.warning(f"Failed to fetch current prices for {tickers}: {e}")
+        return {}
+    missing = [ticker for ticker in tickers if ticker not in prices]
+    if missing:
+        logger.warning(f"Failed to fetch current price for {missing}")
+    return {ticker: float(price) for ticker, price in prices.items()}
 
 
 def build_decider_graph(llm_client):
@@ -0,0 +1,166 @@
+# graph/feature_store.py
+"""티커별 일일 피처 저장소 — (티커, 기준 거래일)마다 한 번 계산해 모든 사용자·에이전트가 공유한다.
+
+같은 종목을 가진 사용자가 N명이어도 지표는 한 번만 계산된다. 유니버스에 따라 달라지는 값(z-score, MOMO)은
+저장하지 않고, 도구가 저장된 행으로 매번 계산한다.
+
+- 키: features:{종류}:{티커}:{기준일}. 기준일은 종가가 확정된 최근 거래일(last_settled_session).
+  일봉 지표는 기준일 이후 봉(장중 미완성 봉)을 잘라내고 계산한다 — 행이 키의 기준일과 어긋나지 않도록.
+- 종류:
+  - momo:{period}: 모멘텀 지표 행 (graph/momentum.momentum_rows)
+  - fund:{규칙 해시}: FUND 스코어. 유니버스와 무관하므로 결과 전체를 저장하고, 규칙 표가 바뀌면 키도 바뀐다.
+  - risk:{period}: ATR%, beta
+  - meta: 회사명, 섹터, 산업
+- 저장은 CacheClient.get_or_set_many로 한다. 미스 티커만 한 번에 계산하고, 같은 티커를 동시에 계산하지 않는다.
+  만료는 일봉 캐시와 같은 bars_expire_at(다음 마감 + 확정 대기)이다. 그 전에는 입력(일봉/info)이 바뀌지 않는다.
+- 계산할 수 없는 티커(데이터 부족 등)는 CachedFailure로 짧게 저장하고 결과에서 뺀다.
+- Redis가 없으면 저장 없이 바로 계산한다.
+"""
+import hashlib
+import json
+import logging
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from clients import get_stock_client, price_matrix
+from clients.cache_client import CachedFailure
+from clients.market_calendar import bars_expire_at, last_settled_session
+
+from .fund import load_fund_rules, score_fundamentals
+from .momentum import momentum_rows
+
+logger = logging.getLogger(__name__)
+
+FEATURE_KEY_PREFIX = "features"
+INFO_PERIOD = "6mo"  # info만 조회할 때 넘기는 기간 (info 캐시는 기간과 무관)
+DEFAULT_RISK_ROW = {"beta": 1.0, "atr_pct": 0.0}  # 리스크 행이 없는 티커(계산 실패)의 중립값
+
+
+def feature_asof(now=None) -> date:
+    """피처 행의 기준일 (종가가 확정된 최근 거래일)"""
+    return last_settled_session(now)
+
+
+def feature_key(kind: str, ticker: str, asof: date) -> str:
+    return f"{FEATURE_KEY_PREFIX}:{kind}:{ticker}:{asof.isoformat()}"
+
+
+def get_feature_rows(
+    kind: str,
+    tickers: Iterable[str],
+    compute: Callable[[List[str]], Dict[str, Any]],
+    asof: Optional[date] = None,
+) -> Dict[str, Any]:
+    """tickers의 kind 피처 행 (tickers 순서, 행이 없는 티커 제외). 저장소 미스만 compute(미스 티커) → {티커: 행}."""
+    asof = asof or feature_asof()
+    tickers = list(dict.fromkeys(tickers))
+    keys = {feature_key(kind, ticker, asof): ticker for ticker in tickers}
+
+    def fetch_many(missing_keys: List[str]) -> Dict[str, Any]:
+        targets = [keys[key] for key in missing_keys]
+        try:
+            rows = compute(targets)
+        except Exception as e:
+            logger.warning(f"피처 계산 실패 ({kind}, {len(targets)}종목): {e}")
+            rows = {}
+        return {
+            feature_key(kind, ticker, asof): rows[ticker] if ticker in rows else CachedFailure("no features")
+            for ticker in targets
+        }
+
+    try:
+        cache = get_stock_client().get_cache_client()
+        stored = cache.get_or_set_many(keys, fetch_many, expire_at=bars_expire_at())
+    except Exception as e:
+        logger.warning(f"피처 저장소 사용 불가 (직접 계산): {e}")
+        stored = fetch_many(list(keys))
+    rows = {keys[key]: row for key, row in stored.items() if not isinstance(row, CachedFailure)}
+    return {ticker: rows[ticker] for ticker in tickers if ticker in rows}
+
+
+# ---- 종류별 행 ----
+
+
+def get_momentum_rows(tickers: List[str], period: str = "6mo", asof: Optional[date] = None) -> Dict[str, Dict]:
+    """모멘텀 지표 행 (봉이 부족한 티커 제외)"""
+    asof = asof or feature_asof()
+
+    def compute(targets: List[str]) -> Dict[str, Dict]:
+        return momentum_rows(settled_histories(get_stock_client().get_history(targets, period), asof))
+
+    return get_feature_rows(f"momo:{period}", tickers, compute, asof)
+
+
+def get_fund_rows(tickers: List[str], asof: Optional[date] = None) -> Dict[str, Dict]:
+    """FUND 스코어 행 (info가 부족한 티커 제외)"""
+
+    def compute(targets: List[str]) -> Dict[str, Dict]:
+        stock_info = _fetch_info(targets)
+        return {row["ticker"]: row for row in score_fundamentals({t: stock_info.get(t) for t in targets})}
+
+    return get_feature_rows(f"fund:{fund_rules_digest()}", tickers, compute, asof)
+
+
+def get_risk_rows(tickers: List[str], period: str = "3mo", asof: Optional[date] = None) -> Dict[str, Dict]:
+    """ATR%(14) / beta 행. history가 없으면 ATR% 0.0, beta가 없으면 1.0."""
+    asof = asof or feature_asof()
+
+    def compute(targets: List[str]) -> Dict[str, Dict]:
+        stock_data = get_stock_client().get_stock_data(targets, period, components=("history", "info"))
+        stock_info = stock_data.get("stock_info", {})
+        atr_pcts = price_matrix.atr_pct(settled_histories(stock_data.get("stock_history", {}), asof))
+        return {
+            ticker: {
+                "atr_pct": float(atr_pcts.get(ticker, 0.0)),
+                "beta": float((stock_info.get(ticker) or {}).get("beta", 1.0) or 1.0),
+            }
+            for ticker in targets
+        }
+
+    return get_feature_rows(f"risk:{period}", tickers, compute, asof)
+
+
+def get_meta_rows(tickers: List[str], asof: Optional[date] = None) -> Dict[str, Dict]:
+    """보고서/결정 표기용 메타데이터 행 (info가 없는 티커 제외)"""
+
+    def compute(targets: List[str]) -> Dict[str, Dict]:
+        stock_info = _fetch_info(targets)
+        rows = {}
+        for ticker in targets:
+            info = stock_info.get(ticker)
+            if info:
+                rows[ticker] = {
+                    "name": info.get("shortName") or info.get("longName") or "",
+                    "sector": info.get("sector") or "",
+                    "industry": info.get("industry") or "",
+                }
+        return rows
+
+    return get_feature_rows("meta", tickers, compute, asof)
+
+
+def settled_histories(histories: Dict[str, Optional[pd.DataFrame]], asof: date) -> Dict[str, Optional[pd.DataFrame]]:
+    """asof(기준 거래일) 이후 봉을 잘라낸 history (regime의 CloseSeries.until과 같은 역할, 자를 봉이 없으면 그대로)"""
+    return {ticker: _until(history, asof) for ticker, history in histories.items()}
+
+
+def _until(history: Optional[pd.DataFrame], session: date) -> Optional[pd.DataFrame]:
+    if history is None or history.empty:
+        return history
+    cutoff = pd.Timestamp(session + timedelta(days=1))
+    if history.index.tz is not None:
+        cutoff = cutoff.tz_localize(history.index.tz)
+    end = int(history.index.searchsorted(cutoff, side="left"))
+    return history if end == len(history) else history.iloc[:end]
+
+
+def fund_rules_digest() -> str:
+    """현재 FUND 규칙 표의 짧은 해시 (규칙을 조정하면 저장된 FUND 행을 새로 계산하도록 키에 넣는다)"""
+    encoded = json.dumps(load_fund_rules(), sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha1(encoded).hexdigest()[:8]
+
+
+def _fetch_info(tickers: List[str]) -> Dict[str, Dict]:
+    return get_stock_client().get_stock_data(tickers, INFO_PERIOD, components=("info",)).get("stock_info", {})
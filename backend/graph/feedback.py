@@ -1,20 +1,25 @@
 # graph/feedback.py
 """추천 트랙레코드: 기록 → 채점 → 스코어카드 → δ(가중치 조정) 산출.
 
-흐름 (worker가 매 런마다 호출):
-    1. score_pending_recommendations : 창(7/30/60일)이 경과한 미채점 추천을 실현 수익률로 채점
-    2. (파이프라인 실행 — REVIEWER가 build_scorecard/compute_delta 사용)
-    3. record_recommendations        : 이번 런의 결정을 다음 채점 대상으로 기록
+흐름:
+    1. score_all_pending_recommendations : (장 마감 후 하루 1회, 전 사용자) 창(7/30/60일)이 경과한 미채점 추천을
+                                           실현 수익률로 채점
+       → 채점된 창은 스코어카드 일 버킷(recommendation_scorecard_daily)에 증분으로 더한다
+    2. (매 런: 파이프라인 실행 — REVIEWER가 버킷 합 스코어카드(get_scorecard)와 compute_delta 사용)
+    3. record_recommendations            : (매 런) 이번 런의 결정을 다음 채점 대상으로 기록
 
 채점 기준: 적중(hit)은 같은 기간 SPY 대비 초과수익의 방향으로 판정한다.
     BUY → 초과수익 > 0이면 적중 / SELL·TRIM → 초과수익 < 0이면 적중 / HOLD → 채점 제외
 """
 import logging
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
 
 from clients import get_stock_client
-from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch
+from clients.close_series import CloseSeries
+from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch, ScorecardBucket
 from repo import get_recommendation_repo
 from .agents.decider.validation import MAX_ADJUSTMENT
 
@@ -34,41 +39,76 @@ BENCHMARK_TICKER = "SPY"
 # ---- 순수 함수: 채점 ----
 
 
-def price_on_or_after(closes_by_date: Dict[date, float], target: date) -> Optional[float]:
+def price_on_or_after(closes: Union[CloseSeries, Dict[date, float]], target: date) -> Optional[float]:
     """target 당일 또는 그 이후 첫 거래일의 종가 (휴장일 보정)."""
-    for d in sorted(closes_by_date):
-        if d >= target:
-            return closes_by_date[d]
-    return None
+    return CloseSeries.coerce(closes).on_or_after(target)
 
 
 def compute_returns_patch(
     rec: RecommendationOut,
-    stock_closes: Dict[date, float],
-    spy_closes: Dict[date, float],
+    stock_closes: Union[CloseSeries, Dict[date, float]],
+    spy_closes: Union[CloseSeries, Dict[date, float]],
     asof: date,
 ) -> Optional[RecommendationReturnsPatch]:
     """경과했지만 아직 채점되지 않은 창들의 수익률을 계산한다. 갱신할 것이 없으면 None."""
-    fields: Dict[str, float] = {}
-    rec_date = rec.created_at.date()
+    return compute_returns_patches([rec], {rec.ticker: stock_closes}, spy_closes, asof)[0]
 
-    for window in SCORING_WINDOWS:
-        if getattr(rec, f"return_{window}d") is not None:
-            continue  # 이미 채점됨
-        end_date = rec_date + timedelta(days=window)
-        if end_date > asof:
-            continue  # 창 미경과
 
-        stock_end = price_on_or_after(stock_closes, end_date)
-        spy_start = price_on_or_after(spy_closes, rec_date)
-        spy_end = price_on_or_after(spy_closes, end_date)
-        if stock_end is None or spy_start is None or spy_end is None or spy_start <= 0:
-            continue  # 가격 데이터 부족 — 다음 런에서 재시도
-
-        fields[f"return_{window}d"] = round(stock_end / rec.price_at_rec - 1.0, 6)
-        fields[f"benchmark_return_{window}d"] = round(spy_end / spy_start - 1.0, 6)
+def compute_returns_patches(
+    recs: List[RecommendationOut],
+    closes_by_ticker: Dict[str, Union[CloseSeries, Dict[date, float]]],
+    spy_closes: Union[CloseSeries, Dict[date, float]],
+    asof: date,
+) -> List[Optional[RecommendationReturnsPatch]]:
+    """여러 추천의 채점 패치를 한 번에 계산한다 (recs 순서, 갱신할 것이 없으면 None).
 
-    return RecommendationReturnsPatch(**fields) if fields else None
+    (추천, 미채점·경과 창) 쌍을 모아 티커별로 창 끝 날짜를 한 번에 조회하고, SPY는 전체를 한 번에 조회한다.
+    """
+    pending_rec, pending_window, end_dates = [], [], []
+    for i, rec in enumerate(recs):
+        rec_date = rec.created_at.date()
+        for window in SCORING_WINDOWS:
+            if getattr(rec, f"return_{window}d") is not None:
+                continue  # 이미 채점됨
+            end_date = rec_date + timedelta(days=window)
+            if end_date > asof:
+                continue  # 창 미경과
+            pending_rec.append(i)
+            pending_window.append(window)
+            end_dates.append(end_date)
+
+    patches: List[Optional[RecommendationReturnsPatch]] = [None] * len(recs)
+    if not pending_rec:
+        return patches
+
+    rec_idx = np.array(pending_rec)
+    spy = CloseSeries.coerce(spy_closes)
+    spy_starts = spy.on_or_after_many(recs[i].created_at.date() for i in pending_rec)
+    spy_ends = spy.on_or_after_many(end_dates)
+
+    stock_ends = np.full(len(pending_rec), np.nan)
+    tickers = np.array([recs[i].ticker for i in pending_rec], dtype=object)
+    for ticker in dict.fromkeys(tickers.tolist()):
+        rows = np.flatnonzero(tickers == ticker)
+        series = CloseSeries.coerce(closes_by_ticker.get(ticker))
+        stock_ends[rows] = series.on_or_after_many(end_dates[row] for row in rows.tolist())
+
+    price_at_rec = np.array([recs[i].price_at_rec for i in pending_rec], dtype="f8")
+    # 가격 데이터 부족(NaN) 창은 건너뛰고 다음 런에서 재시도
+    with np.errstate(invalid="ignore", divide="ignore"):
+        valid = ~np.isnan(stock_ends) & ~np.isnan(spy_ends) & (spy_starts > 0)
+        stock_returns = stock_ends / price_at_rec - 1.0
+        benchmark_returns = spy_ends / spy_starts - 1.0
+
+    fields: Dict[int, Dict[str, float]] = {}
+    for row in np.flatnonzero(valid).tolist():
+        window = pending_window[row]
+        rec_fields = fields.setdefault(int(rec_idx[row]), {})
+        rec_fields[f"return_{window}d"] = round(float(stock_returns[row]), 6)
+        rec_fields[f"benchmark_return_{window}d"] = round(float(benchmark_returns[row]), 6)
+    for i, rec_fields in fields.items():
+        patches[i] = RecommendationReturnsPatch(**rec_fields)
+    return patches
 
 
 def is_hit(action: str, stock_return: float, benchmark_return: float) -> Optional[bool]:
@@ -194,6 +234,70 @@ def _call_summary(scored_item) -> Optional[Dict[str, Any]]:
     return {"ticker": rec.ticker, "action": rec.action, "excess_return_pct": round(excess * 100, 2), "hit": hit}
 
 
+# ---- 순수 함수: 스코어카드 버킷 합산 ----
+
+
+def scorecard_from_buckets(buckets: List[ScorecardBucket], window_days: int = PRIMARY_WINDOW_DAYS) -> Dict[str, Any]:
+    """일 버킷 합으로 build_scorecard와 같은 형태의 스코어카드를 만든다 (룩백은 버킷 조회에서 일 단위로 자른다)."""
+    buckets = [bucket for bucket in buckets if bucket.window_days == window_days]
+
+    def summarize(subset: List[ScorecardBucket]) -> Dict[str, Any]:
+        n = sum(bucket.calls for bucket in subset)
+        if n == 0:
+            return {"calls": 0, "hit_rate": None, "avg_excess_return_pct": None}
+        hits = sum(bucket.hits for bucket in subset)
+        avg_excess = sum(bucket.excess_sum for bucket in subset) / n
+        return {
+            "calls": n,
+            "hit_rate": round(hits / n, 3),
+            "avg_excess_return_pct": round(avg_excess * 100, 2),
+        }
+
+    with_calls = [bucket for bucket in buckets if bucket.calls]
+    best = max((b for b in with_calls if b.best_excess is not None), key=lambda b: b.best_excess, default=None)
+    worst = min((b for b in with_calls if b.worst_excess is not None), key=lambda b: b.worst_excess, default=None)
+
+    return {
+        "window_days": window_days,
+        "lookback_days": SCORECARD_LOOKBACK_DAYS,
+        "overall": summarize(buckets),
+        "momentum_led": summarize([b for b in buckets if b.leader == "momentum"]),
+        "fundamental_led": summarize([b for b in buckets if b.leader == "fundamental"]),
+        "best_call": _bucket_call(best, "best"),
+        "worst_call": _bucket_call(worst, "worst"),
+        "calibration": _bucket_calibration(buckets),
+    }
+
+
+def _bucket_call(bucket: Optional[ScorecardBucket], side: str) -> Optional[Dict[str, Any]]:
+    if bucket is None:
+        return None
+    return {
+        "ticker": getattr(bucket, f"{side}_ticker"),
+        "action": getattr(bucket, f"{side}_action"),
+        "excess_return_pct": round(getattr(bucket, f"{side}_excess") * 100, 2),
+        "hit": getattr(bucket, f"{side}_hit"),
+    }
+
+
+def _bucket_calibration(buckets: List[ScorecardBucket]) -> Dict[str, Any]:
+    """_calibration과 같은 확신도 보정 통계 (버킷 합으로)"""
+    n = sum(bucket.conf_calls for bucket in buckets)
+    if n == 0:
+        return {"calls": 0, "avg_confidence": None, "hit_rate": None, "overconfidence_gap_pct": None, "brier": None}
+
+    avg_confidence = sum(bucket.conf_sum for bucket in buckets) / n
+    hit_rate = sum(bucket.conf_hits for bucket in buckets) / n
+    brier = sum(bucket.brier_sum for bucket in buckets) / n
+    return {
+        "calls": n,
+        "avg_confidence": round(avg_confidence, 3),
+        "hit_rate": round(hit_rate, 3),
+        "overconfidence_gap_pct": round((avg_confidence - hit_rate) * 100, 1),
+        "brier": round(brier, 3),
+    }
+
+
 # ---- 오케스트레이션 (worker / REVIEWER에서 호출) ----
 
 
@@ -225,49 +329,82 @@ async def record_recommendations(user_id: int, report_id: Optional[int], decisio
 
 
 async def score_pending_recommendations(user_id: int, asof: Optional[datetime] = None) -> int:
-    """창이 경과한 미채점 추천을 채점한다. 갱신된 추천 수를 반환."""
+    """한 사용자의 창이 경과한 미채점 추천을 채점한다. 갱신된 추천 수를 반환.
+
+    정기 실행은 전 사용자 일괄 채점(score_all_pending_recommendations)을 쓴다 — 수동 재채점/스크립트용.
+    """
     asof = asof or datetime.now(timezone.utc)
     lookback = SCORECARD_LOOKBACK_DAYS + max(SCORING_WINDOWS)
     recs = await get_recommendation_repo().get_recent(user_id, days=lookback)
+    updated = await _score_recommendations(recs, asof)
+    logger.info(f"Scored {updated} recommendations for user {user_id}")
+    return updated
+
+
+async def score_all_pending_recommendations(asof: Optional[datetime] = None) -> Dict[str, Any]:
+    """전 사용자의 미채점 추천을 한 번에 채점한다 (장 마감 후 하루 1회).
+
+    미채점 추천 조회 1회 + 서로 다른 티커(+SPY)의 종가 일괄 조회 1회 + 일괄 기록 RPC — 비용은 사용자 수가 아니라
+    티커 수에 비례한다.
+    """
+    asof = asof or datetime.now(timezone.utc)
+    since = asof - timedelta(days=SCORECARD_LOOKBACK_DAYS + max(SCORING_WINDOWS))
+    until = asof - timedelta(days=min(SCORING_WINDOWS))
+    recs = await get_recommendation_repo().get_unscored(since, until)
+    updated = await _score_recommendations(recs, asof)
+    summary = {
+        "pending": len(recs),
+        "scored": updated,
+        "users": len({rec.user_id for rec in recs}),
+        "tickers": len({rec.ticker for rec in recs}),
+    }
+    logger.info(f"Batch scored {updated}/{len(recs)} recommendations ({summary['tickers']} tickers)")
+    return summary
+
+
+async def _score_recommendations(recs: List[RecommendationOut], asof: datetime) -> int:
+    """recs를 채점해 바뀐 추천만 일괄 기록한다. 갱신된 추천 수를 반환."""
     if not recs:
         return 0
 
-    spy_closes = fetch_closes(BENCHMARK_TICKER)
+    closes = fetch_closes_many([BENCHMARK_TICKER, *{rec.ticker for rec in recs}])
+    spy_closes = closes.get(BENCHMARK_TICKER)
     if not spy_closes:
         logger.error("Benchmark price history unavailable; skipping scoring this run")
         return 0
 
-    updated = 0
-    closes_cache: Dict[str, Dict[date, float]] = {}
-    for rec in recs:
-        if rec.ticker not in closes_cache:
-            closes_cache[rec.ticker] = fetch_closes(rec.ticker)
-        patch = compute_returns_patch(rec, closes_cache[rec.ticker], spy_closes, asof.date())
-        if patch is None:
-            continue
-        await get_recommendation_repo().update(rec.id, patch)
-        updated += 1
-
-    logger.info(f"Scored {updated} recommendations for user {user_id}")
-    return updated
+    patches = compute_returns_patches(recs, closes, spy_closes, asof.date())
+    scores = {rec.id: patch for rec, patch in zip(recs, patches) if patch is not None}
+    if not scores:
+        return 0
+    # 수익률 기록과 스코어카드 증분은 한 RPC(트랜잭션)에서 — 비어 있던 창만 쓰고 그 창만 버킷에 더한다
+    return await get_recommendation_repo().apply_scores(scores)
 
 
 async def get_scorecard(user_id: int, asof: Optional[datetime] = None) -> Dict[str, Any]:
-    """스코어카드 + δ 조회 (REVIEWER 에이전트용)."""
-    recs = await get_recommendation_repo().get_recent(user_id, days=SCORECARD_LOOKBACK_DAYS)
-    scorecard = build_scorecard(recs, asof=asof)
+    """스코어카드 + δ 조회 (REVIEWER 에이전트용). 채점 때 쌓아 둔 일 버킷을 한 번 조회해 합한다."""
+    asof = asof or datetime.now(timezone.utc)
+    since = (asof - timedelta(days=SCORECARD_LOOKBACK_DAYS)).date()
+    buckets = await get_recommendation_repo().get_scorecard_buckets(user_id, PRIMARY_WINDOW_DAYS, since)
+    scorecard = scorecard_from_buckets(buckets, PRIMARY_WINDOW_DAYS)
     scorecard["delta"] = compute_delta(scorecard)
     return scorecard
 
 
-def fetch_closes(ticker: str, period: str = "6mo") -> Dict[date, float]:
-    """종가 이력을 날짜→종가 dict로 변환 (휴장일 제외, 24h 캐시 적용). regime 모듈도 사용."""
+def fetch_closes(ticker: str, period: str = "6mo") -> CloseSeries:
+    """종가 이력을 날짜순 종가 시계열로 변환 (휴장일 제외, 가격 저장소/캐시 적용). regime 모듈도 사용.
+
+    조회 실패/이력 없음은 빈 시계열 (거짓으로 평가된다).
+    """
+    return fetch_closes_many([ticker], period).get(ticker, CloseSeries.empty())
+
+
+def fetch_closes_many(tickers: List[str], period: str = "6mo") -> Dict[str, CloseSeries]:
+    """여러 티커의 종가 시계열을 한 번에 조회한다 (이력이 없는 티커는 빈 시계열)."""
+    tickers = list(dict.fromkeys(tickers))
     try:
-        data = get_stock_client().get_stock_data([ticker], period=period)
-        history = data.get("stock_history", {}).get(ticker)
-        if history is None or history.empty:
-            return {}
-        return {idx.date(): float(close) for idx, close in history["Close"].items()}
+        histories = get_stock_client().get_history(tickers, period=period)
     except Exception as e:
-        logger.error(f"Failed to fetch price history for {ticker}: {e}")
-        return {}
+        logger.error(f"Failed to fetch price history for {len(tickers)} tickers: {e}")
+        histories = {}
+    return {ticker: CloseSeries.from_history(histories.get(ticker)) for ticker in tickers}
@@ -0,0 +1,145 @@
+# graph/fund.py
+"""펀더멘털(FUND) 스코어 엔진: 규칙 표(fund_rules.json)를 전 티커 지표 표에 열 단위로 적용한다.
+
+- 규칙 한 줄 = 지표(info 필드, 앞 필드가 비면 다음 필드) + 구간 조건(위에서부터 처음 맞는 것 하나) +
+  가감점 + 인사이트 문구 + 그룹(V/G/Q/E). 값이 없거나 0이면 규칙을 건너뛴다.
+- 그룹 점수 = base + 가감점 합, 0~100으로 자른다. FUND = Σ weight·그룹 점수 (정수 버림).
+- 인사이트는 그룹 순서대로 그룹당 최대 max_insights_per_group개. data_confidence는 confidence.fields 중
+  값이 없는(None) 지표 수로 정한다.
+- 임계값/가중치/문구는 코드 수정 없이 JSON으로 조정한다 (FUND_RULES_PATH로 다른 파일 지정 가능).
+"""
+import json
+import logging
+import operator
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(__file__), "fund_rules.json")
+FUND_RULES_PATH = os.getenv("FUND_RULES_PATH") or DEFAULT_RULES_PATH
+MIN_INFO_FIELDS = 5  # info 필드가 이보다 적으면 스코어링하지 않음
+
+OPERATORS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+@lru_cache(maxsize=None)
+def load_fund_rules(path: str = FUND_RULES_PATH) -> Dict[str, Any]:
+    """규칙 표 로드. 지정 파일을 못 읽으면 기본 표로 대체한다."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        if path == DEFAULT_RULES_PATH:
+            raise
+        logger.warning(f"FUND 규칙 표 로드 실패 ({path}), 기본 표 사용: {e}")
+        return load_fund_rules(DEFAULT_RULES_PATH)
+
+
+def fundamentals_frame(stock_info: Dict[str, Optional[dict]], rules: Dict[str, Any]) -> pd.DataFrame:
+    """티커별 info → (티커 × 규칙 지표) 표. 값은 object (None은 None 그대로, 숫자 변환은 스코어링에서).
+
+    info가 비었거나 필드가 MIN_INFO_FIELDS 미만이거나 현재가가 없는 티커는 뺀다.
+    """
+    infos = {
+        ticker: info
+        for ticker, info in stock_info.items()
+        if info
+        and len(info) >= MIN_INFO_FIELDS
+        and (info.get("currentPrice") or info.get("regularMarketPrice"))
+    }
+    # 열(지표) 단위로 모은다. object 배열이라 None(값 없음)이 NaN 값과 구분된다.
+    values = np.empty((len(infos), len(rules["rules"])), dtype=object)
+    for column, rule in enumerate(rules["rules"]):
+        fields = rule["fields"]
+        if len(fields) == 1:
+            values[:, column] = [info.get(fields[0]) for info in infos.values()]
+        else:
+            values[:, column] = [_first_value(info, fields) for info in infos.values()]
+    return pd.DataFrame(values, index=list(infos), columns=[rule["name"] for rule in rules["rules"]])
+
+
+def score_fundamentals(
+    stock_info: Dict[str, Optional[dict]], rules: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """티커별 info → FUND 스코어 항목 리스트 (입력 순서 유지, 스코어링할 수 없는 티커 제외)"""
+    rules = rules or load_fund_rules()
+    raw = fundamentals_frame(stock_info, rules)
+    if raw.empty:
+        return []
+    cells = raw.to_numpy()
+    values = _to_float(cells)
+    tickers = list(raw.index)
+    groups = rules["groups"]
+
+    points = {group: np.zeros(len(tickers), dtype=int) for group in groups}
+    insights: Dict[str, List[List[str]]] = {group: [[] for _ in tickers] for group in groups}
+    for column, rule in enumerate(rules["rules"]):
+        x = values[:, column]
+        numbers = x.tolist()  # 문구는 변환된 수치로 만든다 (문자열 셀이면 서식 지정자가 실패)
+        group_insights = insights[rule["group"]]
+        pending = ~np.isnan(x) & (x != 0)  # 값이 없거나 0이면 규칙 건너뜀
+        for case in rule["cases"]:
+            with np.errstate(invalid="ignore"):
+                hit = pending & OPERATORS[case["op"]](x, case["value"])
+            pending &= ~hit
+            points[rule["group"]] += np.where(hit, case["points"], 0)
+            # 문구는 걸린 티커만 만든다
+            template = case["insight"]
+            for row in np.flatnonzero(hit).tolist():
+                group_insights[row].append(template.format(value=numbers[row]))
+
+    scores = {group: np.clip(spec["base"] + points[group], 0, 100) for group, spec in groups.items()}
+    fund = np.zeros(len(tickers))
+    for group, spec in groups.items():
+        fund = fund + spec["weight"] * scores[group]
+    fund = fund.astype(int)
+
+    labels = np.select(
+        [fund >= threshold for threshold, _ in rules["labels"]],
+        [label for _, label in rules["labels"]],
+        rules["default_label"],
+    )
+    confidence = rules["confidence"]
+    missing = np.equal(raw[confidence["fields"]].to_numpy(), None).sum(axis=1)  # NaN 값은 "있음"으로 본다
+    data_confidence = np.select(
+        [missing >= confidence["low_missing"], missing >= confidence["medium_missing"]], ["low", "medium"], "high"
+    )
+
+    limit = rules["max_insights_per_group"]
+    group_scores = {group: scores[group].tolist() for group in groups}
+    return [
+        {
+            "ticker": ticker,
+            "FUND": fund_score,
+            "scores": {group: group_scores[group][row] for group in groups},
+            "label": label,
+            "insights": [text for group in groups for text in insights[group][row][:limit]] or [rules["no_insight"]],
+            "data_confidence": level,
+        }
+        for row, (ticker, fund_score, label, level) in enumerate(
+            zip(tickers, fund.tolist(), labels.tolist(), data_confidence.tolist())
+        )
+    ]
+
+
+def _first_value(info: dict, fields: List[str]) -> Any:
+    """info.get(a) or info.get(b) ... 와 같은 값 (모두 비면 마지막 필드 값)"""
+    value = None
+    for field in fields:
+        value = info.get(field)
+        if value:
+            break
+    return value
+
+
+def _to_float(cells: np.ndarray) -> np.ndarray:
+    """object 배열 → float 배열 (None·숫자가 아닌 값은 NaN)"""
+    try:
+        return cells.astype("f8")
+    except (TypeError, ValueError):
+        return pd.DataFrame(cells).apply(pd.to_numeric, errors="coerce").to_numpy(dtype="f8")
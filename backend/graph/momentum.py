@@ -0,0 +1,153 @@
+# graph/momentum.py
+"""모멘텀(MOMO) 스코어 엔진: 전 티커를 (봉 × 티커) 배열 하나로 쌓아 한 번에 계산한다.
+
+티커별 DataFrame/rolling 대신 종가·거래량을 2차원 배열로 맞춘 뒤 지표, 유니버스 z-score,
+sigmoid 스코어까지 열(티커) 단위 벡터 연산으로 처리한다 — 수백 종목(후보 스크리닝, 백테스트)도 ms 단위.
+
+- 배열은 최근 봉 기준 오른쪽 정렬 (price_matrix.stack_field). 지표는 티커별 "최근 N봉" 기준이라
+  날짜가 아닌 봉 위치로 맞추는 게 기존 티커별 계산(iloc[-N])과 같다.
+- 지표: r20/r60, MA20>MA60, 직전 20일 최고가 돌파, 거래량 급증(5일/20일), ATR%(14).
+- 스코어: s = 0.5·trend + 0.3·vol_conf + 0.3·pattern − 0.2·vol_penalty → MOMO = ⌊100·σ(0.7·s)⌋.
+- 반환 항목 형태는 calculate_momentum_scores의 momo_score 항목과 같다.
+- 티커별 지표(momentum_rows)와 유니버스 정규화·스코어(score_momentum_rows)를 나눠,
+  지표 행은 피처 저장소(graph/feature_store.py)에 하루 한 번만 계산해 두고 정규화만 매번 한다.
+"""
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from clients import price_matrix
+
+MIN_BARS = 70  # 이보다 봉이 적은 티커는 제외
+HIGH_CONFIDENCE_BARS = 100  # data_confidence "high" 기준 (MIN_BARS 이상이면 "medium")
+SHORT_DAYS = 20  # r20, MA20, 돌파 창, 거래량 기준 창
+LONG_DAYS = 60  # r60, MA60
+VOL_RECENT_DAYS = 5  # 거래량 급증 비교 창
+ATR_DAYS = 14
+ATR_PENALTY_UNIT = 0.05  # ATR% 5%당 vol_penalty 1
+
+FEATURE_NAMES = ("r20", "r60", "ma_cross", "breakout", "vol_surge", "atr_pct_14")  # 결과 features 필드 순서
+ZSCORE_FEATURES = {"z20": "r20", "z60": "r60", "zvol": "vol_surge"}  # 유니버스 내 정규화 지표
+SIGMOID_SLOPE = 0.7
+
+
+def score_momentum(histories: Dict[str, Optional[pd.DataFrame]]) -> List[Dict[str, Any]]:
+    """티커별 history → momo_score 항목 리스트 (입력 순서 유지, 봉이 MIN_BARS 미만인 티커 제외)"""
+    return score_momentum_rows(momentum_rows(histories))
+
+
+def momentum_rows(histories: Dict[str, Optional[pd.DataFrame]]) -> Dict[str, Dict[str, Any]]:
+    """티커별 history → 티커별 지표 행 (유니버스와 무관한 값만, 피처 저장소에 그대로 저장 가능한 기본 타입).
+
+    봉이 MIN_BARS 미만이거나 history가 없는 티커는 빠진다.
+    """
+    valid = {
+        ticker: hist if hist.index.is_monotonic_increasing else hist.sort_index()
+        for ticker, hist in histories.items()
+        if hist is not None and not hist.empty and len(hist) >= MIN_BARS
+    }
+    if not valid:
+        return {}
+
+    tickers, close = price_matrix.stack_field(valid, "Close")
+    _, volume = price_matrix.stack_field(valid, "Volume")
+    features = momentum_features(close.T, volume.T)
+    atr = price_matrix.atr_pct(valid, ATR_DAYS)
+
+    return {
+        ticker: {
+            "r20": float(features["r20"][i]),
+            "r60": float(features["r60"][i]),
+            "ma_cross": bool(features["ma_cross"][i]),
+            "breakout": bool(features["breakout"][i]),
+            "vol_surge": _optional(features["vol_surge"][i]),
+            "atr_pct_14": float(atr[ticker]),
+            "bars": len(valid[ticker]),
+        }
+        for i, ticker in enumerate(tickers)
+    }
+
+
+def score_momentum_rows(rows: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """티커별 지표 행 → 유니버스 z-score + MOMO를 붙인 momo_score 항목 리스트 (rows 순서 유지)"""
+    if not rows:
+        return []
+    tickers = list(rows)
+    features = {
+        name: np.array([np.nan if rows[t][name] is None else rows[t][name] for t in tickers], dtype="f8")
+        for name in ("r20", "r60", "vol_surge", "atr_pct_14")
+    }
+    features["ma_cross"] = np.array([rows[t]["ma_cross"] for t in tickers], dtype=bool)
+    features["breakout"] = np.array([rows[t]["breakout"] for t in tickers], dtype=bool)
+
+    norm = {metric: universe_zscores(features[feature]) for metric, feature in ZSCORE_FEATURES.items()}
+    momo = momo_scores(features, norm)
+
+    return [
+        {
+            "ticker": ticker,
+            "score": {
+                "MOMO": int(momo[i]),
+                "features": {name: rows[ticker][name] for name in FEATURE_NAMES},
+                "norm": {metric: float(z[i]) for metric, z in norm.items() if not np.isnan(z[i])},
+                "data_confidence": "high" if rows[ticker]["bars"] >= HIGH_CONFIDENCE_BARS else "medium",
+            },
+        }
+        for i, ticker in enumerate(tickers)
+    ]
+
+
+def momentum_features(close: np.ndarray, volume: np.ndarray) -> Dict[str, np.ndarray]:
+    """(봉 × 티커) 종가/거래량 → 티커별 지표 배열. 봉은 LONG_DAYS + 1개 이상이어야 한다.
+
+    vol_surge는 20일 평균 거래량이 0 이하(또는 없음)면 NaN.
+    """
+    last = close[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r20 = last / close[-SHORT_DAYS - 1] - 1
+        r60 = last / close[-LONG_DAYS - 1] - 1
+        ma_cross = close[-SHORT_DAYS:].mean(axis=0) > close[-LONG_DAYS:].mean(axis=0)
+        # 직전 20일 각각의 20일 최고가 중 최대 = 오늘을 뺀 최근 2·20-1봉의 최고가
+        recent_high = np.fmax.reduce(close[-2 * SHORT_DAYS : -1], axis=0)
+        breakout = last > recent_high
+        avg_vol = _nanmean(volume[-SHORT_DAYS:])
+        vol_surge = np.where(avg_vol > 0, _nanmean(volume[-VOL_RECENT_DAYS:]) / avg_vol, np.nan)
+    return {"r20": r20, "r60": r60, "ma_cross": ma_cross, "breakout": breakout, "vol_surge": vol_surge}
+
+
+def universe_zscores(values: np.ndarray) -> np.ndarray:
+    """유니버스 내 z-score (소수 둘째 자리). 값이 2개 미만이거나 표준편차 0이면 전부 NaN."""
+    present = ~np.isnan(values)
+    if present.sum() < 2:
+        return np.full(len(values), np.nan)
+    mean, std = values[present].mean(), values[present].std()
+    if not std > 0:
+        return np.full(len(values), np.nan)
+    return np.where(present, np.round((values - mean) / std, 2), np.nan)
+
+
+def momo_scores(features: Dict[str, np.ndarray], norm: Dict[str, np.ndarray]) -> np.ndarray:
+    """지표 + z-score → MOMO(0~100 정수). 없는 구성요소는 0으로 본다."""
+    trend = np.nan_to_num(0.4 * norm["z20"] + 0.6 * norm["z60"])
+    vol_surge = features["vol_surge"]
+    with np.errstate(invalid="ignore"):
+        vol_conf = np.nan_to_num(0.7 * norm["zvol"] + 0.3 * np.log(np.maximum(vol_surge, 0.1)))
+    vol_conf = np.where(vol_surge != 0, vol_conf, 0.0)
+    pattern = 0.5 * features["ma_cross"] + 0.5 * features["breakout"]
+    vol_penalty = np.nan_to_num(features["atr_pct_14"] / ATR_PENALTY_UNIT)
+
+    s = 0.5 * trend + 0.3 * vol_conf + 0.3 * pattern - 0.2 * vol_penalty
+    momo = (100 * (1 / (1 + np.exp(-SIGMOID_SLOPE * s)))).astype(int)
+    return np.clip(momo, 0, 100)
+
+
+def _nanmean(block: np.ndarray) -> np.ndarray:
+    """열별 NaN 제외 평균 (전부 NaN이면 NaN, 경고 없음)"""
+    count = (~np.isnan(block)).sum(axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(count > 0, np.nansum(block, axis=0) / count, np.nan)
+
+
+def _optional(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
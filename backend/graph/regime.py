@@ -7,12 +7,19 @@ LLM은 시장 국면을 일관되게 오판하므로(상승장 과보수, 하락
   - 신규 후보 추가 기준 (CANDIDATE_BUY_EXTRA)
   - 현금 바닥 (CASH_FLOOR_PCT — validation이 코드로 강제)
 에 반영된다.
+
+판정은 거래일당 한 번 (장 마감 후 beat 작업 또는 그날 첫 런) 계산해 Redis에 공유하고,
+입력값(SPY 종가/MA200/고점)과 함께 market_regimes 테이블에 이력으로 남긴다.
 """
 import logging
 import math
-import statistics
-from datetime import date
-from typing import Any, Dict
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional, Union
+
+from clients import get_stock_client
+from clients.cache_client import CachedFailure
+from clients.close_series import CloseSeries
+from clients.market_calendar import last_settled_session
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +27,12 @@ BENCHMARK_TICKER = "SPY"
 MA_DAYS = 200  # 장기 추세 기준선
 VOL_DAYS = 20  # 실현 변동성 측정 창
 TRADING_DAYS_PER_YEAR = 252
+REGIME_HISTORY_PERIOD = "1y"  # MA200 + 고점 산출에 쓰는 SPY 이력
+
+# 거래일당 1회 스냅샷 (Redis 공유 + market_regimes 이력 테이블)
+REGIME_CACHE_PREFIX = "regime:snapshot:"
+REGIME_SNAPSHOT_TTL = 7 * 24 * 60 * 60  # 거래일별 키라 값은 바뀌지 않음 — 연휴를 넘길 만큼만 보관
+SNAPSHOT_ONLY_FIELDS = ("session_date", "inputs", "computed_at")  # 파이프라인 state에는 넣지 않는 필드
 
 # 판정 기준 (Phase 4 백테스트로 튜닝 예정)
 RISK_OFF_DRAWDOWN = -0.15  # 고점 대비 이만큼 빠지면 무조건 risk_off
@@ -42,20 +55,20 @@ NEUTRAL_FALLBACK: Dict[str, Any] = {
 }
 
 
-def classify_regime(closes_by_date: Dict[date, float]) -> Dict[str, Any]:
+def classify_regime(closes: Union[CloseSeries, Dict[date, float]]) -> Dict[str, Any]:
     """SPY 종가 이력(1년 권장)으로 국면을 판정한다. 데이터 부족 시 neutral."""
-    values = [closes_by_date[d] for d in sorted(closes_by_date)]
+    values = CloseSeries.coerce(closes).values
     if len(values) < MA_DAYS + 1:
         return dict(NEUTRAL_FALLBACK)
 
-    current = values[-1]
-    ma200 = sum(values[-MA_DAYS:]) / MA_DAYS
+    current = float(values[-1])
+    ma200 = float(values[-MA_DAYS:].mean())
     spy_vs_ma200 = current / ma200 - 1.0
-    drawdown = current / max(values) - 1.0
+    drawdown = current / float(values.max()) - 1.0
 
     recent = values[-(VOL_DAYS + 1):]
-    daily_returns = [recent[i] / recent[i - 1] - 1.0 for i in range(1, len(recent))]
-    realized_vol = statistics.stdev(daily_returns) * math.sqrt(TRADING_DAYS_PER_YEAR)
+    daily_returns = recent[1:] / recent[:-1] - 1.0
+    realized_vol = float(daily_returns.std(ddof=1)) * math.sqrt(TRADING_DAYS_PER_YEAR)
 
     if (spy_vs_ma200 < 0 and drawdown < RISK_OFF_DRAWDOWN_BELOW_MA) or drawdown < RISK_OFF_DRAWDOWN or realized_vol > RISK_OFF_VOL:
         regime = "risk_off"
@@ -84,13 +97,106 @@ def regime_rules(regime: str) -> Dict[str, Any]:
     }
 
 
-def get_market_regime() -> Dict[str, Any]:
-    """SPY 1년 이력을 조회해 국면을 판정한다. 조회 실패 시 neutral 폴백."""
+def build_regime_snapshot(closes: Union[CloseSeries, Dict[date, float]], session: date) -> Dict[str, Any]:
+    """session(확정 거래일)까지의 종가로 판정한 국면 + 판정 입력값 + 계산 시각.
+
+    session 이후의 봉(장중 미완성 봉 포함)은 버린다 — 같은 거래일이면 언제 계산해도 같은 결과.
+    """
+    series = CloseSeries.coerce(closes).until(session)
+    values = series.values
+    snapshot = classify_regime(series)
+    snapshot.update(
+        {
+            "session_date": session.isoformat(),
+            "inputs": {
+                "spy_close": float(values[-1]) if len(values) else None,
+                "spy_ma200": round(float(values[-MA_DAYS:].mean()), 4) if len(values) >= MA_DAYS else None,
+                "spy_peak": float(values.max()) if len(values) else None,
+                "bars": len(series),
+                "first_date": series.first_date.isoformat() if series else None,
+                "last_date": series.last_date.isoformat() if series else None,
+            },
+            "computed_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+    return snapshot
+
+
+def compute_regime_snapshot(session: Optional[date] = None) -> Any:
+    """SPY 1년 이력을 조회해 session의 국면 스냅샷을 만든다. 종가를 못 받으면 CachedFailure."""
     from .feedback import fetch_closes  # 지연 임포트 (순환 방지)
 
+    session = session or last_settled_session()
+    closes = fetch_closes(BENCHMARK_TICKER, period=REGIME_HISTORY_PERIOD)
+    if not closes:
+        return CachedFailure(f"no {BENCHMARK_TICKER} closes")
+    return build_regime_snapshot(closes, session)
+
+
+def get_regime_snapshot(session: Optional[date] = None, refresh: bool = False) -> Optional[Dict[str, Any]]:
+    """거래일당 한 번만 계산되는 국면 스냅샷 (Redis 공유, 동시 요청은 한 번만 계산). 판정 불가 시 None.
+
+    refresh=True면 저장된 값을 무시하고 다시 계산해 덮어쓴다 (beat 작업용).
+    Redis가 없으면 저장 없이 바로 계산한다.
+    """
+    session = session or last_settled_session()
+    key = f"{REGIME_CACHE_PREFIX}{session.isoformat()}"
+    try:
+        cache = get_stock_client().get_cache_client()
+        if refresh:
+            snapshot = compute_regime_snapshot(session)
+            if not isinstance(snapshot, CachedFailure):
+                cache.set(key, snapshot, ttl_seconds=REGIME_SNAPSHOT_TTL)
+        else:
+            snapshot = cache.get_or_set(
+                key, lambda: compute_regime_snapshot(session), ttl_seconds=REGIME_SNAPSHOT_TTL
+            )
+    except Exception as e:
+        logger.warning(f"Regime snapshot cache unavailable (computing directly): {e}")
+        snapshot = compute_regime_snapshot(session)
+    return None if isinstance(snapshot, CachedFailure) else snapshot
+
+
+def get_market_regime() -> Dict[str, Any]:
+    """오늘(최근 확정 거래일)의 국면. 스냅샷을 읽기만 하고, 없으면 한 번 계산해 공유한다. 실패 시 neutral 폴백."""
     try:
-        closes = fetch_closes(BENCHMARK_TICKER, period="1y")
-        return classify_regime(closes)
+        snapshot = get_regime_snapshot()
     except Exception as e:
         logger.error(f"Failed to compute market regime; falling back to neutral: {e}")
+        snapshot = None
+    if snapshot is None:
         return dict(NEUTRAL_FALLBACK)
+    return {key: value for key, value in snapshot.items() if key not in SNAPSHOT_ONLY_FIELDS}
+
+
+def regime_record(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """스냅샷 → market_regimes 행 (판정 입력값을 열로 펼친다)"""
+    inputs = snapshot.get("inputs") or {}
+    return {
+        "session_date": snapshot["session_date"],
+        "regime": snapshot["regime"],
+        "spy_vs_ma200_pct": snapshot.get("spy_vs_ma200_pct"),
+        "drawdown_pct": snapshot.get("drawdown_pct"),
+        "realized_vol_pct": snapshot.get("realized_vol_pct"),
+        "spy_close": inputs.get("spy_close"),
+        "spy_ma200": inputs.get("spy_ma200"),
+        "spy_peak": inputs.get("spy_peak"),
+        "bars": inputs.get("bars", 0),
+        "note": snapshot.get("note"),
+        "computed_at": snapshot["computed_at"],
+    }
+
+
+async def record_market_regime(session: Optional[date] = None) -> Optional[Dict[str, Any]]:
+    """session의 국면을 다시 계산해 Redis 스냅샷을 덮어쓰고 market_regimes에 upsert한다 (beat 작업용).
+
+    판정할 수 없으면(SPY 종가 없음) 아무것도 기록하지 않고 None.
+    """
+    from data.schemas import MarketRegimeCreate
+    from repo import get_market_regime_repo
+
+    snapshot = get_regime_snapshot(session, refresh=True)
+    if snapshot is None:
+        return None
+    await get_market_regime_repo().upsert(MarketRegimeCreate(**regime_record(snapshot)))
+    return snapshot
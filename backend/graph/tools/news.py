@@ -41,7 +41,7 @@ def get_company_news(tickers: List[str]) -> Dict[str, Any]:
     if not client.is_available():
         return {"status": "unavailable", "error": "news feed not configured — use web search instead"}
     try:
-        news = {ticker: client.get_company_news(ticker, limit=5) for ticker in tickers[:10]}
+        news = client.get_company_news_many(tickers[:10], limit=5)
         return {"status": "success", "news": news}
     except Exception as e:
         logger.error(f"Failed to fetch company news: {e}")
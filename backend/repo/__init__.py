@@ -9,6 +9,7 @@ from .report_repo import ReportRepo
 from .transaction_repo import TransactionRepo
 from .schedule_repo import ScheduleRepo
 from .recommendation_repo import RecommendationRepo
+from .market_regime_repo import MarketRegimeRepo
 
 
 # Database 의존성 주입
@@ -90,6 +91,15 @@ def get_recommendation_repo() -> RecommendationRepo:
     return RecommendationRepo(db_client=db_client)
 
 
+def get_market_regime_repo() -> MarketRegimeRepo:
+    """
+    MarketRegimeRepo 인스턴스를 반환하는 팩토리 함수
+    FastAPI의 Depends와 함께 사용할 수 있습니다.
+    """
+    db_client = get_db_client()
+    return MarketRegimeRepo(db_client=db_client)
+
+
 # 모든 Repo 팩토리 함수들을 외부에서 import할 수 있도록 export
 __all__ = [
     "get_db_client",
@@ -99,10 +109,12 @@ __all__ = [
     "get_report_repo",
     "get_schedule_repo",
     "get_recommendation_repo",
+    "get_market_regime_repo",
     "UserRepo",
     "PortfolioRepo",
     "PositionRepo",
     "ReportRepo",
     "ScheduleRepo",
     "RecommendationRepo",
+    "MarketRegimeRepo",
 ]
@@ -0,0 +1,89 @@
+# repo/market_regime_repo.py
+from datetime import date
+from typing import List, Optional
+
+from supabase import Client
+
+from data.schemas import MarketRegimeCreate, MarketRegimeOut
+from .base_repo import BaseRepo
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class MarketRegimeRepo(BaseRepo):
+    """거래일별 시장 국면 이력 저장소 (session_date가 키)"""
+
+    def __init__(self, db_client: Client, table_name: str = "market_regimes"):
+        super().__init__(db_client, table_name)
+
+    async def create(self, schema: MarketRegimeCreate) -> MarketRegimeOut:
+        """국면 1건 기록 (같은 거래일이 있으면 덮어씀)"""
+        return await self.upsert(schema)
+
+    async def upsert(self, schema: MarketRegimeCreate) -> MarketRegimeOut:
+        """거래일 기준 upsert — 같은 거래일을 다시 판정하면 마지막 판정으로 덮어쓴다"""
+        try:
+            row = schema.model_dump(mode="json")
+            response = self.db_client.table(self.table_name).upsert(row, on_conflict="session_date").execute()
+            if not response.data:
+                raise ValueError("국면 기록 실패: 응답 데이터가 없습니다")
+            return MarketRegimeOut(**response.data[0])
+        except Exception as e:
+            logger.error(f"국면 기록 중 예외 발생: {e}")
+            raise e
+
+    async def get_by_id(self, id: date) -> Optional[MarketRegimeOut]:
+        """거래일로 국면 조회"""
+        try:
+            response = (
+                self.db_client.table(self.table_name).select("*").eq("session_date", id.isoformat()).execute()
+            )
+            if response.data:
+                return MarketRegimeOut(**response.data[0])
+            return None
+        except Exception as e:
+            logger.error(f"국면 조회 중 예외 발생: {e}")
+            raise e
+
+    async def get_latest(self) -> Optional[MarketRegimeOut]:
+        """가장 최근 거래일의 국면"""
+        try:
+            response = (
+                self.db_client.table(self.table_name)
+                .select("*")
+                .order("session_date", desc=True)
+                .limit(1)
+                .execute()
+            )
+            if response.data:
+                return MarketRegimeOut(**response.data[0])
+            return None
+        except Exception as e:
+            logger.error(f"최근 국면 조회 중 예외 발생: {e}")
+            raise e
+
+    async def get_history(self, since: date, until: Optional[date] = None) -> List[MarketRegimeOut]:
+        """기간 내 국면 이력 (거래일 오름차순, 백테스트/보고서용)"""
+        try:
+            query = self.db_client.table(self.table_name).select("*").gte("session_date", since.isoformat())
+            if until is not None:
+                query = query.lte("session_date", until.isoformat())
+            response = query.order("session_date").execute()
+            return [MarketRegimeOut(**row) for row in response.data or []]
+        except Exception as e:
+            logger.error(f"국면 이력 조회 중 예외 발생: {e}")
+            raise e
+
+    async def update(self, schema: MarketRegimeCreate) -> MarketRegimeOut:
+        """국면 갱신 (upsert와 같음)"""
+        return await self.upsert(schema)
+
+    async def delete_by_id(self, id: date) -> bool:
+        """거래일 국면 삭제"""
+        try:
+            response = self.db_client.table(self.table_name).delete().eq("session_date", id.isoformat()).execute()
+            return bool(response.data)
+        except Exception as e:
+            logger.error(f"국면 삭제 중 예외 발생: {e}")
+            raise e
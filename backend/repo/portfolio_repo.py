@@ -11,6 +11,8 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+TICKER_PAGE_SIZE = 1000  # PostgREST 기본 최대 행 수
+
 
 class PortfolioRepo(BaseRepo):
     def __init__(self, stock_client: StockClient, db_client: Client, table_name: str = "portfolios"):
@@ -106,6 +108,30 @@ class PortfolioRepo(BaseRepo):
             logger.error(f"Error fetching positions for portfolio {portfolio_id}: {e}")
             return []
 
+    async def get_all_tickers(self) -> List[str]:
+        """전체 포트폴리오에 보유 중인 종목 티커 (중복 제거, 정렬). 캐시 예열용.
+
+        Returns:
+            List[str]: 티커 목록
+        """
+        if not self.db_client:
+            raise ValueError("DB client not initialized")
+
+        tickers = set()
+        start = 0
+        while True:
+            response = (
+                self.db_client.table("positions")
+                .select("ticker")
+                .range(start, start + TICKER_PAGE_SIZE - 1)
+                .execute()
+            )
+            rows = response.data or []
+            tickers.update(row["ticker"] for row in rows if row.get("ticker"))
+            if len(rows) < TICKER_PAGE_SIZE:
+                return sorted(tickers)
+            start += TICKER_PAGE_SIZE
+
     async def get_by_user_id(self, user_id: int = 1) -> Optional[PortfolioOut]:
         """
         현재 포트폴리오 완전한 정보 조회
@@ -26,7 +26,7 @@ class PositionRepo(BaseRepo):
         """
         try:
             ticker = position.ticker
-            current_price = self.stock_client.get_stock_current_price([ticker])[ticker]
+            current_price = self.stock_client.get_stock_current_price([ticker]).get(ticker)
             if not current_price:
                 raise ValueError(f"Current price not found for ticker: {ticker}")
             total_shares = float(position.total_shares)
@@ -1,15 +1,20 @@
 # repo/recommendation_repo.py
-from datetime import datetime, timedelta, timezone
-from typing import List, Optional
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
 
 from supabase import Client
 
-from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch
+from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch, ScorecardBucket
 from .base_repo import BaseRepo
 import logging
 
 logger = logging.getLogger(__name__)
 
+RECOMMENDATION_PAGE_SIZE = 1000  # PostgREST 기본 최대 행 수 (조회 페이지 / 채점 기록 청크)
+UNSCORED_FILTER = "return_7d.is.null,return_30d.is.null,return_60d.is.null"  # 채점 안 된 창이 하나라도 있음
+SCORECARD_TABLE = "recommendation_scorecard_daily"
+SCORECARD_OVERVIEW_VIEW = "recommendation_scorecard_overview"
+
 
 class RecommendationRepo(BaseRepo):
     """추천 트랙레코드 저장소"""
@@ -64,6 +69,102 @@ class RecommendationRepo(BaseRepo):
             logger.error(f"최근 추천 조회 중 예외 발생: {e}")
             raise e
 
+    async def get_unscored(self, since: datetime, until: datetime) -> List[RecommendationOut]:
+        """전 사용자의 미채점 추천 (since ≤ created_at ≤ until, 채점 안 된 창이 하나라도 있는 것). 일괄 채점용.
+
+        until은 가장 짧은 창이 경과한 시점까지만 넘긴다 — 아직 채점할 수 없는 추천은 가져오지 않는다.
+        """
+        try:
+            recs: List[RecommendationOut] = []
+            start = 0
+            while True:
+                response = (
+                    self.db_client.table(self.table_name)
+                    .select("*")
+                    .gte("created_at", since.isoformat())
+                    .lte("created_at", until.isoformat())
+                    .or_(UNSCORED_FILTER)
+                    .order("id")
+                    .range(start, start + RECOMMENDATION_PAGE_SIZE - 1)
+                    .execute()
+                )
+                rows = response.data or []
+                recs.extend(RecommendationOut(**row) for row in rows)
+                if len(rows) < RECOMMENDATION_PAGE_SIZE:
+                    return recs
+                start += RECOMMENDATION_PAGE_SIZE
+        except Exception as e:
+            logger.error(f"미채점 추천 조회 중 예외 발생: {e}")
+            raise e
+
+    async def apply_scores(self, scores: Dict[int, RecommendationReturnsPatch]) -> int:
+        """채점 결과(id → 수익률 패치)를 기록하고 스코어카드 버킷에 증분을 더한다 (apply_recommendation_scores RPC).
+
+        청크마다 RPC 1회 = 트랜잭션 1회. 수익률 컬럼 중 아직 비어 있는 창만 쓰고, 그 창만 버킷에 더하므로
+        재시도하거나 실행이 겹쳐도 같은 창을 두 번 세지 않는다. 새로 채점된 추천 수를 반환.
+        """
+        if not scores:
+            return 0
+        try:
+            rows = [{"id": rec_id, **patch.model_dump(mode="json", exclude_none=True)} for rec_id, patch in scores.items()]
+            updated = 0
+            for start in range(0, len(rows), RECOMMENDATION_PAGE_SIZE):
+                chunk = rows[start : start + RECOMMENDATION_PAGE_SIZE]
+                response = self.db_client.rpc("apply_recommendation_scores", {"scores": chunk}).execute()
+                updated += int(response.data or 0)
+            return updated
+        except Exception as e:
+            logger.error(f"추천 채점 결과 기록 중 예외 발생: {e}")
+            raise e
+
+    # ---- 스코어카드 집계 (recommendation_scorecard_daily) ----
+
+    async def get_scorecard_buckets(self, user_id: int, window_days: int, since: date) -> List[ScorecardBucket]:
+        """사용자의 since 이후 일 버킷 (창 하나, 주도 신호 전체)"""
+        try:
+            rows: List[dict] = []
+            start = 0
+            while True:
+                response = (
+                    self.db_client.table(SCORECARD_TABLE)
+                    .select("*")
+                    .eq("user_id", user_id)
+                    .eq("window_days", window_days)
+                    .gte("day", since.isoformat())
+                    .order("day")
+                    .range(start, start + RECOMMENDATION_PAGE_SIZE - 1)
+                    .execute()
+                )
+                page = response.data or []
+                rows.extend(page)
+                if len(page) < RECOMMENDATION_PAGE_SIZE:
+                    return [ScorecardBucket(**row) for row in rows]
+                start += RECOMMENDATION_PAGE_SIZE
+        except Exception as e:
+            logger.error(f"스코어카드 집계 조회 중 예외 발생: {e}")
+            raise e
+
+    async def get_scorecard_overview(self, window_days: Optional[int] = None) -> List[Dict[str, Any]]:
+        """전 사용자 최근 90일 스코어카드 요약 (관리자용 뷰). window_days를 주면 그 창만."""
+        try:
+            query = self.db_client.table(SCORECARD_OVERVIEW_VIEW).select("*")
+            if window_days is not None:
+                query = query.eq("window_days", window_days)
+            response = query.order("user_id").execute()
+            return response.data or []
+        except Exception as e:
+            logger.error(f"스코어카드 요약 조회 중 예외 발생: {e}")
+            raise e
+
+    async def rebuild_scorecard_aggregates(self) -> int:
+        """채점 결과 전체로 버킷을 다시 만든다 (증분 누락 복구용). 만든 버킷 수를 반환."""
+        try:
+            response = self.db_client.rpc("rebuild_scorecard_aggregates", {}).execute()
+            return int(response.data or 0)
+        except Exception as e:
+            logger.error(f"스코어카드 집계 재계산 중 예외 발생: {e}")
+            raise e
+
     async def update(self, id: int, schema: RecommendationReturnsPatch) -> Optional[RecommendationOut]:
         """채점 결과 갱신 (null 필드는 건드리지 않음)"""
         try:
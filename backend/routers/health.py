@@ -25,3 +25,21 @@ async def health_db():
     except Exception as e:
         logger.error(f"DB 헬스체크 실패: {e}")
         return {"status": "error", "connected": False, "error": str(e)}
+
+
+@router.get("/quota")
+async def health_quota():
+    """외부 API 호출량 지표 (직전 1분 사용량 / 쿼터 대비 사용률, 호스트별 연결 재사용률, L1 캐시 적중률)"""
+    try:
+        from clients import get_finnhub_client
+        from clients.http_session import connection_stats
+        from clients.local_cache import get_local_cache
+
+        return {
+            "finnhub": get_finnhub_client().get_quota_usage(),
+            "http_connections": connection_stats(),
+            "l1_cache": get_local_cache().stats(),
+        }
+    except Exception as e:
+        logger.error(f"쿼터 지표 조회 실패: {e}")
+        return {"status": "error", "error": str(e)}
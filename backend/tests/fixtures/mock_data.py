@@ -16,7 +16,7 @@ from typing import Any, Dict, List
 from polyfactory.factories.pydantic_factory import ModelFactory
 
 from data.models import Portfolio, Position, Report, Schedule, Transaction, User
-from data.schemas import RecommendationOut
+from data.schemas import MarketRegimeOut, RecommendationOut
 
 
 class _BaseFactory(ModelFactory):
@@ -89,6 +89,19 @@ class _RecommendationFactory(_BaseFactory):
     benchmark_return_60d = None
 
 
+class _MarketRegimeFactory(_BaseFactory):
+    __model__ = MarketRegimeOut
+    regime = "neutral"  # 검증기 제약
+    spy_vs_ma200_pct = 2.5
+    drawdown_pct = -4.0
+    realized_vol_pct = 15.0
+    spy_close = 500.0
+    spy_ma200 = 487.8
+    spy_peak = 520.8
+    bars = 260
+    note = None
+
+
 def _build(factory: type[ModelFactory], pins: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
     """유효한 베이스를 팩토리로 생성한 뒤, 오버라이드는 검증 없이 dict에 적용한다.
 
@@ -157,6 +170,12 @@ class MockDataGenerator:
         pins = {"id": recommendation_id, "user_id": user_id, "ticker": ticker, "report_id": 1}
         return _build(_RecommendationFactory, pins, overrides)
 
+    @staticmethod
+    def create_market_regime(session_date: date = date(2026, 10, 16), **overrides) -> Dict[str, Any]:
+        """테스트용 시장 국면 스냅샷 데이터 생성 (market_regimes 테이블)"""
+        pins = {"session_date": session_date, "computed_at": datetime(2026, 10, 16, 21, 0, tzinfo=timezone.utc)}
+        return _build(_MarketRegimeFactory, pins, overrides)
+
     @staticmethod
     def create_stock_history(ticker: str = "AAPL", days: int = 30) -> Dict[str, Any]:
         """테스트용 주식 히스토리 데이터 생성"""
@@ -0,0 +1,516 @@
+# tests/unit/test_clients/test_cache_client.py
+"""CacheClient 단위 테스트 (Redis는 dict 기반 가짜 클라이언트)"""
+import asyncio
+import fnmatch
+import pickle
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from clients import cache_client as cache_client_module
+from clients import cache_codec
+from clients.cache_client import CachedFailure, CacheClient, CacheEntry
+from clients.local_cache import LocalCache, get_local_cache
+
+
+class FakeRedis:
+    """CacheClient가 쓰는 명령만 흉내 낸 메모리 Redis (TTL은 저장만 하고 만료시키지 않음)"""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+        self.published = []
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+        return True
+
+    def set(self, key, value, nx=False, ex=None):
+        with self.lock:
+            if nx and key in self.data:
+                return None
+            self.data[key] = value
+            self.ttls[key] = ex
+            return True
+
+    def exists(self, key):
+        return int(key in self.data)
+
+    def delete(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def scan(self, cursor=0, match=None, count=None):
+        return 0, [key for key in list(self.data) if fnmatch.fnmatchcase(key, match)]
+
+    def unlink(self, *keys):
+        return self.delete(*keys)
+
+    def publish(self, channel, message):
+        self.published.append((channel, message))
+        return 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def eval(self, script, numkeys, key, token):
+        with self.lock:
+            if self.data.get(key) == token:
+                del self.data[key]
+                return 1
+            return 0
+
+
+@pytest.fixture(autouse=True)
+def isolated_local_cache(monkeypatch):
+    """pub/sub 구독 스레드 없이, 테스트마다 빈 L1으로 시작"""
+    monkeypatch.setattr(cache_client_module, "L1_INVALIDATION", False)
+    get_local_cache().clear()
+    yield
+    get_local_cache().clear()
+
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 순서대로 실행"""
+
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.commands.append((name, args, kwargs))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+def expire(cache: CacheClient, key: str) -> None:
+    """저장된 값의 논리 TTL만 지난 상태로 만든다 (Redis 키는 그대로, L1에서는 제거)"""
+    entry = cache.get_entry(key)
+    cache.client.data[key] = cache_codec.encode(entry.value, time.time() - 1, entry.compute_seconds)
+    get_local_cache().delete(key)
+
+
+def make_cache(redis_client=None) -> CacheClient:
+    cache = CacheClient.__new__(CacheClient)
+    cache.client = redis_client or FakeRedis()
+    return cache
+
+
+@pytest.mark.unit
+class TestCacheEntry:
+    def test_set_wraps_value_with_logical_expiry(self):
+        """stale_ttl만큼 Redis TTL을 늘리고, get은 논리 TTL 안에서만 값을 돌려주는지 테스트"""
+        cache = make_cache()
+        cache.set("k", {"a": 1}, ttl_seconds=60, stale_ttl=30)
+        assert cache.client.ttls["k"] == 90
+        assert cache.get("k") == {"a": 1}
+
+        expire(cache, "k")
+        assert cache.get("k") is None
+        assert cache.get_entry("k").value == {"a": 1}  # stale 구간에서는 항목은 남아 있음
+
+    def test_reads_values_stored_before_codec(self):
+        """코덱 도입 전 pickle 값(원시 값 / CacheEntry)도 읽는지 테스트"""
+        cache = make_cache()
+        cache.client.data["legacy"] = pickle.dumps([1, 2, 3])
+        cache.client.data["entry"] = pickle.dumps(CacheEntry("v", expires_at=time.time() + 60))
+        assert cache.get("legacy") == [1, 2, 3]
+        assert cache.get("entry") == "v"
+
+    def test_expire_at_overrides_ttl(self):
+        cache = make_cache()
+        expire_at = datetime.now(timezone.utc) + timedelta(hours=2)
+        cache.set("k", "v", ttl_seconds=60, expire_at=expire_at)
+        assert 7190 <= cache.client.ttls["k"] <= 7200
+        assert cache.get_entry("k").expires_at == pytest.approx(expire_at.timestamp(), abs=1)
+
+        cache.get_or_set_many(["a"], lambda keys: {"a": 1}, ttl_seconds=60, expire_at=expire_at)
+        assert 7190 <= cache.client.ttls["a"] <= 7200
+
+    def test_early_refresh_probability(self):
+        """계산 시간이 0이면 조기 갱신하지 않고, 만료 직전의 느린 값은 갱신하는지 테스트"""
+        now = 1000.0
+        assert not CacheEntry("v", expires_at=now + 1, compute_seconds=0).should_refresh_early(now=now)
+        with patch("clients.cache_client.random.random", return_value=0.5):
+            assert CacheEntry("v", expires_at=now + 1, compute_seconds=10).should_refresh_early(now=now)
+            assert not CacheEntry("v", expires_at=now + 3600, compute_seconds=10).should_refresh_early(now=now)
+
+
+@pytest.mark.unit
+class TestGetOrSet:
+    def test_miss_computes_once_and_releases_lock(self):
+        cache = make_cache()
+        fetch = MagicMock(return_value="fresh")
+        assert cache.get_or_set("k", fetch, ttl_seconds=60) == "fresh"
+        assert cache.get_or_set("k", fetch, ttl_seconds=60) == "fresh"
+        fetch.assert_called_once()
+        assert "lock:k" not in cache.client.data
+
+    def test_concurrent_misses_share_one_computation(self):
+        """동시에 미스가 나도 fetch는 한 번만 실행되고 나머지는 저장된 값을 받는지 테스트"""
+        cache = make_cache()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.2)
+            return "fresh"
+
+        results = []
+        with patch("clients.cache_client.LOCK_POLL_SECONDS", 0.01):
+            threads = [threading.Thread(target=lambda: results.append(cache.get_or_set("k", fetch))) for _ in range(5)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert results == ["fresh"] * 5
+        assert len(calls) == 1
+
+    def test_waiter_computes_when_lock_holder_fails(self):
+        """락을 잡은 쪽이 값을 못 남기고 락을 풀면 대기하던 요청이 직접 계산하는지 테스트"""
+        cache = make_cache()
+        cache.client.data["lock:k"] = "other"
+        original_exists = cache.client.exists
+
+        def exists(key):
+            cache.client.data.pop("lock:k", None)  # 첫 확인 시점에 상대가 실패하고 락 해제
+            return original_exists(key)
+
+        cache.client.exists = exists
+        assert cache.get_or_set("k", lambda: "mine") == "mine"
+
+    def test_wait_timeout_falls_back_to_direct_compute(self):
+        cache = make_cache()
+        cache.client.data["lock:k"] = "stuck"
+        with patch("clients.cache_client.LOCK_POLL_SECONDS", 0.01):
+            assert cache.get_or_set("k", lambda: "mine", wait_timeout=0.05) == "mine"
+        assert cache.client.data["lock:k"] == "stuck"  # 남의 락은 건드리지 않음
+
+    def test_stale_value_served_while_refreshing(self):
+        cache = make_cache()
+        cache.set("k", "old", ttl_seconds=60, stale_ttl=60)
+        expire(cache, "k")
+
+        refreshed = threading.Event()
+
+        def fetch():
+            refreshed.set()
+            return "new"
+
+        assert cache.get_or_set("k", fetch, ttl_seconds=60, stale_ttl=60) == "old"
+        assert refreshed.wait(1)
+        for _ in range(100):
+            if cache.get("k") == "new":
+                break
+            time.sleep(0.01)
+        assert cache.get("k") == "new"
+
+    def test_expired_without_stale_ttl_recomputes(self):
+        cache = make_cache()
+        cache.set("k", "old", ttl_seconds=60)
+        expire(cache, "k")
+        assert cache.get_or_set("k", lambda: "new") == "new"
+
+    def test_early_refresh_recomputes_hot_key(self):
+        cache = make_cache()
+        cache.set("k", "old", ttl_seconds=60, compute_seconds=5)
+        with patch.object(CacheEntry, "should_refresh_early", return_value=True):
+            assert cache.get_or_set("k", lambda: "new") == "new"
+        assert cache.get("k") == "new"
+
+    def test_redis_lock_failure_degrades_to_direct_compute(self):
+        cache = make_cache()
+        cache.client.set = MagicMock(side_effect=ConnectionError("down"))
+        assert cache.get_or_set("k", lambda: "v") == "v"
+
+
+@pytest.mark.unit
+class TestGetOrSetAsync:
+    async def test_concurrent_misses_share_one_computation(self):
+        """같은 루프에서 동시에 미스가 나도 코루틴 fetch는 한 번만 실행되는지 테스트"""
+        cache = make_cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return "fresh"
+
+        with patch("clients.cache_client.LOCK_POLL_SECONDS", 0.01):
+            results = await asyncio.gather(*(cache.get_or_set_async("k", fetch, ttl_seconds=60) for _ in range(5)))
+
+        assert results == ["fresh"] * 5
+        assert len(calls) == 1
+        assert "lock:k" not in cache.client.data
+
+    async def test_failure_cached_and_not_refetched(self):
+        """fetch가 CachedFailure를 돌려주면 음성 캐시되어 만료 전까지 다시 조회하지 않는지 테스트"""
+        cache = make_cache()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return CachedFailure("boom")
+
+        first = await cache.get_or_set_async("k", fetch, ttl_seconds=60)
+        second = await cache.get_or_set_async("k", fetch, ttl_seconds=60)
+
+        assert isinstance(first, CachedFailure) and isinstance(second, CachedFailure)
+        assert len(calls) == 1
+        assert cache.client.ttls["k"] > first.ttl_seconds  # 연속 실패 횟수 기억 구간 포함
+
+    async def test_hit_and_expired_follow_sync_semantics(self):
+        cache = make_cache()
+        cache.set("k", "old", ttl_seconds=60)
+
+        async def fetch():
+            return "new"
+
+        assert await cache.get_or_set_async("k", fetch) == "old"
+        expire(cache, "k")
+        assert await cache.get_or_set_async("k", fetch) == "new"
+        assert cache.get("k") == "new"
+
+
+@pytest.mark.unit
+class TestBulkOperations:
+    def test_get_many_returns_only_fresh_hits(self):
+        cache = make_cache()
+        cache.set("a", 1, ttl_seconds=60)
+        cache.set("b", 2, ttl_seconds=60, stale_ttl=60)
+        expire(cache, "b")
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1}
+
+    def test_get_many_reads_redis_in_one_round_trip(self):
+        cache = make_cache()
+        cache.set_many({"a": 1, "b": 2}, ttl_seconds=60)
+        get_local_cache().clear()
+        cache.client.get = MagicMock(side_effect=AssertionError("키별 GET 금지"))
+        mget = MagicMock(wraps=cache.client.mget)
+        cache.client.mget = mget
+        assert cache.get_many(["a", "b"]) == {"a": 1, "b": 2}
+        mget.assert_called_once()
+
+    def test_set_many_uses_per_key_ttl(self):
+        cache = make_cache()
+        assert cache.set_many({"a": 1, "b": 2}, ttl_seconds={"a": 10, "b": 20})
+        assert cache.client.ttls == {"a": 10, "b": 20}
+
+    def test_get_or_set_many_fetches_only_misses(self):
+        cache = make_cache()
+        cache.set("a", "cached", ttl_seconds=60)
+        fetch_many = MagicMock(side_effect=lambda keys: {key: f"new:{key}" for key in keys if key != "bad"})
+
+        result = cache.get_or_set_many(["a", "b", "bad"], fetch_many, ttl_seconds=lambda value: 30)
+
+        assert result == {"a": "cached", "b": "new:b"}
+        fetch_many.assert_called_once_with(["b", "bad"])
+        assert cache.client.ttls["b"] == 30
+        assert "bad" not in cache.client.data  # 실패한 키는 저장 안 함
+        assert not any(key.startswith("lock:") for key in cache.client.data)
+
+    def test_get_or_set_many_waits_for_key_locked_elsewhere(self):
+        """다른 요청이 계산 중인 키는 직접 조회하지 않고 저장된 값을 기다리는지 테스트"""
+        cache = make_cache()
+        cache.client.data["lock:b"] = "other"
+
+        def other_worker():
+            time.sleep(0.05)
+            cache.set("b", "from-other", ttl_seconds=60)
+            cache.client.data.pop("lock:b")
+
+        fetch_many = MagicMock(side_effect=lambda keys: {key: "mine" for key in keys})
+        with patch("clients.cache_client.LOCK_POLL_SECONDS", 0.01):
+            worker = threading.Thread(target=other_worker)
+            worker.start()
+            result = cache.get_or_set_many(["a", "b"], fetch_many)
+            worker.join()
+
+        assert result == {"a": "mine", "b": "from-other"}
+        fetch_many.assert_called_once_with(["a"])
+
+
+    def test_clear_pattern_scans_and_invalidates(self, monkeypatch):
+        monkeypatch.setattr("clients.redis_scan.SCAN_PAUSE_SECONDS", 0)
+        cache = make_cache()
+        cache.set_many({"stock:history:AAPL": 1, "stock:history:MSFT": 2, "stock:info:AAPL": 3}, ttl_seconds=60)
+        cache.client.keys = MagicMock(side_effect=AssertionError("KEYS 금지"))
+
+        assert cache.clear_pattern("stock:history:*") == 2
+        assert cache.get_many(["stock:history:AAPL", "stock:info:AAPL"]) == {"stock:info:AAPL": 3}
+
+
+@pytest.mark.unit
+class TestNegativeCaching:
+    def test_failure_ttl_backs_off_exponentially(self, monkeypatch):
+        monkeypatch.setattr(cache_client_module, "NEGATIVE_CACHE_TTL", 60)
+        monkeypatch.setattr(cache_client_module, "NEGATIVE_CACHE_MAX_TTL", 300)
+        assert [CachedFailure("x", failures=n).ttl_seconds for n in (1, 2, 3, 4, 100)] == [60, 120, 240, 300, 300]
+
+    def test_failure_stored_with_short_ttl_and_not_refetched(self):
+        cache = make_cache()
+        fetch = MagicMock(return_value=CachedFailure("yahoo down"))
+
+        first = cache.get_or_set("k", fetch, ttl_seconds=24 * 60 * 60)
+        second = cache.get_or_set("k", fetch, ttl_seconds=24 * 60 * 60)
+
+        assert isinstance(first, CachedFailure) and second == first
+        fetch.assert_called_once()
+        assert cache.get_entry("k").is_failure
+        assert cache.get_entry("k").expires_at < time.time() + cache_client_module.NEGATIVE_CACHE_TTL + 1
+        # 만료 후에도 연속 실패 횟수를 기억할 수 있도록 Redis 키는 더 오래 남는다
+        assert cache.client.ttls["k"] >= cache_client_module.NEGATIVE_MEMORY_SECONDS
+
+    def test_consecutive_failures_counted_and_success_resets(self):
+        cache = make_cache()
+        cache.get_or_set("k", lambda: CachedFailure("e1"))
+        expire(cache, "k")
+        assert cache.get_or_set("k", lambda: CachedFailure("e2")).failures == 2
+        expire(cache, "k")
+        assert cache.get_or_set("k", lambda: "ok", ttl_seconds=60) == "ok"
+        assert cache.client.ttls["k"] == 60
+        expire(cache, "k")
+        assert cache.get_or_set("k", lambda: CachedFailure("e3")).failures == 1
+
+    def test_expired_failure_not_served_as_stale(self):
+        cache = make_cache()
+        cache.get_or_set("k", lambda: CachedFailure("down"))
+        expire(cache, "k")
+        assert cache.get_or_set("k", lambda: "fresh", ttl_seconds=60, stale_ttl=600) == "fresh"
+
+    def test_set_failures_counts_consecutive_failures(self):
+        """값은 다른 곳에 두고 실패 기록만 남길 때도 연속 실패 횟수만큼 TTL이 늘어나는지 테스트"""
+        cache = make_cache()
+        assert cache.set_failures({}) is True
+
+        cache.set_failures({"k": CachedFailure("gone")})
+        assert cache.get("k").failures == 1
+        expire(cache, "k")
+        cache.set_failures({"k": CachedFailure("gone")})
+
+        assert cache.get("k").failures == 2
+        assert cache.get_entry("k").expires_at > time.time() + cache_client_module.NEGATIVE_CACHE_TTL
+        assert cache.client.ttls["k"] >= cache_client_module.NEGATIVE_MEMORY_SECONDS
+
+    def test_get_or_set_many_backs_off_failed_keys(self):
+        cache = make_cache()
+        fetch_many = MagicMock(side_effect=lambda keys: {key: CachedFailure("dead") if key == "bad" else 1 for key in keys})
+        ttl_of = MagicMock(return_value=3600)
+
+        result = cache.get_or_set_many(["good", "bad"], fetch_many, ttl_seconds=ttl_of)
+        assert result["good"] == 1 and isinstance(result["bad"], CachedFailure)
+        ttl_of.assert_called_once_with(1)  # TTL 함수는 성공 값에만
+        assert cache.client.ttls["good"] == 3600
+
+        cache.get_or_set_many(["good", "bad"], fetch_many, ttl_seconds=ttl_of)
+        fetch_many.assert_called_once()  # 실패 기록도 만료 전에는 히트
+
+        expire(cache, "bad")
+        assert cache.get_or_set_many(["bad"], fetch_many)["bad"].failures == 2
+
+
+@pytest.mark.unit
+class TestLocalCacheLayer:
+    def test_repeated_reads_served_from_l1(self):
+        """한 번 읽은 값은 Redis를 다시 읽지 않고, 호출마다 새 객체로 돌려주는지 테스트"""
+        cache = make_cache()
+        cache.set("k", {"a": 1}, ttl_seconds=60)
+        get_local_cache().clear()
+
+        redis_get = MagicMock(wraps=cache.client.get)
+        cache.client.get = redis_get
+        first = cache.get("k")
+        second = cache.get("k")
+
+        assert first == {"a": 1}
+        assert second == first and second is not first
+        redis_get.assert_called_once()
+
+    def test_caller_mutation_does_not_leak_through_l1(self):
+        """한 호출부가 받은 DataFrame/dict를 수정해도 이후 L1 적중 값은 원래 값인지 테스트"""
+        cache = make_cache()
+        frame = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.date_range("2026-06-01", periods=2))
+        cache.set("frame", frame, ttl_seconds=60)
+        cache.set("info", {"beta": 1.2, "tags": ["a"]}, ttl_seconds=60)
+        frame.loc[:, "Close"] = 0.0  # 저장한 원본 수정
+
+        first = cache.get("frame")
+        first.loc[:, "Close"] = -1.0
+        first_many = cache.get_many(["info"])["info"]
+        first_many["beta"] = 9.9
+        first_many["tags"].append("b")
+
+        pd.testing.assert_series_equal(cache.get("frame")["Close"], pd.Series([1.0, 2.0], index=frame.index, name="Close"))
+        assert cache.get_many(["info"])["info"] == {"beta": 1.2, "tags": ["a"]}
+
+    def test_frame_l1_hit_copies_without_decoding(self, monkeypatch):
+        """DataFrame은 L1 적중 시 디코딩 없이 복사본으로 내주는지 테스트 (dict 등은 바이트를 디코딩)"""
+        cache = make_cache()
+        frame = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.date_range("2026-06-01", periods=2, tz="America/New_York"))
+        cache.set("frame", frame, ttl_seconds=60)
+        cache.set("info", {"beta": 1.2}, ttl_seconds=60)
+        decode = MagicMock(wraps=cache_codec.decode)
+        monkeypatch.setattr(cache_codec, "decode", decode)
+
+        first, second = cache.get("frame"), cache.get("frame")
+
+        decode.assert_not_called()
+        pd.testing.assert_frame_equal(first, frame)
+        assert first is not second and not np.shares_memory(first["Close"].to_numpy(), second["Close"].to_numpy())
+        assert cache.get("info") == {"beta": 1.2}
+        decode.assert_called_once()
+
+    def test_set_writes_through_and_delete_drops(self):
+        cache = make_cache()
+        cache.set("k", "v", ttl_seconds=60)
+        cache.client.data.clear()  # Redis 없이도 L1에서 읽힘
+        assert cache.get("k") == "v"
+        cache.delete("k")
+        assert cache.get("k") is None
+
+    def test_l1_ttl_caps_lifetime(self, monkeypatch):
+        monkeypatch.setattr(cache_client_module, "L1_TTL", 0)
+        cache = make_cache()
+        cache.set("k", "v", ttl_seconds=60)
+        assert get_local_cache().get("k") is None
+        assert cache.get("k") == "v"  # Redis에서 읽음
+
+    def test_set_publishes_invalidation_in_same_pipeline(self, monkeypatch):
+        monkeypatch.setattr(cache_client_module, "L1_INVALIDATION", True)
+        monkeypatch.setattr(cache_client_module, "_start_invalidation_listener", lambda client: None)
+        monkeypatch.setattr(cache_client_module, "_listener_origin", "me")
+        cache = make_cache()
+        assert cache.set("k", "v", ttl_seconds=60)
+        cache.delete("k")
+        assert cache.client.published == [
+            (cache_client_module.INVALIDATION_CHANNEL, "me|k|k"),
+            (cache_client_module.INVALIDATION_CHANNEL, "me|k|k"),
+        ]
+
+    def test_apply_invalidation_skips_own_messages(self, monkeypatch):
+        monkeypatch.setattr(cache_client_module, "_listener_origin", "me")
+        local = LocalCache(max_bytes=1000)
+        expires = time.time() + 60
+        for key in ("a", "stock:info:AAPL", "stock:info:MSFT"):
+            local.set(key, key, expires, nbytes=1)
+
+        cache_client_module._apply_invalidation(local, b"me|k|a")
+        assert local.get("a") == "a"
+        cache_client_module._apply_invalidation(local, b"other|k|a")
+        assert local.get("a") is None
+        cache_client_module._apply_invalidation(local, "other|p|stock:info:*")
+        assert local.get("stock:info:AAPL") is None
+        assert local.get("stock:info:MSFT") is None
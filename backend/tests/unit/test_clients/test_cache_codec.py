@@ -0,0 +1,98 @@
+# tests/unit/test_clients/test_cache_codec.py
+"""cache_codec 단위 테스트 (코덱 선택, 왕복 보존, 압축 태그)"""
+import pickle
+from datetime import date
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import patch
+
+from clients import cache_codec
+
+
+def roundtrip(value):
+    decoded, expires_at, compute_seconds = cache_codec.decode(cache_codec.encode(value, 123.0, 0.5))
+    assert (expires_at, compute_seconds) == (123.0, 0.5)
+    return decoded
+
+
+def codec_of(data: bytes) -> int:
+    return cache_codec.HEADER.unpack_from(data)[2]
+
+
+@pytest.fixture
+def history() -> pd.DataFrame:
+    """yfinance history 형태 (뉴욕 시간대 날짜 인덱스, float + int 컬럼)"""
+    index = pd.bdate_range("2026-01-02", periods=30, tz="America/New_York", name="Date")
+    index.freq = None  # yfinance 인덱스에는 freq가 없음
+    closes = np.linspace(100, 130, 30)
+    frame = pd.DataFrame(
+        {"Open": closes, "High": closes + 1, "Low": closes - 1, "Close": closes, "Volume": np.arange(30) * 1000},
+        index=index,
+    )
+    frame.columns.name = "Price"
+    return frame
+
+
+@pytest.mark.unit
+class TestCacheCodec:
+    def test_frame_roundtrip_uses_frame_codec(self, history):
+        data = cache_codec.encode(history, 0.0)
+        assert codec_of(data) == cache_codec.CODEC_FRAME
+        decoded = cache_codec.decode(data)[0]
+        pd.testing.assert_frame_equal(decoded, history)
+        decoded.iloc[0, 0] = 0.0  # 디코딩 결과는 수정 가능한 배열
+        assert history.iloc[0, 0] != 0.0
+
+    @pytest.mark.parametrize(
+        "frame",
+        [
+            pd.DataFrame(),
+            pd.DataFrame(columns=["a", "b"]),
+            pd.DataFrame({"name": ["a", None], "n": [1, 2]}, index=["x", "y"]),
+            pd.DataFrame({"flag": [True, False]}),
+            pd.date_range("2026-01-01", periods=3, freq="D").to_frame(name="when"),
+        ],
+    )
+    def test_frame_edge_cases(self, frame):
+        decoded = roundtrip(frame)
+        if frame.empty and frame.columns.empty:
+            assert decoded.empty
+        else:
+            pd.testing.assert_frame_equal(decoded, frame)
+
+    def test_unsupported_frames_fall_back_to_pickle(self, history):
+        multi = pd.concat({"AAPL": history}, axis=1)
+        data = cache_codec.encode(multi, 0.0)
+        assert codec_of(data) == cache_codec.CODEC_PICKLE
+        pd.testing.assert_frame_equal(cache_codec.decode(data)[0], multi)
+
+    def test_dict_uses_msgpack_and_keeps_nan(self):
+        info = {"symbol": "AAPL", "trailingPE": float("nan"), "officers": [{"age": 50}], "isEsgPopulated": False}
+        data = cache_codec.encode(info, 0.0)
+        assert codec_of(data) == cache_codec.CODEC_MSGPACK
+        decoded = cache_codec.decode(data)[0]
+        assert np.isnan(decoded.pop("trailingPE"))
+        assert decoded == {"symbol": "AAPL", "officers": [{"age": 50}], "isEsgPopulated": False}
+
+    @pytest.mark.parametrize("value", [{"d": [date(2026, 7, 30)]}, {1: "int key"}, np.float64(1.5)])
+    def test_values_msgpack_would_change_use_pickle(self, value):
+        data = cache_codec.encode(value, 0.0)
+        assert codec_of(data) == cache_codec.CODEC_PICKLE
+        assert cache_codec.decode(data)[0] == value
+
+    def test_large_payload_compressed_with_zstd(self):
+        value = {"summary": "x" * 50_000}
+        with patch.object(cache_codec, "COMPRESS_THRESHOLD", 1024):
+            data = cache_codec.encode(value, 0.0)
+        assert cache_codec.HEADER.unpack_from(data)[3] == cache_codec.COMPRESS_ZSTD
+        assert len(data) < 50_000
+        assert cache_codec.decode(data)[0] == value
+
+    def test_small_payload_not_compressed(self):
+        data = cache_codec.encode({"a": 1}, 0.0)
+        assert cache_codec.HEADER.unpack_from(data)[3] == cache_codec.COMPRESS_NONE
+
+    def test_is_encoded_distinguishes_legacy_pickle(self):
+        assert cache_codec.is_encoded(cache_codec.encode([1], 0.0))
+        assert not cache_codec.is_encoded(pickle.dumps([1]))
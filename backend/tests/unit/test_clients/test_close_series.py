@@ -0,0 +1,76 @@
+"""
+CloseSeries 테스트 (정렬 배열 + 이진 탐색 종가 조회)
+"""
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from clients.close_series import CloseSeries
+
+CLOSES = {date(2026, 5, 5): 104.0, date(2026, 5, 1): 100.0, date(2026, 5, 4): 102.0}  # 일부러 순서 섞음
+
+
+def linear_on_or_after(closes, target):
+    """기존 정렬 후 선형 탐색 구현 (비교 기준)"""
+    for d in sorted(closes):
+        if d >= target:
+            return closes[d]
+    return None
+
+
+@pytest.mark.unit
+class TestCloseSeries:
+    def test_from_mapping_sorts_by_date(self):
+        series = CloseSeries.from_mapping(CLOSES)
+        assert series.dates() == sorted(CLOSES)
+        assert series.values.tolist() == [100.0, 102.0, 104.0]
+        assert series.first_date == date(2026, 5, 1)
+        assert series.last_date == date(2026, 5, 5)
+
+    def test_on_or_after_skips_non_trading_days(self):
+        """휴장일 target은 다음 거래일 종가, 데이터 밖은 None인지 테스트"""
+        series = CloseSeries.from_mapping(CLOSES)
+        assert series.on_or_after(date(2026, 5, 4)) == 102.0
+        assert series.on_or_after(date(2026, 5, 2)) == 102.0
+        assert series.on_or_after(date(2026, 4, 1)) == 100.0
+        assert series.on_or_after(date(2026, 5, 6)) is None
+
+    def test_on_or_after_many_matches_linear_scan(self):
+        """여러 날짜 일괄 조회가 날짜별 선형 탐색과 같은지 테스트 (데이터 밖은 NaN)"""
+        rng = np.random.default_rng(7)
+        days = pd.bdate_range("2025-01-01", periods=250)
+        closes = {ts.date(): float(v) for ts, v in zip(days, 100 + rng.normal(0, 1, 250).cumsum())}
+        series = CloseSeries.from_mapping(closes)
+        targets = [d.date() for d in pd.date_range("2024-12-25", "2026-01-10")]
+
+        result = series.on_or_after_many(targets)
+
+        expected = [linear_on_or_after(closes, t) for t in targets]
+        assert [None if np.isnan(v) else v for v in result.tolist()] == expected
+
+    def test_until_drops_later_bars(self):
+        series = CloseSeries.from_mapping(CLOSES)
+        assert series.until(date(2026, 5, 4)).dates() == [date(2026, 5, 1), date(2026, 5, 4)]
+        assert series.until(date(2026, 5, 9)) is series
+        assert not series.until(date(2026, 4, 1))
+
+    def test_from_history_matches_dict_conversion(self):
+        """history 변환이 기존 {idx.date(): close} dict와 같은지 테스트"""
+        index = pd.DatetimeIndex(["2026-05-04", "2026-05-01", "2026-05-05"], tz="America/New_York")
+        history = pd.DataFrame({"Close": [102.0, 100.0, 104.0]}, index=index)
+        series = CloseSeries.from_history(history)
+        assert series.to_dict() == {idx.date(): float(close) for idx, close in history["Close"].items()}
+
+    def test_empty_series_is_falsy(self):
+        assert not CloseSeries.from_history(None)
+        assert not CloseSeries.from_history(pd.DataFrame())
+        assert not CloseSeries.coerce(None)
+        assert CloseSeries.empty().on_or_after(date(2026, 5, 1)) is None
+        assert np.isnan(CloseSeries.empty().on_or_after_many([date(2026, 5, 1)])).all()
+
+    def test_coerce_keeps_series(self):
+        series = CloseSeries.from_mapping(CLOSES)
+        assert CloseSeries.coerce(series) is series
+        assert CloseSeries.coerce(CLOSES).dates() == series.dates()
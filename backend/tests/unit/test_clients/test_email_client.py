@@ -0,0 +1,63 @@
+# tests/unit/test_clients/test_email_client.py
+"""EmailClient 단위 테스트 (resend HTTP 요청이 공유 연결 풀로 나가는지)"""
+import pytest
+import requests
+import resend
+from unittest.mock import MagicMock, patch
+
+from clients import email_client
+from clients.email_client import EmailClient, SessionHTTPClient
+
+
+@pytest.fixture(autouse=True)
+def restore_resend_http_client(monkeypatch):
+    """resend 전역 HTTP 클라이언트와 설치 플래그를 테스트마다 원래대로"""
+    monkeypatch.setattr(resend, "default_http_client", resend.default_http_client)
+    monkeypatch.setattr(email_client, "_session_client_installed", False)
+    monkeypatch.setenv("RESEND_API_KEY", "re_test")
+
+
+def json_response(payload: bytes = b'{"id": "email-1"}', status: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.content = payload
+    response.status_code = status
+    response.headers = {"Content-Type": "application/json"}
+    return response
+
+
+@pytest.mark.unit
+class TestSessionHttpClient:
+    def test_emails_send_goes_through_shared_session(self):
+        """EmailClient 생성 후 resend.Emails.send가 get_http_session()의 세션으로 요청하는지 테스트"""
+        session = MagicMock()
+        session.request.return_value = json_response()
+
+        with patch("clients.email_client.get_http_session", return_value=session):
+            EmailClient()
+            result = resend.Emails.send(
+                {"from": "a@example.com", "to": ["b@example.com"], "subject": "hi", "html": "<p>hi</p>"}
+            )
+
+        assert isinstance(resend.default_http_client, SessionHTTPClient)
+        assert result["id"] == "email-1"
+        session.request.assert_called_once()
+        kwargs = session.request.call_args.kwargs
+        assert kwargs["method"] == "post"
+        assert kwargs["url"].endswith("/emails")
+        assert kwargs["json"]["subject"] == "hi"
+
+    def test_install_is_idempotent(self):
+        EmailClient()
+        installed = resend.default_http_client
+        EmailClient()
+        assert resend.default_http_client is installed
+
+    def test_request_errors_surface_as_resend_errors(self):
+        """연결 오류는 resend가 HttpClientError로 감싸 올리는지 테스트 (기본 클라이언트와 같은 동작)"""
+        session = MagicMock()
+        session.request.side_effect = requests.ConnectionError("refused")
+
+        with patch("clients.email_client.get_http_session", return_value=session):
+            EmailClient()
+            with pytest.raises(resend.exceptions.ResendError):
+                resend.Emails.send({"from": "a@example.com", "to": ["b@example.com"], "subject": "x", "html": "x"})
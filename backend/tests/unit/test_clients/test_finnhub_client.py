@@ -1,9 +1,22 @@
 # tests/unit/test_clients/test_finnhub_client.py
 """FinnhubClient 단위 테스트 (네트워크/캐시 없이)"""
+import asyncio
+
+import httpx
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from clients import finnhub_client
+from clients.cache_client import CachedFailure
+from clients.finnhub_client import AsyncFinnhubClient, FinnhubClient
 
-from clients.finnhub_client import FinnhubClient
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter():
+    """프로세스 공용 토큰 버킷 격리 (테스트 간 토큰 소모가 섞이지 않도록)"""
+    finnhub_client._rate_limiter = None
+    yield
+    finnhub_client._rate_limiter = None
 
 
 def make_client(api_key="test-key") -> FinnhubClient:
@@ -20,6 +33,42 @@ class TestFinnhubClient:
         with pytest.raises(RuntimeError):
             client._get("/quote", {"symbol": "AAPL"})
 
+    def test_429_drains_bucket_and_retries(self):
+        """429 응답이면 버킷을 비우고 Retry-After만큼 쉰 뒤 재시도하는지 테스트"""
+        client = make_client()
+        throttled = MagicMock(status_code=429, headers={"Retry-After": "2"})
+        ok = MagicMock(status_code=200)
+        ok.json.return_value = {"c": 150.0}
+
+        session = MagicMock()
+        session.get.side_effect = [throttled, ok]
+        with patch("clients.finnhub_client.get_http_session", return_value=session), patch(
+            "clients.finnhub_client.time.sleep"
+        ) as sleep, patch.object(client.rate_limiter, "drain") as drain, patch.object(
+            client.rate_limiter, "acquire"
+        ) as acquire:
+            assert client.get_quote("AAPL") == 150.0
+
+        assert session.get.call_count == 2
+        drain.assert_called_once()
+        sleep.assert_called_once_with(2.0)
+        acquire.assert_called_with("quote")
+
+    def test_priorities_passed_to_rate_limiter(self):
+        client = make_client()
+        ok = MagicMock(status_code=200)
+        ok.json.side_effect = [{"earningsCalendar": []}, []]
+
+        session = MagicMock()
+        session.get.return_value = ok
+        with patch("clients.finnhub_client.get_http_session", return_value=session), patch.object(
+            client.rate_limiter, "acquire"
+        ) as acquire:
+            client.get_upcoming_earnings(["AAPL"])
+            client.get_market_news()
+
+        assert [c.args[0] for c in acquire.call_args_list] == ["earnings", "news"]
+
     def test_normalize_article(self):
         article = {
             "headline": "H" * 300,
@@ -63,3 +112,162 @@ class TestFinnhubClient:
             articles = client.get_market_news(limit=30)
         assert len(articles) == 30
         assert articles[0]["headline"] == "news 0"
+
+
+    def test_company_news_many_skips_cached_and_failed_symbols(self):
+        """캐시된 종목은 호출하지 않고, 실패한 종목은 빈 리스트 + 실패 기록으로 캐시하는지 테스트"""
+        client = make_client()
+        stored = {}
+
+        def get_or_set_many(keys, fetch_many, ttl_seconds):
+            keys = list(keys)
+            hits = {key: stored[key] for key in keys if key in stored}
+            fetched = fetch_many([key for key in keys if key not in hits])
+            stored.update(fetched)
+            return {**hits, **fetched}
+
+        to_date = finnhub_client.datetime.now(finnhub_client.timezone.utc).date()
+        key = lambda symbol: finnhub_client._company_news_key(symbol, to_date)
+        client.cache = MagicMock()
+        client.cache.get_or_set_many.side_effect = get_or_set_many
+        stored[key("AAPL")] = [{"headline": "cached"}]
+
+        def fake_get(path, params, priority=finnhub_client.PRIORITY_NEWS):
+            if params["symbol"] == "BAD":
+                raise RuntimeError("boom")
+            return [{"headline": params["symbol"]}]
+
+        with patch.object(client, "_get", side_effect=fake_get) as get:
+            news = client.get_company_news_many(["AAPL", "MSFT", "BAD"])
+
+        assert news["AAPL"] == [{"headline": "cached"}]
+        assert news["MSFT"][0]["headline"] == "MSFT"
+        assert news["BAD"] == []
+        assert [c.args[1]["symbol"] for c in get.call_args_list] == ["MSFT", "BAD"]
+        assert isinstance(stored[key("BAD")], CachedFailure)  # 실패는 성공 값과 구분되게 짧게 캐시
+
+
+def make_async_client(api_key="test-key") -> AsyncFinnhubClient:
+    with patch.object(FinnhubClient, "_init_cache", return_value=None):
+        return AsyncFinnhubClient(api_key=api_key)
+
+
+def mock_http(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.unit
+class TestAsyncFinnhubClient:
+    async def test_unavailable_without_key(self, monkeypatch):
+        monkeypatch.delenv("FINNHUB_API_KEY", raising=False)
+        client = make_async_client(api_key="")
+        with pytest.raises(RuntimeError):
+            await client._get("/quote", {"symbol": "AAPL"})
+
+    async def test_get_quotes_concurrently_skips_failures(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["token"] == "test-key"
+            symbol = request.url.params["symbol"]
+            if symbol == "BAD":
+                return httpx.Response(500)
+            return httpx.Response(200, json={"c": {"AAPL": 150.0, "ZERO": 0}[symbol]})
+
+        client = make_async_client()
+        with patch("clients.finnhub_client.get_async_http_client", return_value=mock_http(handler)):
+            quotes = await client.get_quotes(["AAPL", "ZERO", "BAD"])
+
+        assert quotes == {"AAPL": 150.0}
+
+    async def test_concurrency_limited_by_provider_semaphore(self, monkeypatch):
+        """동시 요청 수가 FINNHUB_MAX_CONCURRENCY를 넘지 않는지 테스트"""
+        monkeypatch.setenv("FINNHUB_MAX_CONCURRENCY", "2")
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return httpx.Response(200, json={"c": 10.0})
+
+        client = make_async_client()
+        with patch("clients.finnhub_client.get_async_http_client", return_value=mock_http(handler)):
+            quotes = await client.get_quotes([f"T{i}" for i in range(6)])
+
+        assert len(quotes) == 6
+        assert peak == 2
+
+    async def test_get_upcoming_earnings_uses_cache(self):
+        """비동기 캐시 조회도 get_or_set 경로(single-flight, 음성 캐시)를 쓰는지 테스트"""
+        cache = MagicMock()
+        cache.get_or_set_async = AsyncMock(return_value=[{"symbol": "AAPL", "date": "2026-06-12"}])
+        client = make_async_client()
+        client.cache = cache
+
+        with patch.object(client, "_get") as get:
+            upcoming = await client.get_upcoming_earnings(["AAPL", "MSFT"])
+
+        assert upcoming == {"AAPL": "2026-06-12"}
+        get.assert_not_called()
+        cache.get.assert_not_called()
+
+    async def test_company_news_many_failure_gives_empty_list(self):
+        client = make_async_client()
+
+        async def fake_get(path, params, priority=finnhub_client.PRIORITY_NEWS):
+            if params["symbol"] == "BAD":
+                raise RuntimeError("boom")
+            return [{"headline": params["symbol"]}]
+
+        with patch.object(client, "_get", side_effect=fake_get):
+            news = await client.get_company_news_many(["AAPL", "BAD"])
+
+        assert news["AAPL"][0]["headline"] == "AAPL"
+        assert news["BAD"] == []
+
+    async def test_company_news_many_reads_cache_in_bulk(self):
+        """캐시에 있는 종목은 한 번의 get_many로 채우고, 나머지만 조회 + 실패는 음성 캐시하는지 테스트"""
+        client = make_async_client()
+        to_date = finnhub_client.datetime.now(finnhub_client.timezone.utc).date()
+        key = lambda symbol: finnhub_client._company_news_key(symbol, to_date)
+        stored = {}
+
+        async def get_or_set_async(cache_key, fetch, ttl_seconds):
+            stored[cache_key] = await fetch()
+            return stored[cache_key]
+
+        client.cache = MagicMock()
+        client.cache.get_many.return_value = {key("AAPL"): [{"headline": "cached"}]}
+        client.cache.get_or_set_async.side_effect = get_or_set_async
+
+        async def fake_get(path, params, priority=finnhub_client.PRIORITY_NEWS):
+            if params["symbol"] == "BAD":
+                raise RuntimeError("boom")
+            return [{"headline": params["symbol"]}]
+
+        with patch.object(client, "_get", side_effect=fake_get) as get:
+            news = await client.get_company_news_many(["AAPL", "MSFT", "BAD"])
+
+        assert news["AAPL"] == [{"headline": "cached"}]
+        assert news["MSFT"][0]["headline"] == "MSFT"
+        assert news["BAD"] == []
+        assert list(news) == ["AAPL", "MSFT", "BAD"]
+        client.cache.get_many.assert_called_once()
+        assert [c.args[1]["symbol"] for c in get.call_args_list] == ["MSFT", "BAD"]
+        assert isinstance(stored[key("BAD")], CachedFailure)
+
+    async def test_429_drains_bucket_without_blocking_loop(self):
+        """429 응답 시 버킷 비우기도 스레드에서 실행하는지 테스트"""
+        responses = iter([httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, json={"c": 5.0})])
+        client = make_async_client()
+        client.rate_limiter = MagicMock()
+        client.rate_limiter.acquire_async = AsyncMock()
+        client.rate_limiter.drain_async = AsyncMock()
+
+        with patch("clients.finnhub_client.get_async_http_client", return_value=mock_http(lambda r: next(responses))):
+            assert await client.get_quote("AAPL") == 5.0
+
+        client.rate_limiter.drain_async.assert_awaited_once()
+        client.rate_limiter.drain.assert_not_called()
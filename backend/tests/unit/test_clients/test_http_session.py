@@ -0,0 +1,49 @@
+# tests/unit/test_clients/test_http_session.py
+"""공유 HTTP 세션(연결 풀) 테스트"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from clients import http_session
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_session.close_http_session()
+    yield
+    http_session.close_http_session()
+
+
+@pytest.mark.unit
+class TestHttpSession:
+    def test_same_session_within_process(self):
+        assert http_session.get_http_session() is http_session.get_http_session()
+
+    def test_new_session_after_fork(self):
+        """pid가 바뀌면(Celery prefork 자식) 새 세션을 만드는지 테스트"""
+        parent = http_session.get_http_session()
+        with patch("clients.http_session.os.getpid", return_value=-1):
+            child = http_session.get_http_session()
+        assert child is not parent
+
+    def test_adapter_pool_and_retry_settings(self):
+        adapter = http_session.get_http_session().get_adapter("https://finnhub.io")
+        assert adapter._pool_maxsize == http_session.POOL_MAXSIZE
+        retry = adapter.max_retries
+        assert retry.total == http_session.RETRY_TOTAL
+        assert 429 not in retry.status_forcelist  # 429는 호출부(토큰 버킷)가 처리
+        assert "POST" not in retry.allowed_methods
+        assert retry.respect_retry_after_header is False
+
+    def test_connection_stats_reports_reuse(self):
+        session = http_session.get_http_session()
+        pool = MagicMock(scheme="https", host="finnhub.io", num_requests=10, num_connections=2)
+        adapter = session.get_adapter("https://finnhub.io")
+        with patch.object(adapter.poolmanager, "pools", {"key": pool}):
+            stats = http_session.connection_stats()
+
+        assert stats == {
+            "https://finnhub.io": {"requests": 10, "connections_opened": 2, "reuse_ratio": pytest.approx(0.8)}
+        }
+
+    def test_connection_stats_empty_without_session(self):
+        assert http_session.connection_stats() == {}
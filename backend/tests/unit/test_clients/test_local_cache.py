@@ -0,0 +1,64 @@
+# tests/unit/test_clients/test_local_cache.py
+"""LocalCache(L1) 단위 테스트"""
+import time
+import pytest
+
+from clients.local_cache import LocalCache
+
+
+@pytest.mark.unit
+class TestLocalCache:
+    def test_get_returns_fresh_value_and_counts_hits(self):
+        cache = LocalCache(max_bytes=1000)
+        cache.set("a", "value", time.time() + 60, nbytes=10)
+        assert cache.get("a") == "value"
+        assert cache.get("missing") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_value_is_dropped(self):
+        cache = LocalCache(max_bytes=1000)
+        cache.set("a", "value", time.time() + 60, nbytes=10)
+        cache._items["a"] = ("value", time.time() - 1, 10)
+        assert cache.get("a") is None
+        assert cache.stats()["bytes"] == 0
+
+    def test_evicts_least_recently_used_over_byte_budget(self):
+        cache = LocalCache(max_bytes=100)
+        expires = time.time() + 60
+        cache.set("a", 1, expires, nbytes=25)
+        cache.set("b", 2, expires, nbytes=25)
+        cache.set("c", 3, expires, nbytes=25)
+        cache.get("a")  # a를 최근 사용으로
+        cache.set("d", 4, expires, nbytes=25)
+        cache.set("e", 5, expires, nbytes=25)
+
+        assert cache.get("b") is None
+        assert [cache.get(k) for k in ("a", "c", "d", "e")] == [1, 3, 4, 5]
+        assert cache.stats()["bytes"] == 100
+
+    def test_oversized_value_not_cached(self):
+        cache = LocalCache(max_bytes=100)
+        cache.set("big", "x", time.time() + 60, nbytes=26)
+        assert cache.get("big") is None
+
+    def test_overwrite_replaces_size(self):
+        cache = LocalCache(max_bytes=100)
+        cache.set("a", 1, time.time() + 60, nbytes=20)
+        cache.set("a", 2, time.time() + 60, nbytes=5)
+        assert cache.get("a") == 2
+        assert cache.stats()["bytes"] == 5
+
+    def test_delete_pattern_uses_redis_glob(self):
+        cache = LocalCache(max_bytes=1000)
+        expires = time.time() + 60
+        for key in ("stock:history:AAPL:1y", "stock:history:MSFT:1y", "stock:info:AAPL"):
+            cache.set(key, key, expires, nbytes=1)
+        cache.delete_pattern("stock:history:*")
+        assert cache.get("stock:history:AAPL:1y") is None
+        assert cache.get("stock:info:AAPL") == "stock:info:AAPL"
+
+    def test_disabled_when_max_bytes_zero(self):
+        cache = LocalCache(max_bytes=0)
+        cache.set("a", 1, time.time() + 60, nbytes=1)
+        assert cache.get("a") is None
@@ -0,0 +1,113 @@
+"""
+market_calendar 헬퍼 테스트 (정규장 시간/다음 개장·마감 시각)
+"""
+import pytest
+from datetime import date, datetime, timezone
+
+from clients.market_calendar import (
+    MARKET_TZ,
+    bars_expire_at,
+    is_market_open,
+    is_trading_day,
+    last_settled_session,
+    next_close,
+    next_open,
+    nyse_early_closes,
+    nyse_holidays,
+    quote_expire_at,
+    seconds_until,
+)
+
+
+@pytest.mark.unit
+class TestMarketCalendar:
+    def test_weekend_is_not_trading_day(self):
+        assert is_trading_day(date(2026, 6, 12))  # 금
+        assert not is_trading_day(date(2026, 6, 13))  # 토
+        assert not is_trading_day(date(2026, 6, 14))  # 일
+
+    def test_is_market_open_during_session(self):
+        assert is_market_open(datetime(2026, 6, 10, 10, 0, tzinfo=MARKET_TZ))
+        assert not is_market_open(datetime(2026, 6, 10, 9, 0, tzinfo=MARKET_TZ))
+        assert not is_market_open(datetime(2026, 6, 10, 16, 0, tzinfo=MARKET_TZ))
+        assert not is_market_open(datetime(2026, 6, 13, 12, 0, tzinfo=MARKET_TZ))
+
+    def test_next_close_same_day_before_close(self):
+        now = datetime(2026, 6, 10, 12, 0, tzinfo=MARKET_TZ)
+        assert next_close(now) == datetime(2026, 6, 10, 16, 0, tzinfo=MARKET_TZ)
+
+    def test_next_close_skips_weekend(self):
+        now = datetime(2026, 6, 12, 16, 0, tzinfo=MARKET_TZ)  # 금요일 마감 시각 (포함하지 않음)
+        assert next_close(now) == datetime(2026, 6, 15, 16, 0, tzinfo=MARKET_TZ)
+
+    def test_next_open_accepts_utc(self):
+        now = datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc)  # 08:00 ET
+        assert next_open(now) == datetime(2026, 6, 10, 9, 30, tzinfo=MARKET_TZ)
+
+    def test_seconds_until_never_negative(self):
+        now = datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc)
+        assert seconds_until(datetime(2026, 6, 10, 13, 0, tzinfo=timezone.utc), now) == 3600
+        assert seconds_until(datetime(2026, 6, 10, 11, 0, tzinfo=timezone.utc), now) == 0
+
+
+@pytest.mark.unit
+class TestNyseHolidays:
+    def test_2026_holidays_match_nyse_calendar(self):
+        assert sorted(nyse_holidays(2026)) == [
+            date(2026, 1, 1),
+            date(2026, 1, 19),
+            date(2026, 2, 16),
+            date(2026, 4, 3),  # 성금요일
+            date(2026, 5, 25),
+            date(2026, 6, 19),
+            date(2026, 7, 3),  # 7/4 토요일 → 금요일 대체 휴장
+            date(2026, 9, 7),
+            date(2026, 11, 26),
+            date(2026, 12, 25),
+        ]
+        assert sorted(nyse_early_closes(2026)) == [date(2026, 11, 27), date(2026, 12, 24)]
+
+    def test_saturday_new_year_has_no_observed_holiday(self):
+        assert date(2027, 12, 31) not in nyse_holidays(2027)
+        assert date(2027, 12, 24) in nyse_holidays(2027)  # 크리스마스 토요일 → 금요일
+        assert not any(day.year == 2028 and day.month == 1 and day.day < 3 for day in nyse_holidays(2028))
+
+    def test_holiday_is_not_trading_day(self):
+        assert not is_trading_day(date(2026, 11, 26))  # 추수감사절
+        assert not is_market_open(datetime(2026, 11, 26, 11, 0, tzinfo=MARKET_TZ))
+
+    def test_early_close_ends_session_at_1pm(self):
+        assert is_market_open(datetime(2026, 11, 27, 12, 59, tzinfo=MARKET_TZ))
+        assert not is_market_open(datetime(2026, 11, 27, 13, 0, tzinfo=MARKET_TZ))
+        now = datetime(2026, 11, 27, 10, 0, tzinfo=MARKET_TZ)
+        assert next_close(now) == datetime(2026, 11, 27, 13, 0, tzinfo=MARKET_TZ)
+
+    def test_next_open_skips_holiday_weekend(self):
+        now = datetime(2026, 7, 2, 17, 0, tzinfo=MARKET_TZ)  # 목 마감 후, 금 대체 휴장
+        assert next_open(now) == datetime(2026, 7, 6, 9, 30, tzinfo=MARKET_TZ)
+
+
+@pytest.mark.unit
+class TestExpiryPolicies:
+    def test_bars_expire_after_next_close_plus_settle(self):
+        now = datetime(2026, 6, 10, 12, 0, tzinfo=MARKET_TZ)
+        assert bars_expire_at(now) == datetime(2026, 6, 10, 16, 30, tzinfo=MARKET_TZ)
+
+    def test_bars_fetched_during_settle_expire_at_same_settle_time(self):
+        now = datetime(2026, 6, 10, 16, 10, tzinfo=MARKET_TZ)
+        assert bars_expire_at(now) == datetime(2026, 6, 10, 16, 30, tzinfo=MARKET_TZ)
+
+    def test_bars_hold_over_holiday_weekend(self):
+        now = datetime(2026, 7, 2, 17, 0, tzinfo=MARKET_TZ)
+        assert bars_expire_at(now) == datetime(2026, 7, 6, 16, 30, tzinfo=MARKET_TZ)
+
+    def test_quote_expiry_never_crosses_close(self):
+        now = datetime(2026, 6, 10, 15, 59, 50, tzinfo=MARKET_TZ)
+        assert quote_expire_at(now, 45) == datetime(2026, 6, 10, 16, 0, tzinfo=MARKET_TZ)
+        closed = datetime(2026, 6, 10, 17, 0, tzinfo=MARKET_TZ)
+        assert quote_expire_at(closed, 45) == datetime(2026, 6, 11, 9, 30, tzinfo=MARKET_TZ)
+
+    def test_last_settled_session(self):
+        assert last_settled_session(datetime(2026, 6, 10, 16, 29, tzinfo=MARKET_TZ)) == date(2026, 6, 9)
+        assert last_settled_session(datetime(2026, 6, 10, 16, 30, tzinfo=MARKET_TZ)) == date(2026, 6, 10)
+        assert last_settled_session(datetime(2026, 7, 6, 8, 0, tzinfo=MARKET_TZ)) == date(2026, 7, 2)
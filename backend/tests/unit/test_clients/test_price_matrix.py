@@ -0,0 +1,54 @@
+"""
+price_matrix 헬퍼 테스트 (티커별 history 스택 + 벡터 ATR%)
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from clients.price_matrix import atr_pct, stack_field
+
+
+def rolling_atr_pct(hist: pd.DataFrame, window: int = 14) -> float:
+    """기존 pandas rolling 구현 (비교 기준)"""
+    high_low = hist["High"] - hist["Low"]
+    high_close = (hist["High"] - hist["Close"].shift()).abs()
+    low_close = (hist["Low"] - hist["Close"].shift()).abs()
+    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
+    return float(tr.rolling(window=window).mean().iloc[-1] / hist["Close"].iloc[-1])
+
+
+def random_history(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 2, n).cumsum()
+    high = close + rng.uniform(0, 3, n)
+    low = close - rng.uniform(0, 3, n)
+    return pd.DataFrame({"High": high, "Low": low, "Close": close}, index=pd.bdate_range("2026-01-01", periods=n))
+
+
+@pytest.mark.unit
+class TestPriceMatrix:
+    def test_stack_field_right_aligns_shorter_histories(self):
+        histories = {"A": random_history(5, 1), "B": random_history(3, 2)}
+        tickers, closes = stack_field(histories, "Close")
+
+        assert tickers == ["A", "B"]
+        assert closes.shape == (2, 5)
+        assert np.isnan(closes[1, :2]).all()
+        np.testing.assert_allclose(closes[1, 2:], histories["B"]["Close"].to_numpy())
+
+    def test_atr_pct_matches_rolling_implementation(self):
+        """벡터 계산이 티커별 pandas rolling 계산과 같은 값인지 테스트"""
+        histories = {"A": random_history(60, 1), "B": random_history(40, 2), "C": random_history(15, 3)}
+        result = atr_pct(histories, window=14)
+
+        for ticker, hist in histories.items():
+            assert result[ticker] == pytest.approx(rolling_atr_pct(hist, 14))
+
+    def test_short_and_empty_histories(self):
+        result = atr_pct({"SHORT": random_history(5, 1), "EMPTY": pd.DataFrame()}, window=14)
+
+        assert np.isnan(result["SHORT"])
+        assert result["EMPTY"] == 0.0
+
+    def test_no_histories(self):
+        assert atr_pct({}) == {}
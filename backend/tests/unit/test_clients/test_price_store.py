@@ -0,0 +1,150 @@
+# tests/unit/test_clients/test_price_store.py
+"""PriceStore 단위 테스트 (임시 디렉토리 사용, 네트워크 없음)"""
+import multiprocessing
+import pytest
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from clients.price_store import PriceStore, period_start_date
+
+
+def make_history(start: str, closes: list) -> pd.DataFrame:
+    dates = pd.bdate_range(start, periods=len(closes))
+    return pd.DataFrame(
+        {
+            "Open": closes,
+            "High": [c + 1 for c in closes],
+            "Low": [c - 1 for c in closes],
+            "Close": closes,
+            "Volume": [1_000_000] * len(closes),
+        },
+        index=dates,
+    )
+
+
+@pytest.mark.unit
+class TestPeriodStartDate:
+    def test_month_and_year_offsets(self):
+        today = date(2026, 6, 11)
+        assert period_start_date("3mo", today) == date(2026, 3, 11)
+        assert period_start_date("1y", today) == date(2025, 6, 11)
+
+    def test_ytd_and_max(self):
+        assert period_start_date("ytd", date(2026, 6, 11)) == date(2026, 1, 1)
+        assert period_start_date("max") is None
+
+    def test_unknown_period_raises(self):
+        with pytest.raises(ValueError):
+            period_start_date("7w")
+
+
+@pytest.mark.unit
+class TestPriceStore:
+    def test_unavailable_without_dir(self, monkeypatch):
+        monkeypatch.delenv("PRICE_STORE_DIR", raising=False)
+        assert PriceStore().is_available() is False
+
+    def test_read_missing_ticker_returns_empty(self, tmp_path):
+        store = PriceStore(str(tmp_path))
+        assert len(store.read("AAPL")) == 0
+        assert store.read_frame("AAPL").empty
+        assert store.last_date("AAPL") is None
+
+    def test_merge_and_read_roundtrip(self, tmp_path):
+        store = PriceStore(str(tmp_path))
+        history = make_history("2026-06-01", [100.0, 101.0, 102.0])
+
+        assert store.merge("AAPL", history, covered_from=date(2026, 6, 1)) == 3
+
+        frame = store.read_frame("AAPL")
+        assert list(frame["Close"]) == [100.0, 101.0, 102.0]
+        assert list(frame.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert store.last_date("AAPL") == date(2026, 6, 3)
+        assert store.get_meta("AAPL")["covered_from"] == "2026-06-01"
+
+    def test_read_is_memory_mapped_slice(self, tmp_path):
+        store = PriceStore(str(tmp_path))
+        store.merge("AAPL", make_history("2026-06-01", [100.0, 101.0, 102.0]))
+
+        bars = store.read("AAPL", start=date(2026, 6, 2))
+        assert isinstance(bars, np.memmap)
+        assert list(bars["close"]) == [101.0, 102.0]
+
+    def test_incremental_merge_overwrites_overlapping_bar(self, tmp_path):
+        """마지막 저장일(미완성 봉)은 새 값으로 덮어쓰고, 이후 봉은 이어붙는다"""
+        store = PriceStore(str(tmp_path))
+        store.merge("AAPL", make_history("2026-06-01", [100.0, 101.0, 102.0]), covered_from=date(2026, 6, 1))
+
+        store.merge("AAPL", make_history("2026-06-03", [105.0, 106.0]))
+
+        frame = store.read_frame("AAPL")
+        assert list(frame["Close"]) == [100.0, 101.0, 105.0, 106.0]
+        assert store.get_meta("AAPL")["covered_from"] == "2026-06-01"  # 증분 병합은 커버 구간 유지
+
+    def test_tz_aware_index_uses_exchange_date(self, tmp_path):
+        store = PriceStore(str(tmp_path))
+        history = make_history("2026-06-01", [100.0])
+        history.index = history.index.tz_localize("America/New_York")
+
+        store.merge("AAPL", history)
+
+        assert store.last_date("AAPL") == date(2026, 6, 1)
+
+    def test_empty_fetch_leaves_coverage_and_sync_time(self, tmp_path):
+        """빈 조회 결과는 봉도, covered_from/synced_at도 기록하지 않는지 테스트 (다음 조회 때 다시 받음)"""
+        store = PriceStore(str(tmp_path))
+
+        assert store.merge("GONE", pd.DataFrame(), covered_from=date(2026, 1, 1)) == 0
+        assert store.get_meta("GONE") == {}
+
+        store.merge("AAPL", make_history("2026-06-01", [100.0]), covered_from=date(2026, 6, 1))
+        meta = store.get_meta("AAPL")
+        assert store.merge("AAPL", pd.DataFrame(), covered_from=date(2020, 1, 1)) == 1
+        assert store.get_meta("AAPL") == meta
+
+    def test_read_frame_is_independent_copy_with_exchange_tz(self, tmp_path):
+        """read_frame은 저장 파일과 분리된 복사본이고, tz를 주면 거래소 타임존 인덱스인지 테스트"""
+        store = PriceStore(str(tmp_path))
+        store.merge("AAPL", make_history("2026-06-01", [100.0, 101.0]))
+
+        frame = store.read_frame("AAPL", tz="America/New_York")
+        frame.loc[:, "Close"] = 0.0
+
+        assert str(frame.index.tz) == "America/New_York"
+        assert frame.index[0].date() == date(2026, 6, 1)
+        assert list(store.read_frame("AAPL")["Close"]) == [100.0, 101.0]
+
+    def test_concurrent_merges_keep_both_writes(self, tmp_path, monkeypatch):
+        """두 프로세스가 같은 티커를 동시에 병합해도 양쪽 봉과 커버 구간이 모두 남는지 테스트 (티커별 flock)"""
+        read = PriceStore.read
+
+        def slow_read(self, ticker, start=None):
+            bars = read(self, ticker, start)
+            time.sleep(0.2)  # 잠금이 없으면 두 병합이 같은 기존 봉을 읽고 서로 덮어쓴다
+            return bars
+
+        monkeypatch.setattr(PriceStore, "read", slow_read)
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(
+                target=PriceStore(str(tmp_path)).merge,
+                args=("AAPL", make_history(start, [close]), covered_from),
+            )
+            for start, close, covered_from in [
+                ("2026-06-01", 100.0, date(2026, 6, 1)),
+                ("2026-06-02", 101.0, None),
+            ]
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=10)
+
+        assert [worker.exitcode for worker in workers] == [0, 0]
+        monkeypatch.setattr(PriceStore, "read", read)
+        store = PriceStore(str(tmp_path))
+        assert list(store.read_frame("AAPL")["Close"]) == [100.0, 101.0]
+        assert store.get_meta("AAPL")["covered_from"] == "2026-06-01"
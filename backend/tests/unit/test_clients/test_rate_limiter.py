@@ -0,0 +1,134 @@
+# tests/unit/test_clients/test_rate_limiter.py
+"""TokenBucket 단위 테스트 (Redis는 mock, 로컬 버킷은 실제 동작)"""
+import threading
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from clients.rate_limiter import DRAIN_SCRIPT, RateLimitTimeout, TokenBucket
+
+
+def make_bucket(capacity=10, reserves=None, max_wait=5.0, redis_client=None) -> TokenBucket:
+    return TokenBucket(
+        "test", capacity=capacity, period_seconds=60, reserves=reserves, redis_client=redis_client, max_wait=max_wait
+    )
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    def test_local_bucket_allows_up_to_capacity(self):
+        bucket = make_bucket(capacity=3)
+        assert [bucket._try_acquire("quote") for _ in range(3)] == [None, None, None]
+        wait = bucket._try_acquire("quote")
+        assert wait == pytest.approx(60 / 3, rel=0.01)  # 토큰 1개 충전 시간
+
+    def test_low_priority_leaves_reserve_for_high_priority(self):
+        """뉴스는 reserve만큼 남겨두고 멈추고, 시세는 남은 토큰을 쓸 수 있는지 테스트"""
+        bucket = make_bucket(capacity=5, reserves={"quote": 0, "news": 3})
+        assert bucket._try_acquire("news") is None
+        assert bucket._try_acquire("news") is None
+        assert bucket._try_acquire("news") is not None  # 3개 남음 → 뉴스 대기
+        assert bucket._try_acquire("quote") is None
+        assert bucket._try_acquire("quote") is None
+
+    def test_acquire_waits_instead_of_failing(self):
+        bucket = make_bucket(capacity=1)
+        bucket._try_acquire("quote")
+        with patch.object(bucket, "_try_acquire", side_effect=[2.0, None]) as attempt, patch(
+            "clients.rate_limiter.time.sleep"
+        ) as sleep:
+            bucket.acquire("quote")
+        assert attempt.call_count == 2
+        assert 2.0 <= sleep.call_args.args[0] <= 2.1
+
+    def test_acquire_times_out_after_max_wait(self):
+        bucket = make_bucket(capacity=1, max_wait=0)
+        bucket._try_acquire("quote")
+        with pytest.raises(RateLimitTimeout):
+            bucket.acquire("quote")
+
+    async def test_acquire_async_waits(self):
+        bucket = make_bucket()
+        with patch.object(bucket, "_try_acquire", side_effect=[0.01, None]) as attempt:
+            await bucket.acquire_async("news")
+        assert attempt.call_count == 2
+
+    async def test_acquire_async_runs_redis_script_off_event_loop(self):
+        """비동기 획득의 Redis 스크립트 호출이 이벤트 루프 스레드를 막지 않는지 테스트"""
+        loop_thread = threading.get_ident()
+        threads = []
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = MagicMock(
+            side_effect=lambda **kwargs: threads.append(threading.get_ident()) or [1, "0", "9"]
+        )
+        bucket = make_bucket(redis_client=redis_client)
+
+        await bucket.acquire_async("quote")
+        await bucket.drain_async()
+
+        assert threads and loop_thread not in threads
+
+    def test_drain_empties_local_bucket(self):
+        bucket = make_bucket(capacity=5)
+        bucket.drain()
+        assert bucket._try_acquire("quote") is not None
+
+    def test_drain_uses_redis_time_script(self):
+        """Redis 버킷 비우기는 로컬 time.time()이 아니라 Lua 스크립트(Redis TIME)로 하는지 테스트"""
+        redis_client = MagicMock()
+        scripts = {}
+        redis_client.register_script.side_effect = lambda source: scripts.setdefault(source, MagicMock())
+        bucket = make_bucket(capacity=60, redis_client=redis_client)
+
+        bucket.drain()
+
+        drain = scripts[DRAIN_SCRIPT]
+        drain.assert_called_once_with(keys=["ratelimit:test"], args=[120])
+        assert "redis.call('TIME')" in DRAIN_SCRIPT
+        redis_client.hset.assert_not_called()
+
+    def test_drain_falls_back_to_local_bucket_when_redis_fails(self):
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = MagicMock(side_effect=ConnectionError("down"))
+        bucket = make_bucket(capacity=5, redis_client=redis_client)
+
+        bucket.drain()
+
+        assert bucket._take_local(0) == (False, pytest.approx(60 / 5, rel=0.01))
+
+    def test_redis_script_shared_state_and_metrics(self):
+        """Redis 버킷은 Lua 스크립트 결과를 따르고, 사용/대기 횟수를 분 단위로 기록하는지 테스트"""
+        redis_client = MagicMock()
+        script = MagicMock(side_effect=[[1, "0", "4"], [0, "1.5", "0.2"]])
+        redis_client.register_script.return_value = script
+        pipe = redis_client.pipeline.return_value
+        pipe.execute.return_value = [1, True]
+        bucket = make_bucket(capacity=5, reserves={"news": 2}, redis_client=redis_client)
+
+        assert bucket._try_acquire("quote") is None
+        assert bucket._try_acquire("news") == 1.5
+
+        assert script.call_args_list[0].kwargs == {"keys": ["ratelimit:test"], "args": [5, 5 / 60, 0, 1]}
+        assert script.call_args_list[1].kwargs["args"][2] == 2
+        incremented = [c.args[0] for c in pipe.incr.call_args_list]
+        assert incremented[0].startswith("ratelimit:test:used:")
+        assert incremented[1].startswith("ratelimit:test:throttled:")
+
+    def test_redis_failure_falls_back_to_local_bucket(self):
+        redis_client = MagicMock()
+        redis_client.register_script.return_value = MagicMock(side_effect=ConnectionError("down"))
+        bucket = make_bucket(capacity=1, redis_client=redis_client)
+
+        assert bucket._try_acquire("quote") is None
+        assert bucket._try_acquire("quote") is not None
+
+    def test_usage_reports_utilization(self):
+        redis_client = MagicMock()
+        redis_client.mget.return_value = [b"45", b"3"]
+        bucket = make_bucket(capacity=60, redis_client=redis_client)
+
+        usage = bucket.usage()
+
+        assert usage["used_last_minute"] == 45
+        assert usage["throttled_last_minute"] == 3
+        assert usage["utilization"] == pytest.approx(0.75)
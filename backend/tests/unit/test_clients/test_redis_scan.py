@@ -0,0 +1,87 @@
+# tests/unit/test_clients/test_redis_scan.py
+"""redis_scan 단위 테스트 (SCAN 커서 순회, 배치 UNLINK)"""
+import fnmatch
+import pytest
+
+from clients.redis_scan import iter_key_batches, scan_unlink
+
+
+class ScanRedis:
+    """SCAN/UNLINK/ZREM만 흉내 낸 메모리 Redis (count개씩 커서 페이지, 키는 bytes로 반환)"""
+
+    def __init__(self, keys):
+        self.data = {key: b"v" for key in keys}
+        self.slots = sorted(keys)  # 해시 슬롯처럼 순서 고정 (순회 중 삭제돼도 커서가 밀리지 않음)
+        self.zset = set(keys)
+        self.scan_calls = 0
+
+    def scan(self, cursor=0, match=None, count=None):
+        self.scan_calls += 1
+        page = [key for key in self.slots[cursor : cursor + count] if key in self.data]
+        next_cursor = cursor + count if cursor + count < len(self.slots) else 0
+        return next_cursor, [key.encode() for key in page if fnmatch.fnmatchcase(key, match)]
+
+    def keys(self, pattern):
+        raise AssertionError("KEYS 금지")
+
+    def unlink(self, *keys):
+        return sum(1 for key in keys if self.data.pop(key, None) is not None)
+
+    def zrem(self, name, *keys):
+        removed = self.zset & set(keys)
+        self.zset -= removed
+        return len(removed)
+
+    def pipeline(self, transaction=True):
+        return ScanPipeline(self)
+
+
+class ScanPipeline:
+    def __init__(self, redis_client):
+        self.redis = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        return [getattr(self.redis, name)(*args) for name, args in self.commands]
+
+
+@pytest.mark.unit
+class TestRedisScan:
+    def test_iter_key_batches_walks_cursor_until_zero(self):
+        client = ScanRedis([f"a:{i}" for i in range(10)] + ["b:1"])
+        batches = list(iter_key_batches(client, "a:*", count=3))
+        assert sorted(key for batch in batches for key in batch) == [f"a:{i}" for i in range(10)]
+        assert client.scan_calls == 4  # 11개 키 / 3개씩
+
+    def test_scan_unlink_deletes_matching_keys_in_batches(self):
+        client = ScanRedis([f"stock:{i}" for i in range(7)] + ["keep"])
+        progress = []
+        result = scan_unlink(client, "stock:*", count=3, pause_seconds=0, progress=lambda r: progress.append(r.deleted))
+
+        assert set(client.data) == {"keep"}
+        assert (result.matched, result.deleted) == (7, 7)
+        assert progress[-1] == 7 and len(progress) == result.batches
+
+    def test_select_and_before_unlink_share_pipeline(self):
+        """필터에 걸린 키만 지우고, 같은 파이프라인에서 스케줄 zset에서도 빼는지 테스트"""
+        client = ScanRedis(["redbeat:user-1", "redbeat:user-2", "redbeat:user-3"])
+        result = scan_unlink(
+            client,
+            "redbeat:user-*",
+            select=lambda key: key != "redbeat:user-2",
+            before_unlink=lambda pipe, keys: pipe.zrem("redbeat::schedule", *keys),
+            count=10,
+            pause_seconds=0,
+        )
+        assert result.deleted == 2
+        assert set(client.data) == {"redbeat:user-2"}
+        assert client.zset == {"redbeat:user-2"}
+
+    def test_duplicate_keys_counted_once_by_unlink(self):
+        client = ScanRedis(["k"])
+        client.scan = lambda cursor=0, match=None, count=None: ((1, [b"k"]) if cursor == 0 else (0, [b"k"]))
+        result = scan_unlink(client, "*", pause_seconds=0)
+        assert (result.scanned, result.deleted) == (2, 1)
@@ -2,30 +2,82 @@
 """
 StockClient 단위 테스트 (네트워크/Redis 없이)
 
-- 캐시(CacheClient.get_or_set)는 fetch 함수를 그대로 실행하도록 mock 처리
-- yfinance(yf.Ticker), requests는 모두 mock 처리
+- 캐시(CacheClient.get_or_set)는 fetch 함수를 그대로 실행하도록, get은 항상 미스로 mock 처리
+- yfinance(yf.Ticker, yf.download), requests는 모두 mock 처리
 """
+import asyncio
+import threading
+import time
 import pytest
-from unittest.mock import patch, MagicMock
+from datetime import date, datetime, timezone
+from unittest.mock import AsyncMock, patch, MagicMock
+import httpx
 import pandas as pd
 import requests
 
-from clients.stock_client import StockClient
+from clients.cache_client import CacheEntry, CachedFailure
+from clients.price_store import PriceStore
+from clients.stock_client import AsyncStockClient, StockClient
+from clients.symbol_index import SymbolIndex
+from data.schemas import StockSearchOut
 
 
 def make_passthrough_cache() -> MagicMock:
-    """get_or_set이 캐시 없이 fetch 함수를 바로 실행하는 mock 캐시"""
+    """get_or_set이 캐시 없이 fetch 함수를 바로 실행하고, get은 항상 미스인 mock 캐시.
+
+    여러 키 API(get_many/set_many/get_or_set_many)는 get/set mock을 키마다 호출하도록 흉내 내어
+    테스트가 get.side_effect / set 호출 기록으로 캐시 상태를 다룰 수 있게 한다.
+    """
     cache = MagicMock()
-    cache.get_or_set.side_effect = lambda key, fetch, ttl_seconds=None: fetch()
+    cache.get.return_value = None
+    cache.get_or_set.side_effect = lambda key, fetch, **kwargs: fetch()
+
+    def get_many(keys):
+        values = {key: cache.get(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+
+    def set_many(values, ttl_seconds=300):
+        for key, value in values.items():
+            cache.set(key, value, ttl_seconds=ttl_seconds[key] if isinstance(ttl_seconds, dict) else ttl_seconds)
+        return True
+
+    def get_or_set_many(keys, fetch_many, ttl_seconds=300, **kwargs):
+        keys = list(keys)
+        results = get_many(keys)
+        missing = [key for key in keys if key not in results]
+        if missing:
+            fetched = fetch_many(missing)
+            set_many(
+                fetched,
+                {
+                    k: v.ttl_seconds if isinstance(v, CachedFailure) else ttl_seconds(v) if callable(ttl_seconds) else ttl_seconds
+                    for k, v in fetched.items()
+                },
+            )
+            results.update(fetched)
+        return results
+
+    cache.get_many.side_effect = get_many
+    cache.set_many.side_effect = set_many
+    cache.get_or_set_many.side_effect = get_or_set_many
     return cache
 
 
 @pytest.fixture(autouse=True)
-def reset_cache_singleton():
-    """클래스 레벨 캐시 싱글톤 격리 (테스트 간 오염 방지)"""
+def reset_cache_singleton(monkeypatch):
+    """클래스 레벨 캐시/가격 저장소/심볼 인덱스 싱글톤 격리 (테스트 간 오염 방지)"""
+    monkeypatch.delenv("PRICE_STORE_DIR", raising=False)
+    # yfinance 타임존 캐시(sqlite)를 건드리지 않도록 거래소 타임존 고정
+    monkeypatch.setattr(StockClient, "_exchange_tz", staticmethod(lambda ticker: "America/New_York"))
     StockClient._cache_client = None
+    StockClient._price_store = None
+    StockClient._symbol_index = None
+    StockClient._symbol_index_expires_at = 0.0
     yield
     StockClient._cache_client = None
+    StockClient._price_store = None
+    StockClient._symbol_index = None
+    StockClient._symbol_index_expires_at = 0.0
 
 
 @pytest.fixture
@@ -64,19 +116,24 @@ def make_mock_ticker(history: pd.DataFrame, info: dict, calendar=None) -> MagicM
     return ticker
 
 
+def make_download_frame(histories: dict) -> pd.DataFrame:
+    """yf.download(group_by="ticker") 형태의 (ticker, field) MultiIndex 컬럼 DataFrame 생성"""
+    return pd.concat(histories, axis=1)
+
+
 @pytest.mark.unit
 class TestGetStockData:
-    """get_stock_data / _get_stock_data_with_cache 테스트"""
+    """get_stock_data 테스트 (history/info/calendar 구성요소별 캐시)"""
 
     @patch("clients.stock_client.yf.Ticker")
     def test_get_stock_data_success_aggregates_per_ticker(self, mock_ticker_cls, mock_history, mock_info):
-        """티커별 history/info/calendar가 집계되어 반환되는지 테스트"""
+        """티커별 history/info/calendar가 집계되어 반환되는지 테스트 (순차 모드)"""
         tickers = ["AAPL", "MSFT"]
         calendar = pd.DataFrame({"Earnings Date": [pd.Timestamp("2026-07-30")]})
         mock_ticker_cls.return_value = make_mock_ticker(mock_history, mock_info, calendar)
 
         with patch.object(StockClient, "get_cache_client", return_value=make_passthrough_cache()):
-            result = StockClient.get_stock_data(tickers, period="1mo")
+            result = StockClient.get_stock_data(tickers, period="1mo", batch=False)
 
         assert result["status"] == "success"
         for ticker in tickers:
@@ -87,60 +144,185 @@ class TestGetStockData:
             assert result["stock_info"][ticker] == mock_info
 
         # 티커별로 yf.Ticker가 호출되고 period가 전달되는지 확인
-        assert mock_ticker_cls.call_count == 2
         mock_ticker_cls.assert_any_call("AAPL")
         mock_ticker_cls.assert_any_call("MSFT")
         mock_ticker_cls.return_value.history.assert_called_with(period="1mo")
 
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_batch_fetches_misses_with_single_download(self, mock_ticker_cls, mock_download, mock_history, mock_info):
+        """캐시 미스 티커들의 history를 yf.download 한 번으로 받고, info/calendar만 티커별로 조회하는지 테스트"""
+        tickers = ["AAPL", "MSFT", "NVDA"]
+        mock_download.return_value = make_download_frame({t: mock_history for t in tickers})
+        mock_ticker_cls.return_value = make_mock_ticker(mock_history, mock_info)
+
+        with patch.object(StockClient, "get_cache_client", return_value=make_passthrough_cache()):
+            result = StockClient.get_stock_data(tickers, period="6mo")
+
+        assert result["status"] == "success"
+        mock_download.assert_called_once()
+        assert mock_download.call_args.args[0] == tickers
+        assert mock_download.call_args.kwargs["period"] == "6mo"
+        # history는 다운로드 결과를 쓰므로 Ticker.history는 호출되지 않음
+        mock_ticker_cls.return_value.history.assert_not_called()
+        for ticker in tickers:
+            # download의 현지 날짜 인덱스에 거래소 타임존을 붙여 yf.Ticker.history와 같은 형태로 반환
+            expected = mock_history.tz_localize("America/New_York")
+            pd.testing.assert_frame_equal(result["stock_history"][ticker], expected, check_names=False)
+            assert result["stock_info"][ticker] == mock_info
+
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_batch_and_sequential_histories_are_equal(self, mock_ticker_cls, mock_download, mock_history):
+        """batch(yf.download, tz-naive)와 순차(yf.Ticker.history, 거래소 타임존) 조회가 같은 프레임을 주는지 테스트"""
+        tickers = ["AAPL", "MSFT"]
+        aware = mock_history.tz_localize("America/New_York")
+        aware.index.name = "Date"
+        mock_ticker_cls.return_value.history.return_value = aware
+        naive = mock_history.copy()
+        naive.index.name = "Date"
+        mock_download.return_value = make_download_frame({t: naive for t in tickers})
+
+        batched = StockClient._fetch_histories(tickers, "1mo", batch=True)
+        sequential = StockClient._fetch_histories(tickers, "1mo", batch=False)
+
+        assert mock_download.call_args.kwargs["ignore_tz"] is True
+        for ticker in tickers:
+            pd.testing.assert_frame_equal(batched[ticker], sequential[ticker])
+            assert str(batched[ticker].index.tz) == "America/New_York"
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_cache_state_resolved_in_bulk(self, mock_download, mock_history):
+        """티커 목록 전체의 캐시 상태를 한 번에 조회하고 미스만 single-flight 경로로 받는지 테스트"""
+        cache = make_passthrough_cache()
+        cache.get.side_effect = lambda key: mock_history if key == "stock:history:AAPL:max" else None
+        mock_download.return_value = {"MSFT": mock_history, "SPY": mock_history}
+
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            histories = StockClient._resolve_histories(["AAPL", "MSFT", "SPY"], period="1y")
+
+        first_lookup = list(cache.get_many.call_args_list[0].args[0])
+        assert first_lookup == ["stock:history:AAPL:1y", "stock:history:MSFT:1y", "stock:history:SPY:1y"]
+        cache.get_or_set_many.assert_called_once()
+        assert list(cache.get_or_set_many.call_args.args[0]) == ["stock:history:MSFT:1y", "stock:history:SPY:1y"]
+        mock_download.assert_called_once_with(["MSFT", "SPY"], period="1y")
+        assert set(histories) == {"AAPL", "MSFT", "SPY"}
+
+    @patch("clients.stock_client.yf.download")
     @patch("clients.stock_client.yf.Ticker")
-    def test_get_stock_data_uses_24h_cache_per_ticker(self, mock_ticker_cls, mock_history, mock_info):
-        """티커별 캐시 키와 24시간 TTL로 get_or_set이 호출되는지 테스트"""
+    def test_info_only_skips_history(self, mock_ticker_cls, mock_download, mock_history, mock_info):
+        """info만 요청하면 history/calendar는 캐시 조회도 다운로드도 하지 않는지 테스트"""
         mock_ticker_cls.return_value = make_mock_ticker(mock_history, mock_info)
         cache = make_passthrough_cache()
 
         with patch.object(StockClient, "get_cache_client", return_value=cache):
-            StockClient.get_stock_data(["AAPL"], period="3mo")
+            result = StockClient.get_stock_data(["AAPL", "MSFT"], components=("info",))
+
+        assert set(result) == {"status", "stock_info"}
+        assert result["stock_info"] == {"AAPL": mock_info, "MSFT": mock_info}
+        mock_download.assert_not_called()
+        mock_ticker_cls.return_value.history.assert_not_called()
+        assert {c.args[0] for c in cache.get.call_args_list} == {"stock:info:AAPL", "stock:info:MSFT"}
+
+    def test_unknown_component_returns_error(self):
+        with patch.object(StockClient, "get_cache_client", return_value=make_passthrough_cache()):
+            result = StockClient.get_stock_data(["AAPL"], components=("quotes",))
+        assert result["status"] == "error"
 
-        assert cache.get_or_set.call_count == 1
-        call = cache.get_or_set.call_args
-        assert call.args[0] == "_get_stock_data_with_cache:AAPL:3mo"
-        assert call.kwargs["ttl_seconds"] == 24 * 60 * 60
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_components_cached_under_separate_keys_and_ttls(
+        self, mock_ticker_cls, mock_download, mock_history, mock_info
+    ):
+        """history/info/calendar가 각자의 키와 TTL로 저장되고, 캐시 히트 티커는 조회하지 않는지 테스트"""
+        cache = make_passthrough_cache()
+        cache.get.side_effect = lambda key: {"shortName": "Cached"} if key == "stock:info:AAPL" else None
+        mock_download.return_value = make_download_frame({"AAPL": mock_history, "MSFT": mock_history})
+        mock_ticker_cls.return_value = make_mock_ticker(mock_history, mock_info, {})
+
+        with patch.object(StockClient, "get_cache_client", return_value=cache), patch.object(
+            StockClient, "_history_ttl", return_value=1234
+        ):
+            result = StockClient.get_stock_data(["AAPL", "MSFT"], period="3mo")
+
+        assert result["stock_info"]["AAPL"] == {"shortName": "Cached"}
+        assert result["stock_info"]["MSFT"] == mock_info
+        ttls = {c.args[0]: c.kwargs["ttl_seconds"] for c in cache.set.call_args_list}
+        assert ttls == {
+            "stock:history:AAPL:3mo": 1234,
+            "stock:history:MSFT:3mo": 1234,
+            "stock:info:MSFT": 3 * 24 * 60 * 60,  # AAPL info는 캐시 히트 → 저장 안 함
+            "stock:calendar:AAPL": 7 * 24 * 60 * 60,
+            "stock:calendar:MSFT": 7 * 24 * 60 * 60,
+        }
+
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_batch_missing_history_returns_empty_frame(self, mock_ticker_cls, mock_download, mock_history, mock_info):
+        """다운로드 결과에 없는 티커는 빈 history로 처리되는지 테스트"""
+        mock_download.return_value = make_download_frame({"AAPL": mock_history})
+        mock_ticker_cls.return_value = make_mock_ticker(mock_history, mock_info)
+
+        with patch.object(StockClient, "get_cache_client", return_value=make_passthrough_cache()):
+            result = StockClient.get_stock_data(["AAPL", "DELISTED"])
+
+        assert result["status"] == "success"
+        assert result["stock_history"]["DELISTED"].empty
+        assert not result["stock_history"]["AAPL"].empty
+
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_batch_download_failure_returns_empty_histories(self, mock_ticker_cls, mock_download, mock_info):
+        """일괄 다운로드가 실패하면 미스 티커 전체의 history가 빈 DataFrame이고, 실패 기록은 짧은 TTL로만 캐시되는지 테스트"""
+        mock_download.side_effect = Exception("Yahoo down")
+        mock_ticker_cls.return_value = make_mock_ticker(pd.DataFrame(), mock_info)
+        cache = make_passthrough_cache()
+
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            result = StockClient.get_stock_data(["AAPL", "MSFT"], components=["history"])
+
+        assert result["status"] == "success"
+        assert result["stock_history"]["AAPL"].empty
+        assert result["stock_history"]["MSFT"].empty
+        stored = {c.args[0]: (c.args[1], c.kwargs["ttl_seconds"]) for c in cache.set.call_args_list}
+        value, ttl = stored["stock:history:AAPL:3mo"]
+        assert isinstance(value, CachedFailure) and "Yahoo down" in value.error
+        assert ttl == value.ttl_seconds  # 하루짜리 history TTL이 아니라 실패 백오프 TTL
 
     @patch("clients.stock_client.yf.Ticker")
     def test_get_stock_data_cache_hit_skips_yfinance(self, mock_ticker_cls, mock_history, mock_info):
-        """캐시 히트 시 yfinance를 호출하지 않는지 테스트"""
+        """모든 구성요소가 캐시 히트면 yfinance를 호출하지 않는지 테스트"""
         cached = {
-            "status": "success",
-            "stock_history": mock_history,
-            "stock_info": mock_info,
-            "stock_calendar": pd.DataFrame(),
+            "stock:history:AAPL:3mo": mock_history,
+            "stock:info:AAPL": mock_info,
+            "stock:calendar:AAPL": {},
         }
-        cache = MagicMock()
-        cache.get_or_set.return_value = cached  # fetch를 실행하지 않음 (캐시 히트)
+        cache = make_passthrough_cache()
+        cache.get.side_effect = cached.get
 
         with patch.object(StockClient, "get_cache_client", return_value=cache):
             result = StockClient.get_stock_data(["AAPL"])
 
         mock_ticker_cls.assert_not_called()
+        cache.set.assert_not_called()
         assert result["status"] == "success"
         assert result["stock_info"]["AAPL"] == mock_info
 
     @patch("clients.stock_client.yf.Ticker")
-    def test_get_stock_data_empty_history_returns_error_entry(self, mock_ticker_cls, mock_info):
-        """히스토리가 비어 있으면 해당 티커는 에러 엔트리(빈 데이터)로 처리되는지 테스트"""
+    def test_get_stock_data_empty_history_returns_empty_frame(self, mock_ticker_cls, mock_info):
+        """히스토리가 비어 있어도 다른 구성요소는 독립적으로 조회되는지 테스트"""
         mock_ticker_cls.return_value = make_mock_ticker(pd.DataFrame(), mock_info)
 
         with patch.object(StockClient, "get_cache_client", return_value=make_passthrough_cache()):
             result = StockClient.get_stock_data(["DELISTED"])
 
-        # 집계 자체는 성공이지만, 해당 티커 데이터는 비어 있어야 함
         assert result["status"] == "success"
         assert result["stock_history"]["DELISTED"].empty
-        assert result["stock_info"]["DELISTED"] == {}
+        assert result["stock_info"]["DELISTED"] == mock_info
         assert result["stock_calendar"]["DELISTED"].empty
 
     @patch("clients.stock_client.yf.Ticker")
-    def test_get_stock_data_fetch_exception_returns_error_entry(self, mock_ticker_cls):
+    def test_get_stock_data_fetch_exception_returns_empty_entries(self, mock_ticker_cls):
         """yfinance 조회 중 예외 발생 시 해당 티커는 빈 데이터로 처리되는지 테스트"""
         mock_ticker_cls.side_effect = Exception("Network error")
 
@@ -151,10 +333,45 @@ class TestGetStockData:
         assert result["stock_history"]["AAPL"].empty
         assert result["stock_info"]["AAPL"] == {}
 
+    @patch("clients.stock_client.yf.download")
+    @patch("clients.stock_client.yf.Ticker")
+    def test_shorter_period_sliced_from_cached_superset(self, mock_ticker_cls, mock_download):
+        """더 긴 기간(1y) history 캐시가 있으면 yfinance 조회 없이 잘라서 반환하고, 새로 저장하지 않는지 테스트"""
+        dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=260, tz="America/New_York")
+        year_history = pd.DataFrame({"Close": range(260), "Volume": [1_000] * 260}, index=dates)
+        cache = make_passthrough_cache()
+        cache.get.side_effect = lambda key: year_history if key == "stock:history:AAPL:1y" else None
+
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            result = StockClient.get_stock_data(["AAPL"], period="3mo", components=("history",))
+
+        mock_download.assert_not_called()
+        mock_ticker_cls.assert_not_called()
+        cache.set.assert_not_called()
+        sliced = result["stock_history"]["AAPL"]
+        assert 55 <= len(sliced) <= 70  # 약 3개월치 거래일
+        assert sliced.index[-1] == year_history.index[-1]
+
+    def test_superset_periods_longest_first(self):
+        """상위 기간 후보가 긴 기간부터 정렬되고, 더 짧은 기간은 제외되는지 테스트"""
+        supersets = StockClient._superset_periods("6mo")
+        assert supersets[0] == "max"
+        assert supersets.index("10y") < supersets.index("1y")
+        assert "3mo" not in supersets and "6mo" not in supersets
+        assert StockClient._superset_periods("max") == []
+
+    def test_empty_history_is_not_reused_as_superset(self):
+        """빈 history는 상위 기간 캐시로 재사용하지 않는지 테스트"""
+        cache = make_passthrough_cache()
+        cache.get.side_effect = lambda key: pd.DataFrame() if key.endswith(":1y") else None
+
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            assert StockClient._get_superset_history("AAPL", "6mo") is None
+
     def test_get_stock_data_cache_failure_returns_error(self):
         """캐시 계층 자체가 실패하면 전체 결과가 error인지 테스트"""
         cache = MagicMock()
-        cache.get_or_set.side_effect = Exception("Redis connection failed")
+        cache.get_many.side_effect = Exception("Redis connection failed")
 
         with patch.object(StockClient, "get_cache_client", return_value=cache):
             result = StockClient.get_stock_data(["AAPL"])
@@ -172,12 +389,183 @@ class TestGetStockData:
         assert result["stock_history"] == {}
         assert result["stock_info"] == {}
         assert result["stock_calendar"] == {}
-        cache.get_or_set.assert_not_called()
+        cache.get.assert_not_called()
+        cache.set.assert_not_called()
+
+
+@pytest.mark.unit
+class TestCacheTtls:
+    """구성요소별 TTL 계산 테스트"""
+
+    def test_history_expires_after_next_close(self):
+        # 2026-06-10(수) 12:00 ET → 당일 16:30 ET 만료
+        now = datetime(2026, 6, 10, 16, 0, tzinfo=timezone.utc)
+        assert StockClient._history_ttl(now) == int(4.5 * 60 * 60)
+
+    def test_history_after_close_waits_for_next_session(self):
+        # 2026-06-12(금) 17:00 ET → 월요일 16:30 ET
+        now = datetime(2026, 6, 12, 21, 0, tzinfo=timezone.utc)
+        assert StockClient._history_ttl(now) == (2 * 24 + 23) * 60 * 60 + 30 * 60
+
+    def test_history_held_over_exchange_holiday(self):
+        # 2026-07-02(목) 17:00 ET → 7/3 대체 휴장 + 주말 → 월요일 16:30 ET
+        now = datetime(2026, 7, 2, 21, 0, tzinfo=timezone.utc)
+        assert StockClient._history_ttl(now) == (3 * 24 + 23) * 60 * 60 + 30 * 60
+
+    def test_calendar_expires_day_after_earnings(self):
+        now = datetime(2026, 7, 28, 0, 0, tzinfo=timezone.utc)
+        calendar = {"Earnings Date": [date(2026, 7, 30)]}
+        assert StockClient._calendar_ttl(calendar, now) == 3 * 24 * 60 * 60
+
+    def test_calendar_without_earnings_uses_max_ttl(self):
+        assert StockClient._calendar_ttl({}) == 7 * 24 * 60 * 60
+        assert StockClient._calendar_ttl(pd.DataFrame()) == 7 * 24 * 60 * 60
+
+    def test_calendar_past_earnings_uses_min_ttl(self):
+        now = datetime(2026, 8, 10, tzinfo=timezone.utc)
+        calendar = pd.DataFrame({"Earnings Date": [pd.Timestamp("2026-07-30")]})
+        assert StockClient._calendar_ttl(calendar, now) == 6 * 60 * 60
+
+
+@pytest.mark.unit
+class TestGetHistory:
+    """get_history 테스트 (가격 저장소 우선, 없으면 Redis 캐시 경로)"""
+
+    @staticmethod
+    def make_history(start: str, periods: int) -> pd.DataFrame:
+        dates = pd.bdate_range(start=start, periods=periods)
+        closes = [100.0 + i for i in range(periods)]
+        return pd.DataFrame(
+            {"Open": closes, "High": closes, "Low": closes, "Close": closes, "Volume": [1_000] * periods},
+            index=dates,
+        )
+
+    def test_without_store_uses_cached_stock_data(self, mock_history):
+        """get_stock_data의 history 구성요소만 요청해서 반환하는지 테스트"""
+        with patch.object(
+            StockClient, "get_stock_data", return_value={"status": "success", "stock_history": {"AAPL": mock_history}}
+        ) as mock_get:
+            histories = StockClient.get_history(["AAPL", "MSFT"], period="1y")
+
+        mock_get.assert_called_once_with(["AAPL", "MSFT"], "1y", components=("history",))
+        pd.testing.assert_frame_equal(histories["AAPL"], mock_history)
+        assert histories["MSFT"].empty
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_store_full_fetch_then_serves_from_disk(self, mock_download, tmp_path):
+        """처음엔 period 전체를 받아 저장하고, 갱신 주기 안의 재조회는 네트워크 없이 저장소에서 읽는지 테스트"""
+        StockClient._price_store = PriceStore(str(tmp_path))
+        history = self.make_history((pd.Timestamp.now() - pd.Timedelta(days=560)).date().isoformat(), 400)
+        mock_download.return_value = {"SPY": history}
+
+        first = StockClient.get_history(["SPY"], period="1y")
+        second = StockClient.get_history(["SPY"], period="3mo")
+
+        mock_download.assert_called_once_with(["SPY"], period="1y")
+        assert not first["SPY"].empty
+        assert len(second["SPY"]) < len(first["SPY"])  # 짧은 기간은 저장된 이력의 슬라이스
+        assert second["SPY"]["Close"].iloc[-1] == history["Close"].iloc[-1]
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_store_incremental_fetch_since_last_date(self, mock_download, tmp_path):
+        """커버 구간이 충분하고 갱신 주기가 지났으면 마지막 저장일 이후만 받는지 테스트"""
+        store = PriceStore(str(tmp_path))
+        StockClient._price_store = store
+        store.merge("SPY", self.make_history("2025-01-01", 300), covered_from=pd.Timestamp("2024-01-01").date())
+        meta_path = store._meta_path("SPY")
+        with open(meta_path, "w") as f:
+            f.write('{"covered_from": "2024-01-01", "synced_at": "2020-01-01T00:00:00+00:00"}')
+        last = store.last_date("SPY")
+        mock_download.return_value = {"SPY": self.make_history(last.isoformat(), 3)}
+
+        StockClient.get_history(["SPY"], period="1y")
+
+        mock_download.assert_called_once_with(["SPY"], start=last)
+        assert store.read_frame("SPY")["Close"].iloc[-1] == 102.0
+
+    def test_store_sync_expires_when_bar_settles(self):
+        """마감 직전 동기화는 갱신 주기 안이라도 일봉 확정(마감 + 30분) 이후엔 만료되는지 테스트"""
+        synced_at = datetime(2026, 6, 10, 19, 55, tzinfo=timezone.utc)  # 수 15:55 ET (마감 직전)
+
+        assert StockClient._store_sync_fresh(synced_at, datetime(2026, 6, 10, 20, 10, tzinfo=timezone.utc))  # 확정 전
+        assert not StockClient._store_sync_fresh(synced_at, datetime(2026, 6, 10, 20, 31, tzinfo=timezone.utc))
+        # 확정 이후 동기화는 다음 거래일 확정까지 갱신 주기 동안 유효
+        settled = datetime(2026, 6, 10, 20, 40, tzinfo=timezone.utc)
+        assert StockClient._store_sync_fresh(settled, datetime(2026, 6, 10, 21, 30, tzinfo=timezone.utc))
+        assert not StockClient._store_sync_fresh(settled, datetime(2026, 6, 10, 21, 41, tzinfo=timezone.utc))
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_store_resyncs_after_close_settles(self, mock_download, tmp_path):
+        """마감 직전에 동기화한 저장소를 마감 확정 직후에 읽으면 증분으로 다시 받는지 테스트"""
+        store = PriceStore(str(tmp_path))
+        StockClient._price_store = store
+        store.merge("SPY", self.make_history("2025-01-01", 300), covered_from=pd.Timestamp("2024-01-01").date())
+        before_close = datetime(2026, 6, 10, 19, 55, tzinfo=timezone.utc)
+        with open(store._meta_path("SPY"), "w") as f:
+            f.write(f'{{"covered_from": "2024-01-01", "synced_at": "{before_close.isoformat()}"}}')
+        last = store.last_date("SPY")
+        mock_download.return_value = {"SPY": self.make_history(last.isoformat(), 1)}
+
+        with patch("clients.stock_client.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 6, 10, 20, 31, tzinfo=timezone.utc)
+            mock_datetime.fromisoformat = datetime.fromisoformat
+            StockClient.get_history(["SPY"], period="1y")
+
+        mock_download.assert_called_once_with(["SPY"], start=last)
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_store_failed_download_is_negative_cached(self, mock_download, tmp_path):
+        """저장소 경로에서도 빈/실패 조회는 백오프 동안 다시 받지 않고, 다시 받아지면 기록을 지우는지 테스트"""
+        StockClient._price_store = PriceStore(str(tmp_path))
+        entries = {}
+        cache = MagicMock()
+        cache.get_entries.side_effect = lambda keys: {key: entries[key] for key in keys if key in entries}
+        cache.set_failures.side_effect = lambda failures, previous: entries.update(
+            {key: CacheEntry(value=failure, expires_at=time.time() + failure.ttl_seconds) for key, failure in failures.items()}
+        )
+        StockClient._cache_client = cache
+        history = self.make_history((pd.Timestamp.now() - pd.Timedelta(days=400)).date().isoformat(), 300)
+        mock_download.side_effect = [{"GONE": pd.DataFrame(), "SPY": history}, {"GONE": history}]
+
+        first = StockClient.get_history(["GONE", "SPY"], period="1y")
+        second = StockClient.get_history(["GONE", "SPY"], period="1y")
+
+        assert first["GONE"].empty and second["GONE"].empty
+        mock_download.assert_called_once_with(["GONE", "SPY"], period="1y")
+        assert list(entries) == ["stock:store_failure:GONE"]
+
+        entries["stock:store_failure:GONE"].expires_at = time.time() - 1  # 백오프 만료
+        third = StockClient.get_history(["GONE", "SPY"], period="1y")
+
+        mock_download.assert_called_with(["GONE"], period="1y")
+        assert not third["GONE"].empty
+        cache.delete.assert_called_once_with("stock:store_failure:GONE")
+
+    @patch("clients.stock_client.StockClient._download_histories")
+    def test_store_empty_full_fetch_is_retried(self, mock_download, tmp_path):
+        """전체 조회가 비어 오면 커버 구간을 기록하지 않아 다음 조회 때 다시 받는지 테스트"""
+        StockClient._price_store = PriceStore(str(tmp_path))
+        history = self.make_history((pd.Timestamp.now() - pd.Timedelta(days=400)).date().isoformat(), 300)
+        mock_download.side_effect = [{"SPY": pd.DataFrame()}, {"SPY": history}]
+
+        first = StockClient.get_history(["SPY"], period="1y")
+        second = StockClient.get_history(["SPY"], period="1y")
+
+        assert first["SPY"].empty
+        assert mock_download.call_count == 2
+        assert not second["SPY"].empty
+        assert str(second["SPY"].index.tz) == "America/New_York"  # 다운로드 경로와 같은 거래소 타임존
 
 
 @pytest.mark.unit
 class TestGetStockCurrentPrice:
-    """get_stock_current_price 테스트 (yfinance → Finnhub 폴백)"""
+    """get_stock_current_price 테스트 (시세 캐시 → yfinance 일괄 조회 → Finnhub 폴백)"""
+
+    @pytest.fixture(autouse=True)
+    def quote_cache(self):
+        self.cache = make_passthrough_cache()
+        with patch.object(StockClient, "get_cache_client", return_value=self.cache):
+            yield
 
     @patch("clients.stock_client.yf.Ticker")
     def test_yfinance_success(self, mock_ticker_cls, mock_history):
@@ -230,14 +618,10 @@ class TestGetStockCurrentPrice:
         assert prices == {}
 
     @patch("clients.finnhub_client.FinnhubClient")
-    @patch("clients.stock_client.yf.Ticker")
-    def test_partial_success_mixed_sources(self, mock_ticker_cls, mock_finnhub_cls, mock_history):
-        """일부는 yfinance, 일부는 Finnhub 폴백으로 가져오는 혼합 케이스 테스트"""
-        ok_ticker = make_mock_ticker(mock_history, {})
-        bad_ticker = MagicMock()
-        bad_ticker.history.side_effect = Exception("no data")
-        mock_ticker_cls.side_effect = lambda t: ok_ticker if t == "AAPL" else bad_ticker
-
+    @patch("clients.stock_client.yf.download")
+    def test_partial_success_mixed_sources(self, mock_download, mock_finnhub_cls, mock_history):
+        """일괄 조회에서 빠진 티커만 Finnhub 폴백으로 가져오는 혼합 케이스 테스트"""
+        mock_download.return_value = make_download_frame({"AAPL": mock_history})
         mock_finnhub = mock_finnhub_cls.return_value
         mock_finnhub.is_available.return_value = True
         mock_finnhub.get_quote.return_value = 99.9
@@ -245,12 +629,95 @@ class TestGetStockCurrentPrice:
         prices = StockClient.get_stock_current_price(["AAPL", "MSFT"])
 
         assert prices == {"AAPL": 156.0, "MSFT": 99.9}
+        mock_download.assert_called_once()
+        assert mock_download.call_args.kwargs["period"] == "1d"
+        mock_finnhub.get_quote.assert_called_once_with("MSFT")
+
+    @patch("clients.stock_client.yf.download")
+    def test_cached_quotes_skip_fetch_and_misses_are_cached(self, mock_download, mock_history):
+        """캐시된 티커는 조회하지 않고, 미스 티커만 조회해 시세 TTL로 저장하는지 테스트"""
+        self.cache.get.side_effect = lambda key: 200.0 if key == "stock:quote:AAPL" else None
+        mock_download.return_value = make_download_frame({"MSFT": mock_history, "NVDA": mock_history})
+
+        with patch.object(StockClient, "_quote_ttl", return_value=45):
+            prices = StockClient.get_stock_current_price(["AAPL", "MSFT", "NVDA"])
+
+        assert prices == {"AAPL": 200.0, "MSFT": 156.0, "NVDA": 156.0}
+        assert mock_download.call_args.args[0] == ["MSFT", "NVDA"]
+        self.cache.set.assert_any_call("stock:quote:MSFT", 156.0, ttl_seconds=45)
+        self.cache.set.assert_any_call("stock:quote:NVDA", 156.0, ttl_seconds=45)
+
+    @patch("clients.stock_client.yf.Ticker")
+    def test_all_cached_makes_no_network_call(self, mock_ticker_cls):
+        self.cache.get.return_value = 123.0
+
+        assert StockClient.get_stock_current_price(["AAPL"]) == {"AAPL": 123.0}
+        mock_ticker_cls.assert_not_called()
+
+    @patch("clients.stock_client.yf.Ticker")
+    def test_cache_failure_still_fetches(self, mock_ticker_cls, mock_history):
+        """캐시 장애 시에도 시세는 조회되는지 테스트"""
+        self.cache.get.side_effect = Exception("Redis down")
+        mock_ticker_cls.return_value = make_mock_ticker(mock_history, {})
+
+        assert StockClient.get_stock_current_price(["AAPL"]) == {"AAPL": 156.0}
+
+    def test_concurrent_identical_requests_are_coalesced(self):
+        """같은 티커를 동시에 조회하면 한 번만 조회하고 결과를 공유하는지 테스트"""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_fetch(tickers):
+            calls.append(list(tickers))
+            started.set()
+            release.wait(timeout=5)
+            return {ticker: 10.0 for ticker in tickers}
+
+        results = []
+        with patch.object(StockClient, "_fetch_quotes", side_effect=slow_fetch):
+            first = threading.Thread(target=lambda: results.append(StockClient.get_stock_current_price(["AAPL"])))
+            first.start()
+            assert started.wait(timeout=5)
+            second = threading.Thread(target=lambda: results.append(StockClient.get_stock_current_price(["AAPL"])))
+            second.start()
+            time.sleep(0.05)
+            release.set()
+            first.join(timeout=5)
+            second.join(timeout=5)
+
+        assert calls == [["AAPL"]]
+        assert results == [{"AAPL": 10.0}, {"AAPL": 10.0}]
+        assert StockClient._quote_inflight == {}
+
+    def test_quote_ttl_short_during_market_hours(self):
+        now = datetime(2026, 6, 10, 15, 0, tzinfo=timezone.utc)  # 11:00 ET
+        assert StockClient._quote_ttl(now) == 45
+
+    def test_quote_ttl_until_next_open_when_closed(self):
+        now = datetime(2026, 6, 12, 21, 0, tzinfo=timezone.utc)  # 금 17:00 ET → 월 09:30 ET
+        assert StockClient._quote_ttl(now) == (2 * 24 + 16) * 60 * 60 + 30 * 60
 
 
 @pytest.mark.unit
 class TestSearchStock:
     """search_stock 테스트 (Yahoo 자동완성 API mock)"""
 
+    @pytest.fixture(autouse=True)
+    def no_index(self):
+        """심볼 인덱스 없음 + 검색어 캐시 미스 → 항상 Yahoo 조회"""
+        self.cache = make_passthrough_cache()
+        with patch.object(StockClient, "get_symbol_index", return_value=None), patch.object(
+            StockClient, "get_cache_client", return_value=self.cache
+        ):
+            yield
+
+    @pytest.fixture
+    def mock_get(self):
+        """공유 HTTP 세션의 get mock"""
+        with patch("clients.stock_client.get_http_session") as get_session:
+            yield get_session.return_value.get
+
     @staticmethod
     def make_response(quotes: list) -> MagicMock:
         response = MagicMock()
@@ -258,7 +725,6 @@ class TestSearchStock:
         response.raise_for_status.return_value = None
         return response
 
-    @patch("clients.stock_client.requests.get")
     def test_search_returns_equity_results(self, mock_get):
         """EQUITY 종목만 ticker/company_name으로 반환하는지 테스트"""
         quotes = [
@@ -276,7 +742,6 @@ class TestSearchStock:
             ("AAPL", "Apple Inc."),
         ]
 
-    @patch("clients.stock_client.requests.get")
     def test_search_limits_to_10_and_dedupes(self, mock_get):
         """결과가 최대 10개로 제한되고 중복 티커가 제거되는지 테스트"""
         quotes = [{"quoteType": "EQUITY", "symbol": f"TK{i}", "shortname": f"Company {i}"} for i in range(15)]
@@ -289,7 +754,6 @@ class TestSearchStock:
         tickers = [r.ticker for r in results]
         assert len(tickers) == len(set(tickers))
 
-    @patch("clients.stock_client.requests.get")
     def test_search_company_name_fallback_to_symbol(self, mock_get):
         """shortname/longname이 모두 없으면 티커를 회사명으로 사용하는지 테스트"""
         mock_get.return_value = self.make_response([{"quoteType": "EQUITY", "symbol": "XYZ"}])
@@ -299,14 +763,12 @@ class TestSearchStock:
         assert len(results) == 1
         assert results[0].company_name == "XYZ"
 
-    @patch("clients.stock_client.requests.get")
     def test_search_empty_results(self, mock_get):
         """검색 결과가 없으면 빈 리스트를 반환하는지 테스트"""
         mock_get.return_value = self.make_response([])
 
         assert StockClient.search_stock("zzz-no-match") == []
 
-    @patch("clients.stock_client.requests.get")
     def test_search_network_error_raises(self, mock_get):
         """네트워크 오류 시 예외가 전파되는지 테스트"""
         mock_get.side_effect = requests.exceptions.ConnectionError("Network down")
@@ -314,37 +776,218 @@ class TestSearchStock:
         with pytest.raises(requests.exceptions.ConnectionError):
             StockClient.search_stock("AAPL")
 
+    def test_index_hit_skips_upstream(self, mock_get):
+        index = SymbolIndex([("AAPL", "Apple Inc."), ("MSFT", "Microsoft Corporation")], {"AAPL": ["애플"]})
+        with patch.object(StockClient, "get_symbol_index", return_value=index):
+            results = StockClient.search_stock("애플")
+
+        assert [r.ticker for r in results] == ["AAPL"]
+        mock_get.assert_not_called()
+
+    def test_index_miss_uses_upstream_and_caches(self, mock_get):
+        """인덱스에 없는 검색어는 Yahoo 결과를 검색어 캐시에 저장하는지 테스트"""
+        index = SymbolIndex([("AAPL", "Apple Inc.")])
+        mock_get.return_value = self.make_response([{"quoteType": "EQUITY", "symbol": "ZZZQ", "shortname": "Zed"}])
+        with patch.object(StockClient, "get_symbol_index", return_value=index):
+            results = StockClient.search_stock("Zed")
+
+        assert [r.ticker for r in results] == ["ZZZQ"]
+        self.cache.set.assert_called_once_with("stock:search:zed", results, ttl_seconds=24 * 60 * 60)
+
+    def test_cached_search_skips_upstream(self, mock_get):
+        cached = [StockSearchOut(ticker="ZZZQ", company_name="Zed")]
+        self.cache.get.return_value = cached
+
+        assert StockClient.search_stock("zed") == cached
+        mock_get.assert_not_called()
+
+
+@pytest.mark.unit
+class TestGetSymbolIndex:
+    """심볼 인덱스 로드/갱신 테스트"""
+
+    def test_builds_index_from_cached_symbol_list_once(self):
+        cache = MagicMock()
+        cache.get_or_set.return_value = [("AAPL", "Apple Inc.")]
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            first = StockClient.get_symbol_index()
+            second = StockClient.get_symbol_index()
+
+        assert first is second
+        assert len(first) == 1
+        cache.get_or_set.assert_called_once()
+        assert cache.get_or_set.call_args.args[0] == "stock:symbols"
+
+    def test_load_failure_returns_none_and_backs_off(self):
+        cache = MagicMock()
+        cache.get_or_set.side_effect = Exception("directory down")
+        with patch.object(StockClient, "get_cache_client", return_value=cache):
+            assert StockClient.get_symbol_index() is None
+            assert StockClient.get_symbol_index() is None
+
+        cache.get_or_set.assert_called_once()  # 재시도 간격 전에는 다시 받지 않음
+
+    def test_fetch_symbol_list_parses_both_directories(self):
+        nasdaq = "Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares\nAAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N\nFile Creation Time: 0101202600:00|||||||"
+        other = "ACT Symbol|Security Name|Exchange|CQS Symbol|ETF|Round Lot Size|Test Issue|NASDAQ Symbol\nBRK.B|Berkshire Hathaway Inc. Class B|N|BRK.B|N|100|N|BRK.B"
+        responses = {
+            "nasdaqlisted": MagicMock(text=nasdaq),
+            "otherlisted": MagicMock(text=other),
+        }
+        session = MagicMock()
+        session.get.side_effect = lambda url, timeout: responses[url.rsplit("/", 1)[-1].split(".")[0]]
+        with patch("clients.stock_client.get_http_session", return_value=session):
+            symbols = StockClient._fetch_symbol_list()
+
+        assert symbols == [("AAPL", "Apple Inc."), ("BRK-B", "Berkshire Hathaway Inc. Class B")]
+
+
+def make_bars(n: int, high: float, low: float, close: float) -> pd.DataFrame:
+    dates = pd.date_range("2026-01-01", periods=n, freq="D")
+    return pd.DataFrame(
+        {"Open": [close] * n, "High": [high] * n, "Low": [low] * n, "Close": [close] * n, "Volume": [1_000_000] * n},
+        index=dates,
+    )
+
 
 @pytest.mark.unit
 class TestGetAtrPct:
-    """get_atr_pct 테스트"""
+    """get_atr_pct / get_atr_pcts 테스트 (캐시된 history로 계산)"""
 
-    @patch("clients.stock_client.yf.Ticker")
-    def test_empty_history_returns_zero(self, mock_ticker_cls):
+    def test_empty_history_returns_zero(self):
         """히스토리가 비어 있으면 0.0을 반환하는지 테스트"""
-        mock_ticker_cls.return_value = make_mock_ticker(pd.DataFrame(), {})
-
-        assert StockClient.get_atr_pct("DELISTED") == 0.0
+        with patch.object(StockClient, "get_history", return_value={"DELISTED": pd.DataFrame()}):
+            assert StockClient.get_atr_pct("DELISTED") == 0.0
 
     @patch("clients.stock_client.yf.Ticker")
-    def test_atr_pct_computed_from_history(self, mock_ticker_cls):
-        """충분한 데이터로 ATR% 가 양수 float로 계산되는지 테스트"""
-        n = 30
-        dates = pd.date_range("2026-01-01", periods=n, freq="D")
-        hist = pd.DataFrame(
-            {
-                "Open": [100.0] * n,
-                "High": [105.0] * n,
-                "Low": [95.0] * n,
-                "Close": [100.0] * n,
-                "Volume": [1_000_000] * n,
-            },
-            index=dates,
-        )
-        mock_ticker_cls.return_value = make_mock_ticker(hist, {})
-
-        atr_pct = StockClient.get_atr_pct("AAPL", window=14)
+    def test_atr_pct_computed_from_cached_history(self, mock_ticker_cls):
+        """get_history(캐시/저장소)의 history로 ATR%를 계산하고 yfinance를 직접 호출하지 않는지 테스트"""
+        with patch.object(StockClient, "get_history", return_value={"AAPL": make_bars(30, 105.0, 95.0, 100.0)}) as get:
+            atr_pct = StockClient.get_atr_pct("AAPL", period="3mo", window=14)
 
         # TR = High - Low = 10, Close = 100 → ATR% = 0.1
         assert isinstance(atr_pct, float)
         assert atr_pct == pytest.approx(0.1)
+        get.assert_called_once_with(["AAPL"], "3mo")
+        mock_ticker_cls.assert_not_called()
+
+    def test_atr_pcts_for_many_tickers_in_one_history_call(self):
+        histories = {"AAPL": make_bars(30, 105.0, 95.0, 100.0), "MSFT": make_bars(20, 204.0, 196.0, 200.0)}
+        with patch.object(StockClient, "get_history", return_value=histories) as get:
+            atr_pcts = StockClient.get_atr_pcts(["AAPL", "MSFT"])
+
+        get.assert_called_once()
+        assert atr_pcts["AAPL"] == pytest.approx(0.1)
+        assert atr_pcts["MSFT"] == pytest.approx(0.04)
+
+
+def chart_response(price) -> dict:
+    return {"chart": {"result": [{"meta": {"regularMarketPrice": price}}]}}
+
+
+@pytest.mark.unit
+class TestAsyncStockClient:
+    """AsyncStockClient 테스트 (httpx MockTransport, 시세 캐시 공유)"""
+
+    @pytest.fixture(autouse=True)
+    def quote_cache(self):
+        self.cache = make_passthrough_cache()
+        with patch.object(StockClient, "get_cache_client", return_value=self.cache):
+            yield
+
+    def use_transport(self, handler):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return patch("clients.stock_client.get_async_http_client", return_value=client)
+
+    async def test_fetches_misses_concurrently_and_caches(self):
+        self.cache.get.side_effect = lambda key: 200.0 if key == "stock:quote:AAPL" else None
+        requested = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested.append(request.url.path.rsplit("/", 1)[-1])
+            return httpx.Response(200, json=chart_response(100.0))
+
+        with self.use_transport(handler), patch.object(StockClient, "_quote_ttl", return_value=45):
+            prices = await AsyncStockClient().get_stock_current_price(["AAPL", "MSFT", "NVDA"])
+
+        assert prices == {"AAPL": 200.0, "MSFT": 100.0, "NVDA": 100.0}
+        assert sorted(requested) == ["MSFT", "NVDA"]
+        self.cache.set.assert_any_call("stock:quote:MSFT", 100.0, ttl_seconds=45)
+
+    async def test_concurrent_identical_requests_share_one_fetch(self):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=chart_response(50.0))
+
+        client = AsyncStockClient()
+        with self.use_transport(handler):
+            first, second = await asyncio.gather(
+                client.get_stock_current_price(["AAPL"]), client.get_stock_current_price(["AAPL"])
+            )
+
+        assert first == second == {"AAPL": 50.0}
+        assert len(calls) == 1
+
+    async def test_yahoo_failure_falls_back_to_finnhub(self):
+        finnhub = MagicMock()
+        finnhub.is_available.return_value = True
+        finnhub.get_quote = AsyncMock(return_value=99.9)
+        client = AsyncStockClient()
+        client._finnhub = finnhub
+
+        with self.use_transport(lambda request: httpx.Response(404)):
+            prices = await client.get_stock_current_price(["AAPL", "GONE"])
+
+        assert prices == {"AAPL": 99.9, "GONE": 99.9}
+        assert finnhub.get_quote.await_count == 2
+
+    async def test_both_sources_fail_ticker_omitted(self):
+        finnhub = MagicMock()
+        finnhub.is_available.return_value = False
+        client = AsyncStockClient()
+        client._finnhub = finnhub
+
+        with self.use_transport(lambda request: httpx.Response(200, json={"chart": {"result": None}})):
+            assert await client.get_stock_current_price(["AAPL"]) == {}
+
+    async def test_search_stock_parses_like_sync_client(self):
+        payload = {
+            "quotes": [
+                {"symbol": "AAPL", "quoteType": "EQUITY", "shortname": "Apple Inc."},
+                {"symbol": "AAPL.L", "quoteType": "EQUITY", "shortname": "Apple London"},
+            ]
+        }
+        with self.use_transport(lambda request: httpx.Response(200, json=payload)), patch.object(
+            StockClient, "get_symbol_index", return_value=None
+        ):
+            results = await AsyncStockClient().search_stock("AAPL")
+
+        assert [r.ticker for r in results] == ["AAPL"]
+
+    async def test_cache_calls_run_off_event_loop(self):
+        """동기 Redis 캐시 호출(시세/검색어)이 이벤트 루프 스레드가 아닌 곳에서 실행되는지 테스트"""
+        loop_thread = threading.get_ident()
+        threads = []
+
+        def record(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return None
+
+        self.cache.get.side_effect = record
+        self.cache.set.side_effect = record
+        payload = {"quotes": [{"symbol": "AAPL", "quoteType": "EQUITY", "shortname": "Apple Inc."}]}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "search" in request.url.path:
+                return httpx.Response(200, json=payload)
+            return httpx.Response(200, json=chart_response(100.0))
+
+        client = AsyncStockClient()
+        with self.use_transport(handler), patch.object(StockClient, "get_symbol_index", return_value=None):
+            await client.get_stock_current_price(["AAPL"])
+            await client.search_stock("AAPL")
+
+        assert threads and loop_thread not in threads
@@ -0,0 +1,94 @@
+# tests/unit/test_clients/test_symbol_index.py
+"""SymbolIndex 단위 테스트 (접두어/오타 허용 검색, 한국어 별칭, 심볼 디렉터리 파싱)"""
+import pytest
+
+from clients.symbol_index import SymbolIndex, load_aliases, normalize, parse_symbol_directory
+
+SYMBOLS = [
+    ("AAPL", "Apple Inc."),
+    ("APLE", "Apple Hospitality REIT, Inc."),
+    ("MSFT", "Microsoft Corporation"),
+    ("MU", "Micron Technology, Inc."),
+    ("MCHP", "Microchip Technology Incorporated"),
+    ("BAC", "Bank of America Corporation"),
+    ("M", "Macy's, Inc."),
+    ("NVDA", "NVIDIA Corporation"),
+]
+ALIASES = {"AAPL": ["애플"], "MSFT": ["마이크로소프트"], "NVDA": ["엔비디아"], "UNLISTED": ["없는종목"]}
+
+
+@pytest.fixture
+def index() -> SymbolIndex:
+    return SymbolIndex(SYMBOLS, ALIASES)
+
+
+def tickers(results) -> list:
+    return [r.ticker for r in results]
+
+
+@pytest.mark.unit
+class TestSymbolIndex:
+    def test_exact_ticker_first(self, index):
+        assert tickers(index.search("M"))[0] == "M"
+        assert tickers(index.search("msft")) == ["MSFT"]
+
+    def test_ticker_and_name_prefix(self, index):
+        results = tickers(index.search("micro"))
+        assert set(results) == {"MSFT", "MCHP", "MU"}
+        assert results[0] == "MSFT"  # 별칭 등록(널리 알려진) 종목 우선
+
+    def test_name_prefix_from_middle_word(self, index):
+        assert tickers(index.search("america")) == ["BAC"]
+
+    def test_company_name_returned(self, index):
+        assert index.search("AAPL")[0].company_name == "Apple Inc."
+
+    def test_korean_alias_prefix_and_exact(self, index):
+        assert tickers(index.search("애플")) == ["AAPL"]
+        assert tickers(index.search("마이크로")) == ["MSFT"]
+
+    def test_alias_for_unknown_ticker_ignored(self, index):
+        assert index.search("없는종목") == []
+
+    def test_typo_tolerant_match(self, index):
+        """오타 1글자(치환/삭제/삽입)까지 일치하는지 테스트"""
+        assert "MSFT" in tickers(index.search("micrisoft"))  # 치환
+        assert "MSFT" in tickers(index.search("microsft"))  # 삭제
+        assert "NVDA" in tickers(index.search("nvidiaa"))  # 삽입
+        assert "NVDA" in tickers(index.search("앤비디아"))  # 한국어 별칭 치환
+
+    def test_no_match_returns_empty(self, index):
+        assert index.search("zzzz") == []
+        assert index.search("   ") == []
+
+    def test_limit(self):
+        many = SymbolIndex([(f"TK{i}", f"Company {i}") for i in range(30)])
+        assert len(many.search("TK")) == 10
+        assert len(many.search("TK", limit=3)) == 3
+
+    def test_normalize(self):
+        assert normalize("  Apple,  Inc. ") == "apple inc"
+        assert normalize("ＡＰＰＬ") == "appl"  # 전각 → 반각
+
+    def test_aliases_file_loads(self):
+        aliases = load_aliases()
+        assert "애플" in aliases["AAPL"]
+
+
+@pytest.mark.unit
+class TestParseSymbolDirectory:
+    def test_skips_etf_test_issue_and_footer(self):
+        text = "\n".join(
+            [
+                "Symbol|Security Name|Market Category|Test Issue|Financial Status|Round Lot Size|ETF|NextShares",
+                "AAPL|Apple Inc. - Common Stock|Q|N|N|100|N|N",
+                "QQQ|Invesco QQQ Trust, Series 1|G|N|N|100|Y|N",
+                "ZXZZT|NASDAQ TEST STOCK|G|Y|N|100|N|N",
+                "ABC$P|Preferred|G|N|N|100|N|N",
+                "File Creation Time: 0101202600:00|||||||",
+            ]
+        )
+        assert parse_symbol_directory(text, "Symbol") == [("AAPL", "Apple Inc.")]
+
+    def test_empty_text(self):
+        assert parse_symbol_directory("", "Symbol") == []
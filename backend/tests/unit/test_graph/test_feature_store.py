@@ -0,0 +1,143 @@
+# tests/unit/test_graph/test_feature_store.py
+"""일일 피처 저장소 단위 테스트 ((티커, 기준일)당 한 번 계산, 실패/Redis 없음 처리)"""
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from clients.cache_client import CachedFailure
+from graph import feature_store
+
+ASOF = date(2026, 10, 16)
+
+
+class DictCache:
+    """get_or_set_many만 흉내 낸 메모리 캐시 (미스 키만 fetch_many로 채움)"""
+
+    def __init__(self):
+        self.data = {}
+        self.expire_at = None
+
+    def get_or_set_many(self, keys, fetch_many, expire_at=None):
+        self.expire_at = expire_at
+        keys = list(keys)
+        missing = [key for key in keys if key not in self.data]
+        if missing:
+            self.data.update(fetch_many(missing))
+        return {key: self.data[key] for key in keys if key in self.data}
+
+
+@pytest.fixture
+def cache():
+    cache = DictCache()
+    client = MagicMock()
+    client.get_cache_client.return_value = cache
+    with patch("graph.feature_store.get_stock_client", return_value=client):
+        yield cache
+
+
+@pytest.mark.unit
+class TestFeatureStore:
+    def test_rows_computed_once_per_ticker_and_day(self, cache):
+        """같은 종목을 가진 다른 사용자 요청은 저장된 행을 쓰고, 새 종목만 계산하는지 테스트"""
+        compute = MagicMock(side_effect=lambda tickers: {t: {"value": t.lower()} for t in tickers})
+
+        first = feature_store.get_feature_rows("test", ["AAPL", "MSFT"], compute, ASOF)
+        second = feature_store.get_feature_rows("test", ["MSFT", "AAPL", "NVDA"], compute, ASOF)
+
+        assert first == {"AAPL": {"value": "aapl"}, "MSFT": {"value": "msft"}}
+        assert list(second) == ["MSFT", "AAPL", "NVDA"]
+        assert [c.args[0] for c in compute.call_args_list] == [["AAPL", "MSFT"], ["NVDA"]]
+        assert "features:test:AAPL:2026-10-16" in cache.data
+        assert cache.expire_at is not None
+
+    def test_new_trading_day_recomputes(self, cache):
+        compute = MagicMock(side_effect=lambda tickers: {t: {} for t in tickers})
+        feature_store.get_feature_rows("test", ["AAPL"], compute, ASOF)
+        feature_store.get_feature_rows("test", ["AAPL"], compute, date(2026, 10, 19))
+        assert compute.call_count == 2
+
+    def test_missing_rows_are_negative_cached(self, cache):
+        """계산 결과가 없거나 계산이 실패한 티커는 CachedFailure로 저장되고 결과에서 빠지는지 테스트"""
+        rows = feature_store.get_feature_rows("test", ["AAPL", "NEW"], lambda tickers: {"AAPL": {"x": 1}}, ASOF)
+        assert rows == {"AAPL": {"x": 1}}
+        assert isinstance(cache.data["features:test:NEW:2026-10-16"], CachedFailure)
+
+        def broken(tickers):
+            raise RuntimeError("yfinance down")
+
+        assert feature_store.get_feature_rows("test", ["MSFT"], broken, ASOF) == {}
+        assert isinstance(cache.data["features:test:MSFT:2026-10-16"], CachedFailure)
+
+    def test_computes_directly_without_redis(self):
+        client = MagicMock()
+        client.get_cache_client.side_effect = ValueError("Redis connection failed")
+        with patch("graph.feature_store.get_stock_client", return_value=client):
+            rows = feature_store.get_feature_rows("test", ["AAPL"], lambda tickers: {"AAPL": {"x": 1}}, ASOF)
+        assert rows == {"AAPL": {"x": 1}}
+
+    def test_risk_and_meta_rows(self, cache):
+        client = feature_store.get_stock_client()
+        client.get_stock_data.return_value = {
+            "stock_history": {"AAPL": pd.DataFrame(), "MSFT": pd.DataFrame()},
+            "stock_info": {"AAPL": {"beta": 1.3, "shortName": "Apple", "sector": "Technology"}, "MSFT": {}},
+        }
+
+        risk = feature_store.get_risk_rows(["AAPL", "MSFT"], asof=ASOF)
+        meta = feature_store.get_meta_rows(["AAPL", "MSFT"], asof=ASOF)
+
+        assert risk == {"AAPL": {"atr_pct": 0.0, "beta": 1.3}, "MSFT": {"atr_pct": 0.0, "beta": 1.0}}
+        assert meta == {"AAPL": {"name": "Apple", "sector": "Technology", "industry": ""}}
+
+    def test_fund_key_tracks_rule_table(self, cache):
+        """FUND 행 키에 규칙 표 해시가 들어가 규칙을 바꾸면 새로 계산되는지 테스트"""
+        client = feature_store.get_stock_client()
+        client.get_stock_data.return_value = {"stock_info": {}}
+        feature_store.get_fund_rows(["AAPL"], asof=ASOF)
+
+        digest = feature_store.fund_rules_digest()
+        assert f"features:fund:{digest}:AAPL:2026-10-16" in cache.data
+        with patch("graph.feature_store.load_fund_rules", return_value={"rules": []}):
+            assert feature_store.fund_rules_digest() != digest
+
+    def test_bars_after_asof_are_trimmed(self, cache):
+        """기준일 이후 봉(장중 미완성 봉)은 모멘텀/리스크 계산에서 빠지는지 테스트"""
+        index = pd.date_range("2026-06-01", "2026-10-19", freq="B", tz="America/New_York")
+        history = pd.DataFrame(
+            {"Open": 100.0, "High": 101.0, "Low": 99.0, "Close": 100.0, "Volume": 1_000},
+            index=index,
+        )
+        history.iloc[-1] = [100.0, 200.0, 50.0, 180.0, 10]  # 10/19 장중 미완성 봉 (asof 10/16 이후)
+        client = feature_store.get_stock_client()
+        client.get_history.return_value = {"AAPL": history}
+        client.get_stock_data.return_value = {"stock_history": {"AAPL": history}, "stock_info": {}}
+
+        with patch("graph.feature_store.momentum_rows", return_value={}) as rows:
+            feature_store.get_momentum_rows(["AAPL"], asof=ASOF)
+        risk = feature_store.get_risk_rows(["AAPL"], asof=ASOF)
+
+        seen = rows.call_args[0][0]["AAPL"]
+        assert seen.index[-1].date() == ASOF
+        assert len(seen) == len(history) - 1
+        assert risk["AAPL"]["atr_pct"] == pytest.approx(0.02)  # 미완성 봉의 큰 범위가 섞이지 않음
+
+    def test_settled_histories_keeps_frames_without_later_bars(self):
+        history = pd.DataFrame({"Close": [1.0, 2.0]}, index=pd.DatetimeIndex(["2026-10-15", "2026-10-16"]))
+        trimmed = feature_store.settled_histories({"A": history, "B": pd.DataFrame(), "C": None}, ASOF)
+        assert trimmed["A"] is history
+        assert trimmed["B"].empty and trimmed["C"] is None
+
+
+@pytest.mark.unit
+class TestMaxWeightTool:
+    def test_missing_risk_row_uses_neutral_values(self):
+        """리스크 행이 없는(계산 실패) 티커는 KeyError 없이 중립값으로 계산하는지 테스트"""
+        from graph.tools.stock_data import calculate_max_weight_pct
+
+        with patch("graph.feature_store.get_risk_rows", return_value={"AAPL": {"beta": 2.0, "atr_pct": 0.02}}):
+            result = calculate_max_weight_pct.invoke({"tickers": ["AAPL", "GONE"], "base_weight": 10})
+
+        assert result["status"] == "success"
+        assert result["results"]["AAPL"]["max_weight_pct"] == pytest.approx(5.0)
+        assert result["results"]["GONE"] == {"beta": 1.0, "atr_pct": 0.0, "max_weight_pct": 10}
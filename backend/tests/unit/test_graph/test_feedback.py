@@ -2,16 +2,22 @@
 """추천 트랙레코드(graph/feedback.py) 순수 함수 단위 테스트"""
 import pytest
 from datetime import date, datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from data.schemas import RecommendationOut
+from clients.close_series import CloseSeries
+from data.schemas import RecommendationOut, RecommendationReturnsPatch, ScorecardBucket
 from graph.feedback import (
     DELTA_COEF,
     SHRINK_TARGET_N,
     build_scorecard,
     compute_delta,
     compute_returns_patch,
+    compute_returns_patches,
+    get_scorecard,
     is_hit,
     price_on_or_after,
+    score_all_pending_recommendations,
+    scorecard_from_buckets,
 )
 from graph.agents.decider.validation import MAX_ADJUSTMENT
 
@@ -112,6 +118,94 @@ class TestComputeReturnsPatch:
         assert compute_returns_patch(rec, {}, {}, NOW.date()) is None
 
 
+@pytest.mark.unit
+class TestBatchScoring:
+    @pytest.fixture
+    def closes(self):
+        """추천일(70일 전)부터 일별 종가: AAPL 상승, MSFT 하락, SPY 완만 상승"""
+        start = (NOW - timedelta(days=70)).date()
+        days = [start + timedelta(days=i) for i in range(71)]
+        return {
+            "AAPL": {d: 100.0 + i for i, d in enumerate(days)},
+            "MSFT": {d: 200.0 - i for i, d in enumerate(days)},
+            "SPY": {d: 400.0 + i * 0.4 for i, d in enumerate(days)},
+        }
+
+    def test_matches_per_rec_patches(self, closes):
+        """일괄 계산이 추천별 compute_returns_patch와 같은지 테스트 (티커·창·가격 누락 섞음)"""
+        recs = [
+            make_rec("AAPL", days_ago=70, rec_id=1),
+            make_rec("MSFT", days_ago=40, rec_id=2),
+            make_rec("AAPL", days_ago=40, rec_id=3, return_7d=0.07, benchmark_return_7d=0.007),
+            make_rec("NVDA", days_ago=40, rec_id=4),  # 종가 없음
+            make_rec("MSFT", days_ago=3, rec_id=5),  # 창 미경과
+        ]
+        series = {ticker: CloseSeries.from_mapping(c) for ticker, c in closes.items() if ticker != "SPY"}
+
+        patches = compute_returns_patches(recs, series, closes["SPY"], NOW.date())
+
+        expected = [
+            compute_returns_patch(rec, closes.get(rec.ticker, {}), closes["SPY"], NOW.date()) for rec in recs
+        ]
+        assert patches == expected
+        assert patches[0].return_60d is not None
+        assert patches[3] is None and patches[4] is None
+
+    async def test_scores_all_users_with_one_fetch_and_one_write(self, closes):
+        """전 사용자 미채점 추천을 종가 일괄 조회 1회 + 채점 기록 RPC 1회로 채점하는지 테스트"""
+        recs = [make_rec("AAPL", days_ago=40, rec_id=1), make_rec("MSFT", days_ago=40, rec_id=2)]
+        recs[1] = recs[1].model_copy(update={"user_id": 2})
+        repo = MagicMock()
+        repo.get_unscored = AsyncMock(return_value=recs)
+        repo.apply_scores = AsyncMock(side_effect=lambda scores: len(scores))
+        series = {ticker: CloseSeries.from_mapping(c) for ticker, c in closes.items()}
+
+        with patch("graph.feedback.get_recommendation_repo", return_value=repo), patch(
+            "graph.feedback.fetch_closes_many", return_value=series
+        ) as fetch:
+            summary = await score_all_pending_recommendations(asof=NOW)
+
+        fetch.assert_called_once()
+        assert set(fetch.call_args[0][0]) == {"SPY", "AAPL", "MSFT"}
+        repo.apply_scores.assert_awaited_once()
+        scores = repo.apply_scores.call_args[0][0]
+        assert list(scores) == [1, 2]
+        assert scores[1].return_30d == pytest.approx(160 / 100 - 1)  # 40일 전 130 → 10일 전 160, 추천가 100 기준
+        assert scores[2].return_30d == pytest.approx(140 / 100 - 1)  # 하락 중이지만 추천가 100 기준
+        assert scores[1].return_60d is None  # 창 미경과
+        assert summary == {"pending": 2, "scored": 2, "users": 2, "tickers": 2}
+
+    async def test_sends_only_return_patches(self, closes):
+        """추천 행 전체가 아니라 수익률 패치만 보내는지 테스트 (동시 수정을 덮지 않음)"""
+        rec = make_rec("AAPL", days_ago=40, rec_id=7)
+        repo = MagicMock()
+        repo.get_unscored = AsyncMock(return_value=[rec])
+        repo.apply_scores = AsyncMock(return_value=1)
+        series = {ticker: CloseSeries.from_mapping(c) for ticker, c in closes.items()}
+
+        with patch("graph.feedback.get_recommendation_repo", return_value=repo), patch(
+            "graph.feedback.fetch_closes_many", return_value=series
+        ):
+            await score_all_pending_recommendations(asof=NOW)
+
+        (scores,) = repo.apply_scores.call_args[0]
+        assert all(isinstance(p, RecommendationReturnsPatch) for p in scores.values())
+
+    async def test_skips_write_without_benchmark(self, closes):
+        """SPY 종가가 없으면 아무것도 기록하지 않는지 테스트"""
+        repo = MagicMock()
+        repo.get_unscored = AsyncMock(return_value=[make_rec("AAPL", days_ago=40)])
+        repo.apply_scores = AsyncMock()
+
+        with patch("graph.feedback.get_recommendation_repo", return_value=repo), patch(
+            "graph.feedback.fetch_closes_many", return_value={"SPY": CloseSeries.empty()}
+        ):
+            summary = await score_all_pending_recommendations(asof=NOW)
+
+        repo.apply_scores.assert_not_awaited()
+        assert summary["scored"] == 0
+
+
 @pytest.mark.unit
 class TestBuildScorecard:
     def scored_rec(self, ticker, action, momo, fund, ret, bench, days_ago=40, rec_id=1):
@@ -151,6 +245,72 @@ class TestBuildScorecard:
         assert sc["overall"]["hit_rate"] is None
 
 
+@pytest.mark.unit
+class TestScorecardAggregates:
+    @staticmethod
+    def scored_calls():
+        """채점이 끝난 추천과, DB(apply_recommendation_scores)가 같은 콜로 쌓았을 일 버킷"""
+        recs = [
+            make_rec("AAPL", days_ago=40, momo=80, fund=50, rec_id=1, confidence=80, return_30d=0.10, benchmark_return_30d=0.02),
+            make_rec("MSFT", days_ago=40, momo=85, fund=50, rec_id=2, return_30d=-0.05, benchmark_return_30d=0.02),
+            make_rec(
+                "JNJ", action="SELL", days_ago=50, momo=40, fund=80, rec_id=3, confidence=60,
+                return_7d=0.01, benchmark_return_7d=0.0, return_30d=-0.03, benchmark_return_30d=0.02,
+            ),
+            make_rec("NVDA", action="HOLD", days_ago=40, momo=80, fund=50, rec_id=4, return_30d=0.01, benchmark_return_30d=0.02),
+        ]
+        momentum_day, fundamental_day = recs[0].created_at.date(), recs[2].created_at.date()
+        buckets = [
+            ScorecardBucket(
+                user_id=1, window_days=30, leader="momentum", day=momentum_day,
+                calls=2, hits=1, excess_sum=(0.10 - 0.02) + (-0.05 - 0.02),
+                conf_calls=1, conf_sum=0.8, conf_hits=1, brier_sum=(0.8 - 1.0) ** 2,
+                best_excess=0.10 - 0.02, best_ticker="AAPL", best_action="BUY", best_hit=True,
+                worst_excess=-0.05 - 0.02, worst_ticker="MSFT", worst_action="BUY", worst_hit=False,
+            ),
+            ScorecardBucket(
+                user_id=1, window_days=30, leader="fundamental", day=fundamental_day,
+                calls=1, hits=1, excess_sum=-0.03 - 0.02,
+                conf_calls=1, conf_sum=0.6, conf_hits=1, brier_sum=(0.6 - 1.0) ** 2,
+                best_excess=-0.03 - 0.02, best_ticker="JNJ", best_action="SELL", best_hit=True,
+                worst_excess=-0.03 - 0.02, worst_ticker="JNJ", worst_action="SELL", worst_hit=True,
+            ),
+            ScorecardBucket(
+                user_id=1, window_days=7, leader="fundamental", day=fundamental_day,
+                calls=1, hits=0, excess_sum=0.01,
+                conf_calls=1, conf_sum=0.6, conf_hits=0, brier_sum=0.6**2,
+                best_excess=0.01, best_ticker="JNJ", best_action="SELL", best_hit=False,
+                worst_excess=0.01, worst_ticker="JNJ", worst_action="SELL", worst_hit=False,
+            ),
+        ]
+        return recs, buckets
+
+    def test_buckets_reproduce_full_scorecard(self):
+        """버킷 합 스코어카드가 추천 전체로 다시 계산한 build_scorecard와 같은지 테스트 (창별로 나뉘는지 포함)"""
+        recs, buckets = self.scored_calls()
+
+        assert scorecard_from_buckets(buckets, 30) == build_scorecard(recs, window_days=30, asof=NOW)
+        assert scorecard_from_buckets(buckets, 7) == build_scorecard(recs, window_days=7, asof=NOW)
+
+    def test_empty_buckets_match_empty_scorecard(self):
+        assert scorecard_from_buckets([]) == build_scorecard([], asof=NOW)
+
+    async def test_get_scorecard_reads_buckets_once(self):
+        """REVIEWER 스코어카드는 룩백 기간 버킷 조회 한 번으로 만들어지는지 테스트"""
+        _, buckets = self.scored_calls()
+        repo = MagicMock()
+        repo.get_scorecard_buckets = AsyncMock(return_value=buckets)
+        repo.get_recent = AsyncMock()
+
+        with patch("graph.feedback.get_recommendation_repo", return_value=repo):
+            scorecard = await get_scorecard(1, asof=NOW)
+
+        repo.get_scorecard_buckets.assert_awaited_once_with(1, 30, (NOW - timedelta(days=90)).date())
+        repo.get_recent.assert_not_awaited()
+        assert scorecard["overall"]["calls"] == 3
+        assert scorecard["delta"] == compute_delta(scorecard)
+
+
 @pytest.mark.unit
 class TestCalibration:
     def conf_rec(self, rec_id, confidence, hit: bool):
@@ -0,0 +1,115 @@
+# tests/unit/test_graph/test_fund.py
+"""FUND 규칙 표 엔진 단위 테스트"""
+import copy
+import pytest
+from unittest.mock import MagicMock, patch
+
+from graph.fund import DEFAULT_RULES_PATH, load_fund_rules, score_fundamentals
+
+
+def make_info(**fields):
+    info = {"currentPrice": 100.0, "symbol": "X", "shortName": "X", "sector": "Tech", "industry": "Software"}
+    info.update(fields)
+    return info
+
+
+@pytest.mark.unit
+class TestFundEngine:
+    def test_scores_insights_and_label(self):
+        """규칙별 가감점, 그룹 점수, 가중합, 라벨, 인사이트 문구 테스트"""
+        info = make_info(
+            trailingPE=12.0,  # V +20
+            priceToBook=5.0,  # V -10
+            revenueGrowth=0.3,  # G +25
+            earningsGrowth=-0.1,  # G -15
+            returnOnEquity=0.25,  # Q +25
+            operatingMargins=0.25,  # Q +20
+            debtToEquity=20,  # Q +10
+            trailingEps=3.0,  # E +10
+            recommendationMean=1.8,  # E +15
+        )
+        result = score_fundamentals({"AAA": info})[0]
+
+        assert result["scores"] == {"V": 60, "G": 60, "Q": 100, "E": 75}
+        assert result["FUND"] == 72  # int(0.3·60 + 0.3·60 + 0.25·100 + 0.15·75)
+        assert result["label"] == "Strong"
+        assert result["insights"][:2] == ["낮은 PER (12.0) (밸류에이션 매력)", "높은 PBR (5.0)"]
+        assert "강한 매출 성장 (30.0%)" in result["insights"]
+        assert result["insights"][-1] == "애널리스트 강력 추천"
+        assert result["data_confidence"] == "high"  # EV/Sales는 신뢰도 지표가 아님
+
+    def test_fallback_field_and_zero_values(self):
+        """trailingPE가 비면 forwardPE를 쓰고, 0 값은 규칙을 건너뛰는지 테스트"""
+        result = score_fundamentals({"A": make_info(trailingPE=None, forwardPE=40.0, revenueGrowth=0)})[0]
+
+        assert result["scores"]["V"] == 35
+        assert result["scores"]["G"] == 50
+        assert result["insights"] == ["높은 PER (40.0) (밸류에이션 부담)"]
+
+    def test_data_confidence_counts_missing_not_nan(self):
+        """None(없음)만 누락으로 세고 NaN 값은 있는 것으로 보는지 테스트 (기존 로직 유지)"""
+        complete = dict(trailingPE=20.0, priceToBook=2.0, revenueGrowth=0.1, returnOnEquity=0.15, operatingMargins=0.1)
+        results = score_fundamentals(
+            {
+                "HIGH": make_info(**complete),
+                "NAN": make_info(**{**complete, "priceToBook": float("nan")}),
+                "MEDIUM": make_info(**{**complete, "priceToBook": None}),
+                "LOW": make_info(trailingPE=20.0, priceToBook=2.0),
+            }
+        )
+        assert {r["ticker"]: r["data_confidence"] for r in results} == {
+            "HIGH": "high",
+            "NAN": "high",
+            "MEDIUM": "medium",
+            "LOW": "low",
+        }
+        assert results[0]["insights"] == ["데이터 제한으로 상세 분석 어려움"]
+        assert results[0]["label"] == "Neutral"
+
+    def test_non_numeric_cell_does_not_fail_batch(self):
+        """문자열 값('Infinity')이 한 티커에 섞여도 배치 전체가 실패하지 않는지 테스트"""
+        good = make_info(trailingPE=12.0, revenueGrowth=0.3)
+        results = score_fundamentals({"A": good, "B": dict(good, trailingPE="Infinity"), "C": dict(good, trailingPE="25")})
+
+        by_ticker = {r["ticker"]: r for r in results}
+        assert set(by_ticker) == {"A", "B", "C"}
+        assert by_ticker["A"]["insights"][0] == "낮은 PER (12.0) (밸류에이션 매력)"
+        assert "높은 PER (inf) (밸류에이션 부담)" in by_ticker["B"]["insights"]
+        assert "강한 매출 성장 (30.0%)" in by_ticker["B"]["insights"]
+
+    def test_unscorable_tickers_are_skipped(self):
+        results = score_fundamentals(
+            {"NONE": None, "SHORT": {"currentPrice": 1.0}, "NOPRICE": make_info(currentPrice=None), "OK": make_info()}
+        )
+        assert [r["ticker"] for r in results] == ["OK"]
+        assert score_fundamentals({}) == []
+
+    def test_thresholds_are_tunable_via_rules(self):
+        """규칙 표만 바꿔 임계값·가감점을 조정할 수 있는지 테스트"""
+        rules = copy.deepcopy(load_fund_rules())
+        pe_rule = next(rule for rule in rules["rules"] if rule["name"] == "pe_ratio")
+        pe_rule["cases"][0].update(value=25, points=30)
+
+        default = score_fundamentals({"A": make_info(trailingPE=20.0)})[0]
+        tuned = score_fundamentals({"A": make_info(trailingPE=20.0)}, rules=rules)[0]
+
+        assert default["scores"]["V"] == 50
+        assert tuned["scores"]["V"] == 80
+
+    def test_load_rules_falls_back_to_default(self, tmp_path):
+        broken = tmp_path / "rules.json"
+        broken.write_text("{not json", encoding="utf-8")
+        assert load_fund_rules(str(broken)) == load_fund_rules(DEFAULT_RULES_PATH)
+
+    def test_tool_payload_shape(self):
+        from graph.tools.stock_data import calculate_fund_scores
+
+        client = MagicMock()
+        client.get_cache_client.side_effect = ValueError("no redis")  # 피처 저장소 없이 직접 계산
+        client.get_stock_data.return_value = {"stock_info": {"A": make_info(trailingPE=12.0)}}
+        with patch("graph.feature_store.get_stock_client", return_value=client):
+            result = calculate_fund_scores.invoke({"tickers": ["A", "B"]})
+
+        assert result["status"] == "success"
+        assert [s["ticker"] for s in result["scores"]] == ["A"]
+        assert set(result["scores"][0]) == {"ticker", "FUND", "scores", "label", "insights", "data_confidence"}
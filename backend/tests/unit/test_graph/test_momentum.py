@@ -0,0 +1,108 @@
+# tests/unit/test_graph/test_momentum.py
+"""모멘텀 스코어 엔진 단위 테스트 (벡터 계산 vs 티커별 pandas 계산)"""
+import numpy as np
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from graph.momentum import MIN_BARS, score_momentum, universe_zscores
+
+
+def random_history(n: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 2, n).cumsum()
+    return pd.DataFrame(
+        {
+            "Close": close,
+            "High": close + rng.uniform(0, 3, n),
+            "Low": close - rng.uniform(0, 3, n),
+            "Volume": rng.integers(100_000, 1_000_000, n).astype(float),
+        },
+        index=pd.bdate_range("2026-01-01", periods=n),
+    )
+
+
+def rolling_features(hist: pd.DataFrame) -> dict:
+    """기존 티커별 pandas 구현 (비교 기준)"""
+    close, volume = hist["Close"], hist["Volume"]
+    return {
+        "r20": close.iloc[-1] / close.iloc[-21] - 1,
+        "r60": close.iloc[-1] / close.iloc[-61] - 1,
+        "ma_cross": bool(close.rolling(20).mean().iloc[-1] > close.rolling(60).mean().iloc[-1]),
+        "breakout": bool(close.iloc[-1] > close.rolling(20).max().iloc[-21:-1].max()),
+        "vol_surge": volume.tail(5).mean() / volume.tail(20).mean(),
+    }
+
+
+@pytest.mark.unit
+class TestMomentumEngine:
+    def test_features_match_per_ticker_rolling(self):
+        histories = {f"T{i}": random_history(80 + 10 * i, i) for i in range(5)}
+        results = {item["ticker"]: item["score"] for item in score_momentum(histories)}
+
+        for ticker, hist in histories.items():
+            expected = rolling_features(hist)
+            features = results[ticker]["features"]
+            for name, value in expected.items():
+                assert features[name] == pytest.approx(value), name
+
+    def test_zscores_use_population_std_and_round(self):
+        values = np.array([0.1, 0.2, np.nan, 0.3])
+        z = universe_zscores(values)
+        expected = np.round((values - np.nanmean(values)) / np.nanstd(values), 2)
+        np.testing.assert_array_equal(z[[0, 1, 3]], expected[[0, 1, 3]])
+        assert np.isnan(z[2])
+        assert np.isnan(universe_zscores(np.array([1.0, np.nan]))).all()  # 값 2개 미만
+        assert np.isnan(universe_zscores(np.array([1.0, 1.0]))).all()  # 표준편차 0
+
+    def test_short_and_empty_histories_are_skipped(self):
+        histories = {"OK": random_history(MIN_BARS, 1), "SHORT": random_history(MIN_BARS - 1, 2), "EMPTY": pd.DataFrame(), "NONE": None}
+        results = score_momentum(histories)
+
+        assert [item["ticker"] for item in results] == ["OK"]
+        score = results[0]["score"]
+        assert score["norm"] == {}  # 유니버스가 1종목이면 정규화 없음
+        assert score["data_confidence"] == "medium"
+        assert 0 <= score["MOMO"] <= 100
+
+    def test_zero_volume_has_no_vol_surge(self):
+        hist = random_history(MIN_BARS, 1)
+        hist["Volume"] = 0.0
+        assert score_momentum({"A": hist})[0]["score"]["features"]["vol_surge"] is None
+
+    def test_stronger_trend_scores_higher(self):
+        base = random_history(120, 1)
+        up, down = base.copy(), base.copy()
+        drift = np.linspace(0, 30, 120)
+        for col in ("Close", "High", "Low"):
+            up[col] = base[col] + drift
+            down[col] = base[col] - drift
+        results = {item["ticker"]: item["score"] for item in score_momentum({"UP": up, "MID": base, "DOWN": down})}
+
+        assert results["UP"]["MOMO"] > results["MID"]["MOMO"] > results["DOWN"]["MOMO"]
+        assert set(results["UP"]["norm"]) == {"z20", "z60"}  # 거래량이 같아 zvol은 표준편차 0으로 제외
+        assert results["UP"]["data_confidence"] == "high"
+
+    def test_tool_payload_shape(self):
+        from graph.tools.stock_data import calculate_momentum_scores
+
+        client = MagicMock()
+        client.get_cache_client.side_effect = ValueError("no redis")  # 피처 저장소 없이 직접 계산
+        client.get_history.return_value = {"A": random_history(100, 1), "B": random_history(100, 2)}
+        with patch("graph.feature_store.get_stock_client", return_value=client):
+            result = calculate_momentum_scores.invoke({"tickers": ["A", "B", "C"]})
+
+        assert result["version"] == "1.0" and "asof" in result
+        assert [item["ticker"] for item in result["momo_score"]] == ["A", "B"]
+        assert set(result["momo_score"][0]["score"]) == {"MOMO", "features", "norm", "data_confidence"}
+
+    def test_tool_error_when_no_valid_tickers(self):
+        from graph.tools.stock_data import calculate_momentum_scores
+
+        client = MagicMock()
+        client.get_cache_client.side_effect = ValueError("no redis")  # 피처 저장소 없이 직접 계산
+        client.get_history.return_value = {"A": pd.DataFrame()}
+        with patch("graph.feature_store.get_stock_client", return_value=client):
+            result = calculate_momentum_scores.invoke({"tickers": ["A"]})
+
+        assert result["status"] == "error"
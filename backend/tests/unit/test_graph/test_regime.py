@@ -2,12 +2,20 @@
 """시장 국면 판정(graph/regime.py) 단위 테스트"""
 import pytest
 from datetime import date, timedelta
+from unittest.mock import MagicMock, patch
 
+from clients.cache_client import CachedFailure
+from data.schemas import MarketRegimeCreate
 from graph.regime import (
     BUY_THRESHOLDS,
     CASH_FLOOR_PCT,
     MA_DAYS,
+    NEUTRAL_FALLBACK,
+    build_regime_snapshot,
     classify_regime,
+    get_market_regime,
+    get_regime_snapshot,
+    regime_record,
     regime_rules,
 )
 
@@ -82,3 +90,90 @@ class TestRegimeRules:
 
     def test_constants_consistency(self):
         assert set(BUY_THRESHOLDS) == set(CASH_FLOOR_PCT) == {"risk_on", "neutral", "risk_off"}
+
+
+class DictCache:
+    """get_or_set/set만 흉내 낸 메모리 캐시"""
+
+    def __init__(self):
+        self.data = {}
+
+    def get_or_set(self, key, fetch_func, ttl_seconds=None):
+        if key not in self.data:
+            self.data[key] = fetch_func()
+        return self.data[key]
+
+    def set(self, key, value, ttl_seconds=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def cache():
+    cache = DictCache()
+    client = MagicMock()
+    client.get_cache_client.return_value = cache
+    with patch("graph.regime.get_stock_client", return_value=client):
+        yield cache
+
+
+@pytest.mark.unit
+class TestRegimeSnapshot:
+    def test_snapshot_ignores_bars_after_session(self):
+        """확정 거래일 이후(장중) 봉은 판정에서 빠지고 입력값이 함께 기록되는지 테스트"""
+        closes = make_closes([100.0 + i * 0.1 for i in range(MA_DAYS + 30)])
+        dates = sorted(closes)
+        session = dates[-2]
+        closes[dates[-1]] = 50.0  # 장중 급락 봉 — 무시돼야 함
+
+        snapshot = build_regime_snapshot(closes, session)
+
+        assert snapshot["regime"] == "risk_on"
+        assert snapshot["session_date"] == session.isoformat()
+        assert snapshot["inputs"]["spy_close"] == closes[session]
+        assert snapshot["inputs"]["bars"] == len(dates) - 1
+        assert snapshot["inputs"]["last_date"] == session.isoformat()
+        assert snapshot["computed_at"]
+
+    def test_computed_once_per_session(self, cache):
+        """같은 거래일의 여러 실행이 한 번만 판정하고 스냅샷을 공유하는지 테스트"""
+        closes = make_closes(flat_series())
+        session = max(closes)
+        with patch("graph.feedback.fetch_closes", return_value=closes) as fetch:
+            first = get_regime_snapshot(session)
+            second = get_regime_snapshot(session)
+        assert fetch.call_count == 1
+        assert first == second
+
+    def test_refresh_overwrites_snapshot(self, cache):
+        """refresh=True면 저장된 스냅샷을 다시 계산해 덮어쓰는지 테스트"""
+        closes = make_closes(flat_series())
+        session = max(closes)
+        with patch("graph.feedback.fetch_closes", return_value=closes) as fetch:
+            get_regime_snapshot(session)
+            get_regime_snapshot(session, refresh=True)
+        assert fetch.call_count == 2
+
+    def test_market_regime_strips_snapshot_fields(self, cache):
+        """파이프라인에 넘기는 국면에는 스냅샷 전용 필드가 없는지 테스트"""
+        closes = make_closes([100.0 + i * 0.1 for i in range(MA_DAYS + 30)])
+        with patch("graph.regime.last_settled_session", return_value=max(closes)), patch(
+            "graph.feedback.fetch_closes", return_value=closes
+        ):
+            regime = get_market_regime()
+        assert regime["regime"] == "risk_on"
+        assert set(regime) == {"regime", "spy_vs_ma200_pct", "drawdown_pct", "realized_vol_pct"}
+
+    def test_market_regime_falls_back_without_closes(self, cache):
+        """SPY 종가가 없으면 neutral 폴백, 실패는 짧게만 저장되는지 테스트"""
+        with patch("graph.feedback.fetch_closes", return_value={}):
+            assert get_market_regime() == NEUTRAL_FALLBACK
+        assert all(isinstance(value, CachedFailure) for value in cache.data.values())
+
+    def test_regime_record_flattens_inputs(self):
+        """스냅샷이 market_regimes 행 스키마로 변환되는지 테스트"""
+        closes = make_closes(flat_series())
+        record = MarketRegimeCreate(**regime_record(build_regime_snapshot(closes, max(closes))))
+        assert record.session_date == max(closes)
+        assert record.spy_close == 100.0
+        assert record.spy_ma200 == 100.0
+        assert record.bars == len(closes)
@@ -36,8 +36,9 @@ class TestNewsTools:
     def test_company_news_caps_ticker_count(self):
         client = MagicMock()
         client.is_available.return_value = True
-        client.get_company_news.return_value = []
+        client.get_company_news_many.return_value = {}
         with patch("graph.tools.news.get_finnhub_client", return_value=client):
             result = get_company_news.invoke({"tickers": [f"T{i}" for i in range(15)]})
         assert result["status"] == "success"
-        assert client.get_company_news.call_count == 10  # 최대 10개 티커
+        tickers = client.get_company_news_many.call_args.args[0]
+        assert len(tickers) == 10  # 최대 10개 티커
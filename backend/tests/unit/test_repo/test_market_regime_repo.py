@@ -0,0 +1,181 @@
+# tests/unit/test_repo/test_market_regime_repo.py
+"""
+MarketRegimeRepo 단위 테스트
+
+현재 구현 기준:
+- 모든 공개 메서드는 async
+- 키는 session_date (거래일) — create()/update()는 upsert(on_conflict="session_date")에 위임
+- get_latest()는 session_date 내림차순 1건, get_history()는 gte(since) [+ lte(until)] 오름차순
+- 예외는 로그 후 그대로 다시 올린다
+"""
+import pytest
+from unittest.mock import MagicMock
+from datetime import date
+
+from repo.market_regime_repo import MarketRegimeRepo
+from data.schemas import MarketRegimeCreate, MarketRegimeOut
+from tests.fixtures.mock_data import MockDataGenerator
+
+
+@pytest.mark.unit
+class TestMarketRegimeRepo:
+    """MarketRegimeRepo 테스트 클래스"""
+
+    @pytest.fixture
+    def mock_db_client(self):
+        """Mock Supabase 클라이언트"""
+        return MagicMock()
+
+    @pytest.fixture
+    def market_regime_repo(self, mock_db_client):
+        """MarketRegimeRepo 인스턴스 (Mock 클라이언트 직접 주입)"""
+        return MarketRegimeRepo(db_client=mock_db_client)
+
+    @pytest.fixture
+    def sample_regime_row(self):
+        """테스트용 market_regimes 테이블 행"""
+        return MockDataGenerator.create_market_regime(session_date=date(2026, 10, 16), regime="risk_on")
+
+    @pytest.fixture
+    def sample_regime_create(self, sample_regime_row):
+        """테스트용 국면 저장 스키마"""
+        return MarketRegimeCreate(**sample_regime_row)
+
+    # ===== 초기화 =====
+
+    def test_market_regime_repo_initialization(self, mock_db_client):
+        """MarketRegimeRepo 초기화: 기본 테이블 이름은 market_regimes"""
+        repo = MarketRegimeRepo(db_client=mock_db_client)
+
+        assert repo.db_client is mock_db_client
+        assert repo.table_name == "market_regimes"
+
+    # ===== upsert / create / update =====
+
+    async def test_upsert_on_session_date(
+        self, market_regime_repo, mock_db_client, sample_regime_create, sample_regime_row
+    ):
+        """upsert: mode='json' 직렬화된 행을 session_date 충돌 기준으로 한 번에 기록"""
+        upsert = mock_db_client.table.return_value.upsert
+        upsert.return_value.execute.return_value.data = [sample_regime_row]
+
+        result = await market_regime_repo.upsert(sample_regime_create)
+
+        mock_db_client.table.assert_called_with("market_regimes")
+        upsert.assert_called_once_with(sample_regime_create.model_dump(mode="json"), on_conflict="session_date")
+        assert upsert.call_args[0][0]["session_date"] == "2026-10-16"
+        assert isinstance(result, MarketRegimeOut)
+        assert result.regime == "risk_on"
+
+    async def test_create_and_update_delegate_to_upsert(
+        self, market_regime_repo, mock_db_client, sample_regime_create, sample_regime_row
+    ):
+        """create()/update(): 같은 거래일을 다시 판정하면 덮어쓰도록 upsert에 위임"""
+        upsert = mock_db_client.table.return_value.upsert
+        upsert.return_value.execute.return_value.data = [sample_regime_row]
+
+        created = await market_regime_repo.create(sample_regime_create)
+        updated = await market_regime_repo.update(sample_regime_create)
+
+        assert upsert.call_count == 2
+        mock_db_client.table.return_value.insert.assert_not_called()
+        assert created.session_date == updated.session_date == date(2026, 10, 16)
+
+    async def test_upsert_empty_response_raises(self, market_regime_repo, mock_db_client, sample_regime_create):
+        """upsert 응답이 비어 있으면 ValueError 발생"""
+        mock_db_client.table.return_value.upsert.return_value.execute.return_value.data = []
+
+        with pytest.raises(ValueError):
+            await market_regime_repo.upsert(sample_regime_create)
+
+    # ===== get_by_id / get_latest =====
+
+    async def test_get_by_id_filters_by_session_date(self, market_regime_repo, mock_db_client, sample_regime_row):
+        """거래일로 조회: session_date를 ISO 문자열로 eq 필터"""
+        select_chain = mock_db_client.table.return_value.select.return_value
+        select_chain.eq.return_value.execute.return_value.data = [sample_regime_row]
+
+        result = await market_regime_repo.get_by_id(date(2026, 10, 16))
+
+        select_chain.eq.assert_called_with("session_date", "2026-10-16")
+        assert isinstance(result, MarketRegimeOut)
+        assert result.bars == sample_regime_row["bars"]
+
+    async def test_get_by_id_not_found(self, market_regime_repo, mock_db_client):
+        """조회 결과 없으면 None 반환"""
+        select_chain = mock_db_client.table.return_value.select.return_value
+        select_chain.eq.return_value.execute.return_value.data = []
+
+        assert await market_regime_repo.get_by_id(date(2026, 10, 17)) is None
+
+    async def test_get_latest_orders_by_session_date_desc(self, market_regime_repo, mock_db_client, sample_regime_row):
+        """가장 최근 거래일 1건: session_date 내림차순 + limit(1)"""
+        order = mock_db_client.table.return_value.select.return_value.order
+        order.return_value.limit.return_value.execute.return_value.data = [sample_regime_row]
+
+        result = await market_regime_repo.get_latest()
+
+        order.assert_called_with("session_date", desc=True)
+        order.return_value.limit.assert_called_with(1)
+        assert result.session_date == date(2026, 10, 16)
+
+    async def test_get_latest_empty_table(self, market_regime_repo, mock_db_client):
+        """기록이 없으면 None 반환"""
+        order = mock_db_client.table.return_value.select.return_value.order
+        order.return_value.limit.return_value.execute.return_value.data = []
+
+        assert await market_regime_repo.get_latest() is None
+
+    # ===== get_history =====
+
+    async def test_get_history_since_and_until(self, market_regime_repo, mock_db_client):
+        """기간 조회: gte(since) + lte(until), 거래일 오름차순"""
+        rows = [
+            MockDataGenerator.create_market_regime(session_date=date(2026, 10, 15)),
+            MockDataGenerator.create_market_regime(session_date=date(2026, 10, 16), regime="risk_off"),
+        ]
+        gte = mock_db_client.table.return_value.select.return_value.gte
+        lte = gte.return_value.lte
+        lte.return_value.order.return_value.execute.return_value.data = rows
+
+        result = await market_regime_repo.get_history(date(2026, 10, 1), until=date(2026, 10, 16))
+
+        gte.assert_called_with("session_date", "2026-10-01")
+        lte.assert_called_with("session_date", "2026-10-16")
+        lte.return_value.order.assert_called_with("session_date")
+        assert [r.regime for r in result] == ["neutral", "risk_off"]
+
+    async def test_get_history_without_until(self, market_regime_repo, mock_db_client):
+        """until이 없으면 lte 없이 since 이후 전체"""
+        gte = mock_db_client.table.return_value.select.return_value.gte
+        gte.return_value.order.return_value.execute.return_value.data = None
+
+        result = await market_regime_repo.get_history(date(2026, 10, 1))
+
+        gte.return_value.lte.assert_not_called()
+        assert result == []
+
+    # ===== delete_by_id =====
+
+    async def test_delete_by_id(self, market_regime_repo, mock_db_client, sample_regime_row):
+        """거래일 삭제: 삭제된 행이 있으면 True, 없으면 False"""
+        delete_eq = mock_db_client.table.return_value.delete.return_value.eq
+        delete_eq.return_value.execute.return_value.data = [sample_regime_row]
+
+        assert await market_regime_repo.delete_by_id(date(2026, 10, 16)) is True
+        delete_eq.assert_called_with("session_date", "2026-10-16")
+
+        delete_eq.return_value.execute.return_value.data = []
+        assert await market_regime_repo.delete_by_id(date(2026, 10, 16)) is False
+
+    # ===== 예외 처리 =====
+
+    async def test_db_errors_propagate(self, market_regime_repo, mock_db_client, sample_regime_create):
+        """DB 예외는 로그 후 그대로 다시 발생"""
+        mock_db_client.table.return_value.upsert.return_value.execute.side_effect = Exception("DB error")
+        mock_db_client.table.return_value.select.return_value.order.side_effect = Exception("DB error")
+
+        with pytest.raises(Exception, match="DB error"):
+            await market_regime_repo.upsert(sample_regime_create)
+        with pytest.raises(Exception, match="DB error"):
+            await market_regime_repo.get_latest()
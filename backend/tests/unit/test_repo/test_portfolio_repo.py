@@ -123,6 +123,23 @@ class TestPortfolioRepo:
 
         assert result == []
 
+    # ===== get_all_tickers =====
+
+    async def test_get_all_tickers_dedupes_across_pages(self, portfolio_repo, mock_db_client, monkeypatch):
+        """페이지 단위로 전 포지션을 읽어 중복 없는 티커 목록을 만드는지 테스트"""
+        monkeypatch.setattr("repo.portfolio_repo.TICKER_PAGE_SIZE", 2)
+        range_chain = mock_db_client.table.return_value.select.return_value.range
+        range_chain.return_value.execute.side_effect = [
+            MagicMock(data=[{"ticker": "MSFT"}, {"ticker": "AAPL"}]),
+            MagicMock(data=[{"ticker": "AAPL"}]),
+        ]
+
+        result = await portfolio_repo.get_all_tickers()
+
+        assert result == ["AAPL", "MSFT"]
+        mock_db_client.table.assert_called_with("positions")
+        assert [c.args for c in range_chain.call_args_list] == [(0, 1), (2, 3)]
+
     # ===== get_by_user_id (enriched) =====
 
     async def test_get_by_user_id_with_positions(
@@ -10,10 +10,10 @@ RecommendationRepo 단위 테스트
 """
 import pytest
 from unittest.mock import MagicMock
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
 
-from repo.recommendation_repo import RecommendationRepo
-from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch
+from repo.recommendation_repo import RECOMMENDATION_PAGE_SIZE, UNSCORED_FILTER, RecommendationRepo
+from data.schemas import RecommendationCreate, RecommendationOut, RecommendationReturnsPatch, ScorecardBucket
 from tests.fixtures.mock_data import MockDataGenerator
 
 
@@ -217,6 +217,78 @@ class TestRecommendationRepo:
 
         assert result is None
 
+    # ===== get_unscored / apply_scores (전 사용자 일괄 채점) =====
+
+    async def test_get_unscored_pages_through_all_users(self, recommendation_repo, mock_db_client):
+        """미채점 추천 조회: created_at 구간 + 미채점 필터, 페이지가 가득 차면 다음 페이지를 조회"""
+        full_page = [
+            MockDataGenerator.create_recommendation(recommendation_id=i + 1, user_id=i % 3 + 1, ticker="AAPL")
+            for i in range(RECOMMENDATION_PAGE_SIZE)
+        ]
+        last_page = [MockDataGenerator.create_recommendation(recommendation_id=9999, user_id=2, ticker="MSFT")]
+        chain = mock_db_client.table.return_value.select.return_value.gte.return_value.lte.return_value
+        range_call = chain.or_.return_value.order.return_value.range
+        range_call.return_value.execute.side_effect = [MagicMock(data=full_page), MagicMock(data=last_page)]
+        since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        until = datetime(2026, 5, 1, tzinfo=timezone.utc)
+
+        result = await recommendation_repo.get_unscored(since, until)
+
+        mock_db_client.table.return_value.select.return_value.gte.assert_called_with("created_at", since.isoformat())
+        chain.or_.assert_called_with(UNSCORED_FILTER)
+        assert range_call.call_args_list[1][0] == (RECOMMENDATION_PAGE_SIZE, 2 * RECOMMENDATION_PAGE_SIZE - 1)
+        assert len(result) == RECOMMENDATION_PAGE_SIZE + 1
+        assert {r.user_id for r in result} == {1, 2, 3}
+
+    async def test_apply_scores_sends_patches_in_one_rpc_per_chunk(self, recommendation_repo, mock_db_client):
+        """채점 기록: 수익률 패치만 apply_recommendation_scores RPC로, 청크당 한 번 보낸다"""
+        scores = {
+            i: RecommendationReturnsPatch(return_7d=0.05, benchmark_return_7d=0.01)
+            for i in range(1, RECOMMENDATION_PAGE_SIZE + 2)
+        }
+        mock_db_client.rpc.return_value.execute.side_effect = [
+            MagicMock(data=RECOMMENDATION_PAGE_SIZE),
+            MagicMock(data=0),  # 이미 채점된 창만 남은 청크 (재시도) → 0건
+        ]
+
+        updated = await recommendation_repo.apply_scores(scores)
+
+        assert updated == RECOMMENDATION_PAGE_SIZE
+        assert mock_db_client.rpc.call_count == 2
+        name, params = mock_db_client.rpc.call_args_list[0][0]
+        assert name == "apply_recommendation_scores"
+        assert len(params["scores"]) == RECOMMENDATION_PAGE_SIZE
+        assert params["scores"][0] == {"id": 1, "return_7d": 0.05, "benchmark_return_7d": 0.01}
+        mock_db_client.table.assert_not_called()
+
+    async def test_apply_scores_empty_is_noop(self, recommendation_repo, mock_db_client):
+        """기록할 채점이 없으면 RPC를 호출하지 않음"""
+        assert await recommendation_repo.apply_scores({}) == 0
+        mock_db_client.rpc.assert_not_called()
+
+    async def test_apply_scores_propagates_errors(self, recommendation_repo, mock_db_client):
+        """RPC 실패는 삼키지 않고 올린다 (트랜잭션이 롤백되어 다음 실행이 다시 채점)"""
+        mock_db_client.rpc.return_value.execute.side_effect = Exception("DB error")
+
+        with pytest.raises(Exception, match="DB error"):
+            await recommendation_repo.apply_scores({1: RecommendationReturnsPatch(return_7d=0.1)})
+
+    # ===== 스코어카드 집계 =====
+
+    async def test_get_scorecard_buckets_filters_user_window_since(self, recommendation_repo, mock_db_client):
+        """버킷 조회: user_id + window_days eq, day gte(since)"""
+        row = ScorecardBucket(user_id=1, window_days=30, leader="fundamental", day=date(2026, 5, 1), calls=3)
+        chain = mock_db_client.table.return_value.select.return_value.eq.return_value.eq.return_value
+        chain.gte.return_value.order.return_value.range.return_value.execute.return_value.data = [
+            row.model_dump(mode="json")
+        ]
+
+        result = await recommendation_repo.get_scorecard_buckets(1, 30, date(2026, 3, 1))
+
+        mock_db_client.table.assert_called_with("recommendation_scorecard_daily")
+        chain.gte.assert_called_with("day", "2026-03-01")
+        assert result == [row]
+
     # ===== delete_by_id =====
 
     async def test_delete_by_id_success(self, recommendation_repo, mock_db_client):
@@ -147,6 +147,15 @@ class TestPortfolioUsecase:
         with pytest.raises(Exception, match="Database error"):
             await portfolio_usecase.update_portfolio(user_id, portfolio_patch)
 
+    async def test_get_all_tickers_delegates_to_repo(self, portfolio_usecase, mock_portfolio_repo):
+        """전체 보유 티커 조회가 repo에 위임되는지 테스트 (캐시 예열용)"""
+        mock_portfolio_repo.get_all_tickers.return_value = ["AAPL", "MSFT"]
+
+        result = await portfolio_usecase.get_all_tickers()
+
+        mock_portfolio_repo.get_all_tickers.assert_awaited_once_with()
+        assert result == ["AAPL", "MSFT"]
+
     def test_portfolio_create_defaults(self):
         """PortfolioCreate 기본값 테스트 (base_currency=USD, cash=0.00)"""
         portfolio_create = PortfolioCreate(user_id=1)
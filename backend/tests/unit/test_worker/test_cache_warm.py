@@ -0,0 +1,59 @@
+# tests/unit/test_worker/test_cache_warm.py
+"""장 마감 후 캐시 예열 단위 테스트"""
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from worker.cache_warm import WARM_HISTORY_PERIOD, warm_market_data, warm_universe
+
+
+def _history():
+    return pd.DataFrame({"Close": [1.0, 2.0]})
+
+
+@pytest.mark.unit
+class TestCacheWarm:
+    def test_warm_universe_normalizes_and_adds_benchmark(self):
+        assert warm_universe(["aapl", "AAPL ", "", None, "msft"]) == ["AAPL", "MSFT", "SPY"]
+
+    def test_warm_market_data_reports_coverage(self):
+        """history/info/calendar/어닝스/뉴스를 채우고 빠진 티커를 보고하는지 테스트"""
+        stock_client = MagicMock()
+        stock_client.get_stock_data.return_value = {
+            "status": "success",
+            "stock_history": {"AAPL": _history(), "SPY": _history(), "MSFT": pd.DataFrame()},
+            "stock_info": {"AAPL": {"symbol": "AAPL"}, "MSFT": {}, "SPY": {"symbol": "SPY"}},
+            "stock_calendar": {"AAPL": {}, "MSFT": {}, "SPY": {}},
+        }
+        finnhub_client = MagicMock()
+        finnhub_client.is_available.return_value = True
+        finnhub_client.get_company_news_many.return_value = {"AAPL": [{"headline": "h"}], "MSFT": []}
+
+        with patch("worker.cache_warm.get_stock_client", return_value=stock_client), patch(
+            "worker.cache_warm.get_finnhub_client", return_value=finnhub_client
+        ):
+            result = warm_market_data(["msft", "aapl"])
+
+        stock_client.get_stock_data.assert_called_once_with(["AAPL", "MSFT", "SPY"], period=WARM_HISTORY_PERIOD)
+        assert result["tickers"] == 3
+        assert result["history"] == {"covered": 2, "ratio": 0.667, "missing": ["MSFT"]}
+        assert result["info"]["missing"] == ["MSFT"]
+        assert result["calendar"]["ratio"] == 1.0
+        assert result["earnings"] == {"7d": "ok", "3d": "ok"}
+        finnhub_client.get_company_news_many.assert_called_once_with(["AAPL", "MSFT"], limit=5)
+        assert result["news"]["missing"] == ["MSFT"]
+
+    def test_failed_batch_and_missing_finnhub_are_reported(self):
+        """배치 실패는 다음 배치로 넘어가고, Finnhub 미설정이면 건너뛰는지 테스트"""
+        stock_client = MagicMock()
+        stock_client.get_stock_data.side_effect = RuntimeError("boom")
+        finnhub_client = MagicMock()
+        finnhub_client.is_available.return_value = False
+
+        with patch("worker.cache_warm.get_stock_client", return_value=stock_client), patch(
+            "worker.cache_warm.get_finnhub_client", return_value=finnhub_client
+        ):
+            result = warm_market_data(["AAPL"])
+
+        assert result["history"] == {"covered": 0, "ratio": 0.0, "missing": ["AAPL", "SPY"]}
+        assert result["earnings"] == "skipped" and result["news"] == "skipped"
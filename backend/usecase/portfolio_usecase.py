@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from repo import PortfolioRepo
 from data.schemas import PortfolioOut, PortfolioPatch, PortfolioCreate
 import asyncio
@@ -35,3 +35,7 @@ class PortfolioUsecase:
 
     async def update_portfolio(self, user_id: int, portfolio: PortfolioPatch) -> Optional[PortfolioOut]:
         return await self.portfolio_repo.update_by_user_id(user_id, portfolio)
+
+    async def get_all_tickers(self) -> List[str]:
+        """전체 사용자 보유 종목 티커 (중복 제거)"""
+        return await self.portfolio_repo.get_all_tickers()
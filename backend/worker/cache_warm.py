@@ -0,0 +1,100 @@
+# worker/cache_warm.py
+"""장 마감 후 캐시 예열 — 전체 사용자 보유 종목(+SPY)의 시장 데이터를 미리 채운다.
+
+사용자별 정기 실행은 각자 고른 시각에 흩어져 있고, 각 실행이 자기 종목을 처음부터 조회한다.
+마감 + 종가 확정 직후 한 번 전 종목을 일괄 조회해 두면 이후 실행은 캐시(또는 가격 저장소)에서 바로 읽는다.
+
+- history: WARM_HISTORY_PERIOD(1y) 한 번이면 3mo/6mo 조회도 상위 기간 캐시를 잘라 쓴다.
+- info / calendar: StockClient 캐시 (구성요소별 TTL).
+- 어닝스 캘린더 / 종목 뉴스: Finnhub 키가 있을 때만 (파이프라인이 쓰는 조회 창/개수와 같게).
+- 결과는 항목별 커버리지(채운 티커 수 / 전체)와 빠진 티커 목록.
+"""
+import logging
+import time
+from typing import Any, Dict, Iterable, List
+
+from clients import get_finnhub_client, get_stock_client
+
+logger = logging.getLogger(__name__)
+
+BENCHMARK_TICKER = "SPY"
+WARM_HISTORY_PERIOD = "1y"  # regime(SPY 1y)이 쓰는 가장 긴 기간
+WARM_BATCH_SIZE = 50  # yf.download / info 조회 한 번에 넘길 티커 수
+WARM_EARNINGS_DAYS = (7, 3)  # risk 에이전트(7일), decider 실적 블랙아웃(3일)의 조회 창
+WARM_NEWS_LIMIT = 5  # graph/tools/news.get_company_news와 같은 기사 수
+MAX_REPORTED_MISSING = 20  # 결과에 담을 빠진 티커 수 상한
+
+
+def warm_universe(tickers: Iterable[str]) -> List[str]:
+    """대문자 정규화 + 중복 제거 + 벤치마크(SPY) 포함, 정렬"""
+    universe = {str(t).strip().upper() for t in tickers if t and str(t).strip()}
+    universe.add(BENCHMARK_TICKER)
+    return sorted(universe)
+
+
+def warm_market_data(tickers: Iterable[str]) -> Dict[str, Any]:
+    """tickers(+SPY)의 history/info/calendar/어닝스/뉴스를 캐시에 채우고 항목별 커버리지를 돌려준다."""
+    started = time.monotonic()
+    universe = warm_universe(tickers)
+    stock_client = get_stock_client()
+
+    covered: Dict[str, set] = {"history": set(), "info": set(), "calendar": set()}
+    for start in range(0, len(universe), WARM_BATCH_SIZE):
+        batch = universe[start : start + WARM_BATCH_SIZE]
+        try:
+            data = stock_client.get_stock_data(batch, period=WARM_HISTORY_PERIOD)
+        except Exception as e:
+            logger.warning(f"캐시 예열 배치 실패 ({batch[0]}~{batch[-1]}): {e}")
+            continue
+        if data.get("status") != "success":
+            logger.warning(f"캐시 예열 배치 실패 ({batch[0]}~{batch[-1]}): {data.get('error')}")
+            continue
+        for ticker, history in data.get("stock_history", {}).items():
+            if history is not None and not history.empty:
+                covered["history"].add(ticker)
+        for ticker, info in data.get("stock_info", {}).items():
+            if info:
+                covered["info"].add(ticker)
+        covered["calendar"].update(data.get("stock_calendar", {}))  # 일정이 없는 종목도 조회는 성공
+
+    result: Dict[str, Any] = {"tickers": len(universe)}
+    for component, done in covered.items():
+        result[component] = _coverage(universe, done)
+    result.update(_warm_finnhub(universe))
+    result["duration_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+def _warm_finnhub(universe: List[str]) -> Dict[str, Any]:
+    """어닝스 캘린더(조회 창별 1회)와 종목 뉴스. Finnhub 미설정이면 건너뜀."""
+    client = get_finnhub_client()
+    if not client.is_available():
+        return {"earnings": "skipped", "news": "skipped"}
+
+    earnings = {}
+    for days in WARM_EARNINGS_DAYS:
+        try:
+            client.get_upcoming_earnings(universe, days=days)
+            earnings[f"{days}d"] = "ok"
+        except Exception as e:
+            logger.warning(f"어닝스 캘린더 예열 실패 ({days}일): {e}")
+            earnings[f"{days}d"] = "error"
+
+    holdings = [ticker for ticker in universe if ticker != BENCHMARK_TICKER]
+    try:
+        news = client.get_company_news_many(holdings, limit=WARM_NEWS_LIMIT)
+        news_coverage = _coverage(holdings, {ticker for ticker, articles in news.items() if articles})
+    except Exception as e:
+        logger.warning(f"종목 뉴스 예열 실패: {e}")
+        news_coverage = _coverage(holdings, set())
+    return {"earnings": earnings, "news": news_coverage}
+
+
+def _coverage(universe: List[str], covered: set) -> Dict[str, Any]:
+    missing = [ticker for ticker in universe if ticker not in covered]
+    total = len(universe)
+    return {
+        "covered": total - len(missing),
+        "ratio": round((total - len(missing)) / total, 3) if total else 1.0,
+        "missing": missing[:MAX_REPORTED_MISSING],
+    }
@@ -7,4 +7,20 @@ beat_schedule = {
         "task": "worker.tasks.sync_all_schedules",
         "schedule": crontab(minute="*/10"),  # 10분마다 동기화
     },
+    # 장 마감(16:00 ET) + 45분에 전체 보유 종목 캐시 예열. 서머타임 여부에 따라 20:45 또는 21:45 UTC가
+    # 마감 후 첫 실행이 되고, 나머지 한 번은 같은 거래일이 이미 예열돼 있어 건너뛴다.
+    "warm-market-cache": {
+        "task": "worker.tasks.warm_market_cache",
+        "schedule": crontab(minute=45, hour="20,21", day_of_week="mon-fri"),
+    },
+    # 예열 직후 국면 스냅샷 (SPY 1y는 예열 캐시에서 읽음). 같은 거래일을 두 번 판정하면 덮어쓴다.
+    "snapshot-market-regime": {
+        "task": "worker.tasks.snapshot_market_regime",
+        "schedule": crontab(minute=50, hour="20,21", day_of_week="mon-fri"),
+    },
+    # 예열 후 전 사용자 추천 일괄 채점. 두 번째 실행은 남은 미채점 창만 다시 본다 (이미 채점된 창은 건너뜀).
+    "score-recommendations": {
+        "task": "worker.tasks.score_recommendations",
+        "schedule": crontab(minute=55, hour="20,21", day_of_week="mon-fri"),
+    },
 }
@@ -2,6 +2,10 @@ class Constants:
     SCHEDULED_AGENT_TASK = "worker.tasks.run_scheduled_agent_task"
     USER_SCHEDULE_KEY_PREFIX = "user-"
 
+    # 캐시 예열 (거래일별 1회, 결과를 이 키에 남김)
+    CACHE_WARM_MARKER_PREFIX = "cache_warm:"
+    CACHE_WARM_MARKER_TTL = 3 * 24 * 60 * 60
+
     # Retry 정책 상수
     DEFAULT_RETRY_POLICY = {
         "max_retries": 3,
@@ -156,15 +156,7 @@ async def _run_agent_async(
         if not user:
             raise Exception("User not found")
 
-        # 2.5. 지난 추천 채점 (실패해도 파이프라인은 계속)
-        update_progress(task_instance, 13.0, "지난 추천 채점 중...")
-        try:
-            from graph.feedback import score_pending_recommendations
-
-            scored_count = await score_pending_recommendations(user_id=current_user_id)
-            logger.info(f"Scored {scored_count} past recommendations for user {current_user_id}")
-        except Exception as e:
-            logger.error(f"추천 채점 실패 (파이프라인은 계속 진행): {e}")
+        # (지난 추천 채점은 장 마감 후 전 사용자 일괄 작업 score_recommendations가 한다)
 
         # 3. Langraph 실행
         update_progress(task_instance, 15.0, "에이전트 파이프라인 실행 중...")
@@ -344,31 +336,31 @@ async def _sync_all_schedules_async():
                 continue
 
         # Prune: DB에 없는 사용자 스케줄 제거 (Redis에서)
+        # KEYS 대신 SCAN으로 훑고 배치마다 스케줄 zset 제거 + UNLINK (브로커와 같은 Redis를 멈추지 않도록)
         removed_count = 0
-        # RedBeat에서 모든 스케줄 키 가져오기
+        prune_stats = {}
         try:
-            from redbeat.schedulers import get_redis
+            from redbeat.schedulers import ensure_conf, get_redis
+            from clients.redis_scan import scan_unlink
 
             redis_client = get_redis(celery_app)
-            redbeat_key_prefix = "redbeat:"
-            all_keys = redis_client.keys(f"{redbeat_key_prefix}*")
-
-            for redis_key in all_keys:
-                # redbeat: 접두사 제거
-                key = redis_key.decode() if isinstance(redis_key, bytes) else redis_key
-                key_without_prefix = key.replace(redbeat_key_prefix, "")
-
-                # 사용자 스케줄이고 live_keys에 없으면 제거
-                if (
-                    key_without_prefix.startswith(Constants.USER_SCHEDULE_KEY_PREFIX)
-                    and key_without_prefix not in live_keys
-                ):
-                    try:
-                        entry = RedBeatSchedulerEntry.from_key(key, app=celery_app)
-                        entry.delete()
-                        removed_count += 1
-                    except Exception as e:
-                        logger.warning(f"스케줄 제거 실패: {key}, error={e}")
+            redbeat_conf = ensure_conf(celery_app)
+            redbeat_key_prefix = redbeat_conf.key_prefix
+            user_key_prefix = f"{redbeat_key_prefix}{Constants.USER_SCHEDULE_KEY_PREFIX}"
+
+            def is_stale(key: str) -> bool:
+                # 사용자 스케줄이고 live_keys에 없으면 제거 (redbeat: 접두사 제거 후 비교)
+                return key.startswith(user_key_prefix) and key[len(redbeat_key_prefix):] not in live_keys
+
+            def remove_from_schedule(pipe, keys: list[str]) -> None:
+                # RedBeatSchedulerEntry.delete()와 같은 정리 (스케줄 zset에서도 제거)
+                pipe.zrem(redbeat_conf.schedule_key, *keys)
+
+            prune_result = scan_unlink(
+                redis_client, f"{user_key_prefix}*", select=is_stale, before_unlink=remove_from_schedule
+            )
+            removed_count = prune_result.deleted
+            prune_stats = prune_result.as_dict()
         except Exception as e:
             logger.warning(f"스케줄 정리 중 오류 발생: {e}")
 
@@ -382,6 +374,7 @@ async def _sync_all_schedules_async():
             "total_schedules": len(live_keys),
             "sync_duration_seconds": round(sync_duration, 3),
             "upserted_count": upserted_count,
+            "prune_scan": prune_stats,
         }
 
         logger.info(
@@ -432,3 +425,99 @@ def sync_all_schedules(self):
 
         # Celery에서 재시도 가능하도록 예외 재발생
         raise Exception(f"Schedule sync task failed: {e}") from e
+
+
+async def _warm_market_cache_async(force: bool = False) -> dict:
+    """전체 사용자 보유 종목(+SPY) 시장 데이터 캐시 예열. 종가가 확정된 거래일마다 한 번만 실행."""
+    from clients import get_cache_client
+    from clients.market_calendar import last_settled_session
+    from worker.cache_warm import warm_market_data
+
+    session = last_settled_session().isoformat()
+    marker_key = f"{Constants.CACHE_WARM_MARKER_PREFIX}{session}"
+    cache_client = get_cache_client()
+    if not force and cache_client.get(marker_key) is not None:
+        logger.info(f"캐시 예열 건너뜀 - 이미 예열된 거래일: {session}")
+        return {"status": "skipped", "session": session}
+
+    dependencies = await _initialize_dependencies(
+        return_email_client=False,
+        return_portfolio_usecase=True,
+        return_report_usecase=False,
+        return_user_usecase=False,
+        return_schedule_usecase=False,
+    )
+    portfolio_usecase = dependencies.get("portfolio_usecase", None)
+    if not portfolio_usecase:
+        raise Exception("PortfolioUsecase 초기화 실패 - 의존성을 확인해주세요")
+
+    tickers = await portfolio_usecase.get_all_tickers()
+    result = {"status": "success", "session": session, **warm_market_data(tickers)}
+    cache_client.set(marker_key, result, ttl_seconds=Constants.CACHE_WARM_MARKER_TTL)
+
+    logger.info(
+        f"캐시 예열 완료 ({session}): 종목 {result['tickers']}개, "
+        f"history {result['history']['ratio']:.0%}, info {result['info']['ratio']:.0%} "
+        f"(소요시간: {result['duration_seconds']}초)"
+    )
+    return result
+
+
+@celery_app.task(bind=True)
+def warm_market_cache(self, force: bool = False):
+    """
+    장 마감 후 전체 사용자 보유 종목(+SPY)의 history/info/calendar/어닝스/뉴스를 미리 캐시에 채운다.
+    이후 사용자별 정기 실행은 캐시에서 바로 읽는다.
+
+    Args:
+        force: True면 같은 거래일에 이미 예열했어도 다시 실행
+
+    Returns:
+        dict: 항목별 커버리지 (채운 티커 수 / 비율 / 빠진 티커)
+    """
+    try:
+        return asyncio.run(_warm_market_cache_async(force))
+    except Exception as e:
+        logger.error(f"캐시 예열 태스크 실패: {e}")
+        raise Exception(f"Cache warm task failed: {e}") from e
+
+
+@celery_app.task(bind=True)
+def snapshot_market_regime(self):
+    """
+    장 마감 후 최근 확정 거래일의 시장 국면을 한 번 판정해 Redis에 공유하고 market_regimes에 이력으로 남긴다.
+    이후 그 거래일의 모든 실행은 저장된 스냅샷을 읽기만 한다.
+
+    Returns:
+        dict: 판정한 거래일과 국면 (판정 불가 시 status "skipped")
+    """
+    from graph.regime import record_market_regime
+
+    try:
+        snapshot = asyncio.run(record_market_regime())
+    except Exception as e:
+        logger.error(f"시장 국면 스냅샷 태스크 실패: {e}")
+        raise Exception(f"Market regime snapshot task failed: {e}") from e
+    if snapshot is None:
+        logger.warning("시장 국면 스냅샷 건너뜀 - SPY 종가 없음")
+        return {"status": "skipped"}
+    logger.info(f"시장 국면 스냅샷 완료 ({snapshot['session_date']}): {snapshot['regime']}")
+    return {"status": "success", "session": snapshot["session_date"], "regime": snapshot["regime"]}
+
+
+@celery_app.task(bind=True)
+def score_recommendations(self):
+    """
+    장 마감 후 전 사용자의 미채점 추천을 한 번에 채점한다 (티커별 종가 1회 조회 + 일괄 upsert).
+    사용자별 에이전트 실행은 채점하지 않고 결과만 읽는다.
+
+    Returns:
+        dict: 미채점 추천 수 / 채점된 추천 수 / 사용자 수 / 티커 수
+    """
+    from graph.feedback import score_all_pending_recommendations
+
+    try:
+        return {"status": "success", **asyncio.run(score_all_pending_recommendations())}
+    except Exception as e:
+        logger.error(f"추천 일괄 채점 태스크 실패: {e}")
+        raise Exception(f"Recommendation scoring task failed: {e}") from e